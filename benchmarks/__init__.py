@@ -0,0 +1,28 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Performance benchmarks for geotecha numerical hot paths.
+
+The benchmarks follow the airspeed velocity (asv) conventions, i.e. classes
+with `params`, `param_names`, `setup` and `time_*`/`peakmem_*` methods.  Run
+them with asv (see asv.conf.json at the repository root) or offline, without
+asv, using::
+
+    python benchmarks/run_benchmarks.py
+
+"""
@@ -0,0 +1,158 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Benchmarks for the speccon integrals: time dependent load integrals
+(Eload_linear etc.) and spectral matrices of piecewise linear
+properties (pdim1sin_*_linear).
+
+"""
+from __future__ import division, print_function
+
+import numpy as np
+
+from geotecha.speccon import integrals
+from geotecha.speccon.integrals import m_from_sin_mx
+
+from .common import IMPLEMENTATIONS
+from .common import require_implementation
+from .common import skip_slow
+from .common import ramp_hold_load
+from .common import layered_polyline
+
+
+class TimeLoadIntegrals(object):
+    """Eload_linear, EDload_linear and Eload_coslinear"""
+
+    params = ([10, 50, 200],
+              [10, 100, 1000],
+              [1, 10, 50],
+              IMPLEMENTATIONS)
+    param_names = ['neig', 'nt', 'nseg', 'implementation']
+
+    def setup(self, neig, nt, nseg, implementation):
+        require_implementation(implementation)
+        skip_slow(implementation, neig * nt * nseg, 50 * 100 * 10)
+        m = np.array([m_from_sin_mx(i, boundary=1) for i in range(neig)])
+        self.eigs = m**2
+        self.tvals = np.logspace(-3, 1.5, nt)
+        self.loadtim, self.loadmag = ramp_hold_load(nseg)
+
+    def time_Eload_linear(self, neig, nt, nseg, implementation):
+        integrals.Eload_linear(self.loadtim, self.loadmag, self.eigs,
+                               self.tvals, implementation=implementation)
+
+    def time_EDload_linear(self, neig, nt, nseg, implementation):
+        integrals.EDload_linear(self.loadtim, self.loadmag, self.eigs,
+                                self.tvals, implementation=implementation)
+
+    def time_Eload_coslinear(self, neig, nt, nseg, implementation):
+        integrals.Eload_coslinear(self.loadtim, self.loadmag, 2.0, 0.3,
+                                  self.eigs, self.tvals,
+                                  implementation=implementation)
+
+    def peakmem_Eload_linear(self, neig, nt, nseg, implementation):
+        integrals.Eload_linear(self.loadtim, self.loadmag, self.eigs,
+                               self.tvals, implementation=implementation)
+
+    def peakmem_Eload_coslinear(self, neig, nt, nseg, implementation):
+        integrals.Eload_coslinear(self.loadtim, self.loadmag, 2.0, 0.3,
+                                  self.eigs, self.tvals,
+                                  implementation=implementation)
+
+
+class SpectralMatrices(object):
+    """pdim1sin_af_linear, pdim1sin_abf_linear and pdim1sin_D_aDf_linear"""
+
+    params = ([10, 50, 200],
+              [1, 5, 20],
+              IMPLEMENTATIONS)
+    param_names = ['neig', 'nlayers', 'implementation']
+
+    def setup(self, neig, nlayers, implementation):
+        require_implementation(implementation)
+        skip_slow(implementation, neig * neig * nlayers, 50 * 50)
+        self.m = np.array([m_from_sin_mx(i, boundary=0)
+                           for i in range(neig)])
+        self.a = layered_polyline(nlayers, 1.0, 3.0)
+        self.b = layered_polyline(nlayers, 2.0, 0.5)
+
+    def time_pdim1sin_af_linear(self, neig, nlayers, implementation):
+        integrals.pdim1sin_af_linear(self.m, self.a,
+                                     implementation=implementation)
+
+    def time_pdim1sin_abf_linear(self, neig, nlayers, implementation):
+        integrals.pdim1sin_abf_linear(self.m, self.a, self.b,
+                                      implementation=implementation)
+
+    def time_pdim1sin_D_aDf_linear(self, neig, nlayers, implementation):
+        integrals.pdim1sin_D_aDf_linear(self.m, self.a,
+                                        implementation=implementation)
+
+    def peakmem_pdim1sin_abf_linear(self, neig, nlayers, implementation):
+        integrals.pdim1sin_abf_linear(self.m, self.a, self.b,
+                                      implementation=implementation)
+
+
+class CSEGeneratedCode(object):
+    """Eload_linear and Eload_coslinear with and without common
+    subexpression elimination in the generated code.
+
+    cse=False is the flat code from integrals_generate_code with
+    CSE = False, i.e. the expressions used before the temporaries were
+    introduced.  Accuracy of the two is compared in
+    geotecha/speccon/test/test_integrals.py.
+
+    """
+
+    params = (['Eload_linear', 'Eload_coslinear'],
+              [True, False],
+              ['scalar', 'vectorized'])
+    param_names = ['function', 'cse', 'implementation']
+    timeout = 300
+
+    def setup_cache(self):
+        from geotecha.speccon import integrals_generate_code as gen
+
+        gen.CSE = False
+        try:
+            return {'Eload_linear': gen.Eload_linear_implementations()[0],
+                    'Eload_coslinear':
+                        gen.Eload_coslinear_implementations()[0]}
+        finally:
+            gen.CSE = True
+
+    def setup(self, cache, function, cse, implementation):
+        from geotecha.speccon.integrals_generate_code import (
+            python_implementation)
+
+        if cse:
+            self.fn = getattr(integrals, function)
+        else:
+            self.fn = python_implementation(cache[function], function)
+        m = np.array([m_from_sin_mx(i, boundary=1) for i in range(50)])
+        self.eigs = m**2
+        self.tvals = np.logspace(-3, 1.5, 100)
+        self.loadtim, self.loadmag = ramp_hold_load(10)
+        if function == 'Eload_linear':
+            self.args = (self.loadtim, self.loadmag, self.eigs, self.tvals)
+        else:
+            self.args = (self.loadtim, self.loadmag, 2.0, 0.3, self.eigs,
+                         self.tvals)
+
+    def time_call(self, cache, function, cse, implementation):
+        self.fn(*self.args, implementation=implementation)
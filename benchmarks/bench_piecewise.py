@@ -0,0 +1,56 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Benchmarks for piecewise linear segment searches.
+
+"""
+from __future__ import division, print_function
+
+import numpy as np
+
+from geotecha.piecewise.piecewise_linear_1d import segment_containing_xi
+from geotecha.piecewise.piecewise_linear_1d import (
+    segment_containing_also_segments_less_than_xi)
+
+
+class SegmentContainingXi(object):
+    """segment_containing_xi and friends on increasing data with steps"""
+
+    params = ([10, 100, 1000],
+              [10, 100, 1000])
+    param_names = ['nx', 'nxi']
+
+    def setup(self, nx, nxi):
+        x = np.linspace(0, 10, nx)
+        # repeat a few points so that the data has steps
+        self.x = np.sort(np.concatenate([x, x[1:-1:7]]))
+        self.y = np.cos(self.x) + np.cumsum(np.diff(self.x, prepend=0) == 0)
+        self.xi = np.linspace(-0.5, 10.5, nxi)
+
+    def time_segment_containing_xi(self, nx, nxi):
+        segment_containing_xi(self.x, self.xi)
+
+    def time_segment_containing_xi_choose_max(self, nx, nxi):
+        segment_containing_xi(self.x, self.xi, choose_max=True)
+
+    def time_segment_containing_also_segments_less_than_xi(self, nx, nxi):
+        segment_containing_also_segments_less_than_xi(self.x, self.y,
+                                                      self.xi)
+
+    def peakmem_segment_containing_xi(self, nx, nxi):
+        segment_containing_xi(self.x, self.xi)
@@ -0,0 +1,72 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Benchmarks for SpecBeam, beam on viscoelastic foundation.
+
+"""
+from __future__ import division, print_function
+
+import numpy as np
+
+from geotecha.piecewise.piecewise_linear_1d import PolyLine
+from geotecha.beam_on_foundation.specbeam import SpecBeam
+
+from .common import IMPLEMENTATIONS
+from .common import require_implementation
+from .common import skip_slow
+from .common import ramp_hold_load
+
+
+class SpecBeamRunme(object):
+    """SpecBeam.runme, analytical solution under a stationary load"""
+
+    params = ([10, 50],
+              [40, 400],
+              [1, 10],
+              [True, False],
+              IMPLEMENTATIONS)
+    param_names = ['nterms', 'nt', 'nseg', 'make_defl', 'implementation']
+
+    def setup(self, nterms, nt, nseg, make_defl, implementation):
+        require_implementation(implementation)
+        skip_slow(implementation, nterms, 10)
+        loadtim, loadmag = ramp_hold_load(nseg, tmax=2.0)
+        self.a = SpecBeam(
+            E=6.998e9,
+            rho=2373,
+            L=160,
+            kf=5.41e-4,
+            mu_norm=39.263,
+            k1_norm=97.552,
+            nterms=nterms,
+            BC="SS",
+            nquad=20,
+            stationary_loads_x_norm=[0.5],
+            stationary_loads_vs_t_norm=[
+                PolyLine(loadtim, 1.013e-4 * loadmag)],
+            tvals=np.linspace(0, 2, nt),
+            xvals=np.linspace(0, 160, 101),
+            use_analytical=True,
+            implementation=implementation,
+            force_calc=True)
+
+    def time_runme(self, nterms, nt, nseg, make_defl, implementation):
+        self.a.runme(make_defl=make_defl)
+
+    def peakmem_runme(self, nterms, nt, nseg, make_defl, implementation):
+        self.a.runme(make_defl=make_defl)
@@ -0,0 +1,75 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Benchmarks for a complete Speccon1dVR vertical consolidation analysis.
+
+"""
+from __future__ import division, print_function
+
+import numpy as np
+
+from geotecha.piecewise.piecewise_linear_1d import PolyLine
+from geotecha.speccon.speccon1d_vr import Speccon1dVR
+
+from .common import IMPLEMENTATIONS
+from .common import require_implementation
+from .common import skip_slow
+from .common import ramp_hold_load
+from .common import layered_polyline
+
+
+class Speccon1dVRMakeAll(object):
+    """Speccon1dVR.make_all for a layered soil under a surcharge"""
+
+    params = ([10, 40, 100],
+              [10, 100],
+              [1, 5],
+              [1, 10],
+              IMPLEMENTATIONS)
+    param_names = ['neig', 'nt', 'nlayers', 'nseg', 'implementation']
+
+    def setup(self, neig, nt, nlayers, nseg, implementation):
+        require_implementation(implementation)
+        skip_slow(implementation, neig * nlayers, 40 * 5)
+
+        # attributes are set directly rather than from a reader string so
+        # that input parsing is not part of the timing.
+        a = Speccon1dVR()
+        a.H = 1
+        a.drn = 1
+        a.dTv = 0.1
+        a.neig = neig
+        a.mvref = 1.0
+        a.kvref = 1.0
+        a.mv = layered_polyline(nlayers, 1.0, 0.5)
+        a.kv = layered_polyline(nlayers, 1.0, 2.0)
+        z = a.mv.x
+        a.surcharge_vs_depth = [PolyLine(z, np.full_like(z, 100.0))]
+        a.surcharge_vs_time = [PolyLine(*ramp_hold_load(nseg))]
+        a.ppress_z = np.linspace(0, 1, 50)
+        a.avg_ppress_z_pairs = [[0, 1]]
+        a.settlement_z_pairs = [[0, 1]]
+        a.tvals = np.logspace(-3, 1, nt)
+        a.implementation = implementation
+        self.a = a
+
+    def time_make_all(self, neig, nt, nlayers, nseg, implementation):
+        self.a.make_all()
+
+    def peakmem_make_all(self, neig, nt, nlayers, nseg, implementation):
+        self.a.make_all()
@@ -0,0 +1,144 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Benchmarks of tabulated constitutive models against the models they wrap.
+
+"""
+from __future__ import division, print_function
+
+import numpy as np
+
+from geotecha.constitutive_models.void_ratio_stress import CcCrSoilModel
+from geotecha.constitutive_models.void_ratio_stress import (
+    PwiseLinearSoilModel)
+from geotecha.constitutive_models.void_ratio_stress import FunctionSoilModel
+from geotecha.constitutive_models.void_ratio_permeability import (
+    CkPermeabilityModel)
+from geotecha.constitutive_models.swcc import SWCC_FredlundAndXing1994
+from geotecha.constitutive_models.tabulated import TabulatedSoilModel
+from geotecha.constitutive_models.tabulated import (
+    TabulatedPermeabilityModel)
+from geotecha.constitutive_models.tabulated import TabulatedSWCC
+
+
+def _e_from_stress(estress, **kwargs):
+    """Log-linear plus linear compression, no closed form inverse"""
+    estress = np.asarray(estress, dtype=float)
+    return 3.0 - 0.5 * np.log10(estress) - 1e-3 * estress
+
+
+def _stress_from_e(e, **kwargs):
+    """Inverse of _e_from_stress by Newton iteration on ln(estress)"""
+    e = np.asarray(e, dtype=float)
+    lns = (3.0 - e) * np.log(10) / 0.5
+    for i in range(50):
+        s = np.exp(lns)
+        dlns = (3.0 - 0.5 * lns / np.log(10) - 1e-3 * s - e) / (
+            0.5 / np.log(10) + 1e-3 * s)
+        lns += dlns
+        if np.max(np.abs(dlns)) < 1e-12:
+            break
+    return np.exp(lns)
+
+
+def _av_from_stress(estress, **kwargs):
+    estress = np.asarray(estress, dtype=float)
+    return 0.5 / (np.log(10) * estress) + 1e-3
+
+
+def _case(name, rng, npts):
+    """model, tabulated model, method name and input values
+
+    The method is always tabulated, even where it is not by default.
+    """
+    stress = np.exp(rng.uniform(0, np.log(1000), npts))
+    pwise = PwiseLinearSoilModel(siga=np.array([1.0, 10, 100, 1000]),
+                                 ea=np.array([3.0, 2.5, 1.8, 1.2]),
+                                 Cr=0.1, xlog=True)
+    if name == 'CcCr.e_from_stress':
+        model = CcCrSoilModel(Cc=3.0, Cr=0.5, siga=10, ea=5)
+        x = stress
+    elif name == 'CcCr.stress_from_e':
+        model = CcCrSoilModel(Cc=3.0, Cr=0.5, siga=10, ea=5)
+        x = model.e_from_stress(stress)
+    elif name == 'PwiseLinear.e_from_stress':
+        model = pwise
+        x = stress
+    elif name == 'PwiseLinear.av_from_stress':
+        model = pwise
+        x = stress
+    elif name == 'Ck.k_from_e':
+        model = CkPermeabilityModel(Ck=1.5, ka=10, ea=4)
+        x = rng.uniform(1.0, 3.0, npts)
+    elif name == 'FredlundAndXing1994.dw_dpsi':
+        model = SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45, psir=300)
+        x = np.exp(rng.uniform(np.log(1e-2), np.log(1e6), npts))
+    elif name == 'FunctionNewton.stress_from_e':
+        model = FunctionSoilModel(_e_from_stress, _stress_from_e,
+                                  _av_from_stress)
+        x = _e_from_stress(stress)
+    else:
+        raise ValueError(name)
+
+    method = name.split('.')[1]
+    if name.startswith('Ck'):
+        tab = TabulatedPermeabilityModel(model, 1.0, 3.0, methods=[method])
+    elif name.startswith('Fredlund'):
+        tab = TabulatedSWCC(model, 1e-2, 1e6, methods=[method])
+    else:
+        tab = TabulatedSoilModel(model, 1.0, 1000.0, methods=[method])
+    return model, tab, method, x
+
+
+class TabulatedVsModel(object):
+    """Tabulated wrapper vs wrapped model, same method and input
+
+    The table is built in setup.  Simple closed form models (CcCr, Ck)
+    are faster than their tables and PwiseLinear.e_from_stress is about
+    even, so the wrappers do not tabulate those by default.  The table
+    wins for PwiseLinear.av_from_stress, FredlundAndXing1994.dw_dpsi and,
+    by more, for FunctionNewton.stress_from_e whose inverse needs root
+    finding.  Those are tabulated by default.
+    """
+
+    params = (['CcCr.e_from_stress',
+               'CcCr.stress_from_e',
+               'PwiseLinear.e_from_stress',
+               'PwiseLinear.av_from_stress',
+               'Ck.k_from_e',
+               'FredlundAndXing1994.dw_dpsi',
+               'FunctionNewton.stress_from_e'],
+              [10**4, 10**6])
+    param_names = ['case', 'npts']
+
+    def setup(self, case, npts):
+        rng = np.random.RandomState(0)
+        model, tab, method, x = _case(case, rng, npts)
+        self.model_fn = getattr(model, method)
+        self.tab_fn = getattr(tab, method)
+        self.x = x
+        self.tab_fn(x[:10])
+
+    def time_model(self, case, npts):
+        self.model_fn(self.x)
+
+    def time_tabulated(self, case, npts):
+        self.tab_fn(self.x)
+
+    def peakmem_tabulated(self, case, npts):
+        self.tab_fn(self.x)
@@ -0,0 +1,143 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Shared helpers for the geotecha benchmarks.
+
+"""
+from __future__ import division, print_function
+
+import importlib
+
+import numpy as np
+
+from geotecha.piecewise.piecewise_linear_1d import PolyLine
+
+
+IMPLEMENTATIONS = ['scalar', 'vectorized', 'fortran', 'jit']
+
+_IMPLEMENTATION_MODULES = {'fortran': 'geotecha.speccon.ext_integrals',
+                           'jit': 'geotecha.speccon.jit_integrals'}
+
+
+def require_implementation(implementation):
+    """Skip a benchmark if an implementation is not available
+
+    geotecha silently falls back to the 'vectorized' implementation when
+    the fortran extension (or numba for 'jit') cannot be imported.  Timing
+    that fallback under the 'fortran' label would be misleading so the
+    benchmark is skipped instead.
+
+    Parameters
+    ----------
+    implementation : ['scalar', 'vectorized', 'fortran', 'jit']
+        Implementation to check.
+
+    Raises
+    ------
+    NotImplementedError
+        If the module behind `implementation` cannot be imported.  asv (and
+        run_benchmarks.py) treat NotImplementedError raised in `setup` as
+        a skipped benchmark.
+
+    """
+
+    module = _IMPLEMENTATION_MODULES.get(implementation, None)
+    if module is None:
+        return
+    try:
+        importlib.import_module(module)
+    except ImportError:
+        raise NotImplementedError("implementation='{}' not available, "
+                                  "{} cannot be "
+                                  "imported".format(implementation, module))
+
+
+def skip_slow(implementation, size, max_size):
+    """Skip the 'scalar' implementation for large problem sizes
+
+    Parameters
+    ----------
+    implementation : str
+        Implementation being benchmarked.
+    size : int
+        Problem size, e.g. neig * len(tvals).
+    max_size : int
+        Largest `size` benchmarked with the 'scalar' implementation.
+
+    Raises
+    ------
+    NotImplementedError
+        If `implementation` is 'scalar' and `size` > `max_size`.
+
+    """
+
+    if implementation == 'scalar' and size > max_size:
+        raise NotImplementedError("'scalar' skipped for size "
+                                  "{} > {}".format(size, max_size))
+
+
+def ramp_hold_load(nseg, tmax=10.0):
+    """Piecewise linear load vs time with `nseg` segments
+
+    Ramp from zero followed by `nseg` - 1 segments of varying magnitude.
+
+    Parameters
+    ----------
+    nseg : int
+        Number of load segments.
+    tmax : float, optional
+        Time at end of last segment.  Default tmax=10.
+
+    Returns
+    -------
+    loadtim, loadmag : 1d ndarray of float
+        Times and magnitudes of the `nseg` + 1 load points.
+
+    """
+
+    loadtim = np.linspace(0, tmax, nseg + 1)
+    loadmag = np.ones(nseg + 1)
+    loadmag[0] = 0
+    loadmag[2:] += 0.5 * np.sin(np.arange(nseg - 1))
+    return loadtim, loadmag
+
+
+def layered_polyline(nlayers, top, bot, H=1.0):
+    """Layered PolyLine with linear variation in each of `nlayers` layers
+
+    Parameters
+    ----------
+    nlayers : int
+        Number of equal thickness layers.
+    top, bot : float
+        Value at top of the first layer and bottom of the last layer.
+        Layer values step by 10% of the top value at each interface.
+    H : float, optional
+        Total depth.  Default H=1.
+
+    Returns
+    -------
+    a : PolyLine
+        Layered distribution from 0 to `H`.
+
+    """
+
+    z = np.linspace(0, H, nlayers + 1)
+    y = np.linspace(top, bot, nlayers + 1)
+    step = 0.1 * top * (1 + np.arange(nlayers) % 2)
+    return PolyLine(z[:-1], z[1:], y[:-1] + step, y[1:])
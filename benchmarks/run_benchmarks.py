@@ -0,0 +1,310 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+
+"""
+Run the geotecha benchmarks without airspeed velocity.
+
+The benchmark classes in benchmarks/bench_*.py follow the asv conventions
+so they can be run with ``asv run``.  This script runs the same benchmarks
+offline against the source tree (no virtualenv, no git checkout, no
+network):
+
+ - `params` are expanded as a cartesian product, `setup` is called for
+   each combination, and a NotImplementedError raised in `setup` marks
+   the combination as skipped (e.g. 'fortran' when the extension is not
+   built).
+ - as with asv, `setup_cache` is called once per class and its result is
+   passed as the first argument of `setup` and the benchmark methods.
+ - ``time_*`` methods report the per call time (minimum and median of
+   several repeats, after a warm up call so that numba compilation is not
+   timed).
+ - ``peakmem_*`` methods report the peak memory allocated during the call
+   as traced by tracemalloc (numpy arrays are traced; memory allocated
+   inside the fortran extension is not).
+
+Examples
+--------
+Run everything::
+
+    python benchmarks/run_benchmarks.py
+
+Run the load integrals once each, save the results, then later compare::
+
+    python benchmarks/run_benchmarks.py -b Eload --quick --json old.json
+    python benchmarks/run_benchmarks.py -b Eload --quick --compare old.json
+
+"""
+from __future__ import division, print_function
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def discover(regex=None):
+    """Find benchmark methods in benchmarks/bench_*.py
+
+    Parameters
+    ----------
+    regex : str, optional
+        Only benchmarks whose 'module.Class.method' name matches `regex`
+        (re.search) are returned.  Default regex=None i.e. all benchmarks.
+
+    Returns
+    -------
+    out : list of (name, cls, method_name)
+        Benchmarks found.
+
+    """
+
+    root = os.path.dirname(BENCHMARK_DIR)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    package = os.path.basename(BENCHMARK_DIR)
+    out = []
+    for fname in sorted(os.listdir(BENCHMARK_DIR)):
+        if not (fname.startswith('bench_') and fname.endswith('.py')):
+            continue
+        module = importlib.import_module(
+            '{}.{}'.format(package, fname[:-3]))
+        for cls_name in sorted(vars(module)):
+            cls = getattr(module, cls_name)
+            if (not isinstance(cls, type) or
+                    cls.__module__ != module.__name__):
+                continue
+            for meth in sorted(vars(cls)):
+                if not meth.startswith(('time_', 'peakmem_')):
+                    continue
+                name = '{}.{}.{}'.format(fname[:-3], cls_name, meth)
+                if regex is None or re.search(regex, name):
+                    out.append((name, cls, meth))
+    return out
+
+
+def param_combinations(cls):
+    """Cartesian product of a benchmark class's asv style `params`
+
+    Parameters
+    ----------
+    cls : class
+        Benchmark class, optionally with `params` and `param_names`.
+
+    Returns
+    -------
+    out : list of tuple
+        Parameter combinations.  [()] if the class has no params.
+
+    """
+
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [()]
+    if not any(isinstance(v, (list, tuple)) for v in params):
+        # single parameter, asv allows a flat list
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def measure_time(func, args, repeat=5, min_time=0.05):
+    """Per call time of func(*args)
+
+    Parameters
+    ----------
+    func : callable
+        Function to time.
+    args : tuple
+        Arguments of `func`.
+    repeat : int, optional
+        Number of repeats.  Default repeat=5.
+    min_time : float, optional
+        Each repeat calls `func` enough times to take at least `min_time`
+        seconds.  Default min_time=0.05.
+
+    Returns
+    -------
+    best, median : float
+        Minimum and median over the repeats of the per call time in
+        seconds.
+
+    """
+
+    timer = timeit.Timer(lambda: func(*args))
+    first = timer.timeit(number=1)  # warm up
+    if repeat <= 1:
+        return first, first
+    number = max(1, int(min_time / max(first, 1e-9)))
+    t = np.array(timer.repeat(repeat=repeat, number=number)) / number
+    return float(np.min(t)), float(np.median(t))
+
+
+def measure_peakmem(func, args):
+    """Peak memory, in bytes, traced by tracemalloc during func(*args)"""
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run(benchmarks, quick=False, verbose=True):
+    """Run benchmarks
+
+    Parameters
+    ----------
+    benchmarks : list of (name, cls, method_name)
+        Benchmarks to run, see `discover`.
+    quick : True/False, optional
+        If True then each time benchmark is called once only.
+        Default quick=False.
+    verbose : True/False, optional
+        Print results as they are made.  Default verbose=True.
+
+    Returns
+    -------
+    results : dict
+        results[name][param_str] is the time in seconds (minimum over
+        repeats) or the peak memory in bytes.  Skipped combinations are
+        None.
+
+    """
+
+    results = {}
+    caches = {}
+    for name, cls, meth in benchmarks:
+        results[name] = {}
+        param_names = getattr(cls, 'param_names', [])
+        if hasattr(cls, 'setup_cache') and cls not in caches:
+            caches[cls] = cls().setup_cache()
+        for args in param_combinations(cls):
+            key = ', '.join('{}={}'.format(k, v)
+                            for k, v in zip(param_names, args))
+            if cls in caches:
+                args = (caches[cls],) + tuple(args)
+            bench = cls()
+            try:
+                if hasattr(bench, 'setup'):
+                    bench.setup(*args)
+            except NotImplementedError:
+                results[name][key] = None
+                if verbose:
+                    print('{} [{}]: skipped'.format(name, key))
+                continue
+            try:
+                func = getattr(bench, meth)
+                if meth.startswith('time_'):
+                    best, median = measure_time(func, args,
+                                                repeat=1 if quick else 5)
+                    value = best
+                    txt = '{:.3g} s (median {:.3g} s)'.format(best, median)
+                else:
+                    value = measure_peakmem(func, args)
+                    txt = '{:.3g} MB'.format(value / 1e6)
+            finally:
+                if hasattr(bench, 'teardown'):
+                    bench.teardown(*args)
+            results[name][key] = value
+            if verbose:
+                print('{} [{}]: {}'.format(name, key, txt))
+    return results
+
+
+def compare(old, new, factor=1.1):
+    """Compare two sets of results
+
+    Parameters
+    ----------
+    old, new : dict
+        Results from `run`.
+    factor : float, optional
+        A ratio new/old greater than `factor` is a regression, less than
+        1/`factor` an improvement.  Default factor=1.1.
+
+    Returns
+    -------
+    regressions : list of (name, param_str, ratio)
+        Benchmarks that got worse.
+
+    """
+
+    regressions = []
+    for name in sorted(new):
+        for key, value in sorted(new[name].items()):
+            before = old.get(name, {}).get(key, None)
+            if value is None or before is None or before == 0:
+                continue
+            ratio = value / before
+            flag = ''
+            if ratio > factor:
+                flag = '+'
+                regressions.append((name, key, ratio))
+            elif ratio < 1 / factor:
+                flag = '-'
+            print('{:1s} {:8.3f} {} [{}]'.format(flag, ratio, name, key))
+    return regressions
+
+
+def main(argv=None):
+    """Command line interface, see module docstring"""
+
+    parser = argparse.ArgumentParser(
+        description='Run geotecha benchmarks without asv.')
+    parser.add_argument('-b', '--bench', default=None,
+                        help="regex of 'module.Class.method' to run")
+    parser.add_argument('--quick', action='store_true',
+                        help='call each time benchmark once only')
+    parser.add_argument('--json', default=None,
+                        help='save results to this json file')
+    parser.add_argument('--compare', default=None,
+                        help='compare with results in this json file')
+    parser.add_argument('--factor', type=float, default=1.1,
+                        help='ratio flagged as a regression by --compare')
+    args = parser.parse_args(argv)
+
+    results = run(discover(args.bench), quick=args.quick)
+
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            old = json.load(f)
+        print('\nratio new/old (+ regression, - improvement)')
+        regressions = compare(old, results, factor=args.factor)
+        if regressions:
+            print('{} regression(s)'.format(len(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
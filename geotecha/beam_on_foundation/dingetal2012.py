@@ -24,7 +24,8 @@ from __future__ import division, print_function
 
 
 import numpy as np
-import matplotlib.pyplot as plt
+from geotecha.inputoutput.lazy_import import lazy_import
+plt = lazy_import('matplotlib.pyplot')
 from geotecha.mathematics.root_finding import find_n_roots
 from scipy import integrate
 from scipy.integrate import odeint
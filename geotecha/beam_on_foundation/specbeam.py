@@ -26,20 +26,18 @@ from __future__ import division, print_function
 
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import matplotlib
 from geotecha.mathematics.root_finding import find_n_roots
 from scipy import integrate
 from scipy.integrate import odeint
-import matplotlib.style
-import matplotlib as mpl
+from geotecha.inputoutput.lazy_import import lazy_import
 
 import time
 from datetime  import timedelta
 import datetime
 from collections import OrderedDict
 import os
+import json
+import hashlib
 
 import geotecha.speccon.speccon1d as speccon1d
 import geotecha.piecewise.piecewise_linear_1d as pwise
@@ -50,9 +48,14 @@ from geotecha.inputoutput.inputoutput import SimpleTimer
 
 from geotecha.plotting.one_d import save_figure
 
-from numpy.testing import assert_allclose
 from geotecha.plotting.one_d import MarkersDashesColors
 
+# matplotlib is only needed for plotting/animation so import on first use.
+plt = lazy_import('matplotlib.pyplot')
+animation = lazy_import('matplotlib.animation')
+matplotlib = lazy_import('matplotlib')
+mpl = matplotlib
+
 DEBUG=True
 
 
@@ -240,6 +243,15 @@ class SpecBeam(object):
     force_calc : [False, True]
         If True then calcualtion will happen regardless of presence of output
         file (file_stem)
+    file_format : ["csv", "npy"], optional
+        On disk format used by `saveme` and `load_defl`.  "csv" (default)
+        writes human readable grids via
+        inputoutput.save_grid_data_to_file.  "npy" writes the raw deflection
+        arrays as binary .npy files alongside a .json sidecar holding the
+        x and t values, the input parameters and a hash of those parameters.
+        The .npy files are loaded lazily with np.load(mmap_mode='r') so only
+        the rows actually used are read from disk.  A saved .npy result is
+        only re-used if its parameter hash matches the current object.
 
     Attributes
     ----------
@@ -372,7 +384,8 @@ class SpecBeam(object):
                     implementation="vectorized",
                     use_analytical=False,
                     file_stem="specbeam_",
-                    force_calc=False):
+                    force_calc=False,
+                    file_format="csv"):
 
 
         self.BC = BC
@@ -437,6 +450,11 @@ class SpecBeam(object):
         self.use_analytical=use_analytical
         self.file_stem=file_stem
         self.force_calc=force_calc
+        self.file_format=file_format
+
+        if not self.file_format in ["csv", "npy"]:
+            raise ValueError("file_format must be 'csv' or 'npy', not "
+                             "'{}'".format(self.file_format))
 
         if (self.k3_norm is None) and self.k3 is None:
             self.k3=0
@@ -905,7 +923,20 @@ class SpecBeam(object):
             return v
 
 
-    def runme(self):
+    def runme(self, make_defl=True):
+        """Solve for the Galerkin coefficients and make deflections
+
+        Parameters
+        ----------
+        make_defl : True/False, optional
+            If False then only the Galerkin coefficients (`v_E_Igamv_the`
+            or `qsol`) are calculated and `defl_norm` is not made.
+            Deflections can then be generated for a few times at a time
+            with `defl_vs_x` (as `animateme` does) so that memory use does
+            not depend on the number of time values.  Default
+            make_defl=True.
+
+        """
 
         if (self.force_calc) or (not self.load_defl()):
             if self.use_analytical:
@@ -933,17 +964,19 @@ class SpecBeam(object):
 
                 self._make_eigs_and_v()
                 self.make_time_dependent_arrays()
-                self.make_output()
+                if make_defl:
+                    self.make_output()
 
 
             else:
                 #using numerical answer
                 self.calulate_qk(t_norm=self.tvals_norm)
-                self.defl_norm = self.wofx(x_norm=self.xvals_norm, normalise_w=True)
+                if make_defl:
+                    self.defl_norm = self.wofx(x_norm=self.xvals_norm, normalise_w=True)
                 #Should be array of shape (len(self.xvals_norm), len(self.tvals_norm))
 
-        if not self.L is None:
-            self.defl = self.defl_norm * self.L
+            if not self.L is None and make_defl:
+                self.defl = self.defl_norm * self.L
 
 
     def _make_gam(self):
@@ -1143,11 +1176,18 @@ class SpecBeam(object):
     def saveme(self):
         """Save deflection vs time to file
 
-        Deflection will be saved to :
+        If `file_format` is "csv", deflection will be saved to :
         'self.file_stem + "_defl.csv'
         Normalised deflection will be saved to:
         'self.file_stem + "_defl_norm.csv"
 
+        If `file_format` is "npy", deflection will be saved to:
+        'self.file_stem + "_defl.npy'
+        Normalised deflection will be saved to:
+        'self.file_stem + "_defl_norm.npy"
+        x values, t values, input parameters and parameter hash will be
+        saved to 'self.file_stem + "_defl_norm.json".
+
         Notes:
         -----
         Might not handle singel x value and single t vlue.
@@ -1157,6 +1197,9 @@ class SpecBeam(object):
 
         two_d_defl_norm = np.atleast_2d(self.defl_norm)
 
+        if self.file_format == "npy":
+            self._save_defl_npy(two_d_defl_norm)
+            return
 
         inputoutput.save_grid_data_to_file(data_dicts=dict(
                                                name="_defl_norm",
@@ -1177,8 +1220,66 @@ class SpecBeam(object):
                                            file_stem=self.file_stem,
                                            create_directory=False)
 
+    def _save_defl_npy(self, two_d_defl_norm):
+        """Save deflections as .npy files with a .json sidecar
+
+        Parameters
+        ----------
+        two_d_defl_norm : 2d array of float
+            Normalised deflections, shape (len(xvals_norm), len(tvals_norm)).
+
+        """
+
+        params = self.input_parameters()
+
+        _save_npy(self.file_stem + "_defl_norm.npy", two_d_defl_norm)
+        if not self.L is None:
+            _save_npy(self.file_stem + "_defl.npy", np.atleast_2d(self.defl))
+
+        sidecar = OrderedDict(
+            shape=list(two_d_defl_norm.shape),
+            xvals_norm=np.atleast_1d(self.xvals_norm).tolist(),
+            tvals_norm=np.atleast_1d(self.tvals_norm).tolist(),
+            has_defl=not self.L is None,
+            hash=_hash_parameters(params),
+            parameters=params)
+
+        with open(self.file_stem + "_defl_norm.json", "w") as f:
+            json.dump(sidecar, f, indent=1)
+
+    def input_parameters(self):
+        """Normalised input parameters that determine the deflections
+
+        Returns
+        -------
+        params : OrderedDict
+            JSON serialisable dict of the parameters that determine
+            `defl_norm` (and `defl` via `L`).  ndarrays are converted to
+            lists and PolyLines to their [x, y] lists.
+
+        """
+
+        names = ["BC", "nterms", "L", "kf", "mu_norm", "k1_norm", "k3_norm",
+                 "nquad",
+                 "Ebar", "rhobar", "Ibar", "Abar", "k1bar", "k3bar", "mubar",
+                 "moving_loads_x_norm", "moving_loads_Fz_norm",
+                 "moving_loads_v_norm", "moving_loads_offset_norm",
+                 "moving_loads_t0_norm", "moving_loads_x0_norm",
+                 "moving_loads_L_norm",
+                 "stationary_loads_x_norm", "stationary_loads_vs_t_norm",
+                 "stationary_loads_omega_phase_norm",
+                 "tvals_norm", "xvals_norm", "use_analytical"]
+
+        return OrderedDict([(name, _jsonable(getattr(self, name, None)))
+                            for name in names])
+
     def load_defl(self):
-        """Loads defl_norm from txt file if it exists
+        """Loads defl_norm from file if it exists
+
+        For `file_format`="npy" the arrays are memory mapped, i.e.
+        `defl_norm` (and `defl`) will be read-only numpy.memmap objects.  The
+        saved result is only used if the parameter hash stored in the
+        .json sidecar matches that of the current object.
 
         Returns
         -------
@@ -1195,6 +1296,8 @@ class SpecBeam(object):
             #defl_norm already exists in memory
             return True
 
+        if self.file_format == "npy":
+            return self._load_defl_npy()
 
         #check if out file exists
         fname = self.file_stem + "_defl_norm.csv"
@@ -1222,8 +1325,44 @@ class SpecBeam(object):
 
             print('loaded it')
             return True
-        except:
+        except (IOError, ValueError, IndexError):
             return False
+
+    def _load_defl_npy(self):
+        """Memory map defl_norm (and defl) from .npy files
+
+        Returns
+        -------
+        Loaded : boolean
+            True if files exist and the stored parameter hash matches.
+
+        """
+
+        fname = self.file_stem + "_defl_norm.npy"
+        fjson = self.file_stem + "_defl_norm.json"
+
+        if not (os.path.isfile(fname) and os.path.isfile(fjson)):
+            return False
+
+        with open(fjson, "r") as f:
+            sidecar = json.load(f)
+
+        if sidecar["hash"] != _hash_parameters(self.input_parameters()):
+            # stale results from different input
+            return False
+
+        self.defl_norm = np.load(fname, mmap_mode='r')
+
+        if not self.L is None:
+            fdefl = self.file_stem + "_defl.npy"
+            if sidecar["has_defl"] and os.path.isfile(fdefl):
+                self.defl = np.load(fdefl, mmap_mode='r')
+            else:
+                self.defl = self.defl_norm * self.L
+            self.xvals = self.xvals_norm * self.L
+
+        return True
+
     def onClick(self, event):
         if self.pause:
             self.ani.event_source.stop()
@@ -1262,7 +1401,55 @@ class SpecBeam(object):
         return ax
 
 
-    def animateme(self, xlim=None, ylim=None, norm=True, saveme=False,interval=50):
+    def defl_vs_x(self, tslice=slice(None, None, None), norm=True):
+        """Deflection at xvals for a subset of time values
+
+        If `defl_norm` exists (calculated, or loaded/memory mapped by
+        `load_defl`) the relevant columns are extracted.  Otherwise the
+        deflections are calculated from the Galerkin coefficients
+        (`v_E_Igamv_the` for use_analytical=True, or `qsol`) for just the
+        requested times.  This allows deflections to be generated a few
+        time values at a time (e.g. by `animateme`) after
+        runme(make_defl=False) without ever forming the full
+        (len(xvals), len(tvals)) array.
+
+        Parameters
+        ----------
+        tslice : slice, int or sequence of int, optional
+            Time indexes.  Default tslice=slice(None, None, None) i.e. all
+            time values.
+        norm : True/False, optional
+            If True then normalised deflections are returned.
+            Default norm=True.
+
+        Returns
+        -------
+        w : ndarray of float
+            Deflection at xvals and tvals[tslice].  Shape is
+            (len(xvals), len(tvals[tslice])), or (len(xvals),) if tslice
+            is an int.
+
+        """
+
+        if hasattr(self, "defl_norm"):
+            w = np.array(self.defl_norm[:, tslice])
+        else:
+            phi = self.phi(self.xvals_norm[:, np.newaxis],
+                           self.beta[np.newaxis, :])
+            if hasattr(self, "v_E_Igamv_the"):
+                w = np.real(phi.dot(self.v_E_Igamv_the[:self.nterms, tslice]))
+            elif hasattr(self, "qsol"):
+                w = phi.dot(self.qsol[tslice, :self.nterms].T)
+            else:
+                raise ValueError("No deflections available.  Use runme "
+                                 "first.")
+
+        if not norm:
+            w = w * self.L
+        return w
+
+    def animateme(self, xlim=None, ylim=None, norm=True, saveme=False,
+                  interval=50, frames=None, writer=None, fps=15):
         """Animate the deflection vs distance over time plot
 
         Will display beam osciallations and evolving max and min deflection
@@ -1277,10 +1464,37 @@ class SpecBeam(object):
             calculated ylim=(1.5*defl_min,1.1*defl_max)
         norm : True/False, optional
             If norm=True normalised values will be plotted. Default norm=True.
-        saveme : False/True
+        saveme : False/True or str
             Whether to save the animation to disk. Default saveme=False.
+            If True the animation is saved to file_stem + "_anim.mp4".
+            If a str then it is the filename to save to (e.g. use a .gif
+            extension with writer='pillow').
         interval : float
             Number of miliseconds for each frame.  Default interval=50.
+        frames : int or sequence of int, optional
+            Time indexes to animate.  If an int then that many evenly
+            spaced time indexes will be used.  Default frames=None i.e. all
+            time values.
+        writer : str or matplotlib.animation.AbstractMovieWriter, optional
+            Writer used when saveme=True.  Default writer=None i.e.
+            FFMpegWriter with codec="libx264".  See `stream_animation`.
+        fps : int, optional
+            Frames per second of saved animation. Default fps=15.
+
+        Returns
+        -------
+        ani : matplotlib.animation.FuncAnimation
+            Animation for display.
+
+        Notes
+        -----
+        Deflections are calculated one frame at a time with `defl_vs_x`
+        and the max and min envelopes are accumulated as the animation
+        progresses, so memory use does not grow with the number of frames.
+        With runme(make_defl=False) the full deflection array is never
+        formed.  When saveme=True frames are streamed to the writer one
+        at a time using blitting (see `stream_animation`) rather than
+        redrawing the whole figure for each frame.
 
         """
 
@@ -1295,7 +1509,6 @@ class SpecBeam(object):
         if norm:
             xx = self.xvals_norm
             tt = self.tvals_norm
-            defl = self.defl_norm
             if self.has_moving_loads:
                 moving_loads = self.moving_loads_norm
             if self.has_stationary_loads:
@@ -1308,7 +1521,6 @@ class SpecBeam(object):
         else:
             xx = self.xvals
             tt = self.tvals
-            defl = self.defl
             if self.has_moving_loads:
                 moving_loads = self.moving_loads
             if self.has_stationary_loads:
@@ -1319,8 +1531,21 @@ class SpecBeam(object):
             ax.set_ylabel("w")
             ax2.set_ylabel("Fz")
 
-        defl_min = np.min(defl)
-        defl_max = np.max(defl)
+        if frames is None:
+            frames = np.arange(len(tt))
+        elif np.isscalar(frames):
+            frames = np.unique(np.linspace(0, len(tt) - 1,
+                                           int(frames)).astype(int))
+        else:
+            frames = np.asarray(frames, dtype=int)
+
+        # deflection extremes, a block of frames at a time
+        defl_min = np.inf
+        defl_max = -np.inf
+        for i in range(0, len(frames), 256):
+            w = self.defl_vs_x(frames[i:i + 256], norm=norm)
+            defl_min = min(defl_min, np.min(w))
+            defl_max = max(defl_max, np.max(w))
 
         x_min = np.min(xx)
         x_max = np.max(xx)
@@ -1332,23 +1557,11 @@ class SpecBeam(object):
         if not ylim is None:
             ax.set_ylim(ylim)
         else:
-            ax.set_ylim(2*defl_min,1.5*defl_max)
             ax.set_ylim(1.5*defl_min,1.1*defl_max)
 
-
-
-        max_defl_evolve = np.zeros_like(defl)
-        min_defl_evolve = np.zeros_like(defl)
-
-
-        max_defl_evolve[:,0] = defl[:,0]
-        min_defl_evolve[:,0] = defl[:,0]
-        for i in range(len(tt)):
-            if i==0:
-                continue
-            max_defl_evolve[:,i] = np.maximum(defl[:,i,], max_defl_evolve[:,i-1])
-            min_defl_evolve[:,i] = np.minimum(defl[:,i,], min_defl_evolve[:,i-1])
-
+        # running envelopes, updated each frame
+        max_defl_evolve = np.empty(len(xx))
+        min_defl_evolve = np.empty(len(xx))
 
         ax.grid()
         ax.invert_yaxis()
@@ -1405,6 +1618,9 @@ class SpecBeam(object):
                         x_map[i]=j
                         break
 
+            # loads acting at each stationary arrow
+            x_groups = [[k for k in range(len(stationary_loads_x))
+                         if x_map[k] == j] for j in range(max(x_map) + 1)]
 
             stationary_lines=[ax2.annotate("", xy=(np.nan,np.nan), xytext=(np.nan, np.nan),
                              arrowprops=dict(facecolor='green', shrink=0.0)
@@ -1417,18 +1633,11 @@ class SpecBeam(object):
 
             pmin_temp=[]
             pmax_temp=[]
-            for i in range(max(x_map)+1):
-                sum_mag_max=0
-                sum_mag_min=0
-                for j in range(len(stationary_loads_x)):
-                    if x_map[j]!=i:
-                        continue
-                    mag_max = max(stationary_loads_vs_t[j].y)
-                    mag_min = min(stationary_loads_vs_t[j].y)
-                    sum_mag_max +=mag_max
-                    sum_mag_min +=mag_min
-                pmin_temp.append(sum_mag_min)
-                pmax_temp.append(sum_mag_max)
+            for group in x_groups:
+                pmin_temp.append(sum(min(stationary_loads_vs_t[k].y)
+                                     for k in group))
+                pmax_temp.append(sum(max(stationary_loads_vs_t[k].y)
+                                     for k in group))
 
             pmax = max(pmax, max(pmax_temp))
             pmin = min(pmin, min(pmin_temp))
@@ -1453,26 +1662,20 @@ class SpecBeam(object):
 
         fig.tight_layout()
 
-        def init():
-            i=0
+        artists = (tuple(stationary_lines) + tuple(mvpl_lines) +
+                   (data_line,) + (time_text,) + (min_line,)+(max_line,))
 
-            if self.has_moving_loads:
-                for mvpl in moving_loads:
-                    for j in range(len(mvpl.xt)):
-                        mvpl_lines[i].xy = (np.nan,np.nan)
-                        mvpl_lines[i].xyann = (np.nan,np.nan)
-                        i=i+1
-            if self.has_stationary_loads:
-                for j in range(max(x_map)+1):#len(stationary_loads_x)):
-                    stationary_lines[j].xy = (np.nan,np.nan)
-                    stationary_lines[j].xyann = (np.nan,np.nan)
+        def init():
+            for line in tuple(mvpl_lines) + tuple(stationary_lines):
+                line.xy = (np.nan,np.nan)
+                line.xyann = (np.nan,np.nan)
 
             data_line.set_data([], [])
             min_line.set_data([], [])
             max_line.set_data([], [])
             time_text.set_text('')
 
-            return tuple(stationary_lines) + tuple(mvpl_lines) + (data_line,) + (time_text,) + (min_line,)+(max_line,)
+            return artists
 
 
         def animate(frame):
@@ -1492,12 +1695,9 @@ class SpecBeam(object):
                         i=i+1
 
             if self.has_stationary_loads:
-                for j in range(max(x_map)+1):#len(stationary_loads_x)):
+                for j, group in enumerate(x_groups):
                     sum_mag = 0
-                    for k in range(len(stationary_loads_x)):
-                        if x_map[k] != j:
-                            continue
-
+                    for k in group:
                         mag = pwise.pinterp_x_y(a=stationary_loads_vs_t[k],xi=tt[frame])
                         if stationary_loads_omega_phase[k] is None:
                             pass
@@ -1506,38 +1706,32 @@ class SpecBeam(object):
                             mag*=np.cos(omega*tt[frame]+phase)
                         sum_mag +=mag
                     stationary_lines[j].xy = (stationary_loads_x[j],0)
-                    #stationary_lines[j].xyann = (stationary_loads_x[j], -mag/p_scale)
                     stationary_lines[j].xyann = (stationary_loads_x[j], sum_mag)
 
+            defl = self.defl_vs_x(frame, norm=norm)
+            if frame == frames[0]:
+                max_defl_evolve[:] = defl
+                min_defl_evolve[:] = defl
+            else:
+                np.maximum(defl, max_defl_evolve, out=max_defl_evolve)
+                np.minimum(defl, min_defl_evolve, out=min_defl_evolve)
 
+            min_line.set_data(xx, min_defl_evolve)
+            max_line.set_data(xx, max_defl_evolve)
 
-            min_line.set_data(xx, min_defl_evolve[:,frame])
-            max_line.set_data(xx, max_defl_evolve[:,frame])
-
-            data_line.set_data(xx, defl.T[frame])
+            data_line.set_data(xx, defl)
             time_text.set_text(time_template.format(tt[frame]))
-            return tuple(stationary_lines) + tuple(mvpl_lines) + (data_line,) + (time_text,) + (min_line,)+(max_line,)
+            return artists
+
+        if saveme:
+            if saveme is True:
+                saveme = self.file_stem + "_anim.mp4"
+            stream_animation(fig, artists, animate, frames, saveme,
+                             writer=writer, fps=fps, init_func=init)
 
-        self.ani = animation.FuncAnimation(fig, animate, len(tt),
+        self.ani = animation.FuncAnimation(fig, animate, frames,
                                       interval=interval, blit=True, init_func=init,repeat=True)
         fig.canvas.mpl_connect('button_press_event', self.onClick)
-#        anim_running = True
-#
-#        def onClick(event):
-#            nonlocal anim_running
-#            if anim_running:
-#                ani.event_source.stop()
-#                anim_running = False
-#            else:
-#                ani.event_source.start()
-#                anim_running = True
-
-
-
-        if saveme:
-            pass
-            self.ani.save(self.file_stem+"_anim.mp4", fps=15,codec="libx264")#changing the codec seems to work for me.
-#            ani.save(self.file_stem+"_anim", fps=15)#changing the codec seems to work for me.
 
         return self.ani
 
@@ -1928,7 +2122,8 @@ class MovingPointLoads(object):
 
         return ax
 
-    def animateme(self, x0=0, t0=0, tf=1,v0=1, xlim=None, ylim=None):
+    def animateme(self, x0=0, t0=0, tf=1,v0=1, xlim=None, ylim=None,
+                  nframes=100, interval=50, saveas=None, writer=None, fps=15):
         """Animate moving vehicle
 
         Parameters
@@ -1944,6 +2139,19 @@ class MovingPointLoads(object):
             positions will be multiplied by -1 before adjusting position.
         xlim, ylim : tuple of size 2, default xlim=ylim=None.
             axes limits.
+        nframes : int, optional
+            Number of frames between t0 and tf.  Default nframes=100.
+        interval : float, optional
+            Number of miliseconds for each frame.  Default interval=50.
+        saveas : str, optional
+            Filename to save animation to.  Frames are streamed to `writer`
+            one at a time (see `stream_animation`).  Default saveas=None
+            i.e. animation is not saved.
+        writer : str or matplotlib.animation.AbstractMovieWriter, optional
+            Writer used when saving.  Default writer=None i.e.
+            FFMpegWriter with codec="libx264".
+        fps : int, optional
+            Frames per second of saved animation. Default fps=15.
 
         Returns
         -------
@@ -2002,8 +2210,13 @@ class MovingPointLoads(object):
             time_text.set_text(time_template.format(t))
             return tuple(lines) + (time_text,)
 
-        ani = animation.FuncAnimation(fig, animate, np.linspace(t0,tf,100),
-                                      interval=50, blit=True, init_func=init,repeat=True)
+        if not saveas is None:
+            stream_animation(fig, tuple(lines) + (time_text,), animate,
+                             np.linspace(t0, tf, nframes), saveas,
+                             writer=writer, fps=fps, init_func=init)
+
+        ani = animation.FuncAnimation(fig, animate, np.linspace(t0,tf,nframes),
+                                      interval=interval, blit=True, init_func=init,repeat=True)
 
         return ani
 
@@ -2146,6 +2359,135 @@ class MovingPointLoads(object):
 #    return
 
 
+def _jsonable(obj):
+    """Convert SpecBeam input values to JSON serialisable python objects
+
+    ndarrays become lists, PolyLines become [x, y] lists and containers are
+    converted recursively.
+    """
+
+    if isinstance(obj, PolyLine):
+        return [obj.x.tolist(), obj.y.tolist()]
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    return obj
+
+
+def _hash_parameters(params):
+    """sha1 hex digest of a JSON serialisable parameter dict"""
+
+    text = json.dumps(params, sort_keys=True)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _save_npy(fname, arr):
+    """np.save via a temporary file that then replaces `fname`
+
+    `arr` may be memory mapped from `fname` itself (results loaded by
+    SpecBeam._load_defl_npy), so writing straight to `fname` would
+    truncate the file being read.  If `arr` is already memory mapped from
+    `fname` nothing is written.
+
+    """
+
+    if (isinstance(arr, np.memmap) and not arr.filename is None and
+            os.path.abspath(arr.filename) == os.path.abspath(fname)):
+        return
+    tmp = fname + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, arr)
+    os.replace(tmp, fname)
+
+
+def stream_animation(fig, artists, update, frames, fname, writer=None,
+                     fps=15, init_func=None):
+    """Write animation frames one at a time to a movie file using blitting
+
+    The static parts of the figure (axes, grid, labels etc.) are rendered
+    once.  For each frame `update` modifies the pre-allocated `artists`,
+    the static background is restored and only the `artists` are drawn
+    before the frame is sent to the writer.  Frames are never accumulated
+    in memory.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        Figure to animate.
+    artists : sequence of matplotlib.artist.Artist
+        Artists that change from frame to frame.
+    update : function
+        update(frame) modifies `artists` for each frame in frames.
+    frames : iterable
+        Values passed to `update`.
+    fname : str
+        Filename to write to.
+    writer : str or matplotlib.animation.AbstractMovieWriter, optional
+        Movie writer instance or name (e.g. 'ffmpeg', 'pillow').  Default
+        writer=None i.e. matplotlib.animation.FFMpegWriter with
+        codec="libx264".
+    fps : int, optional
+        Frames per second when making a writer.  Default fps=15.
+    init_func : function, optional
+        Called once before the background is rendered.  Default
+        init_func=None.
+
+    Notes
+    -----
+    Blitted frames are piped directly to external writers that accept raw
+    rgba frames (e.g. FFMpegWriter, ImageMagickWriter) when the canvas
+    buffer is exactly writer.frame_size pixels.  Other writers (e.g.
+    PillowWriter), or a canvas of a different size (e.g. HiDPI), receive
+    each frame via writer.grab_frame(), i.e. a full redraw.
+
+    """
+
+    if writer is None:
+        writer = animation.FFMpegWriter(fps=fps, codec="libx264")
+    elif isinstance(writer, str):
+        writer = animation.writers[writer](fps=fps)
+
+    if not init_func is None:
+        init_func()
+
+    canvas = fig.canvas
+    for artist in artists:
+        artist.set_animated(True)
+    try:
+        with writer.saving(fig, fname, dpi=fig.dpi):
+            # MovieWriter has no public way to send a pre-rendered frame,
+            # so blitted frames go to its pipe only if they are exactly
+            # the size the writer expects.
+            stdin = getattr(getattr(writer, "_proc", None), "stdin", None)
+            blit = (stdin is not None and
+                    getattr(writer, "frame_format", None) == "rgba" and
+                    hasattr(canvas, "copy_from_bbox") and
+                    hasattr(canvas, "buffer_rgba"))
+            if blit:
+                w, h = writer.frame_size
+                nbytes = w * h * 4
+                canvas.draw()
+                background = canvas.copy_from_bbox(fig.bbox)
+            for frame in frames:
+                update(frame)
+                if blit:
+                    canvas.restore_region(background)
+                    for artist in artists:
+                        fig.draw_artist(artist)
+                    buf = memoryview(canvas.buffer_rgba())
+                    blit = buf.nbytes == nbytes
+                    if blit:
+                        stdin.write(buf)
+                        continue
+                writer.grab_frame()
+    finally:
+        for artist in artists:
+            artist.set_animated(False)
+
+
 def align_yaxis(ax1, ax2):
     """Adjust y-axis limits so zeros of the two axes align, zooming them out
     by same ratio.
@@ -2368,6 +2710,8 @@ def SpecBeam_const_mat_midpoint_defl_runme_analytical_play():
     """Test SpecBeam for constant mat: close to Ding et al Figure 8, displacement vs time at
     beam midpoint (using the runme method) but with k3=0"""
 
+    from numpy.testing import assert_allclose
+
     start_time0 = time.time()
     ftime = datetime.datetime.fromtimestamp(start_time0).strftime('%Y-%m-%d %H%M%S')
 
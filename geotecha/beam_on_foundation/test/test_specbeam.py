@@ -25,11 +25,17 @@ from __future__ import division, print_function
 
 import numpy as np
 from numpy.testing import assert_allclose
+from nose.tools.trivial import ok_
+from testfixtures import TempDirectory
+from mock import patch
 
 import matplotlib.pyplot as plt
 import matplotlib
 import matplotlib.style
 import matplotlib as mpl
+import matplotlib.animation as animation
+import io
+import sys
 
 import time
 from datetime  import timedelta
@@ -41,6 +47,8 @@ import geotecha.piecewise.piecewise_linear_1d as pwise
 from geotecha.piecewise.piecewise_linear_1d import PolyLine
 
 from geotecha.beam_on_foundation.specbeam import SpecBeam
+from geotecha.beam_on_foundation.specbeam import MovingPointLoads
+from geotecha.beam_on_foundation.specbeam import stream_animation
 #from geotecha.beam_on_foundation.specbeam import MovingPointLoads
 #from geotecha.beam_on_foundation.dingetal2012 import DingEtAl2012
 
@@ -1139,6 +1147,228 @@ def test_SpecBeam_const_mat_deflection_shape_stationary_load():
     assert_allclose(expected_50terms_displacement, ycompare, atol=2.4e-4)
 
 
+def test_SpecBeam_saveme_load_defl_npy():
+    """SpecBeam file_format='npy' round trip, memory mapped and hash checked"""
+
+    t = np.linspace(0, 2, 20)
+    pdict = OrderedDict(
+            E = 6.998*1e9, #Pa
+            rho = 2373, #kg/m3
+            L = 160, #m
+            kf=5.41e-4,
+            mu_norm=39.263,
+            k1_norm=97.552,
+            nterms=10,
+            BC="SS",
+            nquad=20,
+            stationary_loads_x_norm=[0.5],
+            stationary_loads_vs_t_norm=[PolyLine([0, 10], [1.013e-4, 1.013e-4])],
+            tvals=t,
+            xvals=np.linspace(0, 160, 15),
+            use_analytical=True,
+            implementation="vectorized",
+            file_format="npy",
+            )
+
+    tempdir = TempDirectory()
+    try:
+        pdict["file_stem"] = os.path.join(tempdir.path, "sb")
+        a = SpecBeam(**pdict)
+        a.runme()
+        a.saveme()
+
+        ok_(os.path.isfile(pdict["file_stem"] + "_defl_norm.npy"))
+        ok_(os.path.isfile(pdict["file_stem"] + "_defl_norm.json"))
+
+        b = SpecBeam(**pdict)
+        ok_(b.load_defl())
+        ok_(isinstance(b.defl_norm, np.memmap))
+        assert_allclose(b.defl_norm, a.defl_norm)
+        assert_allclose(b.defl, a.defl)
+
+        #run from the cached (memory mapped) result then save again
+        b.runme()
+        b.saveme()
+        c = SpecBeam(**pdict)
+        ok_(c.load_defl())
+        assert_allclose(c.defl_norm, a.defl_norm)
+        assert_allclose(c.defl, a.defl)
+        ok_(not os.path.isfile(pdict["file_stem"] + "_defl_norm.npy.tmp"))
+
+        #different input should not pick up stale results
+        pdict["k1_norm"] = 50.0
+        c = SpecBeam(**pdict)
+        ok_(not c.load_defl())
+    finally:
+        tempdir.cleanup()
+
+
+def _stationary_load_pdict():
+    """Small stationary load SpecBeam input for quick tests"""
+
+    return OrderedDict(
+            E = 6.998*1e9, #Pa
+            rho = 2373, #kg/m3
+            L = 160, #m
+            kf=5.41e-4,
+            mu_norm=39.263,
+            k1_norm=97.552,
+            nterms=10,
+            BC="SS",
+            nquad=20,
+            stationary_loads_x_norm=[0.5],
+            stationary_loads_vs_t_norm=[PolyLine([0, 10], [1.013e-4, 1.013e-4])],
+            tvals=np.linspace(0, 2, 40),
+            xvals=np.linspace(0, 160, 15),
+            use_analytical=True,
+            implementation="vectorized",
+            force_calc=True,
+            )
+
+
+class RawFramesWriter(animation.MovieWriter):
+    """Pipe based movie writer that copies the raw rgba frames to file"""
+
+    def _args(self):
+        return [sys.executable, "-c",
+                "import shutil, sys; shutil.copyfileobj(sys.stdin.buffer, "
+                "open(sys.argv[1], 'wb'))", self.outfile]
+
+
+def test_SpecBeam_defl_vs_x_make_defl_False():
+    """SpecBeam.defl_vs_x from Galerkin coefficients matches defl_norm"""
+
+    pdict = _stationary_load_pdict()
+    a = SpecBeam(**pdict)
+    a.runme()
+    b = SpecBeam(**pdict)
+    b.runme(make_defl=False)
+
+    ok_(not hasattr(b, "defl_norm"))
+    assert_allclose(b.defl_vs_x(), a.defl_norm)
+    assert_allclose(b.defl_vs_x([3, 7], norm=False), a.defl[:, [3, 7]])
+    assert_allclose(a.defl_vs_x(5), a.defl_norm[:, 5])
+
+
+def test_stream_animation_blit():
+    """stream_animation blitted frames match full redraw"""
+
+    tempdir = TempDirectory()
+    try:
+        fig = plt.figure(figsize=(3, 2))
+        ax = fig.add_subplot(111)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(-1, 1)
+        ax.grid()
+        line, = ax.plot([], [])
+        text = ax.text(0.1, 0.8, "")
+        # keep clear of the spines, which are drawn over lines in a full
+        # redraw but under the blitted lines.
+        x = np.linspace(0.05, 0.95, 50)
+
+        def update(t):
+            line.set_data(x, 0.5 * np.sin(2 * np.pi * (x - t)))
+            text.set_text("t={:.2f}".format(t))
+
+        fname = os.path.join(tempdir.path, "anim.raw")
+        stream_animation(fig, (line, text), update, np.linspace(0, 1, 7),
+                         fname, writer=RawFramesWriter(fps=5))
+
+        w, h = fig.canvas.get_width_height()
+        with open(fname, "rb") as f:
+            data = f.read()
+        ok_(len(data) == 7 * w * h * 4)
+        ok_(not line.get_animated())
+
+        buf = io.BytesIO()
+        fig.savefig(buf, format="rgba", dpi=fig.dpi)
+        ok_(buf.getvalue() == data[-w * h * 4:])
+        plt.close(fig)
+    finally:
+        tempdir.cleanup()
+
+
+class WrongSizeRawFramesWriter(RawFramesWriter):
+    """RawFramesWriter expecting a different frame size, as with HiDPI"""
+
+    @property
+    def frame_size(self):
+        w, h = RawFramesWriter.frame_size.fget(self)
+        return 2 * w, 2 * h
+
+
+def test_stream_animation_blit_wrong_size():
+    """stream_animation canvas not the writer's frame size uses grab_frame"""
+
+    tempdir = TempDirectory()
+    try:
+        fig = plt.figure(figsize=(3, 2))
+        ax = fig.add_subplot(111)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(-1, 1)
+        line, = ax.plot([], [])
+        x = np.linspace(0.05, 0.95, 50)
+
+        def update(t):
+            line.set_data(x, 0.5 * np.sin(2 * np.pi * (x - t)))
+
+        fname = os.path.join(tempdir.path, "anim.raw")
+        writer = WrongSizeRawFramesWriter(fps=5)
+        with patch.object(writer, "grab_frame",
+                          wraps=writer.grab_frame) as grab:
+            stream_animation(fig, (line,), update, np.linspace(0, 1, 3),
+                             fname, writer=writer)
+        ok_(grab.call_count == 3)
+
+        w, h = fig.canvas.get_width_height()
+        with open(fname, "rb") as f:
+            data = f.read()
+        ok_(len(data) == 3 * w * h * 4)
+        plt.close(fig)
+    finally:
+        tempdir.cleanup()
+
+
+def test_SpecBeam_animateme_saveme():
+    """SpecBeam.animateme streams frames to writer"""
+
+    pdict = _stationary_load_pdict()
+    tempdir = TempDirectory()
+    try:
+        pdict["file_stem"] = os.path.join(tempdir.path, "sb")
+        a = SpecBeam(**pdict)
+        a.runme(make_defl=False)
+
+        ani = a.animateme(saveme=True, writer=RawFramesWriter(fps=15),
+                          frames=5)
+        w, h = ani._fig.canvas.get_width_height()
+        fname = pdict["file_stem"] + "_anim.mp4"
+        ok_(os.path.getsize(fname) == 5 * w * h * 4)
+        plt.close(ani._fig)
+
+        fname = os.path.join(tempdir.path, "sb.gif")
+        ani = a.animateme(saveme=fname, writer="pillow", frames=[0, 10, 20])
+        ok_(os.path.getsize(fname) > 0)
+        plt.close(ani._fig)
+    finally:
+        tempdir.cleanup()
+
+
+def test_MovingPointLoads_animateme_saveas():
+    """MovingPointLoads.animateme saveas"""
+
+    tempdir = TempDirectory()
+    try:
+        fname = os.path.join(tempdir.path, "mvpl.gif")
+        a = MovingPointLoads(x=[0, 1], p=[1, 2])
+        ani = a.animateme(xlim=(-1, 5), ylim=(0, 3), nframes=5,
+                          saveas=fname, writer="pillow")
+        ok_(os.path.getsize(fname) > 0)
+        plt.close(ani._fig)
+    finally:
+        tempdir.cleanup()
+
+
 if __name__ == "__main__":
     mpl.style.use('classic')
     import nose
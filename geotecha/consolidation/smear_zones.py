@@ -27,6 +27,7 @@ from matplotlib import pyplot as plt
 #import cmath
 from numpy import log, sqrt
 import scipy.special as special
+import functools
 
 def mu_ideal(n, *args):
     """Smear zone permeability/geometry parameter for ideal drain (no smear)
@@ -1134,6 +1135,213 @@ def mu_piecewise_linear(s, kap, n=None, kap_m=None):
     return mu
 
 
+def _piecewise_profiles(s, kap, n=None, kap_m=None):
+    """Broadcast batches of piecewise smear zone profiles
+
+    `s` and `kap` have the zone axis last.  If `n` is given it (and
+    `kap_m`, or the last kap if kap_m is None) is appended along the zone
+    axis after broadcasting the leading dimensions of all inputs.
+
+    Returns
+    -------
+    s, kap : ndarray
+        Profiles of shape (..., nzones).
+    """
+
+    s = np.atleast_1d(np.asarray(s, dtype=float))
+    kap = np.atleast_1d(np.asarray(kap, dtype=float))
+    if s.shape[-1] != kap.shape[-1]:
+        raise ValueError('s and kap must have the same number of zones.  '
+                         'You have {}, {}.'.format(s.shape[-1],
+                                                   kap.shape[-1]))
+
+    lead = [s.shape[:-1], kap.shape[:-1]]
+    if not n is None:
+        n = np.asarray(n, dtype=float)
+        if kap_m is None:
+            kap_m = kap[..., -1]
+        kap_m = np.asarray(kap_m, dtype=float)
+        lead.extend([n.shape, kap_m.shape])
+    lead = np.broadcast_shapes(*lead)
+
+    s = np.broadcast_to(s, lead + s.shape[-1:])
+    kap = np.broadcast_to(kap, lead + kap.shape[-1:])
+    if not n is None:
+        s = np.concatenate([s, np.broadcast_to(n, lead)[..., np.newaxis]],
+                           axis=-1)
+        kap = np.concatenate(
+            [kap, np.broadcast_to(kap_m, lead)[..., np.newaxis]], axis=-1)
+    return s, kap
+
+
+def vmu_piecewise_constant(s, kap, n=None, kap_m=None):
+    """Smear zone parameter for batches of piecewise constant permeability
+
+    Vectorised version of `mu_piecewise_constant` for many zone parameter
+    sets and/or many n values at once.  The nested loops over zones are
+    replaced by cumulative sums along the zone axis.
+
+    Parameters
+    ----------
+    s : array_like of float
+        Ratio of segment outer radii to drain radius (r_i/r_0) with the
+        zone axis last, e.g. shape (nzones,) or (nsets, nzones).
+    kap : array_like of float
+        Ratio of undisturbed horizontal permeability to permeability in
+        each segment kh/khi.  Same zone axis as `s`; leading dimensions
+        are broadcast against those of `s`.
+    n, kap_m : float or array_like of float, optional
+        If `n` is given then it and `kap_m` are appended to the zone
+        axis of `s` and `kap` after broadcasting against the leading
+        dimensions of `s` and `kap`.  If n is given but kap_m is None then
+        the last kappa value in kap will be used.  Default n=kap_m=None.
+
+    Returns
+    -------
+    mu : ndarray of float
+        Smear zone permeability/geometry parameter with the broadcast
+        leading shape (a float if that shape is ()).
+
+    See Also
+    --------
+    mu_piecewise_constant : Single profile version.
+
+    Examples
+    --------
+    >>> vmu_piecewise_constant([1.5, 3], [2, 1], n=[5, 10, 20])
+    array([1.308..., 1.975..., 2.657...])
+    >>> vmu_piecewise_constant([[1.5, 3], [2, 4]], [2, 1], n=5)
+    array([1.308..., 1.539...])
+
+    """
+
+    s, kap = _piecewise_profiles(s, kap, n, kap_m)
+
+    if np.any(s <= 1.0):
+        raise ValueError('must have all s>1.')
+    if np.any(kap <= 0.0):
+        raise ValueError('all kap must be greater than 0.')
+    if np.any(np.diff(s, axis=-1) <= 0):
+        raise ValueError('s must increase left to right.')
+
+    n2 = s[..., -1:]**2
+    s_ = np.ones_like(s)
+    s_[..., 1:] = s[..., :-1]
+    ds2 = (s**2 - s_**2) / n2
+    logs = log(s / s_)
+
+    # psi[i] = sum(kap[j] * (...) for j < i) / kap[i]
+    psi = np.zeros_like(s)
+    psi[..., 1:] = np.cumsum(kap * (logs - 0.5 * ds2), axis=-1)[..., :-1]
+    psi /= kap
+
+    sumi = np.sum(kap * (s**2 / n2 * logs
+                         + (psi - 0.5) * ds2
+                         - 0.25 * ds2**2), axis=-1)
+    mu = sumi * n2[..., 0] / (n2[..., 0] - 1)
+    return mu[()]
+
+
+def vmu_piecewise_linear(s, kap, n=None, kap_m=None):
+    """Smear zone parameter for batches of piecewise linear permeability
+
+    Vectorised version of `mu_piecewise_linear` for many zone parameter
+    sets and/or many n values at once.  The three cases for each segment
+    (constant kap, kap proportional to s, general) are selected with
+    masks and the sum over earlier segments is a cumulative sum along the
+    zone axis.
+
+    Parameters
+    ----------
+    s : array_like of float
+        Ratio of radii to drain radius (r_i/r_0) with the zone axis
+        last.  The first value on the zone axis must be 1.
+    kap : array_like of float
+        Ratio of undisturbed horizontal permeability to permeability at
+        each value of s.  Same zone axis as `s`; leading dimensions are
+        broadcast against those of `s`.
+    n, kap_m : float or array_like of float, optional
+        If `n` is given then it and `kap_m` are appended to the zone
+        axis of `s` and `kap` after broadcasting against the leading
+        dimensions of `s` and `kap`.  If n is given but kap_m is None then
+        the last kappa value in kap will be used.  Default n=kap_m=None.
+
+    Returns
+    -------
+    mu : ndarray of float
+        Smear zone permeability/geometry parameter with the broadcast
+        leading shape (a float if that shape is ()).
+
+    See Also
+    --------
+    mu_piecewise_linear : Single profile version.
+
+    Examples
+    --------
+    >>> vmu_piecewise_linear([1, 5, 5], [2, 2, 1], n=[10, 20])
+    array([2.977..., 3.808...])
+
+    """
+
+    s, kap = _piecewise_profiles(s, kap, n, kap_m)
+
+    if np.any(s < 1.0):
+        raise ValueError('must have all s>=1.')
+    if np.any(kap <= 0.0):
+        raise ValueError('all kap must be greater than 0.')
+    if np.any(np.diff(s, axis=-1) < 0):
+        raise ValueError('All s must satisfy s[i]>s[i-1].')
+    if not np.all(np.isclose(s[..., 0], 1)):
+        raise ValueError('First value of s should be 1.')
+
+    n2 = s[..., -1:]**2
+    n4 = n2**2
+    sl = s[..., :-1]
+    sr = s[..., 1:]
+    kl = kap[..., :-1]
+    kr = kap[..., 1:]
+
+    same_s = np.isclose(sl, sr)
+    same_k = np.isclose(kl, kr) & ~same_s
+    prop = np.isclose(kl / kr, sr / sl) & ~(same_s | same_k)
+    gen = ~(same_s | same_k | prop)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ds = sr - sl
+        ds2 = sr**2 - sl**2
+        logs = log(sr / sl)
+        logk = log(kl / kr)
+        A = (kl / kr - 1) / ds
+        B = (sr - kl / kr * sl) / ds
+
+        # term for later segments (psi) and term for own segment (theta)
+        psi = np.where(same_k, logs - ds2 / 2 / n2, 0.0)
+        psi = np.where(prop, ds * (n2 - sl * sr) / sr / n2, psi)
+        psi = np.where(gen, (1 / B * logs
+                             + (B / A**2 / n2 - 1 / B) * logk
+                             - ds / A / n2), psi)
+
+        theta = np.where(same_k, (sr**2 / n2 * logs - ds2 / 2 / n2
+                                  - ds2**2 / 4 / n4), 0.0)
+        theta = np.where(prop, ds**2 / 3 / n4 * (3 * n2 - sl**2
+                                                 - 2 * sl * sr), theta)
+        theta = np.where(gen, (sr**2 / B / n2 * log(kr * sr / kl / sl)
+                               - ds / A / n2 * (1 - B**2 / A**2 / n2)
+                               - ds**2 / 3 / A / n4 * (sl + 2 * sr)
+                               + B / A**2 / n2 * logk
+                               * (1 - B**2 / A**2 / n2)
+                               + B / 2 / A**2 / n4
+                               * (sr**2 * (2 * logk - 1) + sl**2)), theta)
+
+    # Psi[i] = sum(kap[j-1] * psi[j] for j < i)
+    Psi = np.zeros_like(psi)
+    Psi[..., 1:] = np.cumsum(kl * psi, axis=-1)[..., :-1]
+
+    sumi = np.sum(kl * theta + Psi * ds2 / n2, axis=-1)
+    mu = sumi * n2[..., 0] / (n2[..., 0] - 1)
+    return mu[()]
+
+
 def mu_well_resistance(kh, qw, n, H, z=None):
     """Additional smear zone parameter for well resistance
 
@@ -2749,6 +2957,199 @@ def back_calc_drain_spacing_from_eta(eta, pattern, mu_function, rw, s, kap, muw=
     return sp[0], re, n
 
 
+def _mu_batch(mu_function, n, s, kap):
+    """mu for an array of n
+
+    For mu_piecewise_constant and mu_piecewise_linear `s` and `kap` are the
+    smear zone profile shared by all n.  For other mu functions `s` and
+    `kap` are broadcast against `n`.
+    """
+
+    n = np.asarray(n, dtype=float)
+    if mu_function == mu_ideal:
+        return mu_ideal(n)
+    if mu_function == mu_piecewise_constant:
+        return vmu_piecewise_constant(s, kap, n=n)
+    if mu_function == mu_piecewise_linear:
+        return vmu_piecewise_linear(s, kap, n=n)
+
+    n, s, kap = [np.array(v, dtype=float) for v in
+                 np.broadcast_arrays(n, s, kap)]
+    return mu_function(n, s, kap)
+
+
+def vback_calc_drain_spacing_from_eta(eta, pattern, mu_function, rw, s, kap,
+                                      muw=0, rtol=1e-12, maxiter=50):
+    """Back calculate required drain spacings for arrays of design inputs
+
+    Vectorised version of `back_calc_drain_spacing_from_eta`.
+
+    eta = 2 / re**2 / (mu + muw)
+
+    The equation is solved for n=re/rw in the form
+    log(n**2 * (mu(n) + muw)) = log(2 / (eta * rw**2)), whose left hand side
+    increases with n. All entries are solved together: the root is
+    bracketed by repeatedly doubling n from the smear zone extent, then
+    refined with Newton iterations in log(n) that fall back to bisection
+    whenever a step leaves the bracket.
+
+    Parameters
+    ----------
+    eta : float or array_like of float
+        eta value(s).
+    pattern : ['Triangle', 'Square'] or array_like of str
+        Drain installation pattern(s).  Only the first letter is used.
+    mu_function : obj or string
+        The mu_funtion to use. e.g. mu_ideal, mu_constant, mu_linear,
+        mu_overlapping_linear, mu_parabolic, mu_piecewise_constant,
+        mu_piecewise_linear.  This can either be the function object itself
+        or the name of the function e.g. 'mu_ideal'.
+    rw : float or array_like of float
+        Drain/well radius.
+    s, kap : float or array_like of float
+        Ratio of smear zone radius to drain radius (rs/rw) and ratio of
+        undisturbed horizontal permeability to smear zone permeability.
+        For mu_piecewise_constant and mu_piecewise_linear `s` and `kap`
+        are 1d arrays describing a single smear zone profile (see
+        `back_calc_drain_spacing_from_eta`) that is used for every entry.
+        For other mu functions `s` and `kap` are broadcast with `eta`,
+        `rw`, `muw` and `pattern`.
+    muw : float or array_like of float, optional
+        Well resistance mu term, default muw=0.
+    rtol : float, optional
+        Relative tolerance on n. Default rtol=1e-12.
+    maxiter : int, optional
+        Maximum number of Newton/bisection iterations.  Default maxiter=50.
+
+    Returns
+    -------
+    sp : ndarray of float
+        Drain spacing to get the required eta value.
+    re : ndarray of float
+        Drain influence radius.
+    n : ndarray of float
+        Ratio of drain influence radius to drain radius, re/rw.
+    feasible : ndarray of bool
+        False where the required eta cannot be reached without n falling
+        below the smear zone extent s (or below 1 for mu_ideal and
+        mu_overlapping_linear).  sp, re, and n are nan for such entries.
+
+    All outputs have the broadcast shape of the inputs (floats and a bool
+    if all inputs are scalars).
+
+    See Also
+    --------
+    back_calc_drain_spacing_from_eta : Single spacing with fsolve.
+
+    Examples
+    --------
+    >>> sp, re, n, ok = vback_calc_drain_spacing_from_eta(
+    ...     [0.71017973670799939, 50], 't', mu_constant, 0.05, 5, 2, muw=1)
+    >>> sp
+    array([1.5, nan])
+    >>> ok
+    array([ True, False])
+
+    """
+
+    try:
+        mu_fn = globals()[mu_function]
+    except (KeyError, TypeError):
+        mu_fn = mu_function
+
+    piecewise = mu_fn in [mu_piecewise_constant, mu_piecewise_linear]
+
+    pattern = np.char.upper(np.asarray(pattern, dtype=str))
+    tri = np.char.startswith(pattern, 'T')
+    if not np.all(tri | np.char.startswith(pattern, 'S')):
+        raise ValueError("pattern must begin with 'T' for triangular "
+                         " or 'S' for square.  You have pattern="
+                         "{}".format(pattern))
+    factor = np.where(tri, 0.525037567904332, 0.5641895835477563)
+
+    if piecewise:
+        s = np.atleast_1d(np.asarray(s, dtype=float))
+        kap = np.atleast_1d(np.asarray(kap, dtype=float))
+        eta, rw, muw, factor = np.broadcast_arrays(eta, rw, muw, factor)
+        s_ = kap_ = None
+        nmin = np.max(s)
+    else:
+        eta, rw, muw, factor, s, kap = np.broadcast_arrays(eta, rw, muw,
+                                                           factor, s, kap)
+        if mu_fn in [mu_ideal, mu_overlapping_linear]:
+            nmin = np.ones(eta.shape)
+        else:
+            nmin = s.astype(float)
+    shape = eta.shape
+
+    eta, rw, muw, factor = [np.array(v, dtype=float).ravel()
+                            for v in [eta, rw, muw, factor]]
+    if not piecewise:
+        s_ = np.array(s, dtype=float).ravel()
+        kap_ = np.array(kap, dtype=float).ravel()
+    if np.any(eta <= 0) or np.any(rw <= 0):
+        raise ValueError('eta and rw must be greater than zero.')
+
+    logtarget = np.log(2 / (eta * rw**2))
+    size = len(eta)
+
+    def G(x, i):
+        """log(n**2 * (mu + muw)) - log(target) at x=log(n) for entries i"""
+        n = np.exp(x)
+        if piecewise:
+            mu = _mu_batch(mu_fn, n, s, kap)
+        else:
+            mu = _mu_batch(mu_fn, n, s_[i], kap_[i])
+        return 2 * x + np.log(mu + muw[i]) - logtarget[i]
+
+    idx = np.arange(size)
+    xlo = np.log(np.broadcast_to(nmin, shape).ravel().astype(float)
+                 * (1 + 1e-9))
+    glo = G(xlo, idx)
+    feasible = glo <= 0
+
+    # bracket by doubling n
+    xhi = xlo.copy()
+    ghi = glo.copy()
+    i = idx[feasible]
+    while len(i):
+        xlo[i] = xhi[i]
+        glo[i] = ghi[i]
+        xhi[i] += np.log(2)
+        ghi[i] = G(xhi[i], i)
+        i = i[ghi[i] < 0]
+
+    # safeguarded newton in x=log(n)
+    x = np.where(feasible, xhi, np.nan)
+    gx = np.where(feasible, ghi, np.nan)
+    i = idx[feasible & (gx != 0)]
+    h = 1e-7
+    for it in range(maxiter):
+        if not len(i):
+            break
+        dg = (G(x[i] + h, i) - gx[i]) / h
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xnew = x[i] - gx[i] / dg
+        bad = ~((xnew > xlo[i]) & (xnew < xhi[i]))
+        xnew[bad] = 0.5 * (xlo[i][bad] + xhi[i][bad])
+        done = np.abs(xnew - x[i]) <= rtol
+        x[i] = xnew
+        gx[i] = G(xnew, i)
+        up = gx[i] < 0
+        xlo[i[up]] = xnew[up]
+        xhi[i[~up]] = xnew[~up]
+        i = i[~done & (gx[i] != 0) & (xhi[i] - xlo[i] > rtol)]
+
+    n = np.exp(x)
+    re = n * rw
+    sp = re / factor
+
+    if shape == ():
+        return sp[0], re[0], n[0], feasible[0]
+    return (sp.reshape(shape), re.reshape(shape), n.reshape(shape),
+            feasible.reshape(shape))
+
+
 def _g(r_rw, re_rw, nflow=1.0001, nterms=20):
     """Non-darcian equal strain radial consolidation term
 
@@ -2769,8 +3170,9 @@ def _g(r_rw, re_rw, nflow=1.0001, nterms=20):
 
     Returns
     -------
-    g : float
-        Non-darcian equal strain radial consolidation term.
+    g : float or ndarray
+        Non-darcian equal strain radial consolidation term. Array inputs
+        are broadcast against each other.
 
     Notes
     -----
@@ -2878,38 +3280,7 @@ def _g(r_rw, re_rw, nflow=1.0001, nterms=20):
 
 
 
-    if np.any([len(np.asarray(v).shape)>0 for v in
-                [r_rw, re_rw, nflow, nterms]]):
-        #array inputs, use series loop
-        g = 0
-        term1 = nflow * r_rw**(1-1.0/nflow)
-        for j in range(nterms):
-
-            term2 = special.poch(-1.0 / nflow, j)
-            term3 = np.math.factorial(j)
-            term4 = (2 * j + 1) * nflow - 1
-            term5 = (r_rw / re_rw)**(2 * j)
-            g += term2 / term3 / term4 * term5
-
-        g *= term1
-        return g
-
-    else:
-        #scalar inputs, use recursion relationship
-
-        a = np.zeros(nterms)
-
-        a[0] = nflow / (nflow - 1.0) * r_rw**(1.0 - 1.0 / nflow)
-        j = np.arange(1, nterms)
-        a[1:] = (r_rw / re_rw)**2
-        a[1:] *= (j * nflow - nflow - 1)
-        a[1:] *= (2* j * nflow - nflow - 1)
-        a[1:] /= nflow * j * (2 * j * nflow + nflow - 1)
-
-        np.cumprod(a, out=a)
-        g=np.sum(a)
-
-        return g
+    return _g_series(r_rw, re_rw, nflow, nterms, bar=False)
 
 
 def _gbar(r_rw, re_rw, nflow=1.0001, nterms=20):
@@ -2935,8 +3306,9 @@ def _gbar(r_rw, re_rw, nflow=1.0001, nterms=20):
 
     Returns
     -------
-    gbar : float
-        Non-darcian equal strain radial consolidation term.
+    gbar : float or ndarray
+        Non-darcian equal strain radial consolidation term. Array inputs
+        are broadcast against each other.
 
     Notes
     -----
@@ -3046,38 +3418,89 @@ def _gbar(r_rw, re_rw, nflow=1.0001, nterms=20):
 
 
 
-    if np.any([len(np.asarray(v).shape)>0 for v in
-                [r_rw, re_rw, nflow, nterms]]):
-        #array inputs, use series loop
-        gbar = 0
-        term1 = nflow**2 * r_rw**(3 - 1.0/nflow)
-        for j in range(nterms):
+    return _g_series(r_rw, re_rw, nflow, nterms, bar=True)
+
+
+def _g_coefficient_array(nflow, nterms, bar=False):
+    """Coefficients of the `_g` or `_gbar` series for a 1d array of nflow
+
+    g = y**(1 - 1/nflow) * sum(c[j] * (y/N)**(2*j)) and
+    gbar = y**(3 - 1/nflow) * sum(c[j] * (y/N)**(2*j)).
+    Returns array of shape (len(nflow), nterms).
+    """
+
+    nflow = np.asarray(nflow, dtype=float)[:, np.newaxis]
+    c = np.empty((nflow.shape[0], nterms), dtype=float)
+    j = np.arange(1, nterms)[np.newaxis, :]
+    if bar:
+        c[:, :1] = nflow**2 / (nflow - 1.0) / (3 * nflow - 1.0)
+        c[:, 1:] = nflow * j * (2 * j * nflow + 3 * nflow - 1)
+    else:
+        c[:, :1] = nflow / (nflow - 1.0)
+        c[:, 1:] = nflow * j * (2 * j * nflow + nflow - 1)
+    c[:, 1:] = (j * nflow - nflow - 1) * (2 * j * nflow - nflow - 1) / c[:, 1:]
+    np.cumprod(c, axis=1, out=c)
+    return c
+
+
+@functools.lru_cache(maxsize=256)
+def _g_coefficients(nflow, nterms, bar=False):
+    """Cached `_g_coefficient_array` for a single nflow (read only 1d array)"""
+
+    c = _g_coefficient_array([nflow], nterms, bar)[0]
+    c.setflags(write=False)
+    return c
+
 
-            term2 = special.poch(-1.0 / nflow, j)
-            term3 = np.math.factorial(j)
-            term4 = (2 * j + 1) * nflow - 1
-            term4a = (2 * j + 3) * nflow - 1
-            term5 = (r_rw/re_rw)**(2*j)
-            gbar += term2/term3/term4/term4a*term5
+def _g_series(r_rw, re_rw, nflow, nterms, bar=False):
+    """Evaluate the `_g` (bar=False) or `_gbar` (bar=True) series
 
-        gbar *= term1
-        return gbar
+    Inputs are broadcast against each other and the series is summed by
+    Horner's rule over the (..., nterms) coefficients.  The nflow dependent
+    coefficients come from `_g_coefficients` (cached), and terms beyond the
+    point where they no longer affect the sum at the largest y/N are
+    dropped.
+    """
 
+    scalar = all(np.ndim(v) == 0 for v in [r_rw, re_rw, nflow])
+    if np.ndim(nflow) == 0:
+        nflow_u = [float(nflow)]
     else:
+        nflow_u, inverse = np.unique(nflow, return_inverse=True)
+        inverse = inverse.reshape(np.shape(nflow))
+    r_rw, re_rw, nflow = np.broadcast_arrays(np.asarray(r_rw, dtype=float),
+                                             np.asarray(re_rw, dtype=float),
+                                             np.asarray(nflow, dtype=float))
+    if len(nflow_u) <= 16:
+        c = np.array([_g_coefficients(v, nterms, bar) for v in nflow_u])
+    else:
+        c = _g_coefficient_array(nflow_u, nterms, bar)
 
-        a = np.zeros(nterms)
+    x = (r_rw / re_rw)**2
 
-        a[0] = nflow**2 / (nflow - 1.0)/(3 * nflow - 1.0) * r_rw**(3.0 - 1.0 / nflow)
-        j = np.arange(1, nterms)
-        a[1:] = (r_rw / re_rw)**2
-        a[1:] *= (j * nflow - nflow - 1)
-        a[1:] *= (2* j * nflow - nflow - 1)
-        a[1:] /= nflow * j * (2 * j * nflow + 3 * nflow - 1)
+    # tail based truncation: drop terms negligible at the largest x
+    if x.size:
+        mag = np.max(np.abs(c), axis=0) * np.max(x)**np.arange(nterms)
+        keep = np.nonzero(mag > 1e-3 * np.finfo(float).eps * mag[0])[0]
+        c = c[:, :keep[-1] + 1]
 
-        np.cumprod(a, out=a)
-        gbar=np.sum(a)
+    # Horner's rule along the coefficient axis
+    if len(nflow_u) == 1:
+        c = c[0]
+    else:
+        c = c[np.broadcast_to(inverse, x.shape)]
+    series = c[..., -1] * np.ones_like(x)
+    for j in range(c.shape[-1] - 2, -1, -1):
+        series *= x
+        series += c[..., j]
+    if bar:
+        g = series * r_rw**(3.0 - 1.0 / nflow)
+    else:
+        g = series * r_rw**(1.0 - 1.0 / nflow)
 
-        return gbar
+    if scalar:
+        return g[()]
+    return g
 
 
 def non_darcy_beta_ideal(n, nflow=1.0001, nterms=20, *args):
@@ -3466,27 +3889,33 @@ def non_darcy_beta_piecewise_constant(s, kap, n=None, kap_m=None,
     s_ = np.ones_like(s , dtype=float)
     s_[1:] = s[:-1]
 
-    sumi = 0
-    for i in range(len(s)):
-        psi = 0
-        for j in range(i):
-            psi+= kap[j]**(1 / nflow) *(
-                    _g(s[j], n, nflow, nterms)
-                    - _g(s_[j], n, nflow, nterms)
-                    )
-        psi /= kap[i]**(1 / nflow)
-
+    kapn = kap**(1 / nflow)
+    g_s_ = _g(s_, n, nflow, nterms)
+    psi = _non_darcy_psi(kapn, _g(s, n, nflow, nterms), g_s_)
 
-        sumi += kap[i]**(1 / nflow) * (
-            2 * _gbar(s[i], n, nflow, nterms)
-            - 2 * _gbar(s_[i], n, nflow, nterms)
-            +(psi - _g(s_[i], n, nflow, nterms) )* (s[i]**2 - s_[i]**2)
-            )
+    sumi = np.sum(kapn * (
+        2 * _gbar(s, n, nflow, nterms)
+        - 2 * _gbar(s_, n, nflow, nterms)
+        + (psi - g_s_) * (s**2 - s_**2)
+        ))
 
     beta = sumi / (n**2 - 1)
     return beta
 
 
+def _non_darcy_psi(kapn, g_s, g_s_):
+    """psi term for each segment of a non-darcian piecewise constant profile
+
+    psi[i] = sum(kapn[j] * (g_s[j] - g_s_[j]) for j < i) / kapn[i] where
+    kapn = kap**(1/nflow) and g_s, g_s_ are `_g` at the outer and inner
+    radii of each segment.
+    """
+
+    psi = np.zeros_like(kapn, dtype=float)
+    psi[1:] = np.cumsum(kapn * (g_s - g_s_))[:-1]
+    return psi / kapn
+
+
 def non_darcy_u_piecewise_constant(s, kap, si, uavg=1, uw=0, muw=0,
                                    n=None, kap_m=None,
                                    nflow=1.0001, nterms=20):
@@ -3648,8 +4077,6 @@ def non_darcy_u_piecewise_constant(s, kap, si, uavg=1, uw=0, muw=0,
     s_ = np.ones_like(s)
     s_[1:] = s[:-1]
 
-    u = np.empty_like(si, dtype=float )
-
     segment = np.searchsorted(s, si)
 
     beta = non_darcy_beta_piecewise_constant(s, kap,
@@ -3657,32 +4084,15 @@ def non_darcy_u_piecewise_constant(s, kap, si, uavg=1, uw=0, muw=0,
 
     term1 = (uavg - uw) / (beta + muw)
 
-    for ii, i in enumerate(segment):
-
-        psi = 0
-        for j in range(i):
-
-            psi+= kap[j]**(1 / nflow) *(
-                    _g(s[j], n, nflow, nterms)
-                    - _g(s_[j], n, nflow, nterms)
-                    )
-        psi /= kap[i]**(1 / nflow)
-
-#            sumj += (kap[j] * (log(s[j] / s_[j])
-#                    - 0.5 * (s[j] ** 2 / n ** 2 - s_[j] ** 2 / n ** 2)))
-#        sumj = sumj / kap[i]
-
-        u[ii] = kap[i]**(1 / nflow) * (
-                _g(si[ii], n, nflow, nterms)
-                -_g(s_[i], n, nflow, nterms)
-                + psi
-                ) + muw
+    kapn = kap**(1 / nflow)
+    g_s_ = _g(s_, n, nflow, nterms)
+    psi = _non_darcy_psi(kapn, _g(s, n, nflow, nterms), g_s_)
 
-#        u[ii] = kap[i] * (
-#                log(si[ii] / s_[i])
-#                - 0.5 * (si[ii] ** 2 / n ** 2 - s_[i] ** 2 / n ** 2)
-#                + sumj
-#                ) + muw
+    u = kapn[segment] * (
+            _g(si, n, nflow, nterms)
+            - g_s_[segment]
+            + psi[segment]
+            ) + muw
 
     u *= term1
     u += uw
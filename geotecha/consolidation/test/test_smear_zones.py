@@ -28,6 +28,8 @@ import unittest
 from math import pi
 import numpy as np
 import textwrap
+import math
+import scipy.special
 import matplotlib.pyplot as plt
 from geotecha.consolidation.smear_zones import mu_ideal
 from geotecha.consolidation.smear_zones import mu_constant
@@ -36,6 +38,8 @@ from geotecha.consolidation.smear_zones import mu_overlapping_linear
 from geotecha.consolidation.smear_zones import mu_parabolic
 from geotecha.consolidation.smear_zones import mu_piecewise_constant
 from geotecha.consolidation.smear_zones import mu_piecewise_linear
+from geotecha.consolidation.smear_zones import vmu_piecewise_constant
+from geotecha.consolidation.smear_zones import vmu_piecewise_linear
 from geotecha.consolidation.smear_zones import mu_well_resistance
 
 from geotecha.consolidation.smear_zones import u_ideal
@@ -51,6 +55,13 @@ from geotecha.consolidation.smear_zones import k_overlapping_linear
 from geotecha.consolidation.smear_zones import k_parabolic
 from geotecha.consolidation.smear_zones import re_from_drain_spacing
 from geotecha.consolidation.smear_zones import back_calc_drain_spacing_from_eta
+from geotecha.consolidation.smear_zones import vback_calc_drain_spacing_from_eta
+from geotecha.consolidation.smear_zones import drain_eta
+from geotecha.consolidation.smear_zones import _g
+from geotecha.consolidation.smear_zones import _gbar
+from geotecha.consolidation.smear_zones import _g_coefficients
+from geotecha.consolidation.smear_zones import non_darcy_beta_piecewise_constant
+from geotecha.consolidation.smear_zones import non_darcy_u_piecewise_constant
 
 class test_mu_ideal(unittest.TestCase):
     """tests for mu_ideal"""
@@ -1102,6 +1113,228 @@ class test_back_calc_drain_spacing_from_eta(unittest.TestCase):
                             0.05, [5,6], 2, muw=1)
 
 
+class test_vmu_piecewise(unittest.TestCase):
+    """tests for vmu_piecewise_constant and vmu_piecewise_linear"""
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        nsets, nzones = 40, 12
+        self.s = np.cumsum(rng.uniform(0.1, 1, (nsets, nzones)), axis=1) + 1
+        self.kap = rng.uniform(0.5, 5, (nsets, nzones))
+        self.n = self.s[:, -1] + rng.uniform(1, 20, nsets)
+        self.kap_m = rng.uniform(0.5, 2, nsets)
+
+    def test_constant_vs_scalar(self):
+        s, kap, n, kap_m = self.s, self.kap, self.n, self.kap_m
+        assert_allclose(vmu_piecewise_constant(s, kap, n=n, kap_m=kap_m),
+                        [mu_piecewise_constant(s[i], kap[i], n=n[i],
+                                               kap_m=kap_m[i])
+                         for i in range(len(n))], rtol=1e-12)
+
+    def test_linear_vs_scalar(self):
+        s = np.ones((len(self.n), self.s.shape[1] + 1))
+        s[:, 1:] = self.s
+        kap = np.empty_like(s)
+        kap[:, :-1] = self.kap
+        kap[:, -1] = 1
+        s[:, 3] = s[:, 2] # step change in kap
+        kap[:, 5] = kap[:, 4] # constant kap
+        kap[:, 7] = kap[:, 6] * s[:, 6] / s[:, 7] # kap proportional to s
+        n = self.n
+        assert_allclose(vmu_piecewise_linear(s, kap, n=n),
+                        [mu_piecewise_linear(s[i], kap[i], n=n[i])
+                         for i in range(len(n))], rtol=1e-12)
+
+    def test_broadcast_n(self):
+        n = np.array([6.0, 10.0, 30.0])[:, None]
+        mu = vmu_piecewise_constant([[1.5, 3], [2, 4]], [2, 1], n=n)
+        assert_allclose(mu.shape, (3, 2))
+        assert_allclose(mu[1, 1], mu_piecewise_constant([2, 4], [2, 1],
+                                                         n=10))
+        mu = vmu_piecewise_linear([1, 5, 5], [2, 2, 1], n=n)
+        assert_allclose(mu.shape, (3, 1))
+        assert_allclose(mu[2, 0], mu_piecewise_linear([1, 5, 5], [2, 2, 1],
+                                                      n=30))
+
+    def test_no_n(self):
+        mu = vmu_piecewise_constant([1.5, 3, 4], [2, 3, 1])
+        ok_(np.isscalar(mu))
+        assert_allclose(mu, mu_piecewise_constant([1.5, 3, 4], [2, 3, 1]))
+        assert_allclose(vmu_piecewise_linear([1, 2, 5], [3, 2, 1]),
+                        mu_piecewise_linear([1, 2, 5], [3, 2, 1]))
+
+    def test_bad_input(self):
+        assert_raises(ValueError, vmu_piecewise_constant, [1.5, 3], [2, 1],
+                      n=2)
+        assert_raises(ValueError, vmu_piecewise_constant, [1.5, 3], [2, 1, 3])
+        assert_raises(ValueError, vmu_piecewise_linear, [1.5, 3], [2, 1],
+                      n=5)
+        assert_raises(ValueError, vmu_piecewise_linear, [1, 3], [2, -1],
+                      n=5)
+
+
+class test_vback_calc_drain_spacing_from_eta(unittest.TestCase):
+    """tests for vback_calc_drain_spacing_from_eta"""
+
+    def test_vs_back_calc_drain_spacing_from_eta(self):
+        cases = [(1.0680524125462512, 't', mu_ideal, 0.05, 5, 2),
+                 (0.71017973670799939, 't', mu_constant, 0.05, 5, 2),
+                 (0.71017973670799939, 't', mu_linear, 0.05, 5, 2),
+                 (0.71017973670799939, 't', mu_parabolic, 0.05, 5, 2),
+                 (0.71017973670799939, 't', mu_overlapping_linear,
+                  0.05, 5, 2),
+                 (0.71017973670799939, 't', mu_piecewise_constant,
+                  0.05, [5, 6], [2, 1]),
+                 (0.71017973670799939, 't', mu_piecewise_linear,
+                  0.05, [1, 5, 5], [2, 2, 1]),
+                 (0.60411247160628478, 's', mu_piecewise_constant,
+                  0.05, [5, 6], [2, 1])]
+        for args in cases:
+            sp, re, n, ok = vback_calc_drain_spacing_from_eta(*args, muw=1)
+            ok_(ok)
+            assert_allclose([sp, re, n],
+                            back_calc_drain_spacing_from_eta(*args, muw=1),
+                            rtol=1e-9)
+
+    def test_grid(self):
+        eta = np.array([0.1, 0.5, 2.0])[:, None]
+        s = np.array([2.0, 3.0, 5.0])
+        kap = np.array([1.5, 3.0, 6.0])
+        for mu_function in [mu_constant, mu_linear, mu_parabolic,
+                            mu_overlapping_linear]:
+            sp, re, n, ok = vback_calc_drain_spacing_from_eta(
+                eta, ['t', 's', 'Square'], mu_function, 0.05, s, kap,
+                muw=0.5)
+            assert_allclose(sp.shape, (3, 3))
+            ok_(np.all(ok))
+            s_, kap_ = [np.broadcast_to(v, n.shape).copy() for v in [s, kap]]
+            assert_allclose(drain_eta(re, mu_function, n, s_, kap_, muw=0.5),
+                            np.broadcast_to(eta, n.shape), rtol=1e-10)
+            assert_allclose(sp[:, 0], re[:, 0] / 0.525037567904332)
+            assert_allclose(sp[:, 1], re[:, 1] / 0.5641895835477563)
+
+    def test_infeasible(self):
+        sp, re, n, ok = vback_calc_drain_spacing_from_eta(
+            [50, 0.71017973670799939], 't', 'mu_constant', 0.05, 5, 2,
+            muw=1)
+        assert_allclose(ok, [False, True])
+        ok_(np.isnan(sp[0]) and np.isnan(re[0]) and np.isnan(n[0]))
+        assert_allclose(sp[1], 1.5, rtol=1e-9)
+
+    def test_n_near_s(self):
+        """root that fsolve misses when it steps below s"""
+        sp, re, n, ok = vback_calc_drain_spacing_from_eta(5, 't',
+                                                          mu_constant, 0.05,
+                                                          5, 2, muw=1)
+        ok_(ok)
+        ok_(n > 5)
+        assert_allclose(drain_eta(re, mu_constant, n, 5, 2, muw=1), 5)
+
+    def test_bad_pattern(self):
+        assert_raises(ValueError, vback_calc_drain_spacing_from_eta, 1,
+                      ['t', 'x'], mu_constant, 0.05, 5, 2)
+
+
+def _g_poch(y, N, nflow, nterms, bar=False):
+    """_g or _gbar by direct pochhammer summation"""
+    out = 0
+    for j in range(nterms):
+        term = (scipy.special.poch(-1.0 / nflow, j) / math.factorial(j)
+                / ((2 * j + 1) * nflow - 1) * (y / N)**(2 * j))
+        if bar:
+            term /= (2 * j + 3) * nflow - 1
+        out += term
+    if bar:
+        return out * nflow**2 * y**(3 - 1.0 / nflow)
+    return out * nflow * y**(1 - 1.0 / nflow)
+
+
+class test_g_and_gbar(unittest.TestCase):
+    """tests for _g and _gbar non-darcian series"""
+
+    def test_vs_pochhammer_series(self):
+        for nflow in [1.01, 1.3, 2.0]:
+            for y, N in [(1.0, 5.0), (3.0, 20.0), (5.0, 5.0)]:
+                for nterms in [5, 20, 30]:
+                    assert_allclose(_g(y, N, nflow, nterms),
+                                    _g_poch(y, N, nflow, nterms),
+                                    rtol=1e-12)
+                    assert_allclose(_gbar(y, N, nflow, nterms),
+                                    _g_poch(y, N, nflow, nterms, bar=True),
+                                    rtol=1e-12)
+
+    def test_broadcast(self):
+        y = np.array([1.0, 2.5, 7.0])[:, None]
+        nflow = np.array([[1.05, 1.4], [1.2, 1.05], [1.4, 1.2]])[:, None, :]
+        N = 10.0
+        g = _g(y, N, nflow)
+        gbar = _gbar(y, N, nflow)
+        assert_allclose(g.shape, (3, 3, 2))
+        yb, nb = np.broadcast_arrays(y, nflow)
+        assert_allclose(g.ravel(),
+                        [_g_poch(a, N, b, 20) for a, b in
+                         zip(yb.ravel(), nb.ravel())], rtol=1e-12)
+        assert_allclose(gbar.ravel(),
+                        [_g_poch(a, N, b, 20, bar=True) for a, b in
+                         zip(yb.ravel(), nb.ravel())], rtol=1e-12)
+
+    def test_many_nflow(self):
+        nflow = np.linspace(1.05, 1.9, 40)
+        assert_allclose(_g(3.0, 10.0, nflow),
+                        [_g(3.0, 10.0, v) for v in nflow], rtol=1e-14)
+
+    def test_scalar(self):
+        ok_(np.isscalar(_g(3.0, 10.0, 1.3)))
+        ok_(np.isscalar(_gbar(3.0, 10.0, 1.3)))
+
+    def test_coefficients_cached(self):
+        c = _g_coefficients(1.3, 20, True)
+        ok_(_g_coefficients(1.3, 20, True) is c)
+        assert_raises(ValueError, c.__setitem__, 0, 1.0)
+
+
+def _non_darcy_u_loop(s, kap, si, uavg, uw, n, nflow, nterms=20):
+    """non_darcy_u_piecewise_constant with explicit loops"""
+    s = np.append(s, n).astype(float)
+    kap = np.append(kap, kap[-1]).astype(float)
+    s_ = np.ones_like(s)
+    s_[1:] = s[:-1]
+    beta = non_darcy_beta_piecewise_constant(s[:-1], kap[:-1], n=n,
+                                             nflow=nflow, nterms=nterms)
+    u = []
+    for v in si:
+        i = np.searchsorted(s, v)
+        psi = 0
+        for j in range(i):
+            psi += kap[j]**(1 / nflow) * (_g(s[j], n, nflow, nterms)
+                                          - _g(s_[j], n, nflow, nterms))
+        psi /= kap[i]**(1 / nflow)
+        u.append(kap[i]**(1 / nflow) * (_g(v, n, nflow, nterms)
+                                        - _g(s_[i], n, nflow, nterms)
+                                        + psi))
+    return np.array(u) * (uavg - uw) / beta + uw
+
+
+class test_non_darcy_piecewise_constant(unittest.TestCase):
+    """tests for non_darcy_beta/u_piecewise_constant"""
+
+    def test_beta_darcy_limit(self):
+        assert_allclose(non_darcy_beta_piecewise_constant(
+                            [1.5, 3, 4], [2, 3, 1], n=5, nflow=1.000001),
+                        mu_piecewise_constant([1.5, 3, 4], [2, 3, 1], n=5),
+                        rtol=1e-4)
+
+    def test_u_vs_loop(self):
+        si = np.linspace(1, 20, 9)
+        for nflow in [1.01, 1.3, 1.8]:
+            assert_allclose(non_darcy_u_piecewise_constant(
+                                [1.5, 3, 4], [2, 3, 1], si, uavg=1.3, uw=0.1,
+                                n=20, nflow=nflow),
+                            _non_darcy_u_loop([1.5, 3, 4], [2, 3, 1], si,
+                                              1.3, 0.1, 20, nflow),
+                            rtol=1e-12)
+
+
 if __name__ == '__main__':
 
     import nose
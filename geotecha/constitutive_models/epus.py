@@ -31,7 +31,7 @@ try:
     # regardless of what case they are in the source code.
     _SUCCESSFUL_FORTRAN_IMPORT = True
 except ImportError:
-    print("Failed to import epus_ext; EPUS will use slow scalar version instead.")
+    print("Failed to import epus_ext; EPUS will use numpy vectorized version instead.")
     _SUCCESSFUL_FORTRAN_IMPORT = False
 
 from geotecha.constitutive_models import void_ratio_permeability
@@ -104,13 +104,13 @@ class EPUS(object):
         log Scale or 1000000. Default MaxSuction=6
     MinSuction : int, optional
         log scale or 0.001. Default MinSuction=-3
-    implementation : ['fortran', 'scalar', ], optional
+    implementation : ['fortran', 'vectorized', 'scalar'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest).  Currently there is no
-        'vectorized' = numpy(fast) version.
+        'vectorized' = numpy arrays over the pore size distribution (fast),
+        'fortran' = fortran code (fastest).
         Default implementation='fortran'.  If fortran extention module
-        cannot be imported then 'scalar' version will be used.
-        If anything other than 'scalar' is used then
+        cannot be imported then 'vectorized' version will be used.
+        If anything other than 'scalar' or 'vectorized' is used then
         default fortran version will be used.
 
     Attributes
@@ -536,20 +536,10 @@ class EPUS(object):
         else:
             return 0
 
-    def Drying(self, ss_new):
-        """
-        'Increase soil suction at a certain net mean/vertical stress
-        'If increase soil suction at a certain net mean stress. All pores that has air
-
-        """
+    def _drying_curve(self, ss_new):
+        """Update Curveon and RefSr for a suction increase to ss_new"""
 
         RfSr_value = self.RfSr_value
-        ChangeSuction = self.ChangeSuction
-        Changevolume = self.Changevolume
-
-        f = self.f
-        Stress = self.Stress
-
 
         if self.Curveon==1:
             self.Curveon = 1
@@ -567,6 +557,152 @@ class EPUS(object):
                 self.Curveon = 1
                 self.RefSr = RfSr_value(1, ss_new)
 
+    def _wetting_curve(self, ss_new):
+        """Update Curveon and RefSr for a suction decrease to ss_new"""
+
+        RfSr_value = self.RfSr_value
+
+        if self.Curveon==1:
+            if self.RefSr >= RfSr_value(3, ss_new):
+                self.Curveon = 2
+            else:
+                self.Curveon = 3
+                self.RefSr = RfSr_value(3, ss_new)
+        elif self.Curveon==2:
+            if self.RefSr >= RfSr_value(3, ss_new):
+                self.Curveon = 2
+            else:
+                self.Curveon = 3
+                self.RefSr = RfSr_value(3, ss_new)
+        elif self.Curveon==3:
+            self.Curveon = 3
+            self.RefSr = RfSr_value(3, ss_new)
+
+    def _ChangeSuction_array(self, MaxSumStress, Initialsuction, Stress=None):
+        """Array version of ChangeSuction
+
+        Parameters
+        ----------
+        MaxSumStress : 1d array of float
+            As per ChangeSuction, one value per pore group.
+        Initialsuction : 1d array of float
+            As per ChangeSuction, one value per pore group.
+        Stress : float or 1d array of float, optional
+            Current net normal stress.  Default Stress=None i.e. use
+            self.Stress.  An array allows pore groups of different soil
+            elements (each at its own stress) to be evaluated together.
+
+        Returns
+        -------
+        out : 1d array of float
+            ChangeSuction value for each pore group. If any pore group
+            triggers the pore shape error then self.errocc is set to True.
+
+        """
+
+        SimpleSWCC = self.SimpleSWCC
+        Gs = self.Gs
+        Ccs = self.Ccs
+        Css = self.Css
+        if Stress is None:
+            Stress = self.Stress
+        Pore_shape = self.Pore_shape
+
+        out = np.ones_like(Initialsuction)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            temp2 = (SimpleSWCC.wsat * Gs - Ccs * np.log10(Initialsuction)
+                     - SimpleSWCC.wr * Gs)
+            temp1 = ((Ccs - Css) * np.log10(MaxSumStress)
+                     + Css * np.log10(Initialsuction + Stress)
+                     - Ccs * np.log10(Initialsuction))
+            val = 1 - Pore_shape * (temp1 / (3 * temp2))
+
+        calc = ~((Initialsuction >= 1 * MaxSumStress) |
+                 (Initialsuction >= (10 * SimpleSWCC.a) ** (1 / SimpleSWCC.b)) |
+                 (temp2 <= 0))
+        err = calc & (val <= 0)
+        if np.any(err):
+            self.errocc = True
+        ok = calc & ~err
+        out[ok] = val[ok]
+        return out
+
+    def _ChangeWetSuction_array(self, MaxSumStress, Airentryvalue,
+                                Waterentryvalue):
+        """Array version of ChangeWetSuction
+
+        Parameters
+        ----------
+        MaxSumStress : 1d array of float
+            As per ChangeWetSuction, one value per pore group.
+        Airentryvalue : 1d array of float
+            As per ChangeWetSuction, one value per pore group.
+        Waterentryvalue : 1d array of float
+            As per ChangeWetSuction, one value per pore group.
+
+        Returns
+        -------
+        out : 1d array of float
+            ChangeWetSuction value for each pore group. If any pore group
+            triggers the pore shape error then self.errocc is set to True.
+
+        """
+
+        SimpleSWCC = self.SimpleSWCC
+        Gs = self.Gs
+        Ccs = self.Ccs
+        Css = self.Css
+        Stress = self.Stress
+        Pore_shape = self.Pore_shape
+
+        out = np.ones_like(Airentryvalue)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            temp2 = (SimpleSWCC.wsat * Gs - Ccs * np.log10(Airentryvalue)
+                     - SimpleSWCC.wr * Gs)
+            temp1 = ((Ccs - Css) * np.log10(MaxSumStress)
+                     + Css * np.log10(Waterentryvalue + Stress)
+                     - Ccs * np.log10(Airentryvalue))
+            val = 1 - Pore_shape * (temp1 / (3 * temp2))
+
+        calc = ~((Airentryvalue >= 1 * MaxSumStress) |
+                 (Airentryvalue >= (10 * SimpleSWCC.a) ** (1 / SimpleSWCC.b)) |
+                 (temp2 < 0))
+        err = calc & (val <= 0)
+        if np.any(err):
+            self.errocc = True
+        ok = calc & ~err
+        out[ok] = val[ok]
+        return out
+
+    def _Changevolume_array(self, InitialVolume, Yieldstress, CurrentStress,
+                            CompIndex, UnloadIndex):
+        """Array version of Changevolume (negative volumes set to zero)"""
+
+        MinSuction = self.MinSuction
+
+        temp = (InitialVolume - (np.log10(Yieldstress) - MinSuction) * CompIndex
+                + (np.log10(Yieldstress) - np.log10(CurrentStress)) * UnloadIndex)
+        return np.where(temp > 0, temp, 0.0)
+
+    def Drying(self, ss_new):
+        """
+        'Increase soil suction at a certain net mean/vertical stress
+        'If increase soil suction at a certain net mean stress. All pores that has air
+
+        """
+
+        RfSr_value = self.RfSr_value
+        ChangeSuction = self.ChangeSuction
+        Changevolume = self.Changevolume
+
+        f = self.f
+        Stress = self.Stress
+
+
+        self._drying_curve(ss_new)
+
 
 #A-85
 
@@ -619,21 +755,7 @@ class EPUS(object):
         RefSr = self.RefSr
         pm = self.pm
 
-        if self.Curveon==1:
-            if self.RefSr >= RfSr_value(3, ss_new):
-                self.Curveon = 2
-            else:
-                self.Curveon = 3
-                self.RefSr = RfSr_value(3, ss_new)
-        elif self.Curveon==2:
-            if self.RefSr >= RfSr_value(3, ss_new):
-                self.Curveon = 2
-            else:
-                self.Curveon = 3
-                self.RefSr = RfSr_value(3, ss_new)
-        elif self.Curveon==3:
-            self.Curveon = 3
-            self.RefSr = RfSr_value(3, ss_new)
+        self._wetting_curve(ss_new)
 
         for i in range(f.Npoint):
             s = 10 ** f.WEV[i]
@@ -744,6 +866,188 @@ class EPUS(object):
 #            Next i
         self.Stress = st_new     # Change current suction to the new stress.
 
+    def _entry_suctions(self):
+        """10**AEV and 10**WEV for the current pore size distribution
+
+        Evaluated once per PoresizeDistribution with python's scalar `**`
+        so that values are bit for bit those used by the scalar methods.
+        Suction increments often lie on the same log grid as the pore air
+        entry values so exact ties are common and must be resolved the
+        same way as _Calresults_scalar.
+
+        Returns
+        -------
+        sAEV, sWEV : 1d array of float
+            Air entry and water entry suctions of each pore group.
+
+        """
+
+        f = self.f
+        if getattr(f, '_sAEV', None) is None:
+            f._sAEV = np.array([10 ** v for v in f.AEV])
+            f._sWEV = np.array([10 ** v for v in f.WEV])
+        return f._sAEV, f._sWEV
+
+    def _Drying_vectorized(self, ss_new):
+        """Array version of Drying, all pore groups updated at once"""
+
+        f = self.f
+        Stress = self.Stress
+
+        self._drying_curve(ss_new)
+
+        sAEV, sWEV = self._entry_suctions()
+
+        # Only pores currently filled with water are affected.
+        idx = np.flatnonzero(f.Filled)
+        s = sAEV[idx]
+        Y = f.YieldSt[idx]
+        ys = np.where(Stress + s > Y, Stress + s, Y)
+
+        dry = (s / self._ChangeSuction_array(Y, s)) <= ss_new
+
+        # pores that dry out (air entry value exceeded)
+        sd = s[dry]
+        sc = (sd / self._ChangeSuction_array(ys[dry], sd)) + Stress
+        Yd = Y[dry]
+        Y[dry] = np.where(sc > Yd, sc, Yd)
+
+        # pores that remain filled
+        Yw = Y[~dry]
+        Y[~dry] = np.where(Stress + ss_new > Yw, Stress + ss_new, Yw)
+
+        f.YieldSt[idx] = Y
+        f.RVC[idx] = self._Changevolume_array(f.RV[idx], Y, Stress + ss_new,
+                                              f.Ccp[idx], f.Csp[idx])
+        f.Filled[idx[dry]] = False
+        f.Airentrapped[idx[dry]] = True
+
+        self.Suction = ss_new
+
+    def _Wetting_vectorized(self, ss_new):
+        """Array version of Wetting, all pore groups updated at once"""
+
+        CVStress = self.CVStress()
+
+        f = self.f
+        Stress = self.Stress
+        Assumption = self.Assumption
+        RefSr = self.RefSr # value before the curve update below
+        pm = self.pm
+
+        self._wetting_curve(ss_new)
+
+        sAEV, sWEV = self._entry_suctions()
+        filled = f.Filled.copy()
+
+        # Pores that are currently empty.
+        idx = np.flatnonzero(~filled)
+        s = sWEV[idx]
+        aev = sAEV[idx]
+        Y = f.YieldSt[idx]
+        ys = np.where(Stress + s > Y, Stress + s, Y)
+        sw = s / self._ChangeWetSuction_array(ys, aev, s)
+
+        fill = sw >= ss_new
+        i = idx[fill]
+        val = sw[fill] + Stress
+        Yf = Y[fill]
+        Yf = np.where(val > Yf, val, Yf)
+        f.YieldSt[i] = Yf
+        f.RVC[i] = self._Changevolume_array(f.RV[i], Yf, Stress + ss_new,
+                                            f.Ccp[i], f.Csp[i])
+        f.Filled[i] = True
+
+        if Assumption == 1:
+            dry = (~fill) & (f.Ccp[idx] > 0)
+            j = idx[dry]
+            tmp = aev[dry].copy()
+            hi = Stress > tmp
+            jh = j[hi]
+            tmp[hi] = CVStress * 10 ** (((np.log10(Stress / tmp[hi]) *
+                        ((RefSr ** pm) * (f.Ccp[jh] - f.Ccd[jh]) + f.Ccd[jh]))
+                        / f.Ccp[jh]) + f.AEV[jh])
+            up = tmp > f.YieldSt[j]
+            ju = j[up]
+            f.YieldSt[ju] = tmp[up]
+            f.RVC[ju] = self._Changevolume_array(f.RV[ju], tmp[up], tmp[up],
+                                                 f.Ccp[ju], f.Csp[ju])
+
+        # Pores that were already filled.
+        k = np.flatnonzero(filled)
+        Y = f.YieldSt[k]
+        Y = np.where(Stress + ss_new > Y, Stress + ss_new, Y)
+        f.YieldSt[k] = Y
+        f.RVC[k] = self._Changevolume_array(f.RV[k], Y, Stress + ss_new,
+                                            f.Ccp[k], f.Csp[k])
+
+        self.Suction = ss_new
+
+    def _Loading_vectorized(self, st_new):
+        """Array version of Loading, all pore groups updated at once"""
+
+        f = self.f
+        Stress = self.Stress
+        Suction = self.Suction
+        Assumption = self.Assumption
+        RefSr = self.RefSr
+        pm = self.pm
+        CVStress = self.CVStress()
+
+        sAEV, sWEV = self._entry_suctions()
+        filled = f.Filled.copy()
+
+        # Pores currently filled with water.
+        k = np.flatnonzero(filled)
+        Y = f.YieldSt[k]
+        Y = np.where(st_new + Suction > Y, st_new + Suction, Y)
+        f.YieldSt[k] = Y
+        f.RVC[k] = self._Changevolume_array(f.RV[k], Y, Suction + st_new,
+                                            f.Ccp[k], f.Csp[k])
+
+        # Pores not filled with water.
+        idx = np.flatnonzero(~filled)
+        s = sWEV[idx]
+        aev = sAEV[idx]
+        Y = f.YieldSt[idx]
+        ys = np.where(st_new + s > Y, st_new + s, Y)
+
+        fill = (s / self._ChangeWetSuction_array(ys, aev, s)) > Suction
+        i = idx[fill]
+        f.YieldSt[i] = ys[fill]
+        f.RVC[i] = self._Changevolume_array(f.RV[i], ys[fill], Suction + st_new,
+                                            f.Ccp[i], f.Csp[i])
+        f.Filled[i] = True
+
+        if Assumption == 1:
+            dry = (~fill) & (f.Ccp[idx] > 0)
+            j = idx[dry]
+            tmp = aev[dry].copy()
+            hi = Stress > tmp
+            jh = j[hi]
+            tmp[hi] = CVStress * 10 ** (((np.log10(st_new / tmp[hi]) *
+                        ((RefSr ** pm) * (f.Ccp[jh] - f.Ccd[jh]) + f.Ccd[jh]))
+                        / f.Ccp[jh]) + f.AEV[jh])
+            up = tmp > f.YieldSt[j]
+            ju = j[up]
+            f.YieldSt[ju] = tmp[up]
+            f.RVC[ju] = self._Changevolume_array(f.RV[ju], tmp[up], tmp[up],
+                                                 f.Ccp[ju], f.Csp[ju])
+
+        self.Stress = st_new
+
+    def _Unloading_vectorized(self, st_new):
+        """Array version of Unloading, all pore groups updated at once"""
+
+        f = self.f
+        Suction = self.Suction
+
+        k = np.flatnonzero(f.Filled)
+        f.RVC[k] = self._Changevolume_array(f.RV[k], f.YieldSt[k],
+                                            Suction + st_new,
+                                            f.Ccp[k], f.Csp[k])
+        self.Stress = st_new
+
     def DegreeofsaturationSWCC(self):
         """This procedure is used to calculate Srdry and Srwet"""
 
@@ -789,6 +1093,28 @@ class EPUS(object):
 #    '''frmFlash.Refresh
 #      End Sub
 
+    def _DegreeofsaturationSWCC_vectorized(self):
+        """Array version of DegreeofsaturationSWCC"""
+
+        NumSr = self.NumSr
+        MaxSuction = self.MaxSuction
+        MinSuction = self.MinSuction
+
+        self.SlurryPoreSize()       # Reset the soil to initial slurry condition
+        f = self.f
+        intv = (MaxSuction - MinSuction) / NumSr  # Take equal interval in log scale
+
+        for i in range(NumSr): # along the drying process
+            cs = 10 ** (intv * (i - 0) + MinSuction)
+            self._Drying_vectorized(cs)
+            self.Srdry[i] = np.sum(f.RVC[f.Filled]) / np.sum(f.RVC)
+
+        for i in range(NumSr): # along the wetting process
+            cs = 10 ** (MaxSuction - intv * (i - 0))
+            self._Wetting_vectorized(cs)
+            self.Srwet[NumSr - 1 - i] = (np.sum(f.RVC[f.Filled])
+                                         / np.sum(f.RVC))
+
     def RfSr_value(self, curvetype, ssvalue):
         """
         Parameters
@@ -928,6 +1254,221 @@ class EPUS(object):
             #MsgBox " Input data is not valid, please check the PORE-SHAPE PARAMETER"
             print("Input data is not valid, please check the PORE-SHAPE PARAMETER")
 
+    def _Calresults_vectorized(self):
+        """Numpy version of _Calresults_scalar.
+
+        Pore size distribution is stored as arrays and each stress/suction
+        increment is applied to all pore groups at once with masked
+        array operations.  Gives the same results as _Calresults_scalar.
+
+        """
+
+        stp = self.stp
+        CVStress = self.CVStress()
+
+        beta = self.beta
+        Gs = self.Gs
+
+        self.errocc = False
+
+        if self.Assumption == 1:
+            self._DegreeofsaturationSWCC_vectorized()
+
+        self.SlurryPoreSize()
+        ct = self.Stress          #' = current stress
+        cs = self.Suction         #' = current suction
+
+        f = self.f
+        stp.n = -1
+
+        def e_and_w():
+            """Void ratio and water content from current pore state"""
+            filled = f.Filled
+            wfac = np.where(f.Airentrapped[filled], 1 - beta, 1.0)
+            return np.sum(f.RVC), np.sum(f.RVC[filled] / Gs * wfac)
+
+        for i in range(stp.nsteps):
+            stp.n = stp.n + 1
+            datapoint = stp.datapoints[i]
+            datapoint.n = -1
+            if not stp.ist[i]:
+                intv = (log10(stp.vl[i]) - log10(cs)) / (stp.npp[i] - 1) #' Take equal interval in log scale
+                for j in range(stp.npp[i]):
+                    datapoint.n = datapoint.n + 1
+                    datapoint.ss[datapoint.n] = 10 ** ((j - 0) * intv + log10(cs))
+                    datapoint.st[datapoint.n] = ct
+                    if intv > 0:
+                        self._Drying_vectorized(datapoint.ss[datapoint.n])
+                    else:
+                        self._Wetting_vectorized(datapoint.ss[datapoint.n])
+                    datapoint.e[datapoint.n], datapoint.w[datapoint.n] = e_and_w()
+                cs = stp.vl[i]
+            else:
+                intv = (log10(stp.vl[i]) - log10(ct)) / (stp.npp[i] - 1)
+                for j in range(stp.npp[i]):
+                    datapoint.n = datapoint.n + 1
+                    datapoint.ss[datapoint.n] = cs
+                    datapoint.st[datapoint.n] = 10.0 ** ((j - 0) * intv + log10(ct))
+                    if intv > 0:
+                        self._Loading_vectorized(datapoint.st[datapoint.n] * CVStress)
+                    else:
+                        self._Unloading_vectorized(datapoint.st[datapoint.n] * CVStress)
+                    datapoint.e[datapoint.n], datapoint.w[datapoint.n] = e_and_w()
+                ct = stp.vl[i]
+
+        for datapoint in stp.datapoints:
+            datapoint.ss[datapoint.ss >= 999999] = 999998
+            datapoint.st[datapoint.st >= 999999] = 999998
+            datapoint.Sr[:] = datapoint.w * Gs / datapoint.e
+            datapoint.vw[:] = datapoint.Sr * datapoint.e / (datapoint.e + 1)
+
+        if self.errocc:
+            print("Input data is not valid, please check the PORE-SHAPE PARAMETER")
+
+    def _Calresults_batched_load_dry(self, st, ss, npp):
+        """End points of many 'load from slurry then dry' stress paths
+
+        Each soil element is loaded from the slurry condition to net
+        normal stress st[i] and then, if ss[i] > 10**MinSuction, dried to
+        suction ss[i].  This is the stress path used by EpusProfile at each
+        depth.  The slurry pore size distribution is calculated once and
+        the state of all elements is held in 2d (element, pore group)
+        arrays so each stress/suction increment is applied to every
+        element at once.  Results are the same as running
+        _Calresults_vectorized on each element's StressPath.
+
+        Parameters
+        ----------
+        st : 1d array of float
+            Net normal stress at end of loading for each element.  Must be
+            at least (10**MinSuction) / 1000 i.e. the slurry stress.
+        ss : 1d array of float
+            Suction at end of drying for each element.  Values
+            <= 10**MinSuction mean no drying step.
+        npp : int
+            Number of points per stress path step.
+
+        Returns
+        -------
+        out : DataResults object
+            ss, st, e, w, Sr, vw at the end of each element's stress path.
+
+        Notes
+        -----
+        All pores are water filled during loading from slurry and the
+        reference drying/wetting SWCCs (Srdry, Srwet) only influence
+        wetting or the loading of dry pores.  Neither occurs on this
+        stress path so DegreeofsaturationSWCC is not evaluated.
+
+        """
+
+        st = np.atleast_1d(np.asarray(st, dtype=float))
+        ss = np.atleast_1d(np.asarray(ss, dtype=float))
+        n = len(st)
+        CVStress = self.CVStress()
+        beta = self.beta
+        Gs = self.Gs
+        MinSuction = self.MinSuction
+
+        self.errocc = False
+        if getattr(self, '_f_slurry', None) is None:
+            # Calresults etc. replace rather than modify self.f so the
+            # slurry pore size distribution can be reused.
+            self.SlurryPoreSize()
+            self._f_slurry = self.f
+        f = self.f = self._f_slurry
+        sAEV, sWEV = self._entry_suctions()
+
+        ct = (10 ** MinSuction) / 1000  # slurry stress
+        cs = 10 ** MinSuction  # slurry suction
+
+        YieldSt = np.tile(f.YieldSt, (n, 1))
+        RVC = np.tile(f.RVC, (n, 1))
+        Filled = np.tile(f.Filled, (n, 1))
+        Airentrapped = np.tile(f.Airentrapped, (n, 1))
+        RV = f.RV[np.newaxis, :]
+        Ccp = f.Ccp[np.newaxis, :]
+        Csp = f.Csp[np.newaxis, :]
+
+        # Increments are evaluated with python's scalar ** and log10 so
+        # values are bit for bit those of a StressPath.
+        vl = [float(v) for v in np.asarray(st)]
+        intv_st = [(log10(v) - log10(ct)) / (npp - 1) for v in vl]
+        load = np.array([v > 0 for v in intv_st], dtype=bool)
+
+        # Stress increase from slurry. Pores remain water filled.
+        Suction = cs
+        for j in range(npp):
+            st_j = np.array([10.0 ** (j * v + log10(ct)) for v in intv_st])
+            st_new = (st_j * CVStress)[:, np.newaxis]
+            if np.any(load):
+                Y = YieldSt[load]
+                YieldSt[load] = np.where(st_new[load] + Suction > Y,
+                                         st_new[load] + Suction, Y)
+            RVC[:] = np.where(Filled,
+                              self._Changevolume_array(RV, YieldSt,
+                                                       Suction + st_new,
+                                                       Ccp, Csp),
+                              RVC)
+        Stress = st_j * CVStress
+        st_end = st_j
+
+        # Suction increase. Only elements above the water table.
+        dry_el = ss > cs
+        ss_end = np.empty(n)
+        ss_end[:] = cs
+        idx_el = np.flatnonzero(dry_el)
+        if len(idx_el):
+            intv_ss = [(log10(float(ss[i])) - log10(cs)) / (npp - 1)
+                       for i in idx_el]
+            for j in range(npp):
+                ss_j = np.array([10 ** (j * v + log10(cs)) for v in intv_ss])
+                ss_new = np.empty(n)
+                ss_new[idx_el] = ss_j
+
+                act = np.zeros_like(Filled)
+                act[idx_el] = Filled[idx_el]
+                r, c = np.nonzero(act)
+                s = sAEV[c]
+                S = Stress[r]
+                ssn = ss_new[r]
+                Y = YieldSt[r, c]
+                ys = np.where(S + s > Y, S + s, Y)
+
+                dry = (s / self._ChangeSuction_array(Y, s, S)) <= ssn
+
+                sd = s[dry]
+                sc = sd / self._ChangeSuction_array(ys[dry], sd, S[dry]) + S[dry]
+                Yd = Y[dry]
+                Y[dry] = np.where(sc > Yd, sc, Yd)
+
+                Yw = Y[~dry]
+                Sw = S[~dry] + ssn[~dry]
+                Y[~dry] = np.where(Sw > Yw, Sw, Yw)
+
+                YieldSt[r, c] = Y
+                RVC[r, c] = self._Changevolume_array(f.RV[c], Y, S + ssn,
+                                                     f.Ccp[c], f.Csp[c])
+                Filled[r[dry], c[dry]] = False
+                Airentrapped[r[dry], c[dry]] = True
+            ss_end[idx_el] = ss_j
+            st_end[idx_el] = [vl[i] for i in idx_el]
+
+        out = DataResults(npts=n)
+        wfac = np.where(Airentrapped, 1 - beta, 1.0)
+        out.e[:] = np.sum(RVC, axis=1)
+        out.w[:] = np.sum(np.where(Filled, RVC / Gs * wfac, 0.0), axis=1)
+        out.ss[:] = ss_end
+        out.st[:] = st_end
+        out.ss[out.ss >= 999999] = 999998
+        out.st[out.st >= 999999] = 999998
+        out.Sr[:] = out.w * Gs / out.e
+        out.vw[:] = out.Sr * out.e / (out.e + 1)
+
+        if self.errocc:
+            print("Input data is not valid, please check the PORE-SHAPE PARAMETER")
+        return out
+
     def _Calresults_fortran(self):
 
         epus_ext.epus.dealloc()
@@ -988,11 +1529,13 @@ class EPUS(object):
 
         if self.implementation == 'scalar':
             self._Calresults_scalar()
+        elif self.implementation == 'vectorized':
+            self._Calresults_vectorized()
         else:
             if _SUCCESSFUL_FORTRAN_IMPORT:
                 self._Calresults_fortran()
             else:
-                self._Calresults_scalar()
+                self._Calresults_vectorized()
 
 
 
@@ -1362,6 +1905,53 @@ class DataResults(object):
 
 
 
+class _AndersonMixing(object):
+    """Anderson acceleration of a fixed point iteration x = G(x)
+
+    Parameters
+    ----------
+    m : int, optional
+        Number of previous iterates to mix. Default m=5.
+
+    Notes
+    -----
+    With residual r_k = G(x_k) - x_k the next iterate is
+    x_{k+1} = G(x_k) - dG @ gamma where gamma minimises
+    ||r_k - dR @ gamma|| and dR, dG are the last m differences of
+    residuals and G values. With m=0 (or on the first call) this is plain
+    fixed point iteration.
+
+    """
+
+    def __init__(self, m=5):
+        self.m = m
+        self._x = None
+        self._g = None
+        self._dR = []
+        self._dG = []
+
+    def update(self, x, g):
+        """Next iterate given current iterate x and g = G(x)"""
+
+        x = np.asarray(x, dtype=float)
+        g = np.asarray(g, dtype=float)
+        r = g - x
+        if self._x is not None and self.m > 0:
+            self._dR.append(r - (self._g - self._x))
+            self._dG.append(g - self._g)
+            self._dR = self._dR[-self.m:]
+            self._dG = self._dG[-self.m:]
+        self._x = x.copy()
+        self._g = g.copy()
+
+        if not self._dR:
+            return g.copy()
+        dR = np.array(self._dR).T
+        dG = np.array(self._dG).T
+        gamma = np.linalg.lstsq(dR, r, rcond=None)[0]
+        return g - dG.dot(gamma)
+
+
 class EpusProfile(object):
     """1D initial conditons (stress etc.) distribution for EPUS unsaturated
     soil model.
@@ -1439,6 +2029,21 @@ class EpusProfile(object):
         1st element of tuple is list/array of z values, 2nd element is
         list/array. Default intial_stress=None i.e. make up an initial guess
         using unit weight = 15.  Values will be interpolated.
+    solver : ['batched', 'loop'], optional
+        How void ratio and saturation are evaluated at each depth.
+        'batched' builds the slurry pore size distribution once (per
+        refinement level) and applies the stress paths of all depths
+        together (see EPUS._Calresults_batched_load_dry).
+        'loop' creates a new EPUS object and StressPath for each depth
+        and runs a full Calresults (slow). Default solver='batched'.
+    acceleration : ['anderson', None], optional
+        Convergence acceleration of the stress profile iterations.
+        'anderson' uses Anderson mixing of the previous `anderson_m`
+        iterates. None uses plain fixed point iteration.
+        Default acceleration='anderson'.
+    anderson_m : int, optional
+        Number of previous iterates used in Anderson mixing.
+        Default anderson_m=5.
 
 
 
@@ -1482,7 +2087,10 @@ class EpusProfile(object):
                  atol=0.01,
                  rtol=1e-6,
                  max_iter=100,
-                 initial_stress=None):
+                 initial_stress=None,
+                 solver='batched',
+                 acceleration='anderson',
+                 anderson_m=5):
 
 
         self.epus_object = epus_object
@@ -1505,6 +2113,16 @@ class EpusProfile(object):
 
         self.niter=[]
         self.initial_stress = initial_stress
+        if solver not in ['batched', 'loop']:
+            raise ValueError("solver must be 'batched' or 'loop', "
+                             "not {}".format(solver))
+        self.solver = solver
+        if acceleration not in ['anderson', None]:
+            raise ValueError("acceleration must be 'anderson' or None, "
+                             "not {}".format(acceleration))
+        self.acceleration = acceleration
+        self.anderson_m = anderson_m
+        self._batch_epus = dict()
         names = ['SimpleSWCC',
                  #'stp',
                  'logDS',
@@ -1583,6 +2201,9 @@ class EpusProfile(object):
     def _e_and_Sr_from_EPUS(self):
         """Use EPUS and sig and psi distribution to calc e and Sr"""
 
+        if self.solver == 'batched':
+            self._e_and_Sr_from_EPUS_batched()
+            return
 
 
         for i in range(self.profile.npts):
@@ -1612,6 +2233,32 @@ class EpusProfile(object):
         s = self.profile.Sr > 1
         self.profile.Sr[s] = 1
 
+    def _e_and_Sr_from_EPUS_batched(self):
+        """Batched version of _e_and_Sr_from_EPUS
+
+        One EPUS object (and slurry pore size distribution) per Npoint
+        value is reused for all depths and iterations.
+
+        """
+
+        if not self._Npoint in self._batch_epus:
+            d = dict(self._epus_dict)
+            d["Npoint"] = self._Npoint
+            d["stp"] = None
+            self._batch_epus[self._Npoint] = EPUS(**d)
+        a = self._batch_epus[self._Npoint]
+
+        st = np.maximum(self.profile.st,
+                        (10 ** self.epus_object.MinSuction) / 1000)
+        res = a._Calresults_batched_load_dry(st, self.profile.ss, self._npp)
+
+        for v in res._attr:
+            getattr(self.profile, v)[:] = getattr(res, v)
+
+        #adjust Sr
+        s = self.profile.Sr > 1
+        self.profile.Sr[s] = 1
+
     def _blank_profile(self, nz):
         """Modify a DataResults object to contain info about the profile
 
@@ -1685,6 +2332,8 @@ class EpusProfile(object):
                 self.profile = new_profile
 
 
+            if self.acceleration == 'anderson':
+                accel = _AndersonMixing(m=self.anderson_m)
             for j in range(self.max_iter):
                 old_stress = self.profile.st[:].copy()
 
@@ -1696,6 +2345,9 @@ class EpusProfile(object):
                 if np.allclose(old_stress, self.profile.st,
                                atol=self.atol, rtol=self.rtol):
                     break
+                if self.acceleration == 'anderson':
+                    self.profile.st[:] = accel.update(old_stress,
+                                                      self.profile.st)
 
 
             if j>=self.max_iter:
@@ -23,6 +23,8 @@ from matplotlib import pyplot as plt
 import matplotlib
 from scipy.optimize import fsolve
 import sympy
+from geotecha.mathematics.quadrature import gauss_legendre_abscissae_and_weights
+from geotecha.inputoutput.inputoutput import object_attributes_key
 
 
 
@@ -55,6 +57,146 @@ class SWCC(object):
         ax.plot(x, y)
         return
 
+    def _k_integral_table(self, ylo, npts, ng=4):
+        """Cumulative tables of the Fredlund et al. (1994) integrals
+
+        On a fixed grid of ln(suction) values, y, between ylo and
+        b=ln(10**6) (the upper limit of the permeability integral) tabulate
+
+        .. math:: A(y_i) = \\int_{y_i}^{b}
+                  {\\frac{\\theta(e^t)}{e^t}\\theta^{\\prime}(e^t)\\,dt}
+
+        .. math:: B(y_i) = \\int_{y_i}^{b}
+                  {\\frac{1}{e^t}\\theta^{\\prime}(e^t)\\,dt}
+
+        Each grid interval is integrated with ng point Gauss-Legendre
+        quadrature.  Tables are cached on the instance with the SWCC
+        parameters as key and are rebuilt if the parameters change.  A
+        table extending below ylo is reused.
+
+        Parameters
+        ----------
+        ylo : float
+            Lowest ln(suction) value needed.
+        npts : int
+            Number of grid intervals between ylo and b on the first call.
+            The grid spacing is then fixed; later calls needing a lower
+            ylo add intervals.
+        ng : int, optional
+            Number of Gauss-Legendre points per interval. Default ng=4.
+
+        Returns
+        -------
+        y, A, B : 1d array of float
+            Grid and cumulative integrals from each grid point to b.
+
+        """
+
+        b = np.log(1.0e6)
+        key = (object_attributes_key(self), npts, ng)
+        cache = self.__dict__.setdefault('_k_table_cache', dict())
+        table = cache.get(key, None)
+        if table is not None and table['ylo'] <= ylo:
+            return table['y'], table['A'], table['B']
+
+        if table is None:
+            h = (b - ylo) / npts
+        else:
+            h = table['h']
+        n = max(int(np.ceil((b - ylo) / h - 1e-9)), 1)
+        y = b - h * np.arange(n, -1, -1)
+
+        xg, wg = gauss_legendre_abscissae_and_weights(ng)
+        yq = 0.5 * (y[:-1, None] + y[1:, None]) + 0.5 * h * xg[None, :]
+        eyq = np.exp(yq)
+        dw = self.dw_dpsi(eyq) / eyq
+        pA = 0.5 * h * np.sum(self.w_from_psi(eyq) * dw * wg, axis=1)
+        pB = 0.5 * h * np.sum(dw * wg, axis=1)
+
+        A = np.zeros(n + 1)
+        B = np.zeros(n + 1)
+        A[:-1] = np.cumsum(pA[::-1])[::-1]
+        B[:-1] = np.cumsum(pB[::-1])[::-1]
+
+        for old_key in list(cache):
+            if old_key[0] != key[0]:
+                # parameters have changed, drop stale tables
+                del cache[old_key]
+        cache[key] = dict(ylo=y[0], h=h, y=y, A=A, B=B)
+        return y, A, B
+
+    def _k_integrals(self, psi, w0, y, A, B, ng=4):
+        """Fredlund et al. (1994) integral from ln(psi) to ln(10**6)
+
+        Uses the cumulative tables from _k_integral_table and integrates
+        the partial grid interval containing ln(psi) directly.
+
+        Parameters
+        ----------
+        psi : 1d array of float
+            Suction values (lower limit of integral).
+        w0 : 1d array of float
+            Water content subtracted in the integrand, theta(psi) for the
+            numerator.
+        y, A, B : 1d array of float
+            From _k_integral_table.
+        ng : int, optional
+            Number of Gauss-Legendre points for the partial interval.
+            Default ng=4.
+
+        Returns
+        -------
+        out : 1d array of float
+            Integral of (theta(e^t) - w0) / e^t * theta'(e^t) from ln(psi)
+            to ln(10**6).
+
+        """
+
+        yp = np.log(psi)
+        k = np.clip(np.searchsorted(y, yp, side='right') - 1, 0, len(y) - 2)
+        yk = y[k + 1]
+
+        # yp to y[k + 1]; negative interval when psi > 10**6
+        xg, wg = gauss_legendre_abscissae_and_weights(ng)
+        half = 0.5 * (yk - yp)
+        yq = 0.5 * (yp + yk)[:, None] + half[:, None] * xg[None, :]
+        eyq = np.exp(yq)
+        dw = self.dw_dpsi(eyq) / eyq
+        part = half * np.sum((self.w_from_psi(eyq) - w0[:, None]) * dw * wg,
+                             axis=1)
+
+        return (A[k + 1] - w0 * B[k + 1]) + part
+
+    def _k_from_psi_cumulative(self, psi, aev, npts, ws):
+        """k_from_psi by cumulative integral table
+
+        Parameters
+        ----------
+        psi : 1d array of float
+            Suction.
+        aev : float
+            Air entry suction. Lower limit of the denominator integral.
+        npts : int
+            Number of table intervals between ln(min(aev, psi)) and
+            ln(10**6).
+        ws : float
+            Water content subtracted in the denominator integrand.
+
+        Returns
+        -------
+        k : 1d array of float
+            Relative permeability.
+
+        """
+
+        ylo = min(np.log(aev), np.min(np.log(psi)))
+        y, A, B = self._k_integral_table(ylo, npts)
+
+        numer = self._k_integrals(psi, self.w_from_psi(psi), y, A, B)
+        denom = self._k_integrals(np.array([aev], dtype=float),
+                                  np.array([ws], dtype=float), y, A, B)
+        return numer / denom[0]
+
 
 
 class SWCC_FredlundAndXing1994(SWCC):
@@ -316,6 +458,13 @@ class SWCC_FredlundAndXing1994(SWCC):
             Air entry soil suction. Default aev=1.0
         npts : int, optional
             Numper of intervals to break integral into. Default npts=500.
+        method : ['cumulative', 'midpoint'], optional
+            'cumulative' integrates on a fixed ln(suction) grid once,
+            caches cumulative sums (keyed on the SWCC parameters), and
+            evaluates any number of psi values from the cached table.
+            'midpoint' evaluates a separate npts midpoint rule between
+            each psi value and ln(10**6) (memory is len(psi)*npts).
+            Default method='cumulative'.
 
         Returns
         -------
@@ -348,7 +497,11 @@ class SWCC_FredlundAndXing1994(SWCC):
         is the air entry value of soil suction (must be positive for the
         log integral to work).  Each integral is performed by dividing the
         integration inteval into N sections, evaluating the integrand at the
-        mid point of each inteval, then summing the areas of each section.
+        mid point of each inteval, then summing the areas of each section
+        (method='midpoint').  With method='cumulative' the integrand is
+        tabulated once on a fixed log-suction grid and the integral from
+        any psi is the cumulative sum plus a Gauss-Legendre integration of
+        the partial grid interval containing ln(psi).
 
 
         If you enter a single elment array you will get a scalar returned.
@@ -367,8 +520,19 @@ class SWCC_FredlundAndXing1994(SWCC):
 
         aev = kwargs.get('aev', 1.0)
         npts = kwargs.get('npts', 500)
+        method = kwargs.get('method', 'cumulative')
         psi = np.atleast_1d(psi)
 
+        if method == 'cumulative':
+            k = self._k_from_psi_cumulative(psi, aev, npts, ws=self.ws)
+            if k.size==1:
+                return k[0]
+            else:
+                return k
+        elif method != 'midpoint':
+            raise ValueError("method must be 'cumulative' or 'midpoint', "
+                             "not {}".format(method))
+
         b = np.log(1.0e6) #conceivably this could be the suction at residual
         a1 = np.log(psi)
         dy1 = (b - a1) / npts
@@ -693,6 +857,13 @@ class SWCC_PhamAndFredlund2008(SWCC):
             Air entry soil suction. Default aev=0.001
         npts : int, optional
             Numper of intervals to break integral into. Default npts=500.
+        method : ['cumulative', 'midpoint'], optional
+            'cumulative' integrates on a fixed ln(suction) grid once,
+            caches cumulative sums (keyed on the SWCC parameters), and
+            evaluates any number of psi values from the cached table.
+            'midpoint' evaluates a separate npts midpoint rule between
+            each psi value and ln(10**6) (memory is len(psi)*npts).
+            Default method='cumulative'.
 
         Returns
         -------
@@ -725,7 +896,11 @@ class SWCC_PhamAndFredlund2008(SWCC):
         is the air entry value of soil suction (must be positive for the
         log integral to work).  Each integral is performed by dividing the
         integration inteval into N sections, evaluating the integrand at the
-        mid point of each inteval, then summing the areas of each section.
+        mid point of each inteval, then summing the areas of each section
+        (method='midpoint').  With method='cumulative' the integrand is
+        tabulated once on a fixed log-suction grid and the integral from
+        any psi is the cumulative sum plus a Gauss-Legendre integration of
+        the partial grid interval containing ln(psi).
 
 
         If you enter a single element array you will get a scalar returned.
@@ -744,8 +919,19 @@ class SWCC_PhamAndFredlund2008(SWCC):
 
         aev = kwargs.get('aev', 0.001)
         npts = kwargs.get('npts', 500)
+        method = kwargs.get('method', 'cumulative')
         psi = np.atleast_1d(psi)
 
+        if method == 'cumulative':
+            k = self._k_from_psi_cumulative(psi, aev, npts, ws=self.w_from_psi(aev))
+            if k.size==1:
+                return k[0]
+            else:
+                return k
+        elif method != 'midpoint':
+            raise ValueError("method must be 'cumulative' or 'midpoint', "
+                             "not {}".format(method))
+
         b = np.log(1.0e6) #conceivably this could be the suction at residual
         a1 = np.log(psi)
         dy1 = (b - a1) / npts
@@ -0,0 +1,954 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+"""
+Tabulated evaluation of one dimensional constitutive relationships.
+
+A monotone relationship y=f(x) (e.g. void ratio from effective stress) is
+sampled once onto a grid of knots and thereafter evaluated by a constant
+time interval lookup and a piecewise cubic Hermite interpolant.  Knots are
+placed adaptively until the interpolant (and its inverse) match the
+sampled function to a given tolerance.  Forward values, inverse values and
+derivatives are all vectorised.
+
+`TabulatedSoilModel`, `TabulatedPermeabilityModel` and `TabulatedSWCC`
+wrap existing constitutive models so they can be used in place of the
+original model.  Only the wrapper's `methods` are evaluated from a table,
+everything else goes to the wrapped model.  Tables are cached with the
+wrapped model's parameters as key and are rebuilt if the parameters
+change.
+
+Notes
+-----
+Evaluating a table costs about as much as a log, a lookup and a cubic
+polynomial per point.  That is slower than simple closed form expressions
+such as `CcCrSoilModel.e_from_stress`, `CkPermeabilityModel.k_from_e` or
+`SWCC_FredlundAndXing1994.w_from_psi` (see benchmarks/bench_tabulated.py)
+so by default the wrappers do not tabulate those.  Tabulation pays off
+when the wrapped relationship is expensive to evaluate (e.g. a
+`FunctionSoilModel` whose inverse needs root finding, the
+`PwiseLinearSoilModel` slope or SWCC dw_dpsi) or when it has no inverse
+at all (e.g. `TabulatedSWCC.psi_from_w`).  Only the normally consolidated
+relationship is tabulated; calls with `pstress` (or any other keyword
+argument) always go to the wrapped model.
+
+"""
+
+
+from __future__ import print_function, division
+
+import collections
+import warnings
+
+import numpy as np
+
+from geotecha.constitutive_models.void_ratio_stress import (
+    OneDimensionalVoidRatioEffectiveStress, AvSoilModel, CcCrSoilModel,
+    PwiseLinearSoilModel)
+from geotecha.constitutive_models.void_ratio_permeability import (
+    PermeabilityVoidRatioRelationship, CkPermeabilityModel,
+    ConstantPermeabilityModel, PwiseLinearPermeabilityModel)
+from geotecha.constitutive_models.swcc import SWCC
+from geotecha.inputoutput.inputoutput import object_attributes_key
+
+
+class TabulatedFunction(object):
+    """Adaptively tabulated monotone function with inverse and derivative
+
+    The function is interpolated in transformed coordinates u=x or ln(x)
+    and v=y or ln(y) by a piecewise cubic Hermite polynomial.  Slopes at
+    each end of each interval are found by one sided finite differences
+    so that kinks located at knots are represented exactly.  The inverse
+    x(y) is a second Hermite polynomial on the same knots using the
+    reciprocal slopes.  Intervals are bisected (all intervals that fail
+    at once) until the forward and inverse interpolants at each interval
+    mid point are within tolerance.
+
+    Parameters
+    ----------
+    func : callable
+        Function to tabulate, y = func(x).  Must accept a 1d array of x.
+    xmin, xmax : float
+        Range of x values to tabulate.
+    xlog, ylog : True/False, optional
+        If True then interpolation is on ln(x) or ln(y) respectively.
+        Default xlog=ylog=False.
+    tol : float, optional
+        Tolerance of the tabulated values.  Where xlog/ylog is True this is
+        a relative error, otherwise it is relative to the largest magnitude
+        of the tabulated x or y values. Default tol=1e-8.
+    n0 : int, optional
+        Number of initial (equally spaced in u) knots. Default n0=17.
+    max_knots : int, optional
+        Maximum number of knots.  A warning is raised if the tolerance is
+        not achieved. Default max_knots=20000.  Intervals are not bisected
+        below 8e-5 times the u range; a warning is also raised if
+        intervals at that width still fail the tolerance (typically a
+        kink or step that is not in `breakpoints`).
+    breakpoints : 1d array of float, optional
+        x values that must be knots, e.g. the location of kinks in the
+        function. Default breakpoints=None.
+
+    Attributes
+    ----------
+    x, y : 1d ndarray of float
+        Knot values.
+    x_range, y_range : tuple of float
+        (min, max) of the tabulated x and y values.
+    monotonic : True/False
+        True if the tabulated function is strictly monotonic in which case
+        `x_from_y` can be used.
+    converged : True/False
+        True if every interval met `tol`.
+    max_error : float
+        Largest error estimate (interval mid point error, scaled as for
+        `tol`) of the forward and, if `monotonic`, inverse interpolants.
+
+    Examples
+    --------
+    >>> a = TabulatedFunction(np.exp, 0, 2, ylog=True)
+    >>> len(a.x)
+    17
+    >>> a.y_from_x(np.array([0.5, 1.5]))
+    array([1.64872127, 4.48168907])
+    >>> a.x_from_y(np.e)
+    1.0
+    >>> a.dy_dx(1.0)
+    2.71828...
+
+    """
+
+    def __init__(self, func, xmin, xmax, xlog=False, ylog=False, tol=1e-8,
+                 n0=17, max_knots=20000, breakpoints=None):
+
+        if not xmax > xmin:
+            raise ValueError("xmax must be greater than xmin.")
+        self.func = func
+        self.xlog = xlog
+        self.ylog = ylog
+        self.tol = tol
+
+        u = np.linspace(self._u(xmin), self._u(xmax), n0)
+        if breakpoints is not None:
+            ub = self._u(np.asarray(breakpoints, dtype=float).ravel())
+            u = np.union1d(u, ub[(ub > u[0]) & (ub < u[-1])])
+
+        span = u[-1] - u[0]
+        self._delta = 1e-5 * span
+        min_width = 8 * self._delta
+
+        v = self._g(u)
+        sl = self._slope(u[:-1], 1)
+        sr = self._slope(u[1:], -1)
+
+        # intervals still to be checked
+        check = np.ones(len(u) - 1, dtype=bool)
+        converged = True
+        # largest error estimate, and its location, of the forward and
+        # inverse interpolants in intervals that are no longer refined
+        worst = [(0.0, np.nan), (0.0, np.nan)]
+        while True:
+            i = np.flatnonzero(check)
+            if len(i) == 0:
+                break
+            h = u[i + 1] - u[i]
+            um = u[i] + 0.5 * h
+            vm = self._g(um)
+
+            vscale = 1.0 if ylog else max(np.max(np.abs(v)), 1e-300)
+            uscale = 1.0 if xlog else max(np.max(np.abs(u)), 1e-300)
+            vh = _hermite(0.5, h, v[i], v[i + 1], sl[i], sr[i])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                uh = _hermite((vm - v[i]) / (v[i + 1] - v[i]),
+                              v[i + 1] - v[i], u[i], u[i + 1],
+                              1 / sl[i], 1 / sr[i])
+            err = (np.abs(vh - vm) / vscale, np.abs(uh - um) / uscale)
+            bad = (err[0] > tol) | ~(err[1] <= tol)
+            bad &= (h > min_width)
+            done = ~bad
+            if len(u) + np.count_nonzero(bad) > max_knots:
+                converged = False
+                done[:] = True
+            for k in range(2):
+                e = np.where(np.isnan(err[k]), np.inf, err[k])[done]
+                if len(e) and e.max() > worst[k][0]:
+                    worst[k] = (e.max(), um[done][np.argmax(e)])
+            if not np.any(bad) or not converged:
+                break
+
+            i = i[bad]
+            um = um[bad]
+            vm = vm[bad]
+            sm_left = self._slope(um, -1)
+            sm_right = self._slope(um, 1)
+
+            # insert the new knots after knot i
+            u = np.insert(u, i + 1, um)
+            v = np.insert(v, i + 1, vm)
+            sl = np.insert(sl, i + 1, sm_right)
+            sr = np.insert(sr, i, sm_left)
+            check = np.zeros(len(u) - 1, dtype=bool)
+            j = i + np.arange(len(i))
+            check[j] = True
+            check[j + 1] = True
+
+        dv = np.diff(v)
+        self.monotonic = bool(
+            (np.all(dv > 0) and np.all(sl > 0) and np.all(sr > 0))
+            or (np.all(dv < 0) and np.all(sl < 0) and np.all(sr < 0)))
+
+        # the inverse of a non-monotonic table is never evaluated
+        self.max_error, uworst = max(worst if self.monotonic else worst[:1])
+        self.converged = converged and self.max_error <= tol
+        if not converged:
+            warnings.warn("max_knots={} reached before achieving "
+                          "tol={}, max error estimate {:.3g} near "
+                          "x={:.6g}".format(max_knots, tol, self.max_error,
+                                            self._x_from_u(uworst)))
+        elif not self.converged:
+            warnings.warn("tol={} not achieved in intervals narrower than "
+                          "the minimum width, max error estimate {:.3g} "
+                          "near x={:.6g}.  Is there a kink or step that "
+                          "should be in breakpoints?".format(
+                              tol, self.max_error, self._x_from_u(uworst)))
+
+        self.x = self._x_from_u(u)
+        self.y = self._y_from_v(v)
+        self.x_range = (self.x[0], self.x[-1])
+        self.y_range = tuple(np.sort(self.y[[0, -1]]))
+        self._forward = _PiecewiseCubic(u, v, sl, sr)
+        if self.monotonic:
+            if dv[0] > 0:
+                self._inverse = _PiecewiseCubic(v, u, 1 / sl, 1 / sr)
+            else:
+                self._inverse = _PiecewiseCubic(v[::-1], u[::-1],
+                                                1 / sr[::-1], 1 / sl[::-1])
+
+    def _u(self, x):
+        return np.log(x) if self.xlog else np.asarray(x, dtype=float)
+
+    def _x_from_u(self, u):
+        return np.exp(u) if self.xlog else u
+
+    def _v(self, y):
+        return np.log(y) if self.ylog else np.asarray(y, dtype=float)
+
+    def _y_from_v(self, v):
+        return np.exp(v) if self.ylog else v
+
+    def _g(self, u):
+        """Function in transformed coordinates"""
+        return self._v(self.func(self._x_from_u(u)))
+
+    def _slope(self, u, side):
+        """One sided second order finite difference dv/du
+
+        side=1 uses points above u, side=-1 uses points below u.
+        """
+        d = side * self._delta
+        g = self._g(np.concatenate([u, u + d, u + 2 * d])).reshape(3, -1)
+        return (-3 * g[0] + 4 * g[1] - g[2]) / (2 * d)
+
+    def inside(self, x):
+        """True where x is within the tabulated range"""
+        x = np.asarray(x)
+        return (x >= self.x_range[0]) & (x <= self.x_range[1])
+
+    def inside_y(self, y):
+        """True where y is within the tabulated range"""
+        y = np.asarray(y)
+        return (y >= self.y_range[0]) & (y <= self.y_range[1])
+
+    def y_from_x(self, x):
+        """Tabulated y value
+
+        Parameters
+        ----------
+        x : float or ndarray of float
+            x values.  Values outside the table are extrapolated with the
+            end cubic polynomials.
+
+        Returns
+        -------
+        y : float or ndarray of float
+            Interpolated function values.
+
+        """
+
+        return self._forward.evaluate(x, log_in=self.xlog,
+                                      exp_out=self.ylog)
+
+    def dy_dx(self, x):
+        """Derivative of the tabulated function
+
+        Parameters
+        ----------
+        x : float or ndarray of float
+            x values.
+
+        Returns
+        -------
+        dydx : float or ndarray of float
+            Derivative of the interpolant.
+
+        """
+
+        return self._forward.evaluate(x, log_in=self.xlog,
+                                      exp_out=self.ylog, derivative=True)
+
+    def x_from_y(self, y):
+        """Tabulated inverse value
+
+        Parameters
+        ----------
+        y : float or ndarray of float
+            y values.  Values outside the table are extrapolated with the
+            end cubic polynomials.
+
+        Returns
+        -------
+        x : float or ndarray of float
+            Interpolated inverse function values.
+
+        """
+
+        if not self.monotonic:
+            raise ValueError("Tabulated function is not strictly monotonic "
+                             "so the inverse cannot be evaluated.")
+        return self._inverse.evaluate(y, log_in=self.ylog,
+                                      exp_out=self.xlog)
+
+
+def _hermite(t, h, p0, p1, m0, m1):
+    """Cubic Hermite polynomial at t in [0, 1] of an interval of width h"""
+    t2 = t * t
+    t3 = t2 * t
+    return ((2 * t3 - 3 * t2 + 1) * p0 + (t3 - 2 * t2 + t) * h * m0
+            + (-2 * t3 + 3 * t2) * p1 + (t3 - t2) * h * m1)
+
+
+def _cubic_coefficients(xk, p, m0, m1):
+    """Power form coefficients of piecewise cubic Hermite polynomials
+
+    Parameters
+    ----------
+    xk : 1d array of float
+        Increasing knots.
+    p : 1d array of float
+        Values at knots.
+    m0, m1 : 1d array of float
+        Slopes at the start and end of each interval.
+
+    Returns
+    -------
+    coef : 2d array of float
+        Shape (5, len(xk) - 1).  For interval i and t=(x-xk[i])*coef[4, i]
+        the polynomial is coef[0, i] + t*(coef[1, i] + t*(coef[2, i]
+        + t*coef[3, i])).
+
+    """
+
+    h = np.diff(xk)
+    dp = np.diff(p)
+    coef = np.empty((5, len(h)))
+    coef[0] = p[:-1]
+    coef[1] = h * m0
+    coef[2] = 3 * dp - h * (2 * m0 + m1)
+    coef[3] = -2 * dp + h * (m0 + m1)
+    coef[4] = 1 / h
+    return coef
+
+
+class _PiecewiseCubic(object):
+    """Piecewise cubic with constant time interval lookup
+
+    Intervals are located with a table of uniform cells, each no wider
+    than the narrowest interval so that a cell holds at most one knot,
+    rather than a binary search.  Points are evaluated in chunks with
+    preallocated buffers so that large inputs do not generate large
+    temporary arrays.
+
+    Parameters
+    ----------
+    xk : 1d array of float
+        Increasing knots.
+    p : 1d array of float
+        Values at knots.
+    m0, m1 : 1d array of float
+        Slopes at the start and end of each interval.
+
+    """
+
+    chunk = 8192
+    max_cells = 2**16
+
+    def __init__(self, xk, p, m0, m1):
+        self.xk = np.ascontiguousarray(xk, dtype=float)
+        coef = _cubic_coefficients(self.xk, p, m0, m1)
+        self.c0, self.c1, self.c2, self.c3, self.c4 = (
+            np.ascontiguousarray(c) for c in coef)
+        n = len(self.xk) - 1
+        # knot at the end of each interval; the last interval extrapolates
+        self.xnext = np.append(self.xk[1:-1], np.inf)
+
+        span = self.xk[-1] - self.xk[0]
+        ncell = int(np.ceil(span / np.min(np.diff(self.xk))))
+        if ncell > self.max_cells:
+            self.cell = None
+            return
+        self.x0 = self.xk[0]
+        self.scale = ncell / span
+        self.last = ncell - 1
+        edges = self.x0 + np.arange(ncell) / self.scale
+        self.cell = np.clip(np.searchsorted(self.xk, edges, side='right') - 1,
+                            0, n - 1)
+        # with knots on cell edges (e.g. bisection of a uniform grid)
+        # the cell gives the interval directly.
+        pos = (self.xk - self.x0) * self.scale
+        self.exact = bool(np.all(np.abs(pos - np.round(pos)) < 1e-9))
+
+    def _locate(self, u, i, tmp, b):
+        """Interval index i of each u, tmp and b are work buffers"""
+        if self.cell is None:
+            i[...] = np.searchsorted(self.xk, u, side='right')
+            i -= 1
+            np.clip(i, 0, len(self.xk) - 2, out=i)
+            return
+        np.subtract(u, self.x0, out=tmp)
+        tmp *= self.scale
+        np.clip(tmp, 0, self.last, out=tmp)
+        with np.errstate(invalid='ignore'):
+            i[...] = tmp
+        # mode='clip' maps the cast of nan to a valid index; the result
+        # is still nan
+        self.cell.take(i, out=i, mode='clip')
+        if not self.exact:
+            self.xnext.take(i, out=tmp)
+            np.greater(u, tmp, out=b)
+            i += b
+
+    def evaluate(self, x, log_in=False, exp_out=False, derivative=False):
+        """Values, or derivatives, of the piecewise cubic
+
+        Parameters
+        ----------
+        x : float or ndarray of float
+            Points to evaluate.  Points outside the knots are extrapolated
+            with the end polynomials.
+        log_in : True/False, optional
+            If True then the polynomial is in ln(x). Default log_in=False.
+        exp_out : True/False, optional
+            If True then the polynomial gives ln(y). Default exp_out=False.
+        derivative : True/False, optional
+            If True then return dy/dx rather than y. Default
+            derivative=False.
+
+        Returns
+        -------
+        y : float or ndarray of float
+            Values (or derivatives), same shape as x.
+
+        """
+
+        x = np.asarray(x, dtype=float)
+        out = np.empty(x.shape)
+        xf = x.reshape(-1)
+        of = out.reshape(-1)
+        npts = xf.size
+        if npts == 0:
+            return out
+        m = min(self.chunk, npts)
+        bufs = (np.empty(m), np.empty(m), np.empty(m), np.empty(m),
+                np.empty(m, dtype=np.intp), np.empty(m, dtype=bool))
+        for start in range(0, npts, m):
+            stop = min(start + m, npts)
+            u, t, y, tmp, i, b = (a[:stop - start] for a in bufs)
+            xs = xf[start:stop]
+            if log_in:
+                np.log(xs, out=u)
+            else:
+                u[...] = xs
+            self._locate(u, i, tmp, b)
+            self.xk.take(i, out=tmp)
+            np.subtract(u, tmp, out=t)
+            self.c4.take(i, out=tmp)
+            t *= tmp
+            if derivative:
+                # (c1 + t*(2*c2 + 3*c3*t)) * c4
+                self.c3.take(i, out=y)
+                y *= 3
+                y *= t
+                self.c2.take(i, out=tmp)
+                tmp *= 2
+                y += tmp
+                y *= t
+                self.c1.take(i, out=tmp)
+                y += tmp
+                self.c4.take(i, out=tmp)
+                y *= tmp
+                if exp_out:
+                    self._horner(i, t, u, tmp)
+                    np.exp(u, out=u)
+                    y *= u
+                if log_in:
+                    y /= xs
+            else:
+                self._horner(i, t, y, tmp)
+                if exp_out:
+                    np.exp(y, out=y)
+            of[start:stop] = y
+        return out[()]
+
+    def _horner(self, i, t, y, tmp):
+        """y = c0 + t*(c1 + t*(c2 + t*c3)) of intervals i"""
+        self.c3.take(i, out=y)
+        y *= t
+        self.c2.take(i, out=tmp)
+        y += tmp
+        y *= t
+        self.c1.take(i, out=tmp)
+        y += tmp
+        y *= t
+        self.c0.take(i, out=tmp)
+        y += tmp
+
+
+_table_cache = collections.OrderedDict()
+_TABLE_CACHE_SIZE = 64
+
+
+def cached_table(model, method, xmin, xmax, **kwargs):
+    """TabulatedFunction of a model method, cached on model parameters
+
+    Parameters
+    ----------
+    model : object
+        Constitutive model.
+    method : str
+        Name of the model method to tabulate, e.g. 'e_from_stress'.
+    xmin, xmax : float
+        Range of x values to tabulate.
+    **kwargs : various
+        Passed to `TabulatedFunction`.
+
+    Returns
+    -------
+    table : TabulatedFunction
+        Table from the cache if one with the same model parameters,
+        method and tabulation arguments already exists.
+
+    Notes
+    -----
+    The most recently used 64 tables are kept.
+
+    """
+
+    bp = kwargs.get('breakpoints', None)
+    if bp is not None:
+        bp = np.asarray(bp, dtype=float).tobytes()
+    key = (object_attributes_key(model), method, xmin, xmax, bp,
+           tuple(sorted((k, v) for k, v in kwargs.items()
+                        if k != 'breakpoints')))
+    table = _table_cache.get(key, None)
+    if table is None:
+        table = TabulatedFunction(getattr(model, method), xmin, xmax,
+                                  **kwargs)
+        _table_cache[key] = table
+        while len(_table_cache) > _TABLE_CACHE_SIZE:
+            _table_cache.popitem(last=False)
+    else:
+        _table_cache.move_to_end(key)
+    return table
+
+
+class _TabulatedModel(object):
+    """Common functionality of tabulated model wrappers
+
+    Tables are kept on the wrapper.  The wrapped model's public attributes
+    are checked by identity (ndarrays also by value) on each call and the
+    tables are only looked up again, with `cached_table`, when they
+    change.  In place changes to mutable parameters other than ndarrays
+    are not detected; assign a new value instead.
+
+    Subclasses list the methods that can be tabulated in
+    `tabulated_methods`.  The default `methods` are those of the first
+    (model class, methods) pair in `_model_defaults` that the wrapped
+    model is an instance of, otherwise `_other_defaults`.
+    """
+
+    tabulated_methods = ()
+    _model_defaults = ()
+    _other_defaults = ()
+
+    def _set_methods(self, methods):
+        if methods is None:
+            methods = self._other_defaults
+            for cls, default in self._model_defaults:
+                if isinstance(self.model, cls):
+                    methods = default
+                    break
+        methods = tuple(methods)
+        for name in methods:
+            if not name in self.tabulated_methods:
+                raise ValueError("{} cannot be tabulated, use methods "
+                                 "from {}.".format(name,
+                                                   self.tabulated_methods))
+        self.methods = methods
+
+    def _table(self, method, xmin, xmax, **kwargs):
+        tables = self.__dict__.setdefault('_tables', {})
+        if not self._model_unchanged():
+            tables.clear()
+            self._model_state = dict(
+                (k, (v, v.copy() if isinstance(v, np.ndarray) else None))
+                for k, v in vars(self.model).items()
+                if not k.startswith('_'))
+        table = tables.get((method, xmin, xmax), None)
+        if table is None:
+            kw = dict(self._tabulate_kwargs)
+            kw.update(kwargs)
+            table = cached_table(self.model, method, xmin, xmax, **kw)
+            tables[(method, xmin, xmax)] = table
+        return table
+
+    def _model_unchanged(self):
+        """True if model parameters are those the tables were made with"""
+        state = self.__dict__.get('_model_state', None)
+        if state is None:
+            return False
+        n = 0
+        for k, v in vars(self.model).items():
+            if k.startswith('_'):
+                continue
+            n += 1
+            old = state.get(k, None)
+            if old is None or v is not old[0]:
+                return False
+            if old[1] is not None and not np.array_equal(v, old[1]):
+                return False
+        return n == len(state)
+
+    @staticmethod
+    def _evaluate(fn, bounds, x, model_fn):
+        """Evaluate fn where x is within bounds, model_fn elsewhere"""
+        x = np.asarray(x, dtype=float)
+        lo, hi = bounds
+        # nan fails both comparisons and is handled with the mask below
+        if x.size == 0 or (np.min(x) >= lo and np.max(x) <= hi):
+            return fn(x)
+        mask = (x >= lo) & (x <= hi)
+        out = np.empty_like(x)
+        out[mask] = fn(x[mask])
+        out[~mask] = model_fn(x[~mask])
+        return out[()]
+
+    def __getattr__(self, name):
+        # anything not tabulated is delegated to the wrapped model
+        if name.startswith('_') or name == 'model':
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+
+class TabulatedSoilModel(_TabulatedModel,
+                         OneDimensionalVoidRatioEffectiveStress):
+    """Tabulated void ratio-effective stress relationship
+
+    Wraps a `OneDimensionalVoidRatioEffectiveStress` model.  The methods
+    in `methods` (from e_from_stress, stress_from_e and av_from_stress)
+    are evaluated from a table of model.e_from_stress on ln(estress).
+    Other methods, calls with `pstress` or other keyword arguments, and
+    values outside the table are passed to the wrapped model.
+
+    Parameters
+    ----------
+    model : OneDimensionalVoidRatioEffectiveStress object
+        Model to tabulate.
+    estress_min, estress_max : float
+        Range of effective stress to tabulate.
+    methods : sequence of str, optional
+        Methods to evaluate from the table.  Default methods=None i.e.
+        none for `CcCrSoilModel` and `AvSoilModel` (the closed forms are
+        faster), ['av_from_stress'] for `PwiseLinearSoilModel` and
+        ['stress_from_e'] (the inverse) for other models.
+    **kwargs : various
+        Passed to `TabulatedFunction` (e.g. tol).  For a
+        `PwiseLinearSoilModel` the default `breakpoints` are model.siga.
+
+    Examples
+    --------
+    >>> from geotecha.constitutive_models.void_ratio_stress import (
+    ...     CcCrSoilModel)
+    >>> a = TabulatedSoilModel(CcCrSoilModel(Cc=3.0, Cr=0.5, siga=10, ea=5),
+    ...                        1.0, 1000.0, methods=['e_from_stress',
+    ...                        'stress_from_e', 'av_from_stress'])
+    >>> a.e_from_stress(np.array([10, 60]))
+    array([5.        , 2.66554625])
+    >>> round(a.stress_from_e(5.0), 6)
+    10.0
+    >>> a.av_from_stress(10)
+    0.13028...
+    >>> a.e_from_stress(40, pstress=50)
+    2.95154...
+
+    """
+
+    tabulated_methods = ('e_from_stress', 'stress_from_e', 'av_from_stress')
+    _model_defaults = ((CcCrSoilModel, ()),
+                       (AvSoilModel, ()),
+                       (PwiseLinearSoilModel, ('av_from_stress',)))
+    _other_defaults = ('stress_from_e',)
+
+    def __init__(self, model, estress_min, estress_max, methods=None,
+                 **kwargs):
+        self.model = model
+        self.estress_min = estress_min
+        self.estress_max = estress_max
+        self._set_methods(methods)
+        if (kwargs.get('breakpoints', None) is None
+                and isinstance(model, PwiseLinearSoilModel)):
+            kwargs['breakpoints'] = model.siga
+        self._tabulate_kwargs = kwargs
+
+    def _e_table(self):
+        return self._table('e_from_stress', self.estress_min,
+                           self.estress_max, xlog=True)
+
+    def e_from_stress(self, estress, **kwargs):
+        """Void ratio from effective stress (see wrapped model)"""
+        if kwargs or not 'e_from_stress' in self.methods:
+            return self.model.e_from_stress(estress, **kwargs)
+        table = self._e_table()
+        return self._evaluate(table.y_from_x, table.x_range, estress,
+                              self.model.e_from_stress)
+
+    def stress_from_e(self, e, **kwargs):
+        """Effective stress from void ratio (see wrapped model)"""
+        if kwargs or not 'stress_from_e' in self.methods:
+            return self.model.stress_from_e(e, **kwargs)
+        table = self._e_table()
+        return self._evaluate(table.x_from_y, table.y_range, e,
+                              self.model.stress_from_e)
+
+    def av_from_stress(self, estress, **kwargs):
+        """Slope of void ratio from effective stress (see wrapped model)"""
+        if kwargs or not 'av_from_stress' in self.methods:
+            return self.model.av_from_stress(estress, **kwargs)
+        table = self._e_table()
+        return self._evaluate(lambda x: -table.dy_dx(x), table.x_range,
+                              estress, self.model.av_from_stress)
+
+    def e_and_stress_for_plotting(self, **kwargs):
+        """Void ratio and stress values that plot the wrapped model"""
+        return self.model.e_and_stress_for_plotting(**kwargs)
+
+
+class TabulatedPermeabilityModel(_TabulatedModel,
+                                 PermeabilityVoidRatioRelationship):
+    """Tabulated permeability-void ratio relationship
+
+    Wraps a `PermeabilityVoidRatioRelationship` model.  The methods in
+    `methods` (from k_from_e and e_from_k) and dk_de are evaluated from a
+    table of ln(model.k_from_e) on void ratio.  Other methods, calls with
+    keyword arguments and values outside the table are passed to the
+    wrapped model.
+
+    Parameters
+    ----------
+    model : PermeabilityVoidRatioRelationship object
+        Model to tabulate.
+    e_min, e_max : float
+        Range of void ratio to tabulate.
+    methods : sequence of str, optional
+        Methods to evaluate from the table.  Default methods=None i.e.
+        none for `CkPermeabilityModel`, `ConstantPermeabilityModel` and
+        `PwiseLinearPermeabilityModel` (the closed forms are faster) and
+        ['e_from_k'] (the inverse) for other models.
+    **kwargs : various
+        Passed to `TabulatedFunction` (e.g. tol).  For a
+        `PwiseLinearPermeabilityModel` the default `breakpoints` are
+        model.ea.
+
+    Examples
+    --------
+    >>> from geotecha.constitutive_models.void_ratio_permeability import (
+    ...     CkPermeabilityModel)
+    >>> a = TabulatedPermeabilityModel(
+    ...     CkPermeabilityModel(Ck=1.5, ka=10, ea=4), 0.5, 5.0,
+    ...     methods=['k_from_e', 'e_from_k'])
+    >>> a.k_from_e(np.array([3.855, 3.404]))
+    array([8.0..., 4.0...])
+    >>> a.e_from_k(8.0)
+    3.854...
+    >>> a.dk_de(4.0)
+    15.35...
+
+    """
+
+    tabulated_methods = ('k_from_e', 'e_from_k')
+    _model_defaults = ((CkPermeabilityModel, ()),
+                       (ConstantPermeabilityModel, ()),
+                       (PwiseLinearPermeabilityModel, ()))
+    _other_defaults = ('e_from_k',)
+
+    def __init__(self, model, e_min, e_max, methods=None, **kwargs):
+        self.model = model
+        self.e_min = e_min
+        self.e_max = e_max
+        self._set_methods(methods)
+        if (kwargs.get('breakpoints', None) is None
+                and isinstance(model, PwiseLinearPermeabilityModel)):
+            kwargs['breakpoints'] = model.ea
+        self._tabulate_kwargs = kwargs
+
+    def _k_table(self):
+        return self._table('k_from_e', self.e_min, self.e_max, ylog=True)
+
+    def k_from_e(self, e, **kwargs):
+        """Permeability from void ratio (see wrapped model)"""
+        if kwargs or not 'k_from_e' in self.methods:
+            return self.model.k_from_e(e, **kwargs)
+        table = self._k_table()
+        return self._evaluate(table.y_from_x, table.x_range, e,
+                              self.model.k_from_e)
+
+    def e_from_k(self, k, **kwargs):
+        """Void ratio from permeability (see wrapped model)"""
+        if kwargs or not 'e_from_k' in self.methods:
+            return self.model.e_from_k(k, **kwargs)
+        table = self._k_table()
+        return self._evaluate(table.x_from_y, table.y_range, k,
+                              self.model.e_from_k)
+
+    def dk_de(self, e):
+        """Slope of the permeability-void ratio relationship
+
+        Parameters
+        ----------
+        e : float or ndarray of float
+            Void ratio.
+
+        Returns
+        -------
+        dkde : float or ndarray of float
+            Derivative of permeability w.r.t. void ratio.  Outside the
+            tabulated range this is model.dk_de if the wrapped model has
+            one, otherwise a central difference of model.k_from_e.
+
+        """
+        table = self._k_table()
+        return self._evaluate(table.dy_dx, table.x_range, e,
+                              self._model_dk_de)
+
+    def _model_dk_de(self, e):
+        """dk/de of the wrapped model"""
+        fn = getattr(self.model, 'dk_de', None)
+        if fn is not None:
+            return fn(e)
+        h = 1e-6 * np.maximum(1.0, np.abs(e))
+        return (self.model.k_from_e(e + h)
+                - self.model.k_from_e(e - h)) / (2 * h)
+
+    def e_and_k_for_plotting(self, **kwargs):
+        """Void ratio and permeability that plot the wrapped model"""
+        return self.model.e_and_k_for_plotting(**kwargs)
+
+
+class TabulatedSWCC(_TabulatedModel, SWCC):
+    """Tabulated soil water characteristic curve
+
+    Wraps a `SWCC` model.  The methods in `methods` (from w_from_psi,
+    psi_from_w and dw_dpsi) are evaluated from a table of model.w_from_psi
+    on ln(psi).  A tabulated psi_from_w works even if the wrapped model
+    has no inverse.  Other methods, calls with keyword arguments and
+    values outside the table are passed to the wrapped model.
+
+    Parameters
+    ----------
+    model : SWCC object
+        Model to tabulate.
+    psi_min, psi_max : float
+        Range of suction to tabulate.
+    methods : sequence of str, optional
+        Methods to evaluate from the table.  Default methods=None i.e.
+        ['psi_from_w', 'dw_dpsi'].  w_from_psi of the SWCC models in
+        geotecha is faster than its table.
+    **kwargs : various
+        Passed to `TabulatedFunction` (e.g. tol).
+
+    Examples
+    --------
+    >>> from geotecha.constitutive_models.swcc import (
+    ...     SWCC_FredlundAndXing1994)
+    >>> a = TabulatedSWCC(SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45,
+    ...                                            psir=300), 1e-2, 1e6)
+    >>> a.dw_dpsi(np.array([1.0, 3.0]))
+    array([-0.00043..., -0.38755...])
+    >>> a.psi_from_w(a.w_from_psi(3.0))
+    3.0...
+
+    """
+
+    tabulated_methods = ('w_from_psi', 'psi_from_w', 'dw_dpsi')
+    _other_defaults = ('psi_from_w', 'dw_dpsi')
+
+    def __init__(self, model, psi_min, psi_max, methods=None, **kwargs):
+        self.model = model
+        self.psi_min = psi_min
+        self.psi_max = psi_max
+        self._set_methods(methods)
+        self._tabulate_kwargs = kwargs
+
+    def _w_table(self):
+        return self._table('w_from_psi', self.psi_min, self.psi_max,
+                           xlog=True)
+
+    def w_from_psi(self, psi, **kwargs):
+        """Water content from suction (see wrapped model)"""
+        if kwargs or not 'w_from_psi' in self.methods:
+            return self.model.w_from_psi(psi, **kwargs)
+        table = self._w_table()
+        return self._evaluate(table.y_from_x, table.x_range, psi,
+                              self.model.w_from_psi)
+
+    def psi_from_w(self, w, **kwargs):
+        """Suction from water content (see wrapped model)"""
+        if kwargs or not 'psi_from_w' in self.methods:
+            return self.model.psi_from_w(w, **kwargs)
+        table = self._w_table()
+        return self._evaluate(table.x_from_y, table.y_range, w,
+                              self.model.psi_from_w)
+
+    def dw_dpsi(self, psi, **kwargs):
+        """Slope of SWCC dw/dpsi (see wrapped model)"""
+        if kwargs or not 'dw_dpsi' in self.methods:
+            return self.model.dw_dpsi(psi, **kwargs)
+        table = self._w_table()
+        return self._evaluate(table.dy_dx, table.x_range, psi,
+                              self.model.dw_dpsi)
+
+    def k_from_psi(self, psi, **kwargs):
+        """Relative permeability from suction (see wrapped model)"""
+        return self.model.k_from_psi(psi, **kwargs)
+
+    def psi_and_w_for_plotting(self, **kwargs):
+        """Suction and water content that plot the wrapped model"""
+        return self.model.psi_and_w_for_plotting(**kwargs)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest',
+                         '--doctest-options=+ELLIPSIS'])
@@ -8,6 +8,7 @@ from numpy.testing import assert_allclose
 import unittest
 import nose
 import inspect
+from nose.tools.trivial import ok_
 
 from geotecha.constitutive_models import epus as epus
 
@@ -280,6 +281,195 @@ def test_EPUSvsVB_case01_fortran():
     # "catasophic cancellation" or "Loss of significance"
 
 
+def test_EPUSvsVB_case01_vectorized():
+    """EPUS vs VB version, Test Case #01 vectorized version
+
+    See test_EPUSvsVB_case01 for details.
+    """
+    #get test data
+    fname = "EPUS_test_data_case01.csv" #needs to be in same directory as file
+    mname = os.path.abspath(os.path.dirname(inspect.getsourcefile(lambda:0)))
+    fpath = os.path.join(mname,
+                          fname)
+
+    data = np.loadtxt(fpath, skiprows=4, dtype=float, delimiter=',', unpack=True)
+    expect = dict()
+    names=['ss', 'st', 'e', 'w', 'Sr', 'vw']
+    for i, v in enumerate(names):
+        expect[v] = data[i]
+
+    SWCC = epus.CurveFittingSWCC(wsat=0.262,
+                            a = 3.1 * 10 ** 6,
+                            b = 3.377,
+                            wr = 0.128,
+                            sl = 0.115)
+
+    stp = epus.StressPath([dict(ist=True, npp=20, vl=20, name="1. Load to 20kPa"),
+                      dict(ist=True, npp=20, vl=1, name="2. Unload to 1kPa"),
+                      dict(ist=False, npp=20, vl=1e6, name="3. Dry to 10^6kPa"),
+                      dict(ist=False, npp=20, vl=30, name="4. Wetting to 30kPa"),
+                      dict(ist=False, npp=20, vl=1500, name="5. Load to 1500kPa")])
+    pdict=dict(
+         SimpleSWCC=SWCC,
+         stp=stp,
+         logDS=0.6,
+         logRS=2,
+         Css=0.019,
+         beta=0.1,
+         soilname='Artificial silt',
+         username='Hung Pham',
+         Npoint=400,
+         implementation='vectorized')
+
+    a = epus.EPUS(**pdict)
+
+    a.Calresults()
+    a.stp.combine_datapoints()
+    dp = a.stp.datapoints_combined
+
+    assert_allclose(dp.ss, expect['ss'], atol=1e-6, rtol=1e-6)
+    assert_allclose(dp.st, expect['st'], atol=1e-6, rtol=1e-6)
+    assert_allclose(dp.e, expect['e'], atol=1e-2, rtol=1e-6)
+    assert_allclose(dp.w, expect['w'], atol=1e-6, rtol=1e-6)
+    assert_allclose(dp.Sr, expect['Sr'], atol=1e-2, rtol=1e-6)
+    assert_allclose(dp.vw, expect['vw'], atol=1e-2, rtol=1e-6)
+
+
+def test_EPUS_vectorized_vs_scalar():
+    """EPUS 'vectorized' implementation gives same results as 'scalar'"""
+
+    SWCC = epus.CurveFittingSWCC(wsat=0.262,
+                            a = 3.1 * 10 ** 6,
+                            b = 3.377,
+                            wr = 0.128,
+                            sl = 0.115)
+
+    def path():
+        return epus.StressPath([
+                      dict(ist=True, npp=10, vl=20, name="Load to 20kPa"),
+                      dict(ist=True, npp=10, vl=1, name="Unload to 1kPa"),
+                      dict(ist=False, npp=10, vl=1e6, name="Dry to 10^6kPa"),
+                      dict(ist=False, npp=10, vl=30, name="Wet to 30kPa"),
+                      dict(ist=False, npp=10, vl=1500, name="Dry to 1500kPa"),
+                      dict(ist=True, npp=10, vl=200, name="Load to 200kPa"),
+                      dict(ist=True, npp=10, vl=50, name="Unload to 50kPa")])
+
+    for extra in [dict(),
+                  dict(Assumption=0),
+                  dict(Ccd=0.05, pm=2.0, K0=0.6),
+                  dict(Pore_shape=5.0)]:
+        results = []
+        for implementation in ['scalar', 'vectorized']:
+            pdict=dict(
+                 SimpleSWCC=SWCC,
+                 stp=path(),
+                 logDS=0.6,
+                 logRS=2,
+                 Css=0.019,
+                 beta=0.1,
+                 Npoint=200,
+                 NumSr=200,
+                 implementation=implementation)
+            pdict.update(extra)
+            a = epus.EPUS(**pdict)
+            a.Calresults()
+            a.stp.combine_datapoints()
+            results.append((a.stp.datapoints_combined, a.errocc))
+
+        (scalar, scalar_err), (vect, vect_err) = results
+        assert_allclose(vect_err, scalar_err)
+        for v in ['ss', 'st', 'e', 'w', 'Sr', 'vw']:
+            assert_allclose(getattr(vect, v), getattr(scalar, v),
+                            rtol=1e-10, atol=1e-12,
+                            err_msg="{} with {}".format(v, extra))
+
+
+
+def test_EpusProfile_batched_vs_loop():
+    """EpusProfile 'batched' solver gives same profile as 'loop'"""
+
+    SWCC = epus.CurveFittingSWCC(wsat=0.262,
+                            a = 3.1 * 10 ** 6,
+                            b = 3.377,
+                            wr = 0.128,
+                            sl = 0.115)
+
+    pdict=dict(
+         SimpleSWCC=SWCC,
+         stp=None,
+         logDS=0.6,
+         logRS=2,
+         Css=0.019,
+         beta=0.1,
+         NumSr=100)
+    epus_object = epus.EPUS(**pdict)
+
+    profiles = []
+    for solver in ['loop', 'batched']:
+        a = epus.EpusProfile(epus_object, H=10, zw=5, q0=10,
+                             nz=6, Npoint=100, npp=8,
+                             max_iter=20, atol=1e-6,
+                             solver=solver, acceleration=None)
+        a.calc()
+        profiles.append(a)
+
+    loop, batched = profiles
+    assert_allclose(batched.niter, loop.niter)
+    for v in ['ss', 'st', 'e', 'w', 'Sr', 'vw', 'gam']:
+        assert_allclose(getattr(batched.profile, v),
+                        getattr(loop.profile, v),
+                        rtol=1e-10, atol=1e-12, err_msg=v)
+
+
+def test_EpusProfile_anderson():
+    """EpusProfile anderson acceleration converges to same profile"""
+
+    SWCC = epus.CurveFittingSWCC(wsat=0.262,
+                            a = 3.1 * 10 ** 6,
+                            b = 3.377,
+                            wr = 0.128,
+                            sl = 0.115)
+
+    pdict=dict(
+         SimpleSWCC=SWCC,
+         stp=None,
+         logDS=0.6,
+         logRS=2,
+         Css=0.019,
+         beta=0.1)
+    epus_object = epus.EPUS(**pdict)
+
+    profiles = []
+    for acceleration in [None, 'anderson']:
+        a = epus.EpusProfile(epus_object, H=10, zw=8, q0=10,
+                             nz=20, Npoint=200, npp=10,
+                             max_iter=50, atol=1e-9, rtol=1e-12,
+                             acceleration=acceleration)
+        a.calc()
+        profiles.append(a)
+
+    plain, anderson = profiles
+    ok_(anderson.niter[0] <= plain.niter[0])
+    for v in ['st', 'e', 'Sr']:
+        assert_allclose(getattr(anderson.profile, v),
+                        getattr(plain.profile, v),
+                        rtol=1e-8, err_msg=v)
+
+
+def test_AndersonMixing_linear():
+    """_AndersonMixing solves a linear fixed point problem"""
+
+    A = np.array([[0.9, 0.05], [0.02, 0.8]])
+    b = np.array([1.0, 2.0])
+    expected = np.linalg.solve(np.eye(2) - A, b)
+
+    accel = epus._AndersonMixing(m=2)
+    x = np.zeros(2)
+    for i in range(6):
+        x = accel.update(x, A.dot(x) + b)
+    assert_allclose(x, expected, rtol=1e-10)
+
+
 
 if __name__ =="__main__":
     import nose
@@ -0,0 +1,105 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+"""
+Testing rotines for swcc module.
+
+"""
+from __future__ import division, print_function
+
+from nose.tools.trivial import ok_
+from nose.tools.trivial import assert_equal
+from nose.tools.trivial import assert_raises
+from numpy.testing import assert_allclose
+
+import numpy as np
+
+
+from geotecha.constitutive_models.swcc import SWCC_FredlundAndXing1994
+from geotecha.constitutive_models.swcc import SWCC_PhamAndFredlund2008
+
+
+def test_k_from_psi_cumulative_vs_midpoint():
+    """k_from_psi method='cumulative' vs fine method='midpoint'"""
+
+    psi = np.logspace(-2.5, 6.3, 40)
+    for a in [SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45, psir=300),
+              SWCC_FredlundAndXing1994(a=427, n=0.794, m=0.613, psir=3000),
+              SWCC_PhamAndFredlund2008(ws=0.262, a=3.1e6, b=3.377,
+                                       wr=0.128, s1=0.115/2.7)]:
+        expected = a.k_from_psi(psi, method='midpoint', npts=20000)
+        assert_allclose(a.k_from_psi(psi), expected, atol=1e-6)
+
+
+def test_k_from_psi_cumulative_scalar():
+    """k_from_psi method='cumulative' scalar input returns scalar"""
+
+    a = SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45, psir=300)
+    k = a.k_from_psi(4)
+    ok_(np.isscalar(k))
+    assert_allclose(k, 0.0520044, atol=1e-6)
+
+
+def test_k_from_psi_cumulative_cache():
+    """k_from_psi table is reused, extended and rebuilt on new parameters"""
+
+    a = SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45, psir=300)
+    a.k_from_psi(np.array([2.0, 10.0]))
+    assert_equal(len(a._k_table_cache), 1)
+    table = list(a._k_table_cache.values())[0]
+
+    a.k_from_psi(np.array([3.0, 100.0]))
+    ok_(list(a._k_table_cache.values())[0] is table)
+
+    # psi below the table is accomodated by extending the table
+    k = a.k_from_psi(np.array([0.5, 3.0]))
+    assert_equal(len(a._k_table_cache), 1)
+    assert_allclose(k, a.k_from_psi(np.array([0.5, 3.0]), method='midpoint',
+                                    npts=20000), atol=1e-6)
+
+    # changed parameters invalidate the table
+    a.n = 5.0
+    k = a.k_from_psi(np.array([2.0, 10.0]))
+    assert_equal(len(a._k_table_cache), 1)
+    assert_allclose(k, a.k_from_psi(np.array([2.0, 10.0]), method='midpoint',
+                                    npts=20000), atol=1e-6)
+
+
+def test_k_from_psi_cumulative_array_parameter():
+    """k_from_psi with ndarray parameters, changed in place"""
+
+    a = SWCC_FredlundAndXing1994(a=np.array(2.77), n=11.2, m=0.45, psir=300)
+    b = SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45, psir=300)
+    psi = np.array([2.0, 10.0])
+    assert_allclose(a.k_from_psi(psi), b.k_from_psi(psi))
+
+    a.a[()] = 427
+    b.a = 427
+    assert_allclose(a.k_from_psi(psi), b.k_from_psi(psi))
+    assert_equal(len(a._k_table_cache), 1)
+
+
+def test_k_from_psi_bad_method():
+    """k_from_psi unknown method raises ValueError"""
+
+    a = SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45, psir=300)
+    assert_raises(ValueError, a.k_from_psi, 4, method='trapz')
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
+#    nose.runmodule(argv=['nose', '--verbosity=3'])
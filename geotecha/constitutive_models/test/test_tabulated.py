@@ -0,0 +1,308 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+
+"""
+Testing rotines for tabulated module.
+
+"""
+from __future__ import division, print_function
+
+from nose.tools.trivial import ok_
+from nose.tools.trivial import assert_equal
+from nose.tools.trivial import assert_raises
+from numpy.testing import assert_allclose
+
+import warnings
+import numpy as np
+
+from geotecha.constitutive_models.tabulated import TabulatedFunction
+from geotecha.constitutive_models.tabulated import TabulatedSoilModel
+from geotecha.constitutive_models.tabulated import TabulatedPermeabilityModel
+from geotecha.constitutive_models.tabulated import TabulatedSWCC
+from geotecha.constitutive_models.tabulated import cached_table
+from geotecha.constitutive_models.tabulated import _PiecewiseCubic
+
+from geotecha.constitutive_models.void_ratio_stress import CcCrSoilModel
+from geotecha.constitutive_models.void_ratio_stress import (
+    PwiseLinearSoilModel)
+from geotecha.constitutive_models.void_ratio_stress import FunctionSoilModel
+from geotecha.constitutive_models.void_ratio_permeability import (
+    CkPermeabilityModel)
+from geotecha.constitutive_models.void_ratio_permeability import (
+    PwiseLinearPermeabilityModel)
+from geotecha.constitutive_models.swcc import SWCC_FredlundAndXing1994
+from geotecha.constitutive_models.swcc import SWCC_PhamAndFredlund2008
+
+ALL_SOIL = ['e_from_stress', 'stress_from_e', 'av_from_stress']
+
+
+def test_TabulatedFunction_forward_inverse_derivative():
+    """TabulatedFunction values, inverse and derivative within tol"""
+
+    for xlog, ylog in [(False, False), (True, False),
+                       (False, True), (True, True)]:
+        a = TabulatedFunction(lambda x: 2 + np.arctan(x - 3), 0.5, 8.0,
+                              xlog=xlog, ylog=ylog, tol=1e-9)
+        x = np.linspace(0.5, 8.0, 1001)
+        y = 2 + np.arctan(x - 3)
+        assert_allclose(a.y_from_x(x), y, rtol=1e-8)
+        assert_allclose(a.x_from_y(y), x, rtol=1e-8)
+        assert_allclose(a.dy_dx(x), 1 / (1 + (x - 3)**2), rtol=1e-5)
+
+
+def test_TabulatedFunction_decreasing():
+    """TabulatedFunction inverse of decreasing function"""
+
+    a = TabulatedFunction(lambda x: 1 / x, 1.0, 100.0, xlog=True)
+    x = np.logspace(0, 2, 50)
+    assert_allclose(a.x_from_y(1 / x), x, rtol=1e-8)
+    ok_(np.isscalar(a.x_from_y(0.5)))
+
+
+def test_TabulatedFunction_not_monotonic():
+    """TabulatedFunction inverse of non-monotonic function raises"""
+
+    a = TabulatedFunction(np.sin, 0, 6.0)
+    ok_(not a.monotonic)
+    assert_allclose(a.y_from_x(2.0), np.sin(2.0), atol=1e-8)
+    assert_raises(ValueError, a.x_from_y, 0.5)
+
+
+def test_TabulatedFunction_breakpoints():
+    """TabulatedFunction kinks at breakpoints need no extra knots"""
+
+    def f(x):
+        return np.where(x < 2.0, x, 2.0 + 3 * (x - 2.0))
+
+    a = TabulatedFunction(f, 0.0, 4.0, breakpoints=[2.0])
+    x = np.linspace(0, 4.0, 101)
+    assert_allclose(a.y_from_x(x), f(x), atol=1e-12)
+    ok_(len(a.x) <= 18)
+
+
+def test_TabulatedFunction_lookup():
+    """TabulatedFunction interval lookup; cells, searchsorted, nan, shape"""
+
+    def f(x):
+        return np.where(x < 2.3, x, 2.3 + 3 * (x - 2.3))**3
+
+    x = np.linspace(0.5, 4.0, 1001)
+    expected = f(x)
+    a = TabulatedFunction(f, 0.5, 4.0, breakpoints=[2.3])
+    ok_(not a._forward.exact)
+    assert_allclose(a.y_from_x(x), expected, rtol=1e-7)
+    assert_allclose(a.x_from_y(expected), x, rtol=1e-7)
+
+    max_cells = _PiecewiseCubic.max_cells
+    try:
+        _PiecewiseCubic.max_cells = 2
+        b = TabulatedFunction(f, 0.5, 4.0, breakpoints=[2.3])
+    finally:
+        _PiecewiseCubic.max_cells = max_cells
+    ok_(b._forward.cell is None)
+    assert_allclose(b.y_from_x(x), a.y_from_x(x), atol=1e-12)
+
+    y = a.y_from_x(np.array([[0.5, np.nan], [np.inf, 3.0]]))
+    assert_equal(y.shape, (2, 2))
+    ok_(np.isnan(y[0, 1]))
+    assert_allclose(y[[0, 1], [0, 1]], f(np.array([0.5, 3.0])), rtol=1e-8)
+    assert_equal(a.y_from_x(np.array([])).shape, (0,))
+
+
+def test_TabulatedFunction_max_knots():
+    """TabulatedFunction warns when tol cannot be achieved"""
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        a = TabulatedFunction(np.exp, 0, 20.0, tol=1e-14, max_knots=30)
+    ok_(any('max_knots' in str(v.message) for v in w))
+    ok_(not a.converged)
+    ok_(a.max_error > 1e-14)
+
+
+def test_TabulatedFunction_min_width():
+    """TabulatedFunction warns when a kink is not in breakpoints"""
+
+    xk = 50.3
+
+    def f(x):
+        return np.where(x < xk, np.log(x),
+                        np.log(xk) + 2 * (np.log(x) - np.log(xk)))
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        a = TabulatedFunction(f, 1.0, 1000.0, xlog=True, tol=1e-8)
+    ok_(any('breakpoints' in str(v.message) for v in w))
+    ok_(not a.converged)
+    x = np.linspace(50.2, 50.4, 100001)
+    err = np.max(np.abs(a.y_from_x(x) - f(x))) / np.max(np.abs(a.y))
+    ok_(a.max_error > 1e-8)
+    assert_allclose(a.max_error, err, rtol=0.5)
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        a = TabulatedFunction(f, 1.0, 1000.0, xlog=True, tol=1e-8,
+                              breakpoints=[xk])
+    assert_equal(len(w), 0)
+    ok_(a.converged)
+    ok_(a.max_error <= 1e-8)
+
+
+def test_TabulatedSoilModel_CcCr():
+    """TabulatedSoilModel of CcCrSoilModel vs model"""
+
+    model = CcCrSoilModel(Cc=3.0, Cr=0.5, siga=10, ea=5)
+    a = TabulatedSoilModel(model, 1.0, 1000.0, methods=ALL_SOIL)
+    estress = np.logspace(0, 3, 200)
+    e = model.e_from_stress(estress)
+    assert_allclose(a.e_from_stress(estress), e, atol=1e-10)
+    assert_allclose(a.stress_from_e(e), estress, rtol=1e-10)
+    assert_allclose(a.av_from_stress(estress),
+                    model.av_from_stress(estress), rtol=1e-6)
+
+    # keyword arguments and out of range values go to the model
+    assert_allclose(a.e_from_stress(40, pstress=50),
+                    model.e_from_stress(40, pstress=50))
+    x = np.array([0.5, 10.0, 2000.0])
+    assert_allclose(a.e_from_stress(x), model.e_from_stress(x))
+    assert_allclose(a.stress_from_e(model.e_from_stress(x)), x)
+
+    # other attributes are those of the model
+    assert_equal(a.Cc, 3.0)
+
+
+def test_TabulatedSoilModel_methods():
+    """TabulatedSoilModel default methods depend on the model"""
+
+    model = CcCrSoilModel(Cc=3.0, Cr=0.5, siga=10, ea=5)
+    a = TabulatedSoilModel(model, 1.0, 1000.0)
+    assert_equal(a.methods, ())
+    x = np.array([2.0, 30.0])
+    assert_allclose(a.e_from_stress(x), model.e_from_stress(x), rtol=0)
+    ok_(not hasattr(a, '_tables'))
+
+    model = PwiseLinearSoilModel(siga=np.array([1.0, 10, 100, 1000]),
+                                 ea=np.array([3.0, 2.5, 1.8, 1.2]),
+                                 Cr=0.1, xlog=True)
+    assert_equal(TabulatedSoilModel(model, 1.0, 1000.0).methods,
+                 ('av_from_stress',))
+
+    model = FunctionSoilModel(lambda s: 3 - np.log(s), lambda e: np.exp(3 - e),
+                              lambda s: 1 / s)
+    a = TabulatedSoilModel(model, 1.0, 1000.0)
+    assert_equal(a.methods, ('stress_from_e',))
+    assert_allclose(a.stress_from_e(np.array([1.0, 2.5])),
+                    np.exp([2.0, 0.5]), rtol=1e-8)
+
+    assert_raises(ValueError, TabulatedSoilModel, model, 1.0, 1000.0,
+                  methods=['k_from_e'])
+
+
+def test_TabulatedSoilModel_PwiseLinear():
+    """TabulatedSoilModel of PwiseLinearSoilModel uses siga breakpoints"""
+
+    model = PwiseLinearSoilModel(siga=np.array([1.0, 10, 100, 1000]),
+                                 ea=np.array([3.0, 2.5, 1.8, 1.2]),
+                                 Cr=0.1, xlog=True)
+    a = TabulatedSoilModel(model, 1.0, 1000.0, methods=ALL_SOIL)
+    estress = np.logspace(0, 3, 200)
+    e = model.e_from_stress(estress)
+    assert_allclose(a.e_from_stress(estress), e, atol=1e-10)
+    assert_allclose(a.stress_from_e(e), estress, rtol=1e-10)
+
+
+def test_TabulatedPermeabilityModel():
+    """TabulatedPermeabilityModel vs model"""
+
+    for model in [CkPermeabilityModel(Ck=1.5, ka=10, ea=4),
+                  PwiseLinearPermeabilityModel(ka=np.array([1e-10, 1e-9,
+                                                            1e-8]),
+                                               ea=np.array([1.0, 2.0, 3.0]),
+                                               xlog=True)]:
+        assert_equal(TabulatedPermeabilityModel(model, 1.0, 3.0).methods, ())
+        a = TabulatedPermeabilityModel(model, 1.0, 3.0,
+                                       methods=['k_from_e', 'e_from_k'])
+        e = np.linspace(1.0, 3.0, 101)
+        k = model.k_from_e(e)
+        assert_allclose(a.k_from_e(e), k, rtol=1e-8)
+        assert_allclose(a.e_from_k(k), e, rtol=1e-8)
+
+    model = CkPermeabilityModel(Ck=1.5, ka=10, ea=4)
+    a = TabulatedPermeabilityModel(model, 1.0, 3.0)
+    assert_allclose(a.dk_de(e), model.k_from_e(e) * np.log(10) / 1.5,
+                    rtol=1e-6)
+    # outside the table
+    e = np.array([0.5, 2.0, 3.5])
+    assert_allclose(a.dk_de(e), model.k_from_e(e) * np.log(10) / 1.5,
+                    rtol=1e-6)
+
+
+def test_TabulatedSWCC():
+    """TabulatedSWCC vs model, psi_from_w without model inverse"""
+
+    psi = np.logspace(-2, 6, 500)
+    for model in [SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45,
+                                           psir=300),
+                  SWCC_PhamAndFredlund2008(ws=0.262, a=3.1e6, b=3.377,
+                                           wr=0.128, s1=0.115/2.7)]:
+        a = TabulatedSWCC(model, 1e-2, 1e6,
+                          methods=['w_from_psi', 'psi_from_w', 'dw_dpsi'])
+        w = model.w_from_psi(psi)
+        assert_allclose(a.w_from_psi(psi), w, atol=1e-7)
+        dw = model.dw_dpsi(psi)
+        assert_allclose(a.dw_dpsi(psi), dw, atol=1e-5 * np.max(np.abs(dw)))
+
+    model = SWCC_FredlundAndXing1994(a=2.77, n=11.2, m=0.45, psir=300)
+    a = TabulatedSWCC(model, 1e-2, 1e6)
+    assert_equal(a.methods, ('psi_from_w', 'dw_dpsi'))
+    assert_allclose(a.w_from_psi(psi), model.w_from_psi(psi), rtol=0)
+    psi = np.logspace(-1, 5, 50)
+    assert_allclose(a.psi_from_w(model.w_from_psi(psi)), psi, rtol=1e-6)
+    assert_allclose(a.k_from_psi(4), model.k_from_psi(4))
+
+
+def test_cached_table():
+    """tables are shared between equal models and rebuilt on change"""
+
+    model = CcCrSoilModel(Cc=3.0, Cr=0.5, siga=10, ea=5)
+    a = TabulatedSoilModel(model, 1.0, 1000.0, methods=ALL_SOIL)
+    b = TabulatedSoilModel(CcCrSoilModel(Cc=3.0, Cr=0.5, siga=10, ea=5),
+                           1.0, 1000.0)
+    ok_(a._e_table() is b._e_table())
+    ok_(cached_table(model, 'e_from_stress', 1.0, 1000.0, xlog=True)
+        is a._e_table())
+
+    table = a._e_table()
+    ok_(a._e_table() is table)
+    model.Cc = 2.0
+    ok_(a._e_table() is not table)
+    assert_allclose(a.e_from_stress(40.0), model.e_from_stress(40.0))
+
+    # in place changes to array parameters are detected
+    model = PwiseLinearSoilModel(siga=np.array([1.0, 10, 100, 1000]),
+                                 ea=np.array([3.0, 2.5, 1.8, 1.2]),
+                                 Cr=0.1, xlog=True)
+    a = TabulatedSoilModel(model, 1.0, 1000.0, methods=ALL_SOIL)
+    table = a._e_table()
+    model.ea[1] = 2.2
+    ok_(a._e_table() is not table)
+    assert_allclose(a.e_from_stress(10.0), 2.2)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
+#    nose.runmodule(argv=['nose', '--verbosity=3'])
@@ -28,6 +28,7 @@ from nose.tools.trivial import assert_false
 from nose.tools.trivial import assert_equal
 #from nose.tools.trivial import assertSequenceEqual
 import unittest
+import warnings
 import matplotlib.pyplot as plt
 from numpy.testing import assert_allclose
 
@@ -227,6 +228,124 @@ def test_YinAndGrahamSoilModel_av_from_stress_CRSS_methods():
     assert_allclose(av, av_check, atol=0.0001)
 
 
+def test_YinAndGrahamSoilModel_inc_from_stress_constant_stress():
+    """creep integral increment when stress is constant over dt"""
+
+    a = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20, ea=1, ta=1,
+                              e0=0.95, estress0=18)
+    inc = a._inc_from_stress(18.0, 5.0)
+    assert_allclose(inc, 5.0 / a.t0)
+
+    a._estress[:] = 25.0
+    inc = a._inc_from_stress(25.0, 5.0)
+    assert_allclose(inc, 5.0 / a.t0 * (25.0 / 18.0)**a._alpha)
+
+
+def test_YinAndGrahamSoilModel_CRSN_batch_vs_odeint():
+    """CRSN_batch with per point parameters and rates vs CRSN odeint"""
+
+    lam = np.array([0.2, 0.2, 0.25])
+    e0 = np.array([0.95, 0.90, 0.95])
+    estress0 = np.array([18.0, 18.0, 15.0])
+    tt = np.array([0.0, 1000, 1001, 1e4])
+    edot = -np.array([[1e-4, 1e-4, 1e-5, 1e-5],
+                      [1e-5, 1e-5, 1e-5, 1e-5],
+                      [1e-4, 1e-4, 0.0, 0.0]])
+
+    a = YinAndGrahamSoilModel(lam=lam, kap=0.04, psi=0.01, siga=20, ea=1,
+                              ta=1, e0=e0, estress0=estress0)
+    tvals, estress, e, edot_ = a.CRSN_batch(tt, edot)
+
+    assert_equal(estress.shape, (3, len(tvals)))
+    for i in range(3):
+        b = YinAndGrahamSoilModel(lam=lam[i], kap=0.04, psi=0.01, siga=20,
+                                  ea=1, ta=1, e0=e0[i], estress0=estress0[i])
+        tvals2, estress2, e2, edot_2 = b.CRSN(tt, edot[i], method='odeint')
+        assert_allclose(tvals, tvals2)
+        assert_allclose(edot_[i], edot_2)
+        assert_allclose(e[i], e2, atol=1e-12)
+        assert_allclose(estress[i], estress2, rtol=1e-5)
+
+
+def test_YinAndGrahamSoilModel_CRSS_batch_vs_odeint():
+    """CRSS_batch with per point time values vs CRSS odeint"""
+
+    tt = np.array([[0.0, 20, 20.001, 80],
+                   [0.0, 20, 40, 80]])
+    estressdot = np.array([[1, 1, 1e-1, 1e-1],
+                           [1, 0, 0, 0]])
+
+    a = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20, ea=1,
+                              ta=1, e0=0.95, estress0=18)
+    tvals, estress, e, estressdot_ = a.CRSS_batch(tt, estressdot)
+
+    ok_(np.all(np.in1d(tt, tvals)))
+    for i in range(2):
+        b = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20,
+                                  ea=1, ta=1, e0=0.95, estress0=18)
+        tvals2, estress2, e2, estressdot_2 = b.CRSS(tt[i], estressdot[i],
+                                                    method='odeint')
+        assert_allclose(np.interp(tvals2, tvals, estress[i]), estress2)
+        assert_allclose(np.interp(tvals2, tvals, e[i]), e2, atol=5e-6)
+
+
+def test_YinAndGrahamSoilModel_batch_vs_step_igral():
+    """CRSN_batch and CRSS_batch vs CRSN and CRSS with nonzero _igral"""
+
+    def model():
+        a = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20,
+                                  ea=1, ta=1, e0=0.95, estress0=18)
+        a._igral = 3.1
+        return a
+
+    tt = [0.0, 1000, 1001, 1e4]
+    edot = [-1e-4, -1e-4, -1e-5, -1e-5]
+    tvals, estress, e, edot_ = model().CRSN_batch(tt, edot)
+    tvals2, estress2, e2, edot_2 = model().CRSN(tt, edot)
+    assert_allclose(tvals, tvals2)
+    assert_allclose(e[0], e2, atol=1e-6)
+    assert_allclose(estress[0], estress2, rtol=5e-3)
+
+    tt = [0.0, 20, 80]
+    estressdot = [1, 1, 0.1]
+    tvals, estress, e, estressdot_ = model().CRSS_batch(tt, estressdot)
+    tvals2, estress2, e2, estressdot_2 = model().CRSS(tt, estressdot)
+    assert_allclose(tvals, tvals2)
+    assert_allclose(e[0], e2, atol=1e-3)
+    assert_allclose(e[0, 0], 0.95)
+    assert_allclose(estress[0, 0], 18)
+
+
+def test_YinAndGrahamSoilModel_CRSS_batch_state_unchanged():
+    """CRSS_batch does not alter the model state"""
+
+    a = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20, ea=1,
+                              ta=1, e0=0.95, estress0=18)
+    a.CRSS_batch([0, 20], [1, 1])
+    assert_equal(a._igral, 0)
+    assert_allclose(a._estress, 18)
+
+
+def test_YinAndGrahamSoilModel_CRSN_batch_max_substeps():
+    """CRSN_batch warns when rtol is not achieved"""
+
+    a = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20, ea=1,
+                              ta=1, e0=0.95, estress0=18)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        a.CRSN_batch([0, 1000, 1001, 1e4], [-1e-4, -1e-4, -1e-5, -1e-5],
+                     max_substeps=4)
+    ok_(any('max_substeps' in str(v.message) for v in w))
+
+
+def test_YinAndGrahamSoilModel_CRSN_batch_bad_shape():
+    """CRSN_batch points must be 1d"""
+
+    a = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20, ea=1,
+                              ta=1, e0=np.ones((2, 2)), estress0=18)
+    assert_raises(ValueError, a.CRSN_batch, [0, 10], [-1e-4, -1e-4])
+
+
 if __name__ == "__main__":
 #    DEBUG = True
     import nose
@@ -25,6 +25,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import functools
+import warnings
 from scipy.optimize import fixed_point
 from scipy.integrate import odeint
 import geotecha.piecewise.piecewise_linear_1d as pwise
@@ -1641,25 +1642,14 @@ class YinAndGrahamSoilModel(OneDimensionalVoidRatioEffectiveStress):
 
         nans = np.isnan(self._inc)
 
-        # Following expression gives errors when t0, estress0 or _estress are
-        # not arrays so I did it differently (may be slower):
-        # self._inc[nans] = dt / self.t0[nans] * (self._estress[nans] / self.estress0[nans]) ** (self._alpha + 1)
-        if np.isscalar(self._estress):
-            self._inc[nans] = self._estress
-        else:
-            self._inc[nans] = self._estress[nans]
-
-        if np.isscalar(self.estress0):
-            self._inc[nans] /= self.estress0
-        else:
-            self._inc[nans] /= self.estress0[nans]
-
-        np.power(self._inc[nans],(self._alpha + 1),out=self._inc[nans])
-
-        if np.isscalar(self.t0):
-            self._inc[nans] /= self.t0
-        else:
-            self._inc[nans] /= self.t0[nans]
+        if np.any(nans):
+            # Stress constant over dt, the limit of the above expression is
+            # dt / t0 * (estress / estress0) ** alpha.
+            estress_, estress0, t0, alpha = np.broadcast_arrays(
+                self._estress, self.estress0, self.t0, self._alpha)
+            self._inc[nans] = (dt / t0[nans]
+                               * (estress_[nans] / estress0[nans])
+                               ** alpha[nans])
 
         return self._inc
 
@@ -2041,6 +2031,299 @@ class YinAndGrahamSoilModel(OneDimensionalVoidRatioEffectiveStress):
 
         return tvals_, estress, e, estressdot_
 
+    def CRSN_batch(self, tvals, edot, **kwargs):
+        """Constant rate of strain simulation of many material points
+
+        Like `CRSN` with method='step' but N independent material points are
+        integrated in lockstep as arrays.  Model parameters (lam, kap, psi,
+        siga, ea, ta) and initial conditions (e0, estress0 etc.) may be
+        arrays of length N.  Each point may have its own void ratio rate
+        history.
+
+        Parameters
+        ----------
+        tvals : 1d or 2d array of float
+            Time values for piecewise linear strain-rate vs time.  A 1d
+            array is shared by all points. A 2d array of shape (N, nt) gives
+            each point its own time values; the union of all time
+            values will then be used to build the common output times.
+        edot : 1d or 2d array of float
+            Time rate of change of void ratio corresponding to tvals.  A 1d
+            array is shared by all points, a 2d array of shape (N, nt) gives
+            each point its own rate history.  Outside a point's own tvals
+            the rate is held at the end values (as per np.interp).
+        rtol : float, optional
+            Relative tolerance used for adaptive substepping.  Each time
+            increment is integrated with n and 2n substeps; n is doubled
+            until the effective stress of every point agrees to within
+            rtol. Default rtol=1e-6.
+        max_substeps : int, optional
+            Maximum number of substeps per time increment.  A warning is
+            raised if rtol could not be achieved.  Default max_substeps=1024.
+        **kwargs : various
+            Other arguments will be passed to the subdivide_x_into_segments
+            function.  If not given then the following values will be used,
+            dx = (tvals[-1]-tvals[0])/200, min_segments=50.
+
+        Returns
+        -------
+        tvals_ : 1d array of float
+            Time values common to all points.
+        estress : 2d array of float
+            Effective stress at tvals_. Shape (N, len(tvals_)).
+        e : 2d array of float
+            Void ratio at tvals_. Shape (N, len(tvals_)).
+        edot_ : 2d array of float
+            Time rate of change of void ratio at tvals_.
+            Shape (N, len(tvals_)).
+
+        See Also
+        --------
+        CRSN : Single material point simulation.
+        CRSS_batch : Constant rate of stress for many material points.
+
+        Notes
+        -----
+        Unlike `CRSN` the model state (self._igral, self._estress) is not
+        used or altered other than self._igral as the starting
+        value of the creep integral.  As with `CRSN` the first values
+        are e0 and estress0 whatever the value of self._igral.  Void ratio
+        at tvals_ is the exact integral of the piecewise linear edot.
+
+        Examples
+        --------
+        >>> a = YinAndGrahamSoilModel(lam=0.2, kap=0.04, psi=0.01, siga=20,
+        ... ea=1, ta=1, e0=0.95, estress0=np.array([18.0, 18.0, 12.0]))
+        >>> tvals, estress, e, edot_ = a.CRSN_batch([0, 1000],
+        ...     -np.array([[1e-4, 1e-4], [1e-5, 1e-5], [1e-4, 1e-4]]))
+        >>> estress.shape
+        (3, 201)
+        >>> estress[:, -1]
+        array([33.25..., 18.90..., 33.25...])
+
+        """
+
+        return self._batch_integrate(tvals, edot, 'e', kwargs)
+
+    def CRSS_batch(self, tvals, estressdot, **kwargs):
+        """Constant rate of stress simulation of many material points
+
+        Like `CRSS` with method='step' but N independent material points are
+        integrated in lockstep as arrays.  Model parameters (lam, kap, psi,
+        siga, ea, ta) and initial conditions (e0, estress0 etc.) may be
+        arrays of length N.  Each point may have its own stress rate
+        history.
+
+        Parameters
+        ----------
+        tvals : 1d or 2d array of float
+            Time values for piecewise linear stress-rate vs time.  A 1d
+            array is shared by all points. A 2d array of shape (N, nt) gives
+            each point its own time values; the union of all time
+            values will then be used to build the common output times.
+        estressdot : 1d or 2d array of float
+            Time rate of change of effective stress corresponding to tvals.
+            A 1d array is shared by all points, a 2d array of shape (N, nt)
+            gives each point its own rate history.  Outside a point's own
+            tvals the rate is held at the end values (as per np.interp).
+        rtol : float, optional
+            Relative tolerance used for adaptive substepping.  Each time
+            increment is integrated with n and 2n substeps; n is doubled
+            until the void ratio of every point agrees to within
+            rtol. Default rtol=1e-6.
+        max_substeps : int, optional
+            Maximum number of substeps per time increment.  A warning is
+            raised if rtol could not be achieved.  Default max_substeps=1024.
+        **kwargs : various
+            Other arguments will be passed to the subdivide_x_into_segments
+            function.  If not given then the following values will be used,
+            dx = (tvals[-1]-tvals[0])/200, min_segments=50.
+
+        Returns
+        -------
+        tvals_ : 1d array of float
+            Time values common to all points.
+        estress : 2d array of float
+            Effective stress at tvals_. Shape (N, len(tvals_)).
+        e : 2d array of float
+            Void ratio at tvals_. Shape (N, len(tvals_)).
+        estressdot_ : 2d array of float
+            Time rate of change of stress at tvals_.
+            Shape (N, len(tvals_)).
+
+        See Also
+        --------
+        CRSS : Single material point simulation.
+        CRSN_batch : Constant rate of strain for many material points.
+
+        Notes
+        -----
+        Unlike `CRSS` the model state (self._igral, self._estress) is not
+        used or altered other than self._igral as the starting
+        value of the creep integral.  As with `CRSS` the first values
+        are e0 and estress0 whatever the value of self._igral.  Effective stress
+        at tvals_ is the exact integral of the piecewise linear estressdot.
+
+        Examples
+        --------
+        >>> a = YinAndGrahamSoilModel(lam=np.array([0.2, 0.25]), kap=0.04,
+        ... psi=0.01, siga=20, ea=1, ta=1, e0=0.95, estress0=18)
+        >>> tvals, estress, e, estressdot_ = a.CRSS_batch([0, 20, 80],
+        ...     [1, 0, 0])
+        >>> e[:, -1]
+        array([0.890..., 0.873...])
+
+        """
+
+        return self._batch_integrate(tvals, estressdot, 'estress', kwargs)
+
+    def _batch_integrate(self, tvals, rate, control, kwargs):
+        """Lockstep integration of many material points
+
+        Parameters
+        ----------
+        tvals : 1d or 2d array of float
+            Time values, shared or per point.
+        rate : 1d or 2d array of float
+            Rate of the controlled variable, shared or per point.
+        control : ['e', 'estress']
+            The controlled variable.
+        kwargs : dict
+            rtol, max_substeps and subdivide_x_into_segments arguments.
+
+        Returns
+        -------
+        tvals_, estress, e, rate_ : ndarray
+            See `CRSN_batch` and `CRSS_batch`.
+
+        """
+
+        kwargs = dict(kwargs)
+        rtol = kwargs.pop('rtol', 1e-6)
+        max_substeps = kwargs.pop('max_substeps', 1024)
+
+        tvals = np.asarray(tvals, dtype=float)
+        rate = np.asarray(rate, dtype=float)
+        if tvals.ndim > 2 or rate.ndim > 2:
+            raise ValueError("tvals and rate must be 1d or 2d arrays.")
+        tgrid = np.unique(tvals) if tvals.ndim == 2 else tvals
+
+        kwargs['dx'] = kwargs.get('dx', (tgrid[-1] - tgrid[0]) / 200)
+        kwargs['min_segments'] = kwargs.get('min_segments', 50)
+        tvals_ = pwise.subdivide_x_into_segments(tgrid, **kwargs)
+
+        # broadcast parameters and initial conditions to N points
+        params = [np.atleast_1d(np.asarray(v, dtype=float)) for v in
+                  (self.kap, self.psi, self._alpha, self.e0,
+                   self.estress0, self.t0, self._igral)]
+        params = np.broadcast_arrays(np.empty(tvals.shape[:-1]),
+                                     np.empty(rate.shape[:-1]), *params)[2:]
+        if params[0].ndim != 1:
+            raise ValueError("Parameters, initial conditions and rates "
+                             "must broadcast to a 1d array of material "
+                             "points.")
+        kap, psi, alpha, e0, estress0, t0, igral = params
+        npts = len(kap)
+
+        rate_ = np.empty((npts, len(tvals_)), dtype=float)
+        if tvals.ndim == 1 and rate.ndim == 1:
+            rate_[:] = np.interp(tvals_, tvals, rate)
+        else:
+            tv = np.broadcast_to(np.atleast_2d(tvals),
+                                 (npts, tvals.shape[-1]))
+            rt = np.broadcast_to(np.atleast_2d(rate), (npts, rate.shape[-1]))
+            for i in range(npts):
+                rate_[i] = np.interp(tvals_, tv[i], rt[i])
+
+        dt = np.diff(tvals_)
+        x0 = e0 if control == 'e' else estress0
+        x = np.empty_like(rate_)
+        x[:, 0] = x0
+        x[:, 1:] = 0.5 * (rate_[:, :-1] + rate_[:, 1:]) * dt
+        np.cumsum(x, axis=1, out=x)
+
+        ap1 = alpha + 1
+        lnestress0 = np.log(estress0)
+
+        def increment(sn, so, h):
+            """Creep integral increment, stress linear from so to sn"""
+            L = np.log(sn / so)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                ratio = np.where(L == 0, ap1, np.expm1(ap1 * L) / np.expm1(L))
+            return h / (ap1 * t0) * (so / estress0)**alpha * ratio
+
+        def estress_from_e(e, ig, so, h):
+            """Newton iteration on ln(estress) for all points at once"""
+            def resid(y):
+                return (e0 - kap * (y - lnestress0)
+                        - psi * np.log1p(ig + increment(np.exp(y), so, h))
+                        - e)
+            y = np.log(so)
+            for _ in range(50):
+                f = resid(y)
+                dy = -f * 1e-7 / (resid(y + 1e-7) - f)
+                np.clip(dy, -1.0, 1.0, out=dy)
+                y += dy
+                if np.max(np.abs(dy)) < 1e-13:
+                    break
+            return np.exp(y)
+
+        def advance(i, ig, s, nsub):
+            """Integrate interval i with nsub substeps"""
+            h = dt[i] / nsub
+            r0 = rate_[:, i]
+            dr = (rate_[:, i + 1] - r0) / dt[i]
+            for k in range(1, nsub + 1):
+                tau = k * h
+                xt = x[:, i] + r0 * tau + 0.5 * dr * tau**2
+                if k == nsub:
+                    xt = x[:, i + 1]
+                if control == 'e':
+                    sn = estress_from_e(xt, ig, s, h)
+                else:
+                    sn = xt
+                ig = ig + increment(sn, s, h)
+                s = sn
+            if control == 'e':
+                return ig, s, s
+            return ig, s, e0 - kap * np.log(s / estress0) - psi * np.log1p(ig)
+
+        estress = np.empty_like(rate_)
+        e = np.empty_like(rate_)
+        # like CRSN and CRSS the start state is (e0, estress0) whatever the
+        # creep integral; igral only enters through the increments.
+        estress[:, 0] = estress0
+        e[:, 0] = e0
+
+        s = estress[:, 0]
+        nsub = 1
+        converged = True
+        for i in range(len(dt)):
+            nsub = max(nsub // 2, 1)
+            coarse = advance(i, igral, s, nsub)
+            while True:
+                fine = advance(i, igral, s, 2 * nsub)
+                err = np.max(np.abs(fine[2] - coarse[2]) / np.abs(fine[2]))
+                if err <= rtol:
+                    break
+                if 2 * nsub >= max_substeps:
+                    converged = False
+                    break
+                coarse = fine
+                nsub *= 2
+            igral, s, _ = fine
+            estress[:, i + 1] = s
+            if control == 'e':
+                e[:, i + 1] = x[:, i + 1]
+            else:
+                e[:, i + 1] = fine[2]
+
+        if not converged:
+            warnings.warn("max_substeps={} reached without achieving "
+                          "rtol={}".format(max_substeps, rtol))
+
+        return tvals_, estress, e, rate_
+
 
 
 if __name__ == '__main__':
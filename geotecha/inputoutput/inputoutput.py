@@ -33,7 +33,6 @@ import textwrap
 import inspect
 import numpy as np
 from geotecha.piecewise.piecewise_linear_1d import PolyLine
-from sympy.printing.fcode import FCodePrinter
 import multiprocessing
 import time
 try:
@@ -44,8 +43,6 @@ except ImportError:
     from io import StringIO
 import re
 import os
-import pandas as pd
-import matplotlib.pyplot as plt
 import time
 import time
 from datetime  import timedelta
@@ -53,10 +50,15 @@ import fnmatch
 import argparse
 import logging
 from contextlib import contextmanager
-import pkg_resources
 from geotecha.plotting.one_d import copy_dict
 import pkgutil
 import importlib
+from geotecha.inputoutput.lazy_import import lazy_import
+
+# Only needed for plotting/file output, so import on first use.
+pd = lazy_import('pandas')
+plt = lazy_import('matplotlib.pyplot')
+pkg_resources = lazy_import('pkg_resources')
 
 
 class SyntaxChecker(ast.NodeVisitor):
@@ -570,6 +572,55 @@ def object_members(obj, info='function', join=True):
     return members
 
 
+def object_attributes_key(obj):
+    """Hashable key of an object's type and public attributes
+
+    Used to cache results that depend on an object's parameters (e.g. a
+    constitutive model) so that changing any parameter gives a new key.
+
+    Parameters
+    ----------
+    obj : object
+        Object whose public (not starting with '_') attributes are used.
+
+    Returns
+    -------
+    key : tuple
+        (type(obj), (name, value), ...) in name order.  ndarray values are
+        replaced by (dtype, shape, bytes) and other unhashable values by
+        their repr.
+
+    Examples
+    --------
+    >>> class A(object):
+    ...     pass
+    >>> a = A()
+    >>> a.x = np.array([1.0, 2.0])
+    >>> a.y = 3
+    >>> key = object_attributes_key(a)
+    >>> hash(key) == hash(object_attributes_key(a))
+    True
+    >>> a.x[0] = 4.0
+    >>> key == object_attributes_key(a)
+    False
+
+    """
+
+    items = [type(obj)]
+    for k, v in sorted(vars(obj).items()):
+        if k.startswith('_'):
+            continue
+        if isinstance(v, np.ndarray):
+            v = (v.dtype.str, v.shape, v.tobytes())
+        else:
+            try:
+                hash(v)
+            except TypeError:
+                v = repr(v)
+        items.append((k, v))
+    return tuple(items)
+
+
 def make_module_from_text(reader, syntax_checker=None):
     """Make a module from file, StringIO, text etc.
 
@@ -692,6 +743,8 @@ def fcode_one_large_expr(expr, prepend=None, **settings):
 
     """
 
+    from sympy.printing.fcode import FCodePrinter
+
     # FCodePrinter.indent_code uses ''.join to combine lines.  Should it be
     # '\n'.join ? This is my work around:
     class FCodePrinter2(FCodePrinter):
@@ -0,0 +1,128 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+"""\
+Defer importing heavy modules until they are actually used.
+
+Plotting and file output machinery (matplotlib, pandas, sympy etc.) can
+take seconds to import.  Compute only code paths (e.g. running a speccon
+analysis without plotting or saving) should not have to pay for them.
+Modules that only need such a package inside plotting/saving routines
+can bind a `LazyModule` at module level instead of importing directly:
+
+>>> plt = lazy_import('matplotlib.pyplot')
+>>> plt
+<LazyModule 'matplotlib.pyplot' (not yet imported)>
+
+The real module is imported the first time an attribute is accessed.
+
+This module must itself only depend on the standard library.
+
+"""
+
+from __future__ import division, print_function
+
+import importlib
+
+
+class LazyModule(object):
+    """Module proxy that imports the real module on first attribute access
+
+    Parameters
+    ----------
+    name : str
+        Fully qualified module name, e.g. 'matplotlib.pyplot'.
+
+    Notes
+    -----
+    If the imported module does not have a requested attribute then an
+    attempt is made to import a submodule of that name. So
+    `lazy_import('matplotlib').gridspec` works even though
+    `import matplotlib` alone does not import matplotlib.gridspec.
+
+    """
+
+    def __init__(self, name):
+        self.__dict__['_lazy_name'] = name
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self):
+        """Import (if needed) and return the real module"""
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            module = importlib.import_module(self.__dict__['_lazy_name'])
+            self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        module = self._load()
+        try:
+            return getattr(module, attr)
+        except AttributeError:
+            if attr.startswith('__'):
+                raise
+            try:
+                return importlib.import_module(
+                    module.__name__ + '.' + attr)
+            except ImportError:
+                raise AttributeError(
+                    "module '{}' has no attribute '{}'".format(
+                        module.__name__, attr))
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self.__dict__['_lazy_module'] is None:
+            return "<LazyModule '{}' (not yet imported)>".format(
+                self.__dict__['_lazy_name'])
+        return repr(self.__dict__['_lazy_module'])
+
+
+def lazy_import(name):
+    """Module proxy that is only imported when first used
+
+    Parameters
+    ----------
+    name : str
+        Fully qualified module name, e.g. 'matplotlib.pyplot'.
+
+    Returns
+    -------
+    module : LazyModule
+        Proxy for the module.  Attribute access imports the module.
+
+    See Also
+    --------
+    LazyModule : The proxy class.
+
+    Examples
+    --------
+    >>> np_ = lazy_import('numpy')
+    >>> np_.sqrt(4.0)
+    2.0
+
+    """
+
+    return LazyModule(name)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest',
+                         '--doctest-options=+ELLIPSIS'])
@@ -0,0 +1,121 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+"""Test lazy_import and that compute only modules do not eagerly import
+plotting/file output packages.
+
+"""
+from __future__ import division, print_function
+
+from nose.tools.trivial import ok_
+from nose.tools.trivial import assert_equal
+from nose.tools.trivial import assert_raises
+
+import sys
+import subprocess
+import textwrap
+import json
+
+from geotecha.inputoutput.lazy_import import lazy_import
+from geotecha.inputoutput.lazy_import import LazyModule
+
+
+# Modules that a compute only run (solve but no plotting or saving) should
+# be able to import without pulling in any of HEAVY_MODULES.
+COMPUTE_MODULES = ['geotecha.speccon.speccon1d_vr',
+                   'geotecha.speccon.speccon1d_vrc',
+                   'geotecha.speccon.speccon1d_vrw',
+                   'geotecha.speccon.speccon1d_unsat',
+                   'geotecha.beam_on_foundation.specbeam',
+                   'geotecha.inputoutput.inputoutput',
+                   'geotecha.plotting.one_d',
+                   'geotecha.piecewise.piecewise_linear_1d']
+
+HEAVY_MODULES = ['matplotlib',
+                 'pandas',
+                 'sympy',
+                 'brewer2mpl',
+                 'pkg_resources']
+
+
+def _import_in_subprocess(module_names):
+    """Import modules in a fresh interpreter.
+
+    Returns
+    -------
+    out : dict
+        'heavy': list of HEAVY_MODULES that ended up in sys.modules,
+        'seconds': wall clock import time.
+    """
+
+    code = textwrap.dedent("""\
+        import sys, time, json
+        t0 = time.time()
+        for name in {modules!r}:
+            __import__(name)
+        seconds = time.time() - t0
+        heavy = [m for m in {heavy!r} if m in sys.modules]
+        print(json.dumps(dict(heavy=heavy, seconds=seconds)))
+        """).format(modules=module_names, heavy=HEAVY_MODULES)
+
+    out = subprocess.check_output([sys.executable, '-c', code])
+    return json.loads(out.decode('utf-8').splitlines()[-1])
+
+
+def test_compute_modules_do_not_import_heavy_modules():
+    """import-time regression guard for compute only code paths"""
+
+    for name in COMPUTE_MODULES:
+        result = _import_in_subprocess([name])
+        print('{}: {:.3f} s'.format(name, result['seconds']))
+        assert_equal(result['heavy'], [],
+                     msg='{} eagerly imports {}'.format(name, result['heavy']))
+
+
+def test_LazyModule_not_imported_until_used():
+    """LazyModule does not import until attribute access"""
+
+    a = lazy_import('json')
+    ok_(isinstance(a, LazyModule))
+    ok_(a.__dict__['_lazy_module'] is None)
+    assert_equal(a.dumps([1]), '[1]')
+    ok_(a.__dict__['_lazy_module'] is json)
+
+
+def test_LazyModule_submodule_attribute():
+    """LazyModule attribute falls back to submodule import"""
+
+    a = lazy_import('xml')
+    ok_(a.dom.__name__ == 'xml.dom')
+
+
+def test_LazyModule_missing_attribute():
+    """LazyModule missing attribute raises AttributeError"""
+
+    a = lazy_import('json')
+    assert_raises(AttributeError, getattr, a, 'not_an_attribute')
+
+
+def test_LazyModule_missing_module():
+    """LazyModule of missing module raises ImportError on use"""
+
+    a = lazy_import('not_a_real_module_for_geotecha')
+    assert_raises(ImportError, getattr, a, 'anything')
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
+#    nose.runmodule(argv=['nose', '--verbosity=3'])
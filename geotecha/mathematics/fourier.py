@@ -35,6 +35,7 @@ from geotecha.mathematics.quadrature import gauss_kronrod_abscissae_and_weights
 from geotecha.mathematics.quadrature import gauss_legendre_abscissae_and_weights
 from geotecha.mathematics.quadrature import shanks_table
 from geotecha.mathematics.quadrature import shanks
+from geotecha.mathematics.quadrature import vshanks
 
 
 def real_func(x, *myargs):
@@ -630,7 +631,7 @@ def vcosine_transform(f, s, args=(), m=20, ng=20, shanks_ind=None):
     else:
         #extrapolate
         igral.cumsum(axis=1 , out=igral)
-        return shanks(igral, shanks_ind)
+        return vshanks(igral, shanks_ind, axis=1)[0]
 
 def v2dcosine_transform(f, s1, s2, args=(), m=20, ng=20, shanks_ind=None):
     """Cosine transform of f(x, y) at transform variable s1, s2
@@ -750,7 +751,7 @@ def v2dcosine_transform(f, s1, s2, args=(), m=20, ng=20, shanks_ind=None):
     else:
         #extrapolate
         igral.cumsum(axis=4 , out=igral)
-        igral= np.apply_along_axis(shanks, 4, igral, shanks_ind)
+        igral = vshanks(igral, shanks_ind, axis=4)[0]
 
     igral = np.sum(igral, axis=2)
 
@@ -759,7 +760,7 @@ def v2dcosine_transform(f, s1, s2, args=(), m=20, ng=20, shanks_ind=None):
     else:
         #extrapolate
         igral.cumsum(axis=1 , out=igral)
-        igral= np.apply_along_axis(shanks, 1, igral, shanks_ind)
+        igral = vshanks(igral, shanks_ind, axis=1)[0]
 
     return igral
 
@@ -425,6 +425,336 @@ def polyhedron_volume(faces):
 
     return v
 
+def ragged_polygons(polygons):
+    """Flat vertex array and offsets of a collection of polygons
+
+    Parameters
+    ----------
+    polygons : list of array_like
+        List of pts arrays (x, y or x, y, z points) each defining a polygon.
+        Polygons may have different numbers of vertices.
+
+    Returns
+    -------
+    pts : ndarray of float
+        All vertices stacked together.  If any polygon has x, y, z points
+        then 2d polygons are given z=0.
+    offsets : 1d ndarray of int
+        Polygon i has vertices pts[offsets[i]:offsets[i + 1]].
+        len(offsets) = len(polygons) + 1.
+
+    See Also
+    --------
+    vpolygon_properties : Batched properties of ragged polygons.
+
+    Examples
+    --------
+    >>> pts, offsets = ragged_polygons([[[0, 0], [1, 0], [0, 1]],
+    ...                                 [[0, 0], [1, 0], [1, 1], [0, 1]]])
+    >>> pts.shape
+    (7, 2)
+    >>> offsets
+    array([0, 3, 7])
+
+    """
+
+    polygons = [np.atleast_2d(np.asarray(v, dtype=float)) for v in polygons]
+    ncol = max(v.shape[1] for v in polygons)
+    polygons = [v if v.shape[1] == ncol else
+                np.hstack([v, np.zeros((len(v), ncol - v.shape[1]))])
+                for v in polygons]
+    offsets = np.zeros(len(polygons) + 1, dtype=int)
+    offsets[1:] = np.cumsum([len(v) for v in polygons])
+    return np.vstack(polygons), offsets
+
+
+def ragged_polyhedra(polyhedra):
+    """Flat vertex array and face offsets of a collection of polyhedra
+
+    Parameters
+    ----------
+    polyhedra : list of list of array_like
+        Each polyhedron is a list of faces, each face a pts array of x, y, z
+        coords of face vertices (e.g. as returned by `make_hexahedron`).
+
+    Returns
+    -------
+    pts : ndarray of float
+        All face vertices stacked together.
+    face_offsets : 1d ndarray of int
+        Face j has vertices pts[face_offsets[j]:face_offsets[j + 1]].
+    poly_offsets : 1d ndarray of int
+        Polyhedron i has faces poly_offsets[i] to poly_offsets[i + 1] - 1.
+
+    """
+
+    faces = [f for faces in polyhedra for f in faces]
+    pts, face_offsets = ragged_polygons(faces)
+    poly_offsets = np.zeros(len(polyhedra) + 1, dtype=int)
+    poly_offsets[1:] = np.cumsum([len(v) for v in polyhedra])
+    return pts, face_offsets, poly_offsets
+
+
+def _ragged_segments(offsets, npts, min_count=1):
+    """Start index, segment number and next vertex of ragged segments"""
+
+    offsets = np.asarray(offsets, dtype=int)
+    if (offsets.ndim != 1 or len(offsets) < 2 or offsets[0] != 0 or
+            offsets[-1] != npts):
+        raise ValueError("offsets must be 1d, start at 0 and end at the "
+                         "number of points ({})".format(npts))
+    counts = np.diff(offsets)
+    if np.any(counts < min_count):
+        raise ValueError("each segment must have at least {} "
+                         "points".format(min_count))
+    starts = offsets[:-1]
+    seg = np.repeat(np.arange(len(counts)), counts)
+    nxt = np.arange(1, npts + 1)
+    nxt[offsets[1:] - 1] = starts
+    return starts, seg, nxt
+
+
+def _xyz_array(pts):
+    """pts as a n by 3 float array (z=0 for x, y points)"""
+
+    pts = np.asarray(pts, dtype=float)
+    if pts.ndim != 2 or pts.shape[1] not in (2, 3):
+        raise ValueError("pts must be a n by 2 or n by 3 array")
+    if pts.shape[1] == 2:
+        pts = np.hstack([pts, np.zeros((len(pts), 1))])
+    return pts
+
+
+def vpolygon_properties(pts, offsets):
+    """Area, centroid and 2nd moment of area of many polygons at once
+
+    Vectorised equivalent of `polygon_area`, `polygon_centroid` and
+    `polygon_2nd_moment_of_area` for a ragged collection of polygons held
+    as one flat array of vertices.  All polygons are processed together
+    using segment-wise reductions (np.add.reduceat) rather than a python
+    loop over polygons.
+
+    Parameters
+    ----------
+    pts : array_like
+        n by 2 or n by 3 array of x, y or x, y, z vertices of all polygons.
+    offsets : 1d array_like of int
+        Polygon i has vertices pts[offsets[i]:offsets[i + 1]].  Must
+        start at 0 and end at n.  See `ragged_polygons`.
+
+    Returns
+    -------
+    a : 1d ndarray of float
+        Area of each polygon.
+    centroid : ndarray of float
+        len(offsets) - 1 by 3 array of [xc, yc, zc] for each polygon.
+    second_moment : ndarray of float
+        len(offsets) - 1 by 3 array of [Ixx, Iyy, Izz] for each polygon.
+        Same definition as `polygon_2nd_moment_of_area`.
+
+    Notes
+    -----
+    Each polygon is projected onto the coordinate plane most nearly
+    parallel to it.  Unlike `polygon_area` the area is positive
+    regardless of whether vertices are ordered clockwise or anticlockwise.
+    Coordinates are taken relative to the first vertex of each polygon so
+    that large coordinate values (e.g. eastings) do not lose precision.
+
+    Examples
+    --------
+    >>> pts, offsets = ragged_polygons([[[0, 0], [2, 0], [2, 1], [0, 1]],
+    ...                                 [[0, 0], [1, 0], [0, 1]]])
+    >>> a, c, I = vpolygon_properties(pts, offsets)
+    >>> a
+    array([2. , 0.5])
+    >>> c
+    array([[1.        , 0.5       , 0.        ],
+           [0.33333333, 0.33333333, 0.        ]])
+
+    """
+
+    pts = _xyz_array(pts)
+    starts, seg, nxt = _ragged_segments(offsets, len(pts), min_count=3)
+    npoly = len(starts)
+
+    q = pts - pts[starts][seg]  # relative to first vertex of each polygon
+    qn = q[nxt]
+    normal = np.add.reduceat(np.cross(q, qn), starts, axis=0)  # Newell
+    a = np.sqrt(np.sum(normal**2, axis=1)) / 2
+    n = normal / (2 * a[:, np.newaxis])
+
+    # project each polygon onto plane perpendicular to i, u and v in plane
+    i = np.argmax(np.abs(n), axis=1)
+    ju = (i + 1) % 3
+    jv = (i + 2) % 3
+    rows = np.arange(len(pts))
+    u, v = q[rows, ju[seg]], q[rows, jv[seg]]
+    u1, v1 = qn[rows, ju[seg]], qn[rows, jv[seg]]
+    cross = u * v1 - u1 * v
+
+    def ssum(f):
+        """sum over edges of each polygon"""
+        return np.add.reduceat(f, starts)
+
+    aproj = ssum(cross) / 2  # = a * n[i], signed
+    uc = ssum(cross * (u + u1)) / (6 * aproj)
+    vc = ssum(cross * (v + v1)) / (6 * aproj)
+
+    prow = np.arange(npoly)
+    ni, nu, nv = n[prow, i], n[prow, ju], n[prow, jv]
+    wc = -(nu * uc + nv * vc) / ni  # on the plane of the polygon
+
+    centroid = np.empty((npoly, 3))
+    centroid[prow, i] = wc
+    centroid[prow, ju] = uc
+    centroid[prow, jv] = vc
+    centroid += pts[starts]
+
+    iuu = ssum(cross * (u**2 + u * u1 + u1**2)) / (12 * aproj) - uc**2
+    ivv = ssum(cross * (v**2 + v * v1 + v1**2)) / (12 * aproj) - vc**2
+    iuv = (ssum(cross * (2 * u * v + u * v1 + u1 * v + 2 * u1 * v1)) /
+           (24 * aproj) - uc * vc)
+    iww = (nu**2 * iuu + 2 * nu * nv * iuv + nv**2 * ivv) / ni**2
+
+    second_moment = np.empty((npoly, 3))
+    second_moment[prow, i] = iww
+    second_moment[prow, ju] = iuu
+    second_moment[prow, jv] = ivv
+
+    return a, centroid, second_moment
+
+
+def vpolygon_area(pts, offsets):
+    """Area of many polygons defined by a flat array of points and offsets
+
+    Parameters
+    ----------
+    pts : array_like
+        n by 2 or n by 3 array of x, y or x, y, z vertices of all polygons.
+    offsets : 1d array_like of int
+        Polygon i has vertices pts[offsets[i]:offsets[i + 1]].
+
+    Returns
+    -------
+    a : 1d ndarray of float
+        Area of each polygon.
+
+    See Also
+    --------
+    vpolygon_properties : Area, centroid and 2nd moment in one pass.
+
+    """
+
+    pts = _xyz_array(pts)
+    starts, seg, nxt = _ragged_segments(offsets, len(pts), min_count=3)
+    q = pts - pts[starts][seg]
+    normal = np.add.reduceat(np.cross(q, q[nxt]), starts, axis=0)
+    return np.sqrt(np.sum(normal**2, axis=1)) / 2
+
+
+def vpolygon_centroid(pts, offsets):
+    """Centroid of many polygons defined by a flat array of points and offsets
+
+    Parameters
+    ----------
+    pts : array_like
+        n by 2 or n by 3 array of x, y or x, y, z vertices of all polygons.
+    offsets : 1d array_like of int
+        Polygon i has vertices pts[offsets[i]:offsets[i + 1]].
+
+    Returns
+    -------
+    centroid : ndarray of float
+        len(offsets) - 1 by 3 array of [xc, yc, zc] for each polygon.
+
+    See Also
+    --------
+    vpolygon_properties : Area, centroid and 2nd moment in one pass.
+
+    """
+
+    return vpolygon_properties(pts, offsets)[1]
+
+
+def vpolygon_2nd_moment_of_area(pts, offsets):
+    """2nd moment of area of many polygons defined by points and offsets
+
+    Parameters
+    ----------
+    pts : array_like
+        n by 2 or n by 3 array of x, y or x, y, z vertices of all polygons.
+    offsets : 1d array_like of int
+        Polygon i has vertices pts[offsets[i]:offsets[i + 1]].
+
+    Returns
+    -------
+    second_moment : ndarray of float
+        len(offsets) - 1 by 3 array of [Ixx, Iyy, Izz], 2nd moment of area
+        about centroidal x, y, and z axes, for each polygon.
+
+    See Also
+    --------
+    vpolygon_properties : Area, centroid and 2nd moment in one pass.
+
+    """
+
+    return vpolygon_properties(pts, offsets)[2]
+
+
+def vpolyhedron_volume(pts, face_offsets, poly_offsets):
+    """Volume of many polyhedra defined by a flat array of face vertices
+
+    Vectorised equivalent of `polyhedron_volume` for a ragged collection
+    of polyhedra.
+
+    Parameters
+    ----------
+    pts : array_like
+        n by 3 array of x, y, z coords of the face vertices of all
+        polyhedra.
+    face_offsets : 1d array_like of int
+        Face j has vertices pts[face_offsets[j]:face_offsets[j + 1]].
+    poly_offsets : 1d array_like of int
+        Polyhedron i has faces poly_offsets[i] to poly_offsets[i + 1] - 1.
+        See `ragged_polyhedra`.
+
+    Returns
+    -------
+    v : 1d ndarray of float
+        Volume of each polyhedron.
+
+    Notes
+    -----
+    Each face is split into a fan of triangles about its first vertex and
+    the signed volumes of the tetrahedra formed with the first vertex of the
+    polyhedron are summed.  As with `polyhedron_volume`, face vertices
+    should be ordered anti clockwise (CCW) when viewed from outside to give
+    a positive volume.
+
+    Examples
+    --------
+    >>> cube = make_hexahedron([[0, 0, 0], [0, 1, 0], [0, 1, 1], [0, 0, 1],
+    ...                         [1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1]])
+    >>> vpolyhedron_volume(*ragged_polyhedra([cube, [2 * f for f in cube]]))
+    array([1., 8.])
+
+    """
+
+    pts = np.asarray(pts, dtype=float)
+    if pts.ndim != 2 or pts.shape[1] != 3:
+        raise ValueError("pts must be a n by 3 array")
+    fstarts, fseg, nxt = _ragged_segments(face_offsets, len(pts),
+                                          min_count=3)
+    poly_offsets = np.asarray(poly_offsets, dtype=int)
+    pstarts, pseg, _ = _ragged_segments(poly_offsets, len(fstarts))
+    vstarts = fstarts[pstarts]  # first vertex of each polyhedron
+
+    q = pts - pts[vstarts][pseg][fseg]
+    q0 = q[fstarts][fseg]
+    tet = np.sum(q0 * np.cross(q, q[nxt]), axis=1)
+    return np.add.reduceat(tet, vstarts) / 6
+
+
 def make_hexahedron(coords):
     """Assemble the face vertices of a hexahedron
 
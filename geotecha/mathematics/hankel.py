@@ -31,10 +31,12 @@ from numpy.polynomial.polynomial import Polynomial
 
 from geotecha.mathematics.quadrature import gl_quad
 from geotecha.mathematics.quadrature import gk_quad
+from geotecha.mathematics.quadrature import gk_quad_adaptive
 from geotecha.mathematics.quadrature import gauss_kronrod_abscissae_and_weights
 from geotecha.mathematics.quadrature import gauss_legendre_abscissae_and_weights
 from geotecha.mathematics.quadrature import shanks_table
 from geotecha.mathematics.quadrature import shanks
+from geotecha.mathematics.quadrature import vshanks
 
 class HankelTransform(object):
     """Hankel transform of integer order
@@ -62,11 +64,11 @@ class HankelTransform(object):
         the `m` zeros mentined above. Default points=None i.e. no extra points.
         Basically the function is never evaluated at any ofthe points, rather
         they form the boundary four gauss quadrature.
-    ng : [7,10,15,20,25,30], optional
+    ng : int, optional
         Number of gauss points to use in integration after first zero.
         Default ng=10. Number of Kronrod points will automatically
         by 2 * ng + 1.
-    ng0 : [7,10,15,20,25,30], optional
+    ng0 : int, optional
         Number of gauss points to use in integrating between 0 and first zero.
         Default ng0=20.
     shanks_ind : int, optional
@@ -76,6 +78,14 @@ class HankelTransform(object):
         Be careful when using shanks extrapolation; make sure you only begin
         to use it after the intgrand is well behaved.  Use the plot_integrand
         method to check your integrand.
+    tol : float, optional
+        If not None then the segments between zeros are integrated with
+        `gk_quad_adaptive` using `ng` gauss points per subinterval
+        (ng0 is ignored) and epsabs=epsrel=tol.  Only segments (or parts
+        of segments) with large Gauss-Kronrod error estimates are
+        subdivided so smooth integrands need fewer function evaluations;
+        a small ng such as ng=5 is usually sufficient.  Default tol=None,
+        i.e. fixed quadrature.
 
     Returns
     -------
@@ -104,7 +114,7 @@ class HankelTransform(object):
 
 
     def __init__(self, func, args=(), order=0, m=20, points=None, ng=10, ng0=20,
-                 shanks_ind=None):
+                 shanks_ind=None, tol=None):
 
 
         self.func = func
@@ -119,6 +129,7 @@ class HankelTransform(object):
         self.ng = ng
         self.ng0 = ng0
         self.shanks_ind = shanks_ind
+        self.tol = tol
 
         self.zeros_of_jn()
 
@@ -182,22 +193,32 @@ class HankelTransform(object):
         if (a!=0) or (b!=np.inf):
             zeros = np.unique(zeros.clip(a, b))
 
-        #1st segment
-        igral0, err_est0 = gk_quad(integrand, zeros[0], zeros[1],
-                                   self.args, self.ng0)
-        #remaining segments
-        if len(zeros)>2:
-            igralm, err_estm = gk_quad(integrand, zeros[1:-1], zeros[2:],
-                                       self.args, self.ng)
+        if not self.tol is None:
+            igral, err_est = gk_quad_adaptive(integrand, zeros[:-1],
+                                              zeros[1:], self.args,
+                                              self.ng, epsabs=self.tol,
+                                              epsrel=self.tol)
+            igral0, err_est0 = igral[:1], err_est[:1]
+            igralm, err_estm = igral[1:], err_est[1:]
+            if len(zeros) <= 2:
+                return igral0[0], err_est0[0]
         else:
-            return igral0[0], err_est0[0]
+            #1st segment
+            igral0, err_est0 = gk_quad(integrand, zeros[0], zeros[1],
+                                       self.args, self.ng0)
+            #remaining segments
+            if len(zeros)>2:
+                igralm, err_estm = gk_quad(integrand, zeros[1:-1], zeros[2:],
+                                           self.args, self.ng)
+            else:
+                return igral0[0], err_est0[0]
 
 
         if (self.shanks_ind is None) or (b!=np.inf):
             igral = igral0 + np.sum(igralm)
         else:
             igralm.cumsum(out=igralm)
-            igral = igral0 + shanks(igralm, self.shanks_ind)
+            igral = igral0 + vshanks(igralm, self.shanks_ind)[0]
 
         err_est = (200*np.abs(err_est0))**1.5 + np.sum((200*np.abs(err_estm))**1.5)
         return igral[0], err_est[0]
@@ -363,7 +384,7 @@ def vhankel_transform(f, r, args=(), order=0, m=20, ng=20, shanks_ind=None):
     else:
         #extrapolate
         igral.cumsum(axis=1 , out=igral)
-        return shanks(igral, shanks_ind)
+        return vshanks(igral, shanks_ind, axis=1)[0]
 
 
 ##Hankel transform pairs
@@ -24,6 +24,7 @@ from scipy.special import jn_zeros
 from scipy.special import jn
 from matplotlib import pyplot as plt
 import functools
+import warnings
 
 import unittest
 from numpy.testing import assert_allclose
@@ -32,6 +33,7 @@ from numpy.polynomial.polynomial import Polynomial
 
 
 
+@functools.lru_cache(maxsize=None)
 def gauss_kronrod_abscissae_and_weights(n):
     """Gauss-Kronrod quadrature abscissae and weights
 
@@ -46,9 +48,11 @@ def gauss_kronrod_abscissae_and_weights(n):
 
     Parameters
     ----------
-    n : [2-20, 32, 64, 100]
+    n : int
         number of integration points for the Gauss points.  Number of Kronrod
-        points will automatically be 2 * n + 1.
+        points will automatically be 2 * n + 1.  n in [7,10,15,20,25,30] use
+        tabulated values.  Other n>=1 are calculated (and cached) by
+        `gauss_kronrod_nodes`.
 
 
     Returns
@@ -60,17 +64,23 @@ def gauss_kronrod_abscissae_and_weights(n):
     wi2 : 1d array
         Weights for the fine integral
 
+    Results are cached and the returned arrays are read only.
+
     References
     ----------
     .. [2] Holoborodko, Pavel. 2011. 'Gauss-Kronrod Quadrature Nodes and
            Weights. November 7.
            http://www.advanpix.com/2011/11/07/gauss-kronrod-quadrature-nodes-weights/#Tabulated_Gauss-Kronrod_weights_and_abscissae
 
+    See Also
+    --------
+    gauss_kronrod_nodes : Calculate abscissae and weights for any n.
+
     """
 
 
     if n not in [7,10,15,20,25,30]:
-        raise ValueError('n must be 2-20, 32, 64, or 100')
+        return gauss_kronrod_nodes(n)
 
     weights = {
       7: {
@@ -479,11 +489,12 @@ def gauss_kronrod_abscissae_and_weights(n):
     wi1[dup] = w['g'][:, 1]
     wi2 = w['k'][:,1]
 
-    return xi, wi1, wi2
+    return _read_only(xi, wi1, wi2)
 
 
 
 
+@functools.lru_cache(maxsize=None)
 def gauss_legendre_abscissae_and_weights(n):
     """Gauss-Legendre quadrature abscissae and weights
 
@@ -491,14 +502,17 @@ def gauss_legendre_abscissae_and_weights(n):
 
     Parameters
     ----------
-    n : [2-20, 32, 64, 100]
-        Number of integration points
+    n : int
+        Number of integration points.  n in [2-20, 32, 64, 100] use
+        tabulated values.  Other n>=1 are calculated (and cached) by
+        `gauss_legendre_nodes`.
 
 
     Returns
     -------
     xi, wi : 1d array of len(n)
-        Abscissae and weights for numericla integration
+        Abscissae and weights for numericla integration.  Results are cached
+        and the returned arrays are read only.
 
 
     References
@@ -507,11 +521,15 @@ def gauss_legendre_abscissae_and_weights(n):
            April 24.
            http://www.holoborodko.com/pavel/numerical-methods/numerical-integration/.
 
+    See Also
+    --------
+    gauss_legendre_nodes : Calculate abscissae and weights for any n.
+
     """
 
     if n not in [2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,
                  32, 64, 100]:
-        raise ValueError('n must be 2-20, 32, 64, or 100')
+        return gauss_legendre_nodes(n)
 
     weights = {
         2: np.array(
@@ -965,7 +983,293 @@ def gauss_legendre_abscissae_and_weights(n):
              dtype=float),
               }
 
-    return weights[n][:,0], weights[n][:,1]
+    return _read_only(weights[n][:,0].copy(), weights[n][:,1].copy())
+
+
+def _check_order(n):
+    """Raise ValueError if n is not a positive integer"""
+
+    if int(n) != n or n < 1:
+        raise ValueError('n must be a positive integer, not {}'.format(n))
+    return int(n)
+
+
+def _read_only(*arrays):
+    """Flag arrays as read only so cached values cannot be altered"""
+
+    for a in arrays:
+        a.setflags(write=False)
+    return arrays
+
+
+def _legendre_recurrence(n):
+    """Recurrence coefficients of the monic Legendre polynomials on [-1, 1]
+
+    p[k+1](x) = (x - a[k]) * p[k](x) - b[k] * p[k-1](x), with b[0] the
+    integral of the weight function.
+    """
+
+    k = np.arange(n, dtype=float)
+    a = np.zeros(n, dtype=float)
+    b = np.empty(n, dtype=float)
+    b[0] = 2.0
+    b[1:] = k[1:]**2 / (4 * k[1:]**2 - 1)
+    return a, b
+
+
+def _golub_welsch(a, b):
+    """Nodes and weights from the eigen system of the Jacobi matrix"""
+
+    J = np.diag(a) + np.diag(np.sqrt(b[1:]), 1) + np.diag(np.sqrt(b[1:]), -1)
+    x, v = np.linalg.eigh(J)
+    w = b[0] * v[0, :]**2
+    return x, w
+
+
+def _legendre_and_derivative(n, x):
+    """Legendre polynomial P_n(x) and its derivative by recurrence"""
+
+    p0 = np.ones_like(x)
+    p1 = x.copy()
+    for k in range(2, n + 1):
+        p0, p1 = p1, ((2 * k - 1) * x * p1 - (k - 1) * p0) / k
+    dp = n * (x * p1 - p0) / (x**2 - 1)
+    return p1, dp
+
+
+@functools.lru_cache(maxsize=None)
+def gauss_legendre_nodes(n):
+    """Gauss-Legendre abscissae and weights of any order (cached)
+
+    Integral = Sum(f(xi) * wi)
+
+    The Golub-Welsch eigenvalue method gives starting values that are then
+    polished with Newton iterations on the Legendre polynomial.  Results are
+    cached so each n is only calculated once per session.
+
+    Parameters
+    ----------
+    n : int
+        Number of integration points, n>=1.
+
+    Returns
+    -------
+    xi, wi : 1d array of len(n)
+        Abscissae (ascending) and weights for numerical integration on
+        [-1, 1].  The arrays are read only.
+
+    See Also
+    --------
+    gauss_legendre_abscissae_and_weights : Tabulated values for common n.
+    gauss_kronrod_nodes : Gauss-Kronrod rule of any order.
+
+    References
+    ----------
+    .. [1] Golub, G. H., and J. H. Welsch. 1969. 'Calculation of Gauss
+           Quadrature Rules'. Mathematics of Computation 23 (106): 221-230.
+
+    Examples
+    --------
+    >>> xi, wi = gauss_legendre_nodes(3)
+    >>> np.allclose(xi, [-np.sqrt(0.6), 0, np.sqrt(0.6)])
+    True
+    >>> np.allclose(wi, [5/9, 8/9, 5/9])
+    True
+
+    """
+
+    n = _check_order(n)
+    if n == 1:
+        return _read_only(np.zeros(1), 2 * np.ones(1))
+
+    x, w = _golub_welsch(*_legendre_recurrence(n))
+    for i in range(3):
+        p, dp = _legendre_and_derivative(n, x)
+        x = x - p / dp
+    x = 0.5 * (x - x[::-1]) # enforce symmetry
+    p, dp = _legendre_and_derivative(n, x)
+    w = 2 / ((1 - x**2) * dp**2)
+    return _read_only(x, w)
+
+
+def _kronrod_recurrence(n):
+    """Recurrence coefficients of the Jacobi-Kronrod matrix for 2*n+1 points
+
+    Laurie's algorithm as implemented in Gautschi's OPQ routine r_kronrod.
+    """
+
+    m = int(np.ceil(3 * n / 2)) + 1
+    a0, b0 = _legendre_recurrence(m)
+    a = np.zeros(2 * n + 1, dtype=float)
+    b = np.zeros(2 * n + 1, dtype=float)
+    k = np.arange(3 * n // 2 + 1)
+    a[k] = a0[k]
+    k = np.arange(m)
+    b[k] = b0[k]
+    s = np.zeros(n // 2 + 2, dtype=float)
+    t = np.zeros(n // 2 + 2, dtype=float)
+    t[1] = b[n + 1]
+    for m in range(n - 1):
+        k = np.arange((m + 1) // 2, -1, -1)
+        l = m - k
+        s[k + 1] = np.cumsum((a[k + n + 1] - a[l]) * t[k + 1]
+                             + b[k + n + 1] * s[k] - b[l] * s[k + 1])
+        s, t = t, s
+    j = np.arange(n // 2, -1, -1)
+    s[j + 1] = s[j]
+    for m in range(n - 1, 2 * n - 2):
+        k = np.arange(m + 1 - n, (m - 1) // 2 + 1)
+        l = m - k
+        j = n - 1 - l
+        s[j + 1] = np.cumsum(-(a[k + n + 1] - a[l]) * t[j + 1]
+                             - b[k + n + 1] * s[j + 1] + b[l] * s[j + 2])
+        j = j[-1]
+        k = (m + 1) // 2
+        if m % 2 == 0:
+            a[k + n + 1] = (a[k] + (s[j + 1] - b[k + n + 1] * s[j + 2])
+                            / t[j + 2])
+        else:
+            b[k + n + 1] = s[j + 1] / s[j + 2]
+        s, t = t, s
+    a[2 * n] = a[n - 1] - b[2 * n] * s[1] / t[1]
+    return a, b
+
+
+@functools.lru_cache(maxsize=None)
+def gauss_kronrod_nodes(n):
+    """Gauss-Kronrod abscissae and weights of any order (cached)
+
+    Coarse integral = Sum(f(xi) * wi1)
+
+    Fine integral   = Sum(f(xi) * wi2)
+
+    The 2*n+1 point Kronrod rule is found from the eigen system of the
+    Jacobi-Kronrod matrix (Laurie's algorithm).  The embedded n point
+    Gauss rule comes from `gauss_legendre_nodes`. Results are cached so
+    each n is only calculated once per session.
+
+    Parameters
+    ----------
+    n : int
+        Number of Gauss points, n>=1.  There will be 2 * n + 1 Kronrod
+        points.
+
+    Returns
+    -------
+    xi : 1d array
+        Abscissae (ascending) for the quadrature points on [-1, 1].
+    wi1 : 1d array
+        Weights for the coarse (Gauss) integral.  Weights for the Kronrod
+        only points are zero.
+    wi2 : 1d array
+        Weights for the fine (Kronrod) integral.
+
+    All arrays are read only.
+
+    See Also
+    --------
+    gauss_kronrod_abscissae_and_weights : Tabulated values for common n.
+    gauss_legendre_nodes : Gauss-Legendre rule of any order.
+
+    References
+    ----------
+    .. [1] Laurie, D. P. 1997. 'Calculation of Gauss-Kronrod Quadrature
+           Rules'. Mathematics of Computation 66 (219): 1133-1145.
+    .. [2] Gautschi, W. 2004. Orthogonal Polynomials: Computation and
+           Approximation. Oxford University Press.
+
+    Examples
+    --------
+    >>> xi, wi1, wi2 = gauss_kronrod_nodes(1)
+    >>> np.allclose(xi, [-np.sqrt(0.6), 0, np.sqrt(0.6)])
+    True
+    >>> np.allclose(wi1, [0, 2, 0])
+    True
+
+    """
+
+    n = _check_order(n)
+    xi, wi2 = _golub_welsch(*_kronrod_recurrence(n))
+    xi = 0.5 * (xi - xi[::-1]) # enforce symmetry
+    wi2 = 0.5 * (wi2 + wi2[::-1])
+
+    # Gauss points interlace the Kronrod points
+    xg, wg = gauss_legendre_nodes(n)
+    xi[1::2] = xg
+    wi1 = np.zeros_like(xi)
+    wi1[1::2] = wg
+    return _read_only(xi, wi1, wi2)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_interval_nodes(rule, n, a_bytes, b_bytes):
+    """Quadrature points mapped to intervals, keyed on interval bytes"""
+
+    ai = np.frombuffer(a_bytes, dtype=float)[:, np.newaxis]
+    bi = np.frombuffer(b_bytes, dtype=float)[:, np.newaxis]
+
+    if rule == 'gk':
+        xj_, wj1, wj2 = gauss_kronrod_abscissae_and_weights(n)
+        weights = (wj1, wj2)
+    else:
+        xj_, wj = gauss_legendre_abscissae_and_weights(n)
+        weights = (wj,)
+
+    bma = (bi - ai) / 2 # b minus a
+    bpa = (ai + bi) / 2 # b plus a
+
+    # xj_ are in [-1, 1] so need to transform to [a, b]
+    xij = bma * xj_[np.newaxis, :] + bpa
+    wij = tuple(bma * w[np.newaxis, :] for w in weights)
+    return _read_only(xij, *wij)
+
+
+def interval_nodes(a, b, n=10, rule='gl'):
+    """Quadrature points and scaled weights for a set of intervals
+
+    Mapping the [-1, 1] abscissae to each interval is cached for the most
+    recent 32 combinations of `a`, `b`, `n`, and `rule`, so repeated
+    integrations over the same intervals (e.g. transforms evaluated for
+    many functions) do not rebuild the point arrays.
+
+    Parameters
+    ----------
+    a, b : 1d array
+        Limits of integration. Must have len(a)==len(b).
+    n : int, optional
+        Number of Gauss points. Default n=10.
+    rule : ['gl', 'gk'], optional
+        'gl' for Gauss-Legendre (n points), 'gk' for Gauss-Kronrod
+        (2*n+1 points).  Default rule='gl'.
+
+    Returns
+    -------
+    xij : 2d array
+        Quadrature points. xij[i, j] is the jth point in the ith interval.
+    wij : 2d array
+        Weights multiplied by the half width of each interval, so that
+        the integral over the ith interval is Sum(f(xij[i]) * wij[i]). For
+        rule='gk' two arrays, coarse and fine weights, are returned.
+
+    All arrays are read only.
+
+    Examples
+    --------
+    >>> xij, wij = interval_nodes([0, 1], [1, 3], n=3)
+    >>> np.sum(xij**2 * wij, axis=1)
+    array([0.3333..., 8.6666...])
+
+    """
+
+    if rule not in ['gl', 'gk']:
+        raise ValueError("rule must be 'gl' or 'gk', not {}".format(rule))
+    ai = np.ascontiguousarray(np.atleast_1d(a), dtype=float)
+    bi = np.ascontiguousarray(np.atleast_1d(b), dtype=float)
+    if ai.shape != bi.shape or ai.ndim != 1:
+        raise ValueError('a and b must be 1d and the same length')
+
+    return _cached_interval_nodes(rule, int(n), ai.tobytes(), bi.tobytes())
+
 
 def shanks_table(seq, table=None, randomized=False):
     r'''Copied from sympy.mpmath.mpmath.calculus.extrapolation.py
@@ -1188,6 +1492,114 @@ def shanks(seq, ind=0):
     return +seq[...,-1]
 
 
+def vshanks(seq, ind=0, axis=-1):
+    """Vectorised Wynn epsilon extrapolation of many sequences at once
+
+    The Wynn epsilon table (equivalent to the iterated Shanks
+    transformation) is built column by column for every sequence along
+    `axis` simultaneously.  Sequences whose table breaks down (division by
+    zero, usually because they have converged exactly) keep their best
+    estimate so far; other sequences carry on.
+
+    Parameters
+    ----------
+    seq : array_like
+        Partial sums (real or complex).  Each 1d slice along `axis` is a
+        separate sequence. `seq` is not modified.
+    ind : int, optional
+        Start index for extrapolation. Can be negative, e.g. ind=-5
+        will extrapolate based on the last 5 elements of each sequence.
+        Default ind=0 i.e. use all elements.  If ind is None then
+        the last element of each sequence is returned with no
+        extrapolation.
+    axis : int, optional
+        Axis along which the sequences lie. Default axis=-1.
+
+    Returns
+    -------
+    out : ndarray or float
+        Extrapolated values. Shape of `seq` with `axis` removed.  Float if
+        `seq` is 1d.
+    err : ndarray or float
+        Per sequence convergence estimate; the difference between the
+        returned estimate and the previous estimate from the table (for
+        no extrapolation the difference between the last two elements).
+
+    See Also
+    --------
+    shanks : Iterated Shanks transformation.
+    shanks_table : Full epsilon table of a single sequence.
+
+    Notes
+    -----
+    The epsilon table is
+
+    .. math:: \\varepsilon_{-1}^{(n)}=0,\\quad
+              \\varepsilon_{0}^{(n)}=A_n,\\quad
+              \\varepsilon_{k+1}^{(n)}=\\varepsilon_{k-1}^{(n+1)}
+              +\\frac{1}{\\varepsilon_{k}^{(n+1)}-\\varepsilon_{k}^{(n)}}
+
+    The even columns :math:`\\varepsilon_{2k}` hold the extrapolated
+    values.  The last element of each even column is an estimate of the
+    limit; the estimate with the smallest difference from its predecessor
+    is returned (similar to QUADPACK's qelg).
+
+    Examples
+    --------
+    Leibniz series for pi, and a geometric series:
+
+    >>> n = np.arange(12)
+    >>> S = np.array([np.cumsum(4 * (-1.0)**n / (2 * n + 1)),
+    ...               np.cumsum(0.5**n)])
+    >>> out, err = vshanks(S)
+    >>> out
+    array([3.14159265, 2.        ])
+    >>> err[0] < 1e-8
+    True
+
+    """
+
+    seq = np.asarray(seq)
+    seq = np.moveaxis(seq.astype(np.result_type(seq, float)), axis, -1)
+
+    n = seq.shape[-1]
+    out = seq[..., -1].copy()
+    if n < 2:
+        return out[()], np.full_like(out, np.inf)[()]
+    err = np.abs(seq[..., -1] - seq[..., -2])
+    if ind is None:
+        return out[()], err[()]
+    if ind < 0:
+        ind = n + ind
+    cur = seq[..., max(ind, 0):]
+    n = cur.shape[-1]
+    if n < 3:
+        return out[()], err[()]
+
+    est = out.copy()
+    active = np.isfinite(out)
+    prev = np.zeros_like(cur)
+    best = np.full_like(out, np.inf)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for k in range(1, n):
+            new = (prev[..., 1:cur.shape[-1]]
+                   + 1.0 / (cur[..., 1:] - cur[..., :-1]))
+            prev, cur = cur, new
+            if k % 2:
+                continue
+            ok = active & np.isfinite(cur[..., -1])
+            active = ok
+            if not np.any(ok):
+                break
+            e = np.abs(cur[..., -1] - est)
+            est = np.where(ok, cur[..., -1], est)
+            better = ok & (e <= best)
+            best = np.where(better, e, best)
+            out = np.where(better, cur[..., -1], out)
+    err = np.where(np.isfinite(best), best, err)
+    return out[()], err[()]
+
+
 def gk_quad(f, a, b, args=(), n=10, sum_intervals=False):
     """Integration by Gauss-Kronrod quadrature between intervals
 
@@ -1201,9 +1613,10 @@ def gk_quad(f, a, b, args=(), n=10, sum_intervals=False):
         Limits of integration. Must have len(a)==len(b).
     args : tuple, optional
         `args` will be passed to f using f(x, *args). Default args=().
-    n : [7,10,15,20,25,30], optional
+    n : int, optional
         Number of gauss quadrature evaluation points. Default n=10. There will
-        be 2*n+1 Kronrod quadrature points.
+        be 2*n+1 Kronrod quadrature points. n in [7,10,15,20,25,30] use
+        tabulated abscissae, other values are calculated and cached.
         sum_intervals : [False, True]
     If sum_intervals=True the integral for each a and b, will be summed.
         Otherwise each interval integration will be returned.  The sum of the
@@ -1224,41 +1637,20 @@ def gk_quad(f, a, b, args=(), n=10, sum_intervals=False):
 
     """
 
-    ai = np.atleast_1d(a)
-    bi = np.atleast_1d(b)
-
-    xj_, wj1, wj2 = gauss_kronrod_abscissae_and_weights(n)
-
     # dim1 = each integration limits, a and b
     # dim2 = each quadrature point
-
-    ai = ai[:, np.newaxis]
-    bi = bi[:, np.newaxis]
-
-    xj_ = xj_[np.newaxis, :]
-    wj1 = wj1[np.newaxis, :]
-    wj2 = wj2[np.newaxis, :]
-
-    bma = (bi - ai) / 2 # b minus a
-    bpa = (ai + bi) /2 # b plus a
-
-
-    xij = bma * xj_ + bpa # xj_ are in [-1, 1] so need to transform to [a, b]
+    xij, wij1, wij2 = interval_nodes(a, b, n, rule='gk')
 
     #get shape of output with scalar argument and form a slice that will ensure
     #any extra dims are appended to the args.
     extra = np.array(f(xij.flat[0], *args))
-    gen_slice = [slice(None)] * xij.ndim + [None] * extra.ndim
+    gen_slice = tuple([slice(None)] * xij.ndim + [None] * extra.ndim)
 
-    fij = f(xij[gen_slice], *args)
+    # xij is cached and read only, f may modify its argument in place.
+    fij = f(xij[gen_slice].copy(), *args)
 
-#    igral1 = np.ravel(bma) * np.sum(fij * wj1, axis=1)
-#    igral2 = np.ravel(bma) * np.sum(fij * wj2, axis=1)
-#    igral1 = bma[:, 0] * np.sum(fij * wj1, axis=1)
-#    igral2 = bma[:, 0] * np.sum(fij * wj2, axis=1)
-
-    igral1 =  np.sum(bma[gen_slice] *fij * wj1[gen_slice], axis=1)
-    igral2 =  np.sum(bma[gen_slice] *fij * wj2[gen_slice], axis=1)
+    igral1 =  np.sum(fij * wij1[gen_slice], axis=1)
+    igral2 =  np.sum(fij * wij2[gen_slice], axis=1)
     err_estimate = np.abs(igral2 - igral1)
 
 
@@ -1271,6 +1663,142 @@ def gk_quad(f, a, b, args=(), n=10, sum_intervals=False):
     return igral2, err_estimate
 
 
+def gk_quad_adaptive(f, a, b, args=(), n=7, epsabs=1.49e-8, epsrel=1.49e-8,
+                     limit=50, sum_intervals=False, full_output=False):
+    """Adaptive Gauss-Kronrod quadrature with batched interval bisection
+
+    Each a-b interval is integrated with `gk_quad`.  Then, round by round,
+    every (sub)interval whose Kronrod error estimate exceeds its share of
+    the tolerance is bisected, and all the new halves are integrated in a
+    single vectorised `gk_quad` call.  A (sub)interval's share of the
+    tolerance is proportional to its width, so when no (sub)interval
+    exceeds its share the summed error estimate is within tolerance.
+
+    Parameters
+    ----------
+    f : function or method
+        Function to integrate.  Must accept vector arguments for x.
+    a, b : 1d array
+        Limits of integration. Must have len(a)==len(b).  Limits must be
+        finite.
+    args : tuple, optional
+        `args` will be passed to f using f(x, *args). Default args=().
+    n : int, optional
+        Number of gauss quadrature evaluation points in each (sub)interval.
+        Default n=7. There will be 2*n+1 Kronrod quadrature points.
+    epsabs, epsrel : float, optional
+        Absolute and relative tolerance on the total integral over all
+        intervals.  The required error is
+        max(epsabs, epsrel * abs(total integral)).  If f returns extra
+        dimensions then each component must satisfy the tolerance.
+        Default epsabs=epsrel=1.49e-8.
+    limit : int, optional
+        Maximum number of bisection rounds. Default limit=50.  A warning is
+        given if the tolerance is not met, either after `limit` rounds or
+        earlier when the only (sub)intervals exceeding their share of the
+        tolerance have nan error estimates (e.g. f returns nan).
+    sum_intervals : [False, True], optional
+        If sum_intervals=True the integral for each a and b will be summed.
+        Otherwise the integral for each original a-b interval (i.e. the sum
+        over its subintervals) is returned. Default sum_intervals=False.
+    full_output : [False, True], optional
+        If True then a dict of extra information is also returned.
+        Default full_output=False.
+
+    Returns
+    -------
+    igral : ndarray
+        Integral of f between a and b.  Same shape as from `gk_quad`.
+    err_estimate : ndarray same size as igral
+        Sum of the Kronrod error estimates of all the subintervals.
+    info : dict, only returned if full_output=True
+        'neval' number of function evaluations,
+        'rounds' number of bisection rounds,
+        'nintervals' final number of subintervals,
+        'converged' True if the tolerance was met.
+
+    See Also
+    --------
+    gk_quad : Non-adaptive Gauss-Kronrod quadrature.
+
+    Examples
+    --------
+    >>> igral, err = gk_quad_adaptive(np.sqrt, 0, 1, sum_intervals=True)
+    >>> np.allclose(igral, 2/3)
+    True
+
+    """
+
+    a0 = np.atleast_1d(a).astype(float)
+    b0 = np.atleast_1d(b).astype(float)
+    if not (np.all(np.isfinite(a0)) and np.all(np.isfinite(b0))):
+        raise ValueError('integration limits must be finite')
+
+    npts = 2 * n + 1
+    width = np.sum(np.abs(b0 - a0))
+    owner = np.arange(len(a0))
+    lo = a0
+    hi = b0
+
+    igral, err = gk_quad(f, lo, hi, args, n)
+    neval = npts * len(lo)
+    rounds = 0
+    converged = False
+    reason = 'limit={} reached'.format(limit)
+
+    while True:
+        # dim0 = each subinterval, dim1 = each component of f
+        total = np.sum(igral, axis=0)
+        tol = np.maximum(epsabs, epsrel * np.abs(total))
+        if np.all(np.sum(err, axis=0) <= tol) or width == 0:
+            converged = True
+            break
+        if rounds >= limit:
+            break
+
+        share = np.abs(hi - lo) / width
+        share = share.reshape(share.shape + (1,) * (err.ndim - 1))
+        ratio = (err / (tol * share)).reshape(len(lo), -1).max(axis=1)
+        split = ratio > 1
+        if not np.any(split):
+            # e.g. nan error estimates
+            reason = 'nan error estimate, bisection cannot help'
+            break
+
+        mid = 0.5 * (lo[split] + hi[split])
+        new_lo = np.concatenate([lo[split], mid])
+        new_hi = np.concatenate([mid, hi[split]])
+        new_igral, new_err = gk_quad(f, new_lo, new_hi, args, n)
+        neval += npts * len(new_lo)
+
+        keep = ~split
+        lo = np.concatenate([lo[keep], new_lo])
+        hi = np.concatenate([hi[keep], new_hi])
+        owner = np.concatenate([owner[keep], owner[split], owner[split]])
+        igral = np.concatenate([igral[keep], new_igral])
+        err = np.concatenate([err[keep], new_err])
+        rounds += 1
+
+    if not converged:
+        warnings.warn('gk_quad_adaptive did not reach the requested '
+                      'tolerance in {} rounds ({})'.format(rounds, reason))
+
+    if sum_intervals:
+        igral_out = np.sum(igral, axis=0)
+        err_out = np.sum(err, axis=0)
+    else:
+        igral_out = np.zeros((len(a0),) + igral.shape[1:], dtype=igral.dtype)
+        err_out = np.zeros((len(a0),) + err.shape[1:], dtype=err.dtype)
+        np.add.at(igral_out, owner, igral)
+        np.add.at(err_out, owner, err)
+
+    if full_output:
+        info = dict(neval=neval, rounds=rounds, nintervals=len(lo),
+                    converged=converged)
+        return igral_out, err_out, info
+    return igral_out, err_out
+
+
 def gl_quad(f, a, b, args=(), n=10, shanks_ind=False, sum_intervals=False):
     """Integration by Gauss-Legendre quadrature with subdivided interval
 
@@ -1283,8 +1811,10 @@ def gl_quad(f, a, b, args=(), n=10, shanks_ind=False, sum_intervals=False):
         limits of integration
     args : tuple, optional
         args will be passed to f using f(x, *args). default=()
-    n : [2-20, 32, 64, 100], optional
-        number of quadrature evaluation points. default=10
+    n : int, optional
+        number of quadrature evaluation points. default=10. n in
+        [2-20, 32, 64, 100] use tabulated abscissae, other values are
+        calculated and cached.
     sum_intervals : [False, True]
         If sum_intervals=True the integral for each a and b, will be summed.
         Otherwise each interval integration will be returned.
@@ -1309,34 +1839,19 @@ def gl_quad(f, a, b, args=(), n=10, shanks_ind=False, sum_intervals=False):
     """
 
 
-    ai = np.atleast_1d(a)
-    bi = np.atleast_1d(b)
-
-    xj_, wj = gauss_legendre_abscissae_and_weights(n)
-
     # dim1 = each integration limits, a and b
     # dim2 = each quadrature point
-
-    ai = ai[:, np.newaxis]
-    bi = bi[:, np.newaxis]
-
-    xj_ = xj_[np.newaxis, :]
-    wj = wj[np.newaxis, :]
-
-    bma = (bi - ai) / 2 # b minus a
-    bpa = (ai + bi) /2 # b plus a
-
-
-    xij = bma * xj_ + bpa # xj_ are in [-1, 1] so need to transform to [a, b]
+    xij, wij = interval_nodes(a, b, n, rule='gl')
 
     #get shape of output with scalar argument and form a slice that will ensure
     #any extra dims are appended to the args.
     extra = np.array(f(xij.flat[0], *args))
-    gen_slice = [slice(None)] * xij.ndim + [None] * extra.ndim
+    gen_slice = tuple([slice(None)] * xij.ndim + [None] * extra.ndim)
 
-    fij = f(xij[gen_slice], *args)
+    # xij is cached and read only, f may modify its argument in place.
+    fij = f(xij[gen_slice].copy(), *args)
 
-    igral = np.sum(bma[gen_slice] * fij *wj[gen_slice], axis=1)
+    igral = np.sum(fij * wij[gen_slice], axis=1)
 
     if sum_intervals:
         igral = np.sum(igral, axis=0)
@@ -40,6 +40,13 @@ from geotecha.mathematics.geometry import integrate_f_over_polyhedra_code
 from geotecha.mathematics.geometry import make_hexahedron
 from geotecha.mathematics.geometry import polyhedron_volume
 from geotecha.mathematics.geometry import polygon_2nd_moment_of_area
+from geotecha.mathematics.geometry import ragged_polygons
+from geotecha.mathematics.geometry import ragged_polyhedra
+from geotecha.mathematics.geometry import vpolygon_properties
+from geotecha.mathematics.geometry import vpolygon_area
+from geotecha.mathematics.geometry import vpolygon_centroid
+from geotecha.mathematics.geometry import vpolygon_2nd_moment_of_area
+from geotecha.mathematics.geometry import vpolyhedron_volume
 
 def test_replace_x0_and_x1_with_vect():
     """test for replace_x0_and_x1_with_vect"""
@@ -277,6 +284,105 @@ class test_polygon_2nd_moment_of_area(unittest.TestCase):
 
 
 
+class test_vpolygon_properties(unittest.TestCase):
+    """tests for vpolygon_properties and friends"""
+
+    shp = test_polygon_2nd_moment_of_area.shp
+
+    def random_polygons(self, n=30, seed=3):
+        """random star shaped polygons lying in random planes"""
+        rng = np.random.RandomState(seed)
+        polygons = []
+        for k in range(n):
+            m = rng.randint(3, 9)
+            theta = np.sort(rng.uniform(0, 2 * np.pi, m))
+            r = rng.uniform(0.5, 2, m)
+            uv = np.column_stack([r * np.cos(theta), r * np.sin(theta)])
+            if k % 3 == 0:
+                polygons.append(uv + rng.uniform(-5, 5, 2))
+                continue
+            while True:
+                e1, e2 = np.linalg.qr(rng.normal(size=(3, 2)))[0].T
+                pts = uv[:, :1] * e1 + uv[:, 1:] * e2 + rng.uniform(-5, 5, 3)
+                n = eqn_of_plane(pts)[0]
+                if np.max(n) <= 0:
+                    pts = pts[::-1]
+                    n = -n
+                # polygon_area projects on the xz (not zx) plane when
+                # argmax(n) == 1, giving a negative area, so avoid that.
+                if np.argmax(n) != 1:
+                    break
+            polygons.append(pts)
+        return polygons
+
+    def test_vs_scalar(self):
+        polygons = self.random_polygons()
+        a, c, I = vpolygon_properties(*ragged_polygons(polygons))
+        assert_allclose(a, [polygon_area(v) for v in polygons])
+        assert_allclose(c, [polygon_centroid(v) for v in polygons],
+                        atol=1e-10)
+        assert_allclose(I, [polygon_2nd_moment_of_area(v) for v in polygons],
+                        atol=1e-10)
+
+    def test_shapes(self):
+        polygons = [self.shp[k] for k in ['unit square', 'right tri',
+                                          '3D tri', '2D tri',
+                                          'octahedral tri']]
+        pts, offsets = ragged_polygons(polygons)
+        assert_allclose(vpolygon_area(pts, offsets),
+                        [polygon_area(v) for v in polygons])
+        assert_allclose(vpolygon_centroid(pts, offsets),
+                        [polygon_centroid(v) for v in polygons])
+        assert_allclose(vpolygon_2nd_moment_of_area(pts, offsets),
+                        [polygon_2nd_moment_of_area(v) for v in polygons])
+
+    def test_clockwise(self):
+        pts, offsets = ragged_polygons([self.shp['2D tri'][::-1]])
+        a, c, I = vpolygon_properties(pts, offsets)
+        assert_allclose(a, polygon_area(self.shp['2D tri']))
+        assert_allclose(I[0], polygon_2nd_moment_of_area(self.shp['2D tri']))
+
+    def test_large_coords(self):
+        pts = np.array(self.shp['unit square'], dtype=float) + [3e6, 6e6]
+        a, c, I = vpolygon_properties(pts, [0, 4])
+        assert_allclose(a, 1)
+        assert_allclose(c, [[3e6 + 0.5, 6e6 + 0.5, 0]])
+        assert_allclose(I, [[1 / 12, 1 / 12, 0]], atol=1e-12)
+
+    def test_bad_offsets(self):
+        pts = np.array(self.shp['unit square'])
+        assert_raises(ValueError, vpolygon_area, pts, [0, 3])
+        assert_raises(ValueError, vpolygon_area, pts, [0, 2, 4])
+        assert_raises(ValueError, vpolygon_area, pts[:, :1], [0, 4])
+
+
+class test_vpolyhedron_volume(unittest.TestCase):
+    """tests for vpolyhedron_volume"""
+
+    def test_vs_scalar(self):
+        rng = np.random.RandomState(0)
+        base = np.array([[0, 0, 0], [0, 1, 0], [0, 1, 1], [0, 0, 1],
+                         [1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1]], float)
+        polyhedra = [test_polyhedron_volume.twounitcube,
+                     test_polyhedron_volume.righttetra]
+        # affine maps keep the faces planar
+        polyhedra += [make_hexahedron(base.dot(np.eye(3) +
+                                               rng.uniform(-0.3, 0.3, (3, 3)))
+                                      + rng.uniform(-100, 100, 3))
+                      for k in range(20)]
+        v = vpolyhedron_volume(*ragged_polyhedra(polyhedra))
+        assert_allclose(v, [polyhedron_volume(f) for f in polyhedra])
+        assert_allclose(v[:2], [8, 1 / 6])
+
+    def test_bad_pts(self):
+        pts, face_offsets, poly_offsets = ragged_polyhedra(
+            [test_polyhedron_volume.righttetra])
+        assert_raises(ValueError, vpolyhedron_volume, pts[:, :2],
+                      face_offsets, poly_offsets)
+        assert_raises(ValueError, vpolyhedron_volume, pts,
+                      face_offsets, [0, 5])
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
@@ -155,6 +155,30 @@ def check_HankelTransform(s, funcanddoc, funcanddoc_, args, order, m,
 
 
 
+def test_hankel_transform_tol():
+    """HankelTransform with tol uses adaptive quadrature"""
+
+    neval = [0]
+    def f(r, a, v):
+        neval[0] += np.size(r)
+        return hankel5_(r, a, v)
+
+    for order in [0, 1, 4]:
+        for s in [0.1, 0.5, 1.5]:
+            args = (1.1, order)
+            neval[0] = 0
+            h = HankelTransform(f, args, order, m=20, ng=10, ng0=20,
+                                shanks_ind=-5)
+            h(s)
+            n_fixed = neval[0]
+
+            neval[0] = 0
+            h = HankelTransform(f, args, order, m=20, ng=5, shanks_ind=-5,
+                                tol=1e-8)
+            assert_allclose(h(s)[0], hankel5(s, *args), atol=1e-10)
+            ok_(neval[0] < n_fixed)
+
+
 class test_HankelTransform(unittest.TestCase):
     """one off tests for HankelTransform class"""
 
@@ -24,11 +24,19 @@ from numpy.testing import assert_allclose
 
 import numpy as np
 import unittest
+import warnings
 
 from geotecha.mathematics.quadrature import gl_quad
 from geotecha.mathematics.quadrature import gk_quad
+from geotecha.mathematics.quadrature import gk_quad_adaptive
 from geotecha.mathematics.quadrature import shanks
 from geotecha.mathematics.quadrature import shanks_table
+from geotecha.mathematics.quadrature import vshanks
+from geotecha.mathematics.quadrature import gauss_legendre_nodes
+from geotecha.mathematics.quadrature import gauss_kronrod_nodes
+from geotecha.mathematics.quadrature import gauss_legendre_abscissae_and_weights
+from geotecha.mathematics.quadrature import gauss_kronrod_abscissae_and_weights
+from geotecha.mathematics.quadrature import interval_nodes
 
 
 
@@ -95,6 +103,58 @@ class test_shanks(unittest.TestCase):
         assert_allclose(shanks(seq, -50), np.pi, atol=1e-8)
 
 
+class test_vshanks(unittest.TestCase):
+    """tests for vshanks"""
+
+    def test_vs_shanks_table(self):
+        """vshanks value and error estimate vs shanks_table"""
+        n = np.arange(15)
+        seq = np.cumsum(4 * (-1.0)**n / (2 * n + 1))
+        out, err = vshanks(seq)
+        ok_(np.isscalar(out))
+        assert_allclose(out, np.pi, atol=1e-10)
+        ok_(err < 1e-8)
+        assert_allclose(out, shanks_table(list(seq))[-1][-1], atol=1e-10)
+
+    def test_many_sequences_axis(self):
+        """vshanks many sequences along axis=0"""
+        n = np.arange(20)[:, None]
+        x = np.linspace(0.1, 0.9, 7)[None, :]
+        seq = np.cumsum((-x)**n / (n + 1), axis=0)
+        out, err = vshanks(seq, axis=0)
+        assert_allclose(out, np.log(1 + x[0]) / x[0], atol=1e-12)
+        assert_allclose(vshanks(seq.T)[0], out)
+        ok_(np.all(err < 1e-8))
+
+    def test_breakdown_per_sequence(self):
+        """vshanks division by zero in one sequence only"""
+        n = np.arange(10)
+        seq = np.array([np.cumsum(0.5**n),
+                        np.ones(10),
+                        np.cumsum(4 * (-1.0)**n / (2 * n + 1))])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            out, err = vshanks(seq)
+        assert_allclose(out, [2.0, 1.0, np.pi], atol=1e-7)
+
+    def test_complex(self):
+        """vshanks complex sequence"""
+        n = np.arange(20)
+        seq = np.cumsum((0.5j - 0.3)**n)
+        out, err = vshanks(seq)
+        assert_allclose(out, 1 / (1.3 - 0.5j), atol=1e-12)
+
+    def test_ind(self):
+        """vshanks start index"""
+        n = np.arange(30)
+        seq = np.cumsum(4 * (-1.0)**n / (2 * n + 1))
+        out, err = vshanks(seq, -8)
+        assert_allclose(out, np.pi, atol=1e-6)
+        out, err = vshanks(seq, None)
+        assert_allclose(out, seq[-1])
+        assert_allclose(err, np.abs(seq[-1] - seq[-2]))
+
+
 def test_gl_quad_polynomials_chunks():
     """tests for gl_quad exact polynomial broken into intervals"""
     for n in [2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20, 32, 64, 100]:
@@ -260,6 +320,156 @@ def check_gk_quad_chunks_extra_dims2(n):
 
 
 
+def test_gauss_legendre_nodes_vs_tables():
+    """gauss_legendre_nodes vs tabulated abscissae and weights"""
+    for n in [2, 3, 4, 7, 10, 15, 20, 32, 64, 100]:
+        xi, wi = gauss_legendre_abscissae_and_weights(n)
+        x, w = gauss_legendre_nodes(n)
+        assert_allclose(x, xi, rtol=0, atol=1e-14)
+        assert_allclose(w, wi, rtol=0, atol=1e-14)
+
+
+def test_gauss_kronrod_nodes_vs_tables():
+    """gauss_kronrod_nodes vs tabulated abscissae and weights"""
+    for n in [7, 10, 15, 20, 25, 30]:
+        xi, wi1, wi2 = gauss_kronrod_abscissae_and_weights(n)
+        x, w1, w2 = gauss_kronrod_nodes(n)
+        assert_allclose(x, xi, rtol=0, atol=1e-14)
+        assert_allclose(w1, wi1, rtol=0, atol=1e-14)
+        assert_allclose(w2, wi2, rtol=0, atol=1e-14)
+
+
+def test_gl_quad_polynomials_generated():
+    """tests for gl_quad exact polynomial with non tabulated n"""
+    for n in [1, 21, 25]:
+        yield check_gl_quad, n
+
+
+def test_gk_quad_polynomials_generated():
+    """tests for gk_quad exact polynomial with non tabulated n"""
+    for n in [1, 2, 3, 5, 9]:
+        yield check_gk_quad, n
+
+
+def test_abscissae_and_weights_cached():
+    """abscissae and weights are cached and read only"""
+    for f in [gauss_legendre_abscissae_and_weights,
+              gauss_kronrod_abscissae_and_weights,
+              gauss_legendre_nodes,
+              gauss_kronrod_nodes]:
+        for n in [10, 23]:
+            a = f(n)
+            ok_(f(n)[0] is a[0])
+            for v in a:
+                assert_raises(ValueError, v.__setitem__, 0, 1.0)
+
+
+def test_gauss_nodes_bad_n():
+    """gauss_legendre_nodes and gauss_kronrod_nodes non positive integer n"""
+    for f in [gauss_legendre_nodes, gauss_kronrod_nodes]:
+        assert_raises(ValueError, f, 0)
+        assert_raises(ValueError, f, 2.5)
+
+
+def test_interval_nodes():
+    """interval_nodes points, weights and caching"""
+    a = np.array([0.0, 1.0])
+    b = np.array([1.0, 3.0])
+    xij, wij = interval_nodes(a, b, n=3)
+    assert_allclose(np.sum(xij**2 * wij, axis=1), [1/3, 26/3])
+    ok_(interval_nodes(a.copy(), b.copy(), n=3)[0] is xij)
+
+    xij, wij1, wij2 = interval_nodes(a, b, n=7, rule='gk')
+    assert_allclose(xij.shape, (2, 15))
+    assert_allclose(np.sum(xij**5 * wij1, axis=1), [1/6, (3**6 - 1) / 6])
+    assert_allclose(np.sum(xij**5 * wij2, axis=1), [1/6, (3**6 - 1) / 6])
+
+    assert_raises(ValueError, interval_nodes, a, b, 3, 'simpson')
+    assert_raises(ValueError, interval_nodes, a, b[:1], 3)
+
+
+def test_quad_integrand_modifies_x():
+    """gl_quad and gk_quad integrand may change x in place"""
+    def f(x):
+        x *= 2
+        return x
+
+    assert_allclose(gl_quad(f, [0, 1], [1, 2], n=5), [1, 3])
+    igral, err = gk_quad(f, [0, 1], [1, 2], n=5)
+    assert_allclose(igral, [1, 3])
+    # cached nodes unchanged
+    assert_allclose(gl_quad(lambda x: x, [0, 1], [1, 2], n=5), [0.5, 1.5])
+
+
+def test_gk_quad_adaptive_sqrt():
+    """gk_quad_adaptive sqrt(x) with singular derivative at 0"""
+    igral, err, info = gk_quad_adaptive(np.sqrt, 0, 1, n=7, epsabs=1e-12,
+                                        epsrel=1e-12, sum_intervals=True,
+                                        full_output=True)
+    assert_allclose(igral, 2 / 3, rtol=1e-12)
+    ok_(err <= 1e-12)
+    ok_(info['converged'])
+    ok_(info['rounds'] > 0)
+    assert_allclose(info['neval'], 15 * (1 + 2 * info['rounds']))
+
+
+def test_gk_quad_adaptive_intervals():
+    """gk_quad_adaptive subinterval results are summed per interval"""
+    a = np.array([0.0, 1.0, 2.0])
+    b = np.array([1.0, 2.0, 5.0])
+    def f(x):
+        return np.sin(20 * x) * np.array([1.0, 2.0])
+
+    igral, err, info = gk_quad_adaptive(f, a, b, n=3, epsabs=1e-10,
+                                        epsrel=0, full_output=True)
+    exact = (np.cos(20 * a) - np.cos(20 * b)) / 20
+    assert_allclose(igral, exact[:, None] * [1, 2], atol=1e-10)
+    ok_(info['nintervals'] > 3)
+    ok_(np.sum(err, axis=0).max() <= 1e-10)
+
+
+def test_gk_quad_adaptive_smooth_no_refinement():
+    """gk_quad_adaptive smooth integrand needs no bisection"""
+    igral, err, info = gk_quad_adaptive(np.exp, [0, 1], [1, 2], n=7,
+                                        full_output=True)
+    assert_allclose(igral, [np.e - 1, np.e**2 - np.e])
+    assert_allclose(info['rounds'], 0)
+    assert_allclose(info['neval'], 30)
+
+
+def test_gk_quad_adaptive_limit():
+    """gk_quad_adaptive warns if tolerance not met"""
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        igral, err, info = gk_quad_adaptive(lambda x: x**-0.5, 0, 1,
+                                            epsabs=1e-14, epsrel=0,
+                                            limit=2, full_output=True)
+    ok_(not info['converged'])
+    assert_allclose(info['rounds'], 2)
+    ok_(any('tolerance in 2 rounds (limit=2 reached)' in str(v.message)
+            for v in w))
+
+
+def test_gk_quad_adaptive_nan():
+    """gk_quad_adaptive nan error estimate stops before limit"""
+    def f(x):
+        return np.where(x < 0.5, np.nan, x)
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        igral, err, info = gk_quad_adaptive(f, 0, 1, limit=10,
+                                            full_output=True)
+    ok_(not info['converged'])
+    assert_allclose(info['rounds'], 0)
+    msg = [str(v.message) for v in w]
+    ok_(any('in 0 rounds (nan error estimate' in v for v in msg))
+
+
+def test_gk_quad_adaptive_infinite_limits():
+    """gk_quad_adaptive infinite limits raise ValueError"""
+    assert_raises(ValueError, gk_quad_adaptive, np.exp, 0, np.inf)
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
@@ -23,7 +23,6 @@ from __future__ import print_function, division
 import numpy as np
 import math
 import sys
-import matplotlib.pyplot as plt
 import copy
 import operator
 
@@ -23,10 +23,7 @@ One dimensional data is basically x-y data. (i.e. no contour plot needed)
 from __future__ import division, print_function
 
 import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
-import brewer2mpl
+from geotecha.inputoutput.lazy_import import lazy_import
 import random
 import itertools
 import geotecha.mathematics.transformations as transformations
@@ -34,6 +31,13 @@ from geotecha.piecewise.piecewise_linear_1d import PolyLine
 import geotecha.piecewise.piecewise_linear_1d as pwise
 import warnings
 
+# matplotlib is only imported when something is actually plotted so that
+# compute only users of this module (e.g. copy_dict) stay light.
+mpl = lazy_import('matplotlib')
+plt = lazy_import('matplotlib.pyplot')
+gridspec = lazy_import('matplotlib.gridspec')
+brewer2mpl = lazy_import('brewer2mpl')
+
 
 def rgb_shade(rgb, factor=1, scaled=True):
     """Apply shade (darken) to a red, green, blue (rgb) triplet
@@ -1024,9 +1028,203 @@ def split_sequence_into_dict_and_nondicts(*args):
     return merged_non_dict, merged_dict
 
 
+def decimate_xy(x, y, npts, method='minmax'):
+    """Reduce the number of points in x-y line data, preserving peaks
+
+    Long lines (e.g. 10^5 time steps) are reduced to about `npts` points
+    so that plotting is fast and files are small, while the visual
+    appearance of the line is kept.
+
+    Parameters
+    ----------
+    x : 1d array_like
+        Independent variable, length n.  Can also be a 2d array with the
+        same shape as `y`.
+    y : 1d or 2d array_like
+        Dependent variable.  If 2d then each column is a line (as per
+        plt.plot(x, y)).  len(y) must equal len(x).
+    npts : int
+        Approximate number of points in each decimated line.
+    method : ['minmax', 'lttb'], optional
+        Decimation method.  Default method='minmax'.
+
+        - 'minmax' splits the data into npts // 2 equal sized buckets and
+          keeps the minimum and maximum of each bucket (in their original
+          order) so every peak and trough is retained.  Rendered at npts / 2
+          pixels wide the line is indistinguishable from the full line.
+        - 'lttb' is Largest-Triangle-Three-Buckets; one point per bucket,
+          chosen to maximise the area of the triangle formed with the
+          previously chosen point and the average of the next bucket.
+          Gives visually smoother lines than 'minmax' for the same npts.
+
+    Returns
+    -------
+    x_, y_ : ndarray
+        Decimated data.  If `y` is 2d then `x_` will be 2d (the selected
+        points are different for each line).  If len(x) <= npts then the
+        data is returned as is.
+
+    Examples
+    --------
+    >>> x = np.linspace(0, 1, 1001)
+    >>> y = np.zeros_like(x)
+    >>> y[337] = 5
+    >>> x_, y_ = decimate_xy(x, y, npts=20)
+    >>> len(x_), max(y_)
+    (22, 5.0)
+
+    """
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if len(x) != n:
+        raise ValueError("x and y must have the same length. "
+                         "{} vs {}".format(len(x), n))
+    if y.ndim > 2 or (x.ndim > 1 and x.shape != y.shape):
+        raise ValueError("y must be 1d or 2d and x must be 1d or the "
+                         "same shape as y")
+    if npts < 3:
+        raise ValueError("npts must be at least 3, not {}".format(npts))
+    if n <= npts:
+        return x, y
+
+    y2 = y.reshape(n, -1)
+    m = y2.shape[1]
+    cols = np.arange(m)
+
+    if method == 'minmax':
+        nb = npts // 2
+        bs = -(-n // nb) # ceil
+        nb = -(-n // bs)
+        # pad with repeats of last row so buckets are equal sized
+        yp = np.concatenate([y2, np.repeat(y2[-1:], nb * bs - n, axis=0)])
+        yp = yp.reshape(nb, bs, m)
+        start = (np.arange(nb) * bs)[:, np.newaxis]
+        imin = np.minimum(np.argmin(yp, axis=1) + start, n - 1)
+        imax = np.minimum(np.argmax(yp, axis=1) + start, n - 1)
+        idx = np.empty((2 * nb + 2, m), dtype=int)
+        idx[0] = 0
+        idx[1:-1:2] = np.minimum(imin, imax)
+        idx[2:-1:2] = np.maximum(imin, imax)
+        idx[-1] = n - 1
+    elif method == 'lttb':
+        x2 = np.broadcast_to(x.reshape(n, -1), (n, m))
+        edges = np.linspace(1, n - 1, npts - 1).astype(int)
+        edges = np.append(edges, n)
+        idx = np.empty((npts, m), dtype=int)
+        idx[0] = 0
+        idx[-1] = n - 1
+        xa, ya = x2[0], y2[0]
+        for i in range(npts - 2):
+            lo, hi = edges[i], edges[i + 1]
+            xc = x2[hi:edges[i + 2]].mean(axis=0)
+            yc = y2[hi:edges[i + 2]].mean(axis=0)
+            area = np.abs((xa - xc) * (y2[lo:hi] - ya) -
+                          (xa - x2[lo:hi]) * (yc - ya))
+            j = np.argmax(area, axis=0) + lo
+            idx[i + 1] = j
+            xa, ya = x2[j, cols], y2[j, cols]
+    else:
+        raise ValueError("method must be 'minmax' or 'lttb', "
+                         "not '{}'".format(method))
+
+    y_ = np.take_along_axis(y2, idx, axis=0)
+    if x.ndim == 1:
+        x_ = x[idx]
+    else:
+        x_ = np.take_along_axis(x.reshape(n, -1), idx, axis=0)
+    if y.ndim == 1:
+        return x_[:, 0], y_[:, 0]
+    return x_, y_
+
+
+def screen_npts(fig, direction='x'):
+    """Number of points that can be resolved across a figure on screen
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        Figure.
+    direction : ['x', 'y'], optional
+        'x' uses the figure width, 'y' uses the figure height.
+        Default direction='x'.
+
+    Returns
+    -------
+    npts : int
+        Two points (a min and a max) per pixel at the figure's dpi.
+
+    """
+
+    if direction == 'x':
+        size = fig.get_figwidth()
+    else:
+        size = fig.get_figheight()
+    return int(2 * np.ceil(size * fig.dpi))
+
+
+def _decimate_for_figure(fig, x, y, decimate, direction='x'):
+    """Apply a `decimate` plot option to x-y data
+
+    decimate can be None/False (do nothing), True (minmax), a method
+    name, or a dict with 'method' and/or 'npts' keys.  If npts is not
+    given then screen_npts(fig, direction) is used.
+    """
+
+    if decimate is None or decimate is False:
+        return x, y
+    if decimate is True:
+        decimate = {}
+    elif not isinstance(decimate, dict):
+        decimate = {'method': decimate}
+    method = decimate.get('method', 'minmax')
+    npts = decimate.get('npts', None)
+    if npts is None:
+        npts = screen_npts(fig, direction)
+    return decimate_xy(x, y, npts=npts, method=method)
+
+
+def rasterize_dense_lines(fig, npts=5000):
+    """Rasterize lines and line collections that have many points
+
+    Vector output (pdf, eps) of lines with very many points is large and
+    slow to render.  Rasterized artists are drawn as an image (at the
+    savefig dpi) in vector output while text, axes etc. remain as vectors.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        Figure to search for dense lines.
+    npts : int, optional
+        Lines with more than npts points will be rasterized.
+        Default npts=5000.
+
+    Returns
+    -------
+    artists : list
+        The artists that were rasterized.
+
+    """
+
+    artists = []
+    for ax in fig.get_axes():
+        for line in ax.get_lines():
+            if len(line.get_xdata(orig=False)) > npts:
+                artists.append(line)
+        for coll in ax.collections:
+            if isinstance(coll, mpl.collections.LineCollection):
+                if sum(len(v.vertices) for v in coll.get_paths()) > npts:
+                    artists.append(coll)
+    for artist in artists:
+        artist.set_rasterized(True)
+    return artists
+
+
 def plot_data_in_grid(fig, data, gs,
                        gs_index=None,
-                       sharex=None, sharey=None):
+                       sharex=None, sharey=None,
+                       decimate=None, rasterize_npts=None):
     """Make a subplot for each set of data
 
     Parameters
@@ -1074,6 +1272,18 @@ def plot_data_in_grid(fig, data, gs,
         If only one value is given and ther is more than one data set then
         all subplots will share the given axis.  Note that the axis to share
         must already have been created.
+    decimate : bool, str or dict, optional
+        Decimate long (x, y) data sets before plotting (only for the
+        default 'plot' plot_type).  True uses 'minmax' decimation, a str
+        gives the method, and a dict can contain 'method' and 'npts' keys.
+        If npts is not given the number of points that can be resolved
+        across the figure is used.  See `decimate_xy`.  A 'decimate' key
+        in the dict part of data[i][j] overrides this for that data set.
+        Default decimate=None i.e. no decimation.
+    rasterize_npts : int, optional
+        Lines with more than rasterize_npts points will be rasterized.
+        See `rasterize_dense_lines`.  Default rasterize_npts=None i.e.
+        no rasterization.
 
 
     Returns
@@ -1144,6 +1354,10 @@ def plot_data_in_grid(fig, data, gs,
             #xy_etc is a single [x,y,dict] to send to plt.plot, or plt.plot_type
             args_, kwargs_ = split_sequence_into_dict_and_nondicts(*xy_etc)
             plot_type = kwargs_.pop('plot_type', 'plot')
+            decimate_ = kwargs_.pop('decimate', decimate)
+            if plot_type == 'plot' and len(args_) == 2:
+                args_ = _decimate_for_figure(fig, args_[0], args_[1],
+                                             decimate_)
 
             getattr(ax[-1], plot_type)(*args_,**kwargs_) #http://stackoverflow.com/a/3071/2530083
 
@@ -1162,6 +1376,8 @@ def plot_data_in_grid(fig, data, gs,
 #        else:
 #
 ##        ax[-1].set_ylabel(i) #use for debugging
+    if not rasterize_npts is None:
+        rasterize_dense_lines(fig, rasterize_npts)
     return ax
 
 def apply_dict_to_object(obj, dic):
@@ -1276,6 +1492,16 @@ def plot_generic_loads(load_triples, load_names, ylabels=None,
                             Defaults include:
                             title='Load'
                             fontsize=9
+        decimate            Decimate long load_vs_time lines. True
+                            for 'minmax' decimation, 'lttb' for
+                            Largest-Triangle-Three-Buckets or a dict
+                            with 'method' and 'npts' keys.
+                            See decimate_xy.  Default npts is the
+                            number resolvable across the figure.
+                            Default=None i.e. no decimation.
+        rasterize_npts      Rasterize lines with more than this many
+                            points. See rasterize_dense_lines.
+                            Default=None i.e. no rasterization.
         ==================  ============================================
 
 
@@ -1387,7 +1613,8 @@ def plot_generic_loads(load_triples, load_names, ylabels=None,
             x, y = pwise.subdivide_x_y_into_segments(x=vs_time.x, y=vs_time.y, dx=dx, min_segments=4)
             if not omega_phase is None:
                 y *= np.cos(omega * x + phase)
-
+            x, y = _decimate_for_figure(fig, x, y,
+                                        prop_dict.get('decimate', None))
 
 
 
@@ -1461,6 +1688,10 @@ def plot_generic_loads(load_triples, load_names, ylabels=None,
         ax2[-1].set_xticks([0,0.5,1])
 
         fig.tight_layout()
+
+    rasterize_npts = prop_dict.get('rasterize_npts', None)
+    if not rasterize_npts is None:
+        rasterize_dense_lines(fig, rasterize_npts)
     return fig
 
 
@@ -1511,6 +1742,16 @@ def plot_vs_time(t, y, line_labels=None, prop_dict={}):
                             Defaults include:
                             title='Depth interval'
                             fontsize=9
+        decimate            Decimate long lines before plotting. True
+                            for 'minmax' decimation, 'lttb' for
+                            Largest-Triangle-Three-Buckets or a dict
+                            with 'method' and 'npts' keys.
+                            See decimate_xy.  Default npts is the
+                            number resolvable across the figure.
+                            Default=None i.e. no decimation.
+        rasterize_npts      Rasterize lines with more than this many
+                            points. See rasterize_dense_lines.
+                            Default=None i.e. no rasterization.
         ==================  ============================================
 
     Returns
@@ -1553,6 +1794,7 @@ def plot_vs_time(t, y, line_labels=None, prop_dict={}):
 
 
     fig = plt.figure(**fig_prop)
+    t, y = _decimate_for_figure(fig, t, y, prop_dict.get('decimate', None))
     plt.plot(t, y)
 
     xlabel = prop_dict.get('xlabel', 'Time, t')
@@ -1588,6 +1830,10 @@ def plot_vs_time(t, y, line_labels=None, prop_dict={}):
         leg = fig.gca().legend(**legend_prop)
         leg.draggable(True)
         plt.setp(leg.get_title(),fontsize=legend_prop['fontsize'])
+
+    rasterize_npts = prop_dict.get('rasterize_npts', None)
+    if not rasterize_npts is None:
+        rasterize_dense_lines(fig, rasterize_npts)
     return fig
 
 
@@ -1873,6 +2119,16 @@ def plot_vs_depth(x, z, line_labels=None, H = 1.0, RLzero=None,
                             defaults include:
                             title='Depth interval'
                             fontsize=9
+        decimate            Decimate long lines before plotting. True
+                            for 'minmax' decimation, 'lttb' for
+                            Largest-Triangle-Three-Buckets or a dict
+                            with 'method' and 'npts' keys.
+                            See decimate_xy.  Default npts is the
+                            number resolvable across the figure.
+                            Default=None i.e. no decimation.
+        rasterize_npts      Rasterize lines with more than this many
+                            points. See rasterize_dense_lines.
+                            Default=None i.e. no rasterization.
         ==================  ============================================
 
     Returns
@@ -1910,6 +2166,8 @@ def plot_vs_depth(x, z, line_labels=None, H = 1.0, RLzero=None,
     z = transformations.depth_to_reduced_level(z, H, RLzero)
 
     fig = plt.figure(**fig_prop)
+    z, x = _decimate_for_figure(fig, z, x, prop_dict.get('decimate', None),
+                                direction='y')
     plt.plot(x, z)
 
     xlabel = prop_dict.get('xlabel', 'x')
@@ -1964,9 +2222,14 @@ def plot_vs_depth(x, z, line_labels=None, H = 1.0, RLzero=None,
         leg = fig.gca().legend(**legend_prop)
         leg.draggable(True)
         plt.setp(leg.get_title(),fontsize=legend_prop['fontsize'])
+
+    rasterize_npts = prop_dict.get('rasterize_npts', None)
+    if not rasterize_npts is None:
+        rasterize_dense_lines(fig, rasterize_npts)
     return fig
 
-def save_figure(fig, fname='fig', ext=['pdf', 'eps', 'png'], dpi=1200):
+def save_figure(fig, fname='fig', ext=['pdf', 'eps', 'png'], dpi=1200,
+                vector_dpi=None):
     """Save a figure to a file in multiple formats
 
     Figure will be saved in as fname.ext where ext is each of the extenstions
@@ -1982,16 +2245,22 @@ def save_figure(fig, fname='fig', ext=['pdf', 'eps', 'png'], dpi=1200):
         List of file extensions to save.  Must be one of the matplolib
         save as file types.  default ext=[['pdf','eps','png'].
     dpi : int, optional
-        dpi setting to save png etc figures as. Default dpi=1200.
+        dpi setting to save png figures as. Default dpi=1200.
+    vector_dpi : int, optional
+        dpi setting for formats other than png, i.e. the resolution of any
+        raster content (images, or artists rasterized with
+        `rasterize_dense_lines`) in vector formats.  Default
+        vector_dpi=None i.e. matplotlib's savefig.dpi setting.
 
     """
 
     for ex in ext:
         if ex in ['png']:
             d = {'dpi': dpi}
-            d['dpi'] = dpi
+        elif vector_dpi is not None:
+            d = {'dpi': vector_dpi}
         else:
-            d={}
+            d = {}
         fig.savefig('{}.{}'.format(fname, ex), format=ex, **d)
 
 
@@ -57,6 +57,10 @@ from geotecha.plotting.one_d import plot_vs_depth
 from geotecha.plotting.one_d import plot_single_material_vs_depth
 from geotecha.plotting.one_d import plot_generic_loads
 from geotecha.plotting.one_d import plot_data_in_grid
+from geotecha.plotting.one_d import decimate_xy
+from geotecha.plotting.one_d import screen_npts
+from geotecha.plotting.one_d import rasterize_dense_lines
+from geotecha.plotting.one_d import save_figure
 
 
 def test_rgb_shade():
@@ -1311,6 +1315,118 @@ class test_plot_data_in_grid(temp_cls):
 
 
 
+class test_decimate_xy(unittest.TestCase):
+    """tests for decimate_xy"""
+
+    x = np.linspace(0, 10, 100001)
+    y = np.column_stack([np.sin(3 * x) + 0.01 * np.cos(2000 * x),
+                         np.where(x > 7.77777, 1.0, 0.0)])
+    y[31415, 1] = -4.0 # isolated spike
+
+    def test_minmax_keeps_extremes(self):
+        x_, y_ = decimate_xy(self.x, self.y, 1000)
+        ok_(len(x_) <= 1002)
+        assert_equal(x_.shape, y_.shape)
+        assert_allclose(y_.max(axis=0), self.y.max(axis=0))
+        assert_allclose(y_.min(axis=0), self.y.min(axis=0))
+        assert_allclose(x_[[0, -1], 0], [0, 10])
+        ok_(np.all(np.diff(x_, axis=0) >= 0))
+        # points are on the original line
+        assert_allclose(y_[:, 0], np.interp(x_[:, 0], self.x, self.y[:, 0]))
+
+    def test_lttb(self):
+        x_, y_ = decimate_xy(self.x, self.y[:, 0], 1000, method='lttb')
+        assert_equal(len(x_), 1000)
+        ok_(np.all(np.diff(x_) > 0))
+        assert_allclose(y_, np.interp(x_, self.x, self.y[:, 0]))
+        assert_allclose(np.interp(self.x, x_, y_), self.y[:, 0], atol=0.03)
+
+        x_, y_ = decimate_xy(self.x, self.y, 1000, method='lttb')
+        ok_(np.any(y_[:, 1] == -4.0))
+
+    def test_short_unchanged(self):
+        x_, y_ = decimate_xy([0, 1, 2], [3, 4, 5], 10)
+        assert_allclose(x_, [0, 1, 2])
+        assert_allclose(y_, [3, 4, 5])
+
+    def test_bad_input(self):
+        assert_raises(ValueError, decimate_xy, [0, 1, 2], [3, 4], 10)
+        assert_raises(ValueError, decimate_xy, self.x, self.y, 100,
+                      method='average')
+
+
+class test_plot_decimate_and_rasterize(temp_cls):
+    """tests for decimate and rasterize_npts plot options"""
+
+    t = np.linspace(0, 10, 50001)
+    y = np.column_stack([np.sin(t), np.cos(t)])
+
+    def test_plot_vs_time(self):
+        fig = plot_vs_time(self.t, self.y, None,
+                           prop_dict={'decimate': True,
+                                      'rasterize_npts': 100})
+        lines = fig.get_axes()[0].get_lines()
+        assert_equal(len(lines), 2)
+        npts = screen_npts(fig)
+        ok_(len(lines[0].get_xdata()) <= npts + 2)
+        assert_allclose(lines[1].get_ydata().max(), 1)
+        ok_(all(line.get_rasterized() for line in lines))
+
+    def test_plot_vs_time_default(self):
+        fig = plot_vs_time(self.t, self.y, None)
+        line = fig.get_axes()[0].get_lines()[0]
+        assert_equal(len(line.get_xdata()), len(self.t))
+        ok_(not line.get_rasterized())
+
+    def test_plot_vs_depth(self):
+        fig = plot_vs_depth(self.y, self.t, None,
+                            prop_dict={'decimate': {'method': 'lttb',
+                                                    'npts': 200}})
+        line = fig.get_axes()[0].get_lines()[0]
+        assert_equal(len(line.get_ydata()), 200)
+        assert_allclose(line.get_xdata(), np.sin(line.get_ydata()))
+
+    def test_plot_data_in_grid(self):
+        fig = plt.figure()
+        gs = mpl.gridspec.GridSpec(1, 2)
+        ax = plot_data_in_grid(fig, [([self.t, self.y[:, 0]],),
+                                     ([self.t, self.y[:, 0],
+                                       {'decimate': None}],)],
+                               gs, decimate={'npts': 100})
+        ok_(len(ax[0].get_lines()[0].get_xdata()) <= 102)
+        assert_equal(len(ax[1].get_lines()[0].get_xdata()), len(self.t))
+
+    def test_rasterize_dense_lines(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(111)
+        ax.plot(self.t, self.y[:, 0])
+        ax.plot([0, 1], [0, 1])
+        ax.add_collection(mpl.collections.LineCollection(
+            [np.column_stack([self.t, self.y[:, 1]])]))
+        artists = rasterize_dense_lines(fig, npts=1000)
+        assert_equal(len(artists), 2)
+        ok_(not ax.get_lines()[1].get_rasterized())
+
+
+class test_save_figure(unittest.TestCase):
+    """tests for save_figure"""
+
+    def test_dpi(self):
+        fig = plt.figure()
+        with patch.object(fig, 'savefig') as savefig:
+            save_figure(fig, 'fig', ext=['pdf', 'eps', 'png'], dpi=50)
+        assert_equal([c[1] for c in savefig.call_args_list],
+                     [{'format': 'pdf'}, {'format': 'eps'},
+                      {'format': 'png', 'dpi': 50}])
+
+        with patch.object(fig, 'savefig') as savefig:
+            save_figure(fig, 'fig', ext=['pdf', 'png'], dpi=50,
+                        vector_dpi=300)
+        assert_equal([c[1] for c in savefig.call_args_list],
+                     [{'format': 'pdf', 'dpi': 300},
+                      {'format': 'png', 'dpi': 50}])
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
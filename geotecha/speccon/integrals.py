@@ -79,13 +79,14 @@ def pdim1sin_af_linear(m, a, **kwargs):
        Eeigenvlaues of BVP. Generate with geoteca.speccon.m_from_sin_mx.
     a : PolyLine object
         PolyLine defining piecewise linear relationship.
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -140,13 +141,14 @@ def pdim1sin_abf_linear(m, a, b, **kwargs):
         eigenvlaues of BVP. generate with geoteca.speccon.m_from_sin_mx
     a, b : PolyLine object
         PolyLine defining piecewise linear relationship.
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -198,13 +200,14 @@ def pdim1sin_D_aDf_linear(m, a, **kwargs):
         eigenvlaues of BVP. generate with geoteca.speccon.m_from_sin_mx
     a : PolyLine object
         PolyLine defining piecewise linear relationship.
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -265,13 +268,14 @@ def pdim1sin_ab_linear(m, a, b, **kwargs):
         eigenvlaues of BVP. generate with geoteca.speccon.m_from_sin_mx
     a, b : PolyLine object
         PolyLine defining piecewise linear relationship.
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -324,13 +328,14 @@ def pdim1sin_abc_linear(m, a, b, c, **kwargs):
         eigenvlaues of BVP. generate with geoteca.speccon.m_from_sin_mx
     a, b, c : PolyLine object
         PolyLine defining piecewise linear relationship.
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -393,13 +398,14 @@ def pdim1sin_D_aDb_linear(m, a, b, **kwargs):
         eigenvlaues of BVP. generate with geoteca.speccon.m_from_sin_mx
     a, b : PolyLine object
         PolyLine defining piecewise linear relationship.
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -483,13 +489,14 @@ def pEDload_linear(a, eigs, tvals, dT=1.0, **kwargs):
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -583,13 +590,14 @@ def pEload_linear(a, eigs, tvals, dT=1.0, **kwargs):
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -685,13 +693,14 @@ def pEDload_coslinear(a, omega, phase, eigs, tvals, dT=1.0, **kwargs):
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -787,13 +796,14 @@ def pEload_coslinear(a, omega, phase, eigs, tvals, dT=1.0, **kwargs):
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -889,13 +899,14 @@ def pEload_sinlinear(a, omega, phase, eigs, tvals, dT=1.0, **kwargs):
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -1241,13 +1252,14 @@ def dim1sin_af_linear(m, at, ab, zt, zb, implementation='vectorized'):
         Normalised depth or z-coordinate at top of each layer. `zt[0]` = 0
     zb : ``list`` of ``float``
         Normalised depth or z-coordinate at bottom of each layer. `zt[-1]` = 1
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -1382,6 +1394,13 @@ def dim1sin_af_linear(m, at, ab, zt, zb, implementation='vectorized'):
         except ImportError:
             A = dim1sin_af_linear(m, at, ab, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_af_linear(m, at, ab, zt, zb)
+        except ImportError:
+            A = dim1sin_af_linear(m, at, ab, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -1455,13 +1474,14 @@ def dim1sin_abf_linear(m, at, ab, bt, bb,  zt, zb, implementation='vectorized'):
         Normalised depth or z-coordinate at top of each layer. `zt[0]` = 0
     zb : ``list`` of ``float``
         Normalised depth or z-coordinate at bottom of each layer. `zt[-1]` = 1
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -1775,6 +1795,13 @@ def dim1sin_abf_linear(m, at, ab, bt, bb,  zt, zb, implementation='vectorized'):
             except ImportError:
                 A = dim1sin_abf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_abf_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_abf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -1955,13 +1982,14 @@ def dim1sin_D_aDf_linear(m, at, ab, zt, zb, implementation='vectorized'):
         Normalised depth or z-coordinate at top of each layer. `zt[0]` = 0
     zb : ``list`` of ``float``
         Normalised depth or z-coordinate at bottom of each layer. `zt[-1]` = 1
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -2107,6 +2135,13 @@ def dim1sin_D_aDf_linear(m, at, ab, zt, zb, implementation='vectorized'):
             except ImportError:
                 A = dim1sin_D_aDf_linear(m, at, ab, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_d_adf_linear(m, at, ab, zt, zb)
+        except ImportError:
+            A = dim1sin_D_aDf_linear(m, at, ab, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2181,13 +2216,14 @@ def dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized'):
         Normalised depth or z-coordinate at top of each layer. `zt[0]` = 0
     zb : ``list`` of ``float``
         Normalised depth or z-coordinate at bottom of each layer. `zt[-1]` = 1
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -2279,6 +2315,13 @@ def dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized'):
             except ImportError:
                 A = dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2327,13 +2370,14 @@ def dim1sin_abc_linear(m, at, ab, bt, bb, ct, cb, zt, zb, implementation='vector
         Normalised depth or z-coordinate at top of each layer. `zt[0]` = 0
     zb : ``list`` of ``float``
         Normalised depth or z-coordinate at bottom of each layer. `zt[-1]` = 1
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -2459,6 +2503,13 @@ def dim1sin_abc_linear(m, at, ab, bt, bb, ct, cb, zt, zb, implementation='vector
             except ImportError:
                 A = dim1sin_abc_linear(m, at, ab, bt, bb,  ct, cb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_abc_linear(m, at, ab, bt, bb, ct, cb, zt, zb)
+        except ImportError:
+            A = dim1sin_abc_linear(m, at, ab, bt, bb, ct, cb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2533,13 +2584,14 @@ def dim1sin_D_aDb_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
         Normalised depth or z-coordinate at top of each layer. `zt[0]` = 0
     zb : ``list`` of ``float``
         Normalised depth or z-coordinate at bottom of each layer. `zt[-1]` = 1
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -2647,6 +2699,13 @@ def dim1sin_D_aDb_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
             except ImportError:
                 A = dim1sin_D_aDb_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_d_adb_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_D_aDb_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2685,13 +2744,14 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -2776,6 +2836,7 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
         cos = np.cos
         exp = np.exp
 
+
         A = np.zeros([len(tvals), len(eigs)], dtype=complex)
 
         (ramps_less_than_t, constants_less_than_t, steps_less_than_t,
@@ -2784,64 +2845,32 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
         for i, t in enumerate(tvals):
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) + loadmag[k]/(dT*eig))
+                    A[i,j] += ((1 - exp(-dT*eig*(t - loadtim[k])))*loadmag[k]/(dT*eig))
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (exp(-dT*eig*(t - loadtim[k + 1]))*loadmag[k]/(dT*eig) - exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig))
+                    x0 = dT*eig
+                    A[i,j] += ((-exp(-x0*(t - loadtim[k])) + exp(-x0*(t - loadtim[k + 1])))*loadmag[k]/(dT*eig))
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k] + dT*eig*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k])**(-1)*loadmag[k + 1] + (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] - (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k])/(dT*eig) -
-                        (-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*loadmag[k + 1] + dT*eig*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] - dT*eig*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k] + dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k])/(dT*eig))
+                    x0 = t - loadtim[k]
+                    x1 = 1/(dT*eig)
+                    x2 = (-t*loadmag[k + 1] + t*loadmag[k] + x1*loadmag[k + 1] - x1*loadmag[k] + loadmag[k + 1]*loadtim[k] -
+                        loadmag[k]*loadtim[k + 1])
+                    A[i,j] += (x1*(x2 - (x0*loadmag[k + 1] - x0*loadmag[k] + x2)*exp(-dT*eig*x0))/(-loadtim[k + 1] + loadtim[k]))
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-(-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] + dT*eig*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] - dT*eig*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k] + dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k])/(dT*eig)
-                        + (-dT*eig*t*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] + dT*eig*t*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k] + dT*eig*(t - loadtim[k +
-                        1])*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] - dT*eig*(t - loadtim[k +
-                        1])*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k] + dT*eig*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k
-                        + 1] - dT*eig*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k] +
-                        exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] - exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k])/(dT*eig))
+                    x0 = -loadtim[k + 1]
+                    x1 = t + x0
+                    x2 = dT*eig
+                    x3 = 1/(dT*eig)
+                    x4 = (-t*loadmag[k + 1] + t*loadmag[k] + x3*loadmag[k + 1] - x3*loadmag[k] + loadmag[k + 1]*loadtim[k] -
+                        loadmag[k]*loadtim[k + 1])
+                    x5 = t - loadtim[k]
+                    A[i,j] += (x3*(-(x4 + x5*loadmag[k + 1] - x5*loadmag[k])*exp(-x2*x5) + (x1*loadmag[k + 1] - x1*loadmag[k] +
+                        x4)*exp(-x1*x2))/(x0 + loadtim[k]))
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
+
         if MUST_TRY_FORTRAN:
             from geotecha.speccon.ext_integrals import eload_linear as fn
         else:
@@ -2850,12 +2879,18 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
             except ImportError:
                 fn = Eload_linear
         A = fn(loadtim, loadmag, eigs, tvals, dT)
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import eload_linear as fn
+        except ImportError:
+            fn = Eload_linear
+        A = fn(loadtim, loadmag, eigs, tvals, dT)
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
         exp = np.exp
 
-        A = np.zeros([len(tvals), len(eigs)],dtype=complex)
+        A = np.zeros([len(tvals), len(eigs)], dtype=complex)
 
         (ramps_less_than_t, constants_less_than_t, steps_less_than_t,
             ramps_containing_t, constants_containing_t) = segment_containing_also_segments_less_than_xi(loadtim, loadmag, tvals, steps_or_equal_to = True)
@@ -2864,65 +2899,32 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
         for i, t in enumerate(tvals):
             k = constants_containing_t[i]
             if len(k):
-                A[i, :] += np.sum(-exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) + loadmag[k]/(dT*eig), axis=1)
+                A[i, :] += np.sum((1 - exp(-dT*eig*(t - loadtim[k])))*loadmag[k]/(dT*eig), axis=1)
 
             k = constants_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(exp(-dT*eig*(t - loadtim[k + 1]))*loadmag[k]/(dT*eig) - exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig), axis=1)
+                x0 = dT*eig
+                A[i, :] += np.sum((-exp(-x0*(t - loadtim[k])) + exp(-x0*(t - loadtim[k + 1])))*loadmag[k]/(dT*eig), axis=1)
 
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum((-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k] + dT*eig*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k])**(-1)*loadmag[k + 1] + (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] - (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k])/(dT*eig) -
-                        (-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*loadmag[k + 1] + dT*eig*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] - dT*eig*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k] + dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k])/(dT*eig), axis=1)
+                x0 = t - loadtim[k]
+                x1 = 1/(dT*eig)
+                x2 = (-t*loadmag[k + 1] + t*loadmag[k] + x1*loadmag[k + 1] - x1*loadmag[k] + loadmag[k + 1]*loadtim[k] -
+                        loadmag[k]*loadtim[k + 1])
+                A[i, :] += np.sum(x1*(x2 - (x0*loadmag[k + 1] - x0*loadmag[k] + x2)*exp(-dT*eig*x0))/(-loadtim[k + 1] + loadtim[k]), axis=1)
 
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(-(-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] + dT*eig*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] - dT*eig*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k] + dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - (-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k])/(dT*eig)
-                        + (-dT*eig*t*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] + dT*eig*t*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k] + dT*eig*(t - loadtim[k +
-                        1])*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] - dT*eig*(t - loadtim[k +
-                        1])*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k] + dT*eig*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k
-                        + 1] - dT*eig*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k] +
-                        exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k])**(-1)*loadmag[k + 1] - exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k])**(-1)*loadmag[k])/(dT*eig), axis=1)
+                x0 = -loadtim[k + 1]
+                x1 = t + x0
+                x2 = dT*eig
+                x3 = 1/(dT*eig)
+                x4 = (-t*loadmag[k + 1] + t*loadmag[k] + x3*loadmag[k + 1] - x3*loadmag[k] + loadmag[k + 1]*loadtim[k] -
+                        loadmag[k]*loadtim[k + 1])
+                x5 = t - loadtim[k]
+                A[i, :] += np.sum(x3*(-(x4 + x5*loadmag[k + 1] - x5*loadmag[k])*exp(-x2*x5) + (x1*loadmag[k + 1] - x1*loadmag[k] +
+                        x4)*exp(-x1*x2))/(x0 + loadtim[k]), axis=1)
     return A
 
 
@@ -2948,13 +2950,14 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -3027,6 +3030,7 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
         is not differentiated with repect to time.
 
     """
+
     loadtim = np.asarray(loadtim)
     loadmag = np.asarray(loadmag)
     eigs = np.asarray(eigs)
@@ -3045,17 +3049,17 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
         for i, t in enumerate(tvals):
             for k in steps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] - loadmag[k]))
+                    A[i,j] += ((loadmag[k + 1] - loadmag[k])*exp(-dT*eig*(t - loadtim[k])))
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((loadtim[k + 1] - loadtim[k])**(-1)*(loadmag[k + 1] - loadmag[k])/(dT*eig) - (loadtim[k + 1] -
-                        loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] -
-                        loadmag[k])/(dT*eig))
+                    x0 = -loadtim[k]
+                    A[i,j] += ((1 - exp(-dT*eig*(t + x0)))*(loadmag[k + 1] - loadmag[k])/(dT*eig*(x0 + loadtim[k + 1])))
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-(loadtim[k + 1] - loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] -
-                        loadmag[k])/(dT*eig) + exp(-dT*eig*(t - loadtim[k + 1]))*(loadtim[k + 1] -
-                        loadtim[k])**(-1)*(loadmag[k + 1] - loadmag[k])/(dT*eig))
+                    x0 = -loadtim[k]
+                    x1 = dT*eig
+                    A[i,j] += ((exp(-x1*(t - loadtim[k + 1])) - exp(-x1*(t + x0)))*(loadmag[k + 1] - loadmag[k])/(dT*eig*(x0 +
+                        loadtim[k + 1])))
 
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
@@ -3067,6 +3071,14 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
             except ImportError:
                 fn = EDload_linear
         A = fn(loadtim, loadmag, eigs, tvals, dT)
+
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import edload_linear as fn
+        except ImportError:
+            fn = EDload_linear
+        A = fn(loadtim, loadmag, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -3083,17 +3095,17 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
         for i, t in enumerate(tvals):
             k = steps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] - loadmag[k]), axis=1)
+                A[i, :] += np.sum((loadmag[k + 1] - loadmag[k])*exp(-dT*eig*(t - loadtim[k])), axis=1)
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum((loadtim[k + 1] - loadtim[k])**(-1)*(loadmag[k + 1] - loadmag[k])/(dT*eig) - (loadtim[k + 1] -
-                        loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] -
-                        loadmag[k])/(dT*eig), axis=1)
+                x0 = -loadtim[k]
+                A[i, :] += np.sum((1 - exp(-dT*eig*(t + x0)))*(loadmag[k + 1] - loadmag[k])/(dT*eig*(x0 + loadtim[k + 1])), axis=1)
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(-(loadtim[k + 1] - loadtim[k])**(-1)*exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] -
-                        loadmag[k])/(dT*eig) + exp(-dT*eig*(t - loadtim[k + 1]))*(loadtim[k + 1] -
-                        loadtim[k])**(-1)*(loadmag[k + 1] - loadmag[k])/(dT*eig), axis=1)
+                x0 = -loadtim[k]
+                x1 = dT*eig
+                A[i, :] += np.sum((exp(-x1*(t - loadtim[k + 1])) - exp(-x1*(t + x0)))*(loadmag[k + 1] - loadmag[k])/(dT*eig*(x0 +
+                        loadtim[k + 1])), axis=1)
     return A
 
 
@@ -3122,13 +3134,14 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -3201,6 +3214,7 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
 
 
     """
+
     loadtim = np.asarray(loadtim)
     loadmag = np.asarray(loadmag)
     eigs = np.asarray(eigs)
@@ -3219,543 +3233,148 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((cos(omega*t + phase)/(1 + omega**2/(dT**2*eig**2)) + omega*sin(omega*t + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))/(1 +
-                        omega**2/(dT**2*eig**2)) + omega*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t -
-                        omega*(t - loadtim[k]) + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig))
+                    x0 = omega*t + phase
+                    x1 = 1/(dT*eig)
+                    x2 = omega*x1
+                    x3 = t - loadtim[k]
+                    x4 = -omega*x3 + x0
+                    A[i,j] += (x1*(x2*sin(x0) - (x2*sin(x4) + cos(x4))*exp(-dT*eig*x3) + cos(x0))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)))
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k + 1]))/(1 +
-                        omega**2/(dT**2*eig**2)) + omega*exp(-dT*eig*(t - loadtim[k +
-                        1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))/(1 +
-                        omega**2/(dT**2*eig**2)) + omega*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t -
-                        omega*(t - loadtim[k]) + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig))
+                    x0 = t - loadtim[k + 1]
+                    x1 = dT*eig
+                    x2 = omega*t + phase
+                    x3 = -omega*x0 + x2
+                    x4 = 1/(dT*eig)
+                    x5 = omega*x4
+                    x6 = t - loadtim[k]
+                    x7 = -omega*x6 + x2
+                    A[i,j] += (x4*((x5*sin(x3) + cos(x3))*exp(-x0*x1) - (x5*sin(x7) + cos(x7))*exp(-x1*x6))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)))
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((-dT*eig*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - dT*eig*cos(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*cos(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] -
-                        omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*sin(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*sin(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + cos(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**3*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*sin(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*sin(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig)
-                        - (-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        + omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) +
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) - omega**2*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) - omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2))/(dT*eig))
+                    x0 = dT*eig
+                    x1 = x0*loadtim[k]
+                    x2 = x0*loadtim[k + 1]
+                    x3 = omega**4/(dT**3*eig**3)
+                    x4 = omega**2
+                    x5 = 1/(dT*eig)
+                    x6 = 2*x5
+                    x7 = x4*x6
+                    x8 = omega*t
+                    x9 = phase + x8
+                    x10 = cos(x9)
+                    x11 = x10*loadmag[k + 1]
+                    x12 = x10*loadmag[k]
+                    x13 = sin(x9)
+                    x14 = x13*x8
+                    x15 = omega*loadtim[k]
+                    x16 = x13*loadmag[k + 1]
+                    x17 = omega*loadtim[k + 1]
+                    x18 = x13*loadmag[k]
+                    x19 = t*x0
+                    x20 = omega*x6
+                    x21 = 1/(dT**2*eig**2)
+                    x22 = x21*x4
+                    x23 = omega**3*x21
+                    x24 = t*x23
+                    x25 = t*x5
+                    x26 = x25*x4
+                    x27 = x5*loadtim[k]
+                    x28 = x5*loadtim[k + 1]
+                    x29 = t - loadtim[k]
+                    x30 = x0*x29
+                    x31 = omega*x29
+                    x32 = -x31 + x9
+                    x33 = cos(x32)
+                    x34 = x33*loadmag[k + 1]
+                    x35 = x33*loadmag[k]
+                    x36 = sin(x32)
+                    x37 = x36*x8
+                    x38 = x36*loadmag[k + 1]
+                    x39 = x36*loadmag[k]
+                    x40 = x35*x4
+                    x41 = x23*x38
+                    x42 = x34*x4
+                    x43 = x23*x39
+                    x44 = x29*x5
+                    A[i,j] += (x5*(x1*x11 - x11*x19 - x11*x22 - x11*x26 + x11*x27*x4 + x11 + x12*x19 - x12*x2 + x12*x22 + x12*x26 -
+                        x12*x28*x4 - x12 - x14*loadmag[k + 1] + x14*loadmag[k] + x15*x16 + x16*x20 +
+                        x16*x23*loadtim[k] - x16*x24 - x17*x18 - x18*x20 - x18*x23*loadtim[k + 1] +
+                        x18*x24 - (x1*x34 + x15*x38 - x17*x39 - x19*x34 + x19*x35 - x2*x35 + x20*x38
+                        - x20*x39 + x21*x40 - x22*x34 - x24*x38 + x24*x39 + x25*x40 - x25*x42 +
+                        x27*x42 - x28*x40 + x29*x41 - x29*x43 + x30*x34 - x30*x35 + x31*x38 -
+                        x31*x39 + x34 - x35 - x37*loadmag[k + 1] + x37*loadmag[k] - x40*x44 +
+                        x41*loadtim[k] + x42*x44 - x43*loadtim[k + 1])*exp(-x30))/(x1 - x2 -
+                        x3*loadtim[k + 1] + x3*loadtim[k] - x7*loadtim[k + 1] + x7*loadtim[k]))
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-(-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        + omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) +
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) - omega**2*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) - omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2))/(dT*eig) + (-dT*eig*t*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*(t - loadtim[k
-                        + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*(t -
-                        loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*loadtim[k
-                        + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*(t - loadtim[k
-                        + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - omega*(t -
-                        loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - omega*loadtim[k +
-                        1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) + omega**2*(t
-                        - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        2*omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        2*omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**3*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig))
+                    x0 = dT*eig
+                    x1 = x0*loadtim[k]
+                    x2 = x0*loadtim[k + 1]
+                    x3 = omega**4/(dT**3*eig**3)
+                    x4 = omega**2
+                    x5 = 1/(dT*eig)
+                    x6 = 2*x5
+                    x7 = x4*x6
+                    x8 = t - loadtim[k + 1]
+                    x9 = x0*x8
+                    x10 = omega*x8
+                    x11 = omega*t
+                    x12 = phase + x11
+                    x13 = -x10 + x12
+                    x14 = cos(x13)
+                    x15 = x14*loadmag[k + 1]
+                    x16 = x14*loadmag[k]
+                    x17 = sin(x13)
+                    x18 = x11*x17
+                    x19 = x17*loadmag[k + 1]
+                    x20 = omega*loadtim[k]
+                    x21 = x17*loadmag[k]
+                    x22 = omega*loadtim[k + 1]
+                    x23 = t*x0
+                    x24 = omega*x6
+                    x25 = x16*x4
+                    x26 = 1/(dT**2*eig**2)
+                    x27 = x26*x4
+                    x28 = omega**3*x26
+                    x29 = t*x28
+                    x30 = t*x5
+                    x31 = x19*x28
+                    x32 = x15*x4
+                    x33 = x5*loadtim[k]
+                    x34 = x21*x28
+                    x35 = x5*loadtim[k + 1]
+                    x36 = x5*x8
+                    x37 = t - loadtim[k]
+                    x38 = x0*x37
+                    x39 = omega*x37
+                    x40 = x12 - x39
+                    x41 = cos(x40)
+                    x42 = x41*loadmag[k + 1]
+                    x43 = x41*loadmag[k]
+                    x44 = sin(x40)
+                    x45 = x11*x44
+                    x46 = x44*loadmag[k + 1]
+                    x47 = x44*loadmag[k]
+                    x48 = x30*x4
+                    x49 = x28*x46
+                    x50 = x4*x42
+                    x51 = x28*x47
+                    x52 = x4*x43
+                    x53 = x37*x5
+                    A[i,j] += (x5*((x1*x15 + x10*x19 - x10*x21 - x15*x23 - x15*x27 + x15*x9 + x15 - x16*x2 + x16*x23 - x16*x9 - x16
+                        - x18*loadmag[k + 1] + x18*loadmag[k] + x19*x20 + x19*x24 - x19*x29 -
+                        x21*x22 - x21*x24 + x21*x29 + x25*x26 + x25*x30 - x25*x35 - x25*x36 -
+                        x30*x32 + x31*x8 + x31*loadtim[k] + x32*x33 + x32*x36 - x34*x8 -
+                        x34*loadtim[k + 1])*exp(-x9) - (x1*x42 - x2*x43 + x20*x46 - x22*x47 -
+                        x23*x42 + x23*x43 + x24*x46 - x24*x47 - x27*x42 + x27*x43 - x29*x46 +
+                        x29*x47 + x33*x50 - x35*x52 + x37*x49 - x37*x51 + x38*x42 - x38*x43 +
+                        x39*x46 - x39*x47 - x42*x48 + x42 + x43*x48 - x43 - x45*loadmag[k + 1] +
+                        x45*loadmag[k] + x49*loadtim[k] + x50*x53 - x51*loadtim[k + 1] -
+                        x52*x53)*exp(-x38))/(x1 - x2 - x3*loadtim[k + 1] + x3*loadtim[k] -
+                        x7*loadtim[k + 1] + x7*loadtim[k]))
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
         if MUST_TRY_FORTRAN:
@@ -3766,6 +3385,14 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
             except ImportError:
                 fn = Eload_coslinear
         A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import eload_coslinear as fn
+        except ImportError:
+            fn = Eload_coslinear
+        A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -3780,546 +3407,151 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             k = constants_containing_t[i]
             if len(k):
-                A[i, :] += np.sum((cos(omega*t + phase)/(1 + omega**2/(dT**2*eig**2)) + omega*sin(omega*t + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))/(1 +
-                        omega**2/(dT**2*eig**2)) + omega*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t -
-                        omega*(t - loadtim[k]) + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig), axis=1)
+                x0 = omega*t + phase
+                x1 = 1/(dT*eig)
+                x2 = omega*x1
+                x3 = t - loadtim[k]
+                x4 = -omega*x3 + x0
+                A[i, :] += np.sum(x1*(x2*sin(x0) - (x2*sin(x4) + cos(x4))*exp(-dT*eig*x3) + cos(x0))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)), axis=1)
 
             k = constants_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum((cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k + 1]))/(1 +
-                        omega**2/(dT**2*eig**2)) + omega*exp(-dT*eig*(t - loadtim[k +
-                        1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))/(1 +
-                        omega**2/(dT**2*eig**2)) + omega*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t -
-                        omega*(t - loadtim[k]) + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig), axis=1)
+                x0 = t - loadtim[k + 1]
+                x1 = dT*eig
+                x2 = omega*t + phase
+                x3 = -omega*x0 + x2
+                x4 = 1/(dT*eig)
+                x5 = omega*x4
+                x6 = t - loadtim[k]
+                x7 = -omega*x6 + x2
+                A[i, :] += np.sum(x4*((x5*sin(x3) + cos(x3))*exp(-x0*x1) - (x5*sin(x7) + cos(x7))*exp(-x1*x6))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)), axis=1)
 
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum((-dT*eig*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - dT*eig*cos(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*cos(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] -
-                        omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*sin(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*sin(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + cos(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**3*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*sin(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*sin(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig)
-                        - (-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        + omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) +
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) - omega**2*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) - omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2))/(dT*eig), axis=1)
+                x0 = dT*eig
+                x1 = x0*loadtim[k]
+                x2 = x0*loadtim[k + 1]
+                x3 = omega**4/(dT**3*eig**3)
+                x4 = omega**2
+                x5 = 1/(dT*eig)
+                x6 = 2*x5
+                x7 = x4*x6
+                x8 = omega*t
+                x9 = phase + x8
+                x10 = cos(x9)
+                x11 = x10*loadmag[k + 1]
+                x12 = x10*loadmag[k]
+                x13 = sin(x9)
+                x14 = x13*x8
+                x15 = omega*loadtim[k]
+                x16 = x13*loadmag[k + 1]
+                x17 = omega*loadtim[k + 1]
+                x18 = x13*loadmag[k]
+                x19 = t*x0
+                x20 = omega*x6
+                x21 = 1/(dT**2*eig**2)
+                x22 = x21*x4
+                x23 = omega**3*x21
+                x24 = t*x23
+                x25 = t*x5
+                x26 = x25*x4
+                x27 = x5*loadtim[k]
+                x28 = x5*loadtim[k + 1]
+                x29 = t - loadtim[k]
+                x30 = x0*x29
+                x31 = omega*x29
+                x32 = -x31 + x9
+                x33 = cos(x32)
+                x34 = x33*loadmag[k + 1]
+                x35 = x33*loadmag[k]
+                x36 = sin(x32)
+                x37 = x36*x8
+                x38 = x36*loadmag[k + 1]
+                x39 = x36*loadmag[k]
+                x40 = x35*x4
+                x41 = x23*x38
+                x42 = x34*x4
+                x43 = x23*x39
+                x44 = x29*x5
+                A[i, :] += np.sum(x5*(x1*x11 - x11*x19 - x11*x22 - x11*x26 + x11*x27*x4 + x11 + x12*x19 - x12*x2 + x12*x22 + x12*x26 -
+                        x12*x28*x4 - x12 - x14*loadmag[k + 1] + x14*loadmag[k] + x15*x16 + x16*x20 +
+                        x16*x23*loadtim[k] - x16*x24 - x17*x18 - x18*x20 - x18*x23*loadtim[k + 1] +
+                        x18*x24 - (x1*x34 + x15*x38 - x17*x39 - x19*x34 + x19*x35 - x2*x35 + x20*x38
+                        - x20*x39 + x21*x40 - x22*x34 - x24*x38 + x24*x39 + x25*x40 - x25*x42 +
+                        x27*x42 - x28*x40 + x29*x41 - x29*x43 + x30*x34 - x30*x35 + x31*x38 -
+                        x31*x39 + x34 - x35 - x37*loadmag[k + 1] + x37*loadmag[k] - x40*x44 +
+                        x41*loadtim[k] + x42*x44 - x43*loadtim[k + 1])*exp(-x30))/(x1 - x2 -
+                        x3*loadtim[k + 1] + x3*loadtim[k] - x7*loadtim[k + 1] + x7*loadtim[k]), axis=1)
 
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(-(-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] -
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        + omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) +
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) - omega**2*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) - omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2))/(dT*eig) + (-dT*eig*t*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*(t - loadtim[k
-                        + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*(t -
-                        loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*loadtim[k
-                        + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*(t - loadtim[k
-                        + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - omega*(t -
-                        loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - omega*loadtim[k +
-                        1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) + omega**2*(t
-                        - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        2*omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        2*omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**3*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig), axis=1)
+                x0 = dT*eig
+                x1 = x0*loadtim[k]
+                x2 = x0*loadtim[k + 1]
+                x3 = omega**4/(dT**3*eig**3)
+                x4 = omega**2
+                x5 = 1/(dT*eig)
+                x6 = 2*x5
+                x7 = x4*x6
+                x8 = t - loadtim[k + 1]
+                x9 = x0*x8
+                x10 = omega*x8
+                x11 = omega*t
+                x12 = phase + x11
+                x13 = -x10 + x12
+                x14 = cos(x13)
+                x15 = x14*loadmag[k + 1]
+                x16 = x14*loadmag[k]
+                x17 = sin(x13)
+                x18 = x11*x17
+                x19 = x17*loadmag[k + 1]
+                x20 = omega*loadtim[k]
+                x21 = x17*loadmag[k]
+                x22 = omega*loadtim[k + 1]
+                x23 = t*x0
+                x24 = omega*x6
+                x25 = x16*x4
+                x26 = 1/(dT**2*eig**2)
+                x27 = x26*x4
+                x28 = omega**3*x26
+                x29 = t*x28
+                x30 = t*x5
+                x31 = x19*x28
+                x32 = x15*x4
+                x33 = x5*loadtim[k]
+                x34 = x21*x28
+                x35 = x5*loadtim[k + 1]
+                x36 = x5*x8
+                x37 = t - loadtim[k]
+                x38 = x0*x37
+                x39 = omega*x37
+                x40 = x12 - x39
+                x41 = cos(x40)
+                x42 = x41*loadmag[k + 1]
+                x43 = x41*loadmag[k]
+                x44 = sin(x40)
+                x45 = x11*x44
+                x46 = x44*loadmag[k + 1]
+                x47 = x44*loadmag[k]
+                x48 = x30*x4
+                x49 = x28*x46
+                x50 = x4*x42
+                x51 = x28*x47
+                x52 = x4*x43
+                x53 = x37*x5
+                A[i, :] += np.sum(x5*((x1*x15 + x10*x19 - x10*x21 - x15*x23 - x15*x27 + x15*x9 + x15 - x16*x2 + x16*x23 - x16*x9 - x16
+                        - x18*loadmag[k + 1] + x18*loadmag[k] + x19*x20 + x19*x24 - x19*x29 -
+                        x21*x22 - x21*x24 + x21*x29 + x25*x26 + x25*x30 - x25*x35 - x25*x36 -
+                        x30*x32 + x31*x8 + x31*loadtim[k] + x32*x33 + x32*x36 - x34*x8 -
+                        x34*loadtim[k + 1])*exp(-x9) - (x1*x42 - x2*x43 + x20*x46 - x22*x47 -
+                        x23*x42 + x23*x43 + x24*x46 - x24*x47 - x27*x42 + x27*x43 - x29*x46 +
+                        x29*x47 + x33*x50 - x35*x52 + x37*x49 - x37*x51 + x38*x42 - x38*x43 +
+                        x39*x46 - x39*x47 - x42*x48 + x42 + x43*x48 - x43 - x45*loadmag[k + 1] +
+                        x45*loadmag[k] + x49*loadtim[k] + x50*x53 - x51*loadtim[k + 1] -
+                        x52*x53)*exp(-x38))/(x1 - x2 - x3*loadtim[k + 1] + x3*loadtim[k] -
+                        x7*loadtim[k + 1] + x7*loadtim[k]), axis=1)
     return A
 
 
@@ -4347,13 +3579,14 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
         List of time values to calculate integral at.
     dT : ``float``, optional
         Time factor multiple (Default dT=1.0).
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
 
     Returns
@@ -4426,6 +3659,7 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
 
 
     """
+
     loadtim = np.asarray(loadtim)
     loadmag = np.asarray(loadmag)
     eigs = np.asarray(eigs)
@@ -4444,552 +3678,157 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             for k in steps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (cos(omega*loadtim[k] + phase)*exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] - loadmag[k]))
+                    A[i,j] += ((loadmag[k + 1] - loadmag[k])*exp(-dT*eig*(t - loadtim[k]))*cos(omega*loadtim[k] + phase))
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        + omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*sin(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*sin(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] -
-                        cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + cos(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) -
-                        omega**2*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) - omega**2*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) -
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**3*t*sin(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1]
-                        + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*sin(omega*t + phase)*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*sin(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k]/(dT**2*eig**2) - omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        - omega**4*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) +
-                        omega**4*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) +
-                        omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3) - omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**3*eig**3)
-                        - omega**4*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) +
-                        omega**4*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) -
-                        omega**4*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT**3*eig**3) + omega**4*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**3*eig**3) + omega**4*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**3*eig**3) -
-                        omega**4*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3))
+                    x0 = dT*eig
+                    x1 = omega**4/(dT**3*eig**3)
+                    x2 = x1*loadtim[k]
+                    x3 = x1*loadtim[k + 1]
+                    x4 = omega**2
+                    x5 = 1/dT
+                    x6 = 1/eig
+                    x7 = 2*x5*x6
+                    x8 = x4*x7
+                    x9 = omega*t
+                    x10 = phase + x9
+                    x11 = cos(x10)
+                    x12 = x11*loadmag[k]
+                    x13 = x11*loadmag[k + 1]
+                    x14 = sin(x10)
+                    x15 = omega*x14
+                    x16 = loadmag[k]*loadtim[k + 1]
+                    x17 = x14*x9
+                    x18 = loadmag[k + 1]*loadtim[k]
+                    x19 = x15*x7
+                    x20 = 1/(dT**2*eig**2)
+                    x21 = x13*x4
+                    x22 = x12*x4
+                    x23 = omega**3*x20
+                    x24 = x14*x23
+                    x25 = t*x1
+                    x26 = x5*x6
+                    x27 = t*x26
+                    x28 = x26*loadtim[k]
+                    x29 = t*x24
+                    x30 = x26*loadtim[k + 1]
+                    x31 = t - loadtim[k]
+                    x32 = omega*x31
+                    x33 = x10 - x32
+                    x34 = exp(-x0*x31)
+                    x35 = x34*cos(x33)
+                    x36 = x35*loadmag[k + 1]
+                    x37 = x35*loadmag[k]
+                    x38 = x34*sin(x33)
+                    x39 = x38*x9
+                    x40 = omega*x38
+                    x41 = x32*x38
+                    x42 = x40*x7
+                    x43 = x20*x4
+                    x44 = x37*x4
+                    x45 = x23*x38
+                    x46 = t*x45
+                    x47 = x27*x4
+                    x48 = x36*x4
+                    x49 = x1*x31
+                    x50 = x26*x31
+                    x51 = x31*x45
+                    A[i,j] += ((x12*x25 - x12*x3 + x12 + x13*x2 - x13*x25 - x13 + x15*x16 - x15*x18 + x16*x24 - x16*x40 - x16*x45 +
+                        x17*loadmag[k + 1] - x17*loadmag[k] - x18*x24 + x18*x40 + x18*x45 -
+                        x19*loadmag[k + 1] + x19*loadmag[k] - x2*x36 + x20*x21 - x20*x22 - x21*x27 +
+                        x21*x28 + x22*x27 - x22*x30 + x25*x36 - x25*x37 - x28*x48 + x29*loadmag[k +
+                        1] - x29*loadmag[k] + x3*x37 + x30*x44 - x36*x43 + x36*x47 - x36*x49 + x36 +
+                        x37*x43 - x37*x47 + x37*x49 - x37 - x39*loadmag[k + 1] + x39*loadmag[k] +
+                        x41*loadmag[k + 1] - x41*loadmag[k] + x42*loadmag[k + 1] - x42*loadmag[k] +
+                        x44*x50 - x46*loadmag[k + 1] + x46*loadmag[k] - x48*x50 + x51*loadmag[k + 1]
+                        - x51*loadmag[k])/(-x0*loadtim[k + 1] + x0*loadtim[k] + x2 - x3 -
+                        x8*loadtim[k + 1] + x8*loadtim[k]))
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] -
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*(t - loadtim[k
-                        + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + omega*(t -
-                        loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - omega*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k
-                        + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) -
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) + omega**2*(t
-                        - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*cos(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) -
-                        omega**2*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - 2*omega*exp(-dT*eig*(t - loadtim[k +
-                        1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*t*exp(-dT*eig*(t - loadtim[k +
-                        1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k]/(dT**2*eig**2) - omega**3*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k + 1]*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        + omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3) - omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**3*eig**3)
-                        - omega**4*t*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) +
-                        omega**4*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) +
-                        omega**4*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) -
-                        omega**4*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) -
-                        omega**4*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT**3*eig**3) + omega**4*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**3*eig**3) + omega**4*cos(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**3*eig**3)
-                        - omega**4*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) -
-                        omega**4*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3))
+                    x0 = dT*eig
+                    x1 = omega**4/(dT**3*eig**3)
+                    x2 = x1*loadtim[k]
+                    x3 = x1*loadtim[k + 1]
+                    x4 = omega**2
+                    x5 = 1/dT
+                    x6 = 1/eig
+                    x7 = 2*x5*x6
+                    x8 = x4*x7
+                    x9 = t - loadtim[k + 1]
+                    x10 = omega*x9
+                    x11 = omega*t
+                    x12 = phase + x11
+                    x13 = -x10 + x12
+                    x14 = exp(-x0*x9)
+                    x15 = x14*cos(x13)
+                    x16 = x15*loadmag[k]
+                    x17 = t - loadtim[k]
+                    x18 = omega*x17
+                    x19 = x12 - x18
+                    x20 = exp(-x0*x17)
+                    x21 = x20*cos(x19)
+                    x22 = x21*loadmag[k + 1]
+                    x23 = x21*loadmag[k]
+                    x24 = x15*loadmag[k + 1]
+                    x25 = x14*sin(x13)
+                    x26 = x25*loadmag[k]
+                    x27 = omega*loadtim[k + 1]
+                    x28 = x20*sin(x19)
+                    x29 = x11*loadmag[k]
+                    x30 = x28*loadmag[k + 1]
+                    x31 = omega*loadtim[k]
+                    x32 = x11*loadmag[k + 1]
+                    x33 = x28*loadmag[k]
+                    x34 = x25*loadmag[k + 1]
+                    x35 = omega*x7
+                    x36 = 1/(dT**2*eig**2)
+                    x37 = x23*x4
+                    x38 = x36*x4
+                    x39 = omega**3*x36
+                    x40 = x26*x39
+                    x41 = x5*x6
+                    x42 = x37*x41
+                    x43 = t*x16
+                    x44 = t*x39
+                    x45 = x4*x41
+                    x46 = x30*x39
+                    x47 = x24*x45
+                    x48 = t*x22
+                    x49 = x33*x39
+                    x50 = x16*x45
+                    x51 = x1*x23
+                    x52 = x34*x39
+                    x53 = x22*x45
+                    x54 = x1*x24
+                    A[i,j] += ((-t*x42 - t*x47 - t*x51 - t*x54 - x1*x16*x9 - x1*x17*x22 + x1*x43 + x1*x48 + x10*x26 - x10*x34 -
+                        x16*x3 - x16*x38 + x16 + x17*x42 + x17*x46 - x17*x49 + x17*x51 - x17*x53 +
+                        x18*x30 - x18*x33 - x2*x22 + x2*x24 - x22*x38 + x22 + x23*x3 - x23 + x24*x38
+                        - x24 - x25*x29 + x25*x32 + x26*x27 + x26*x35 - x26*x44 - x27*x33 + x28*x29
+                        - x28*x32 + x30*x31 + x30*x35 - x30*x44 - x31*x34 - x33*x35 + x33*x44 -
+                        x34*x35 + x34*x44 + x36*x37 + x40*x9 + x40*loadtim[k + 1] + x42*loadtim[k +
+                        1] + x43*x45 + x45*x48 + x46*loadtim[k] + x47*x9 + x47*loadtim[k] -
+                        x49*loadtim[k + 1] - x50*x9 - x50*loadtim[k + 1] - x52*x9 - x52*loadtim[k] -
+                        x53*loadtim[k] + x54*x9)/(-x0*loadtim[k + 1] + x0*loadtim[k] + x2 - x3 -
+                        x8*loadtim[k + 1] + x8*loadtim[k]))
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-omega*(sin(omega*t + phase)/(1 + omega**2/(dT**2*eig**2)) - omega*cos(omega*t + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) + omega*(exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig))
+                    x0 = omega*t + phase
+                    x1 = omega/(dT*eig)
+                    x2 = t - loadtim[k]
+                    x3 = -omega*x2 + x0
+                    A[i,j] += (x1*(x1*cos(x0) + (-x1*cos(x3) + sin(x3))*exp(-dT*eig*x2) - sin(x0))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)))
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-omega*(exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) + omega*(exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig))
+                    x0 = t - loadtim[k]
+                    x1 = dT*eig
+                    x2 = omega*t + phase
+                    x3 = -omega*x0 + x2
+                    x4 = omega/(dT*eig)
+                    x5 = t - loadtim[k + 1]
+                    x6 = -omega*x5 + x2
+                    A[i,j] += (x4*((-x4*cos(x3) + sin(x3))*exp(-x0*x1) - (-x4*cos(x6) + sin(x6))*exp(-x1*x5))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)))
 
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
@@ -5001,6 +3840,14 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
             except ImportError:
                 fn = EDload_coslinear
         A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import edload_coslinear as fn
+        except ImportError:
+            fn = EDload_coslinear
+        A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -5017,552 +3864,157 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             k = steps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(cos(omega*loadtim[k] + phase)*exp(-dT*eig*(t - loadtim[k]))*(loadmag[k + 1] - loadmag[k]), axis=1)
+                A[i, :] += np.sum((loadmag[k + 1] - loadmag[k])*exp(-dT*eig*(t - loadtim[k]))*cos(omega*loadtim[k] + phase), axis=1)
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum(omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - omega*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        + omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*sin(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*sin(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] -
-                        cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + cos(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) -
-                        omega**2*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) - omega**2*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) -
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**3*t*sin(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1]
-                        + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*sin(omega*t + phase)*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*sin(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k]/(dT**2*eig**2) - omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k]*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        - omega**4*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) +
-                        omega**4*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) +
-                        omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3) - omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**3*eig**3)
-                        - omega**4*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) +
-                        omega**4*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) -
-                        omega**4*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT**3*eig**3) + omega**4*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**3*eig**3) + omega**4*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**3*eig**3) -
-                        omega**4*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3), axis=1)
+                x0 = dT*eig
+                x1 = omega**4/(dT**3*eig**3)
+                x2 = x1*loadtim[k]
+                x3 = x1*loadtim[k + 1]
+                x4 = omega**2
+                x5 = 1/dT
+                x6 = 1/eig
+                x7 = 2*x5*x6
+                x8 = x4*x7
+                x9 = omega*t
+                x10 = phase + x9
+                x11 = cos(x10)
+                x12 = x11*loadmag[k]
+                x13 = x11*loadmag[k + 1]
+                x14 = sin(x10)
+                x15 = omega*x14
+                x16 = loadmag[k]*loadtim[k + 1]
+                x17 = x14*x9
+                x18 = loadmag[k + 1]*loadtim[k]
+                x19 = x15*x7
+                x20 = 1/(dT**2*eig**2)
+                x21 = x13*x4
+                x22 = x12*x4
+                x23 = omega**3*x20
+                x24 = x14*x23
+                x25 = t*x1
+                x26 = x5*x6
+                x27 = t*x26
+                x28 = x26*loadtim[k]
+                x29 = t*x24
+                x30 = x26*loadtim[k + 1]
+                x31 = t - loadtim[k]
+                x32 = omega*x31
+                x33 = x10 - x32
+                x34 = exp(-x0*x31)
+                x35 = x34*cos(x33)
+                x36 = x35*loadmag[k + 1]
+                x37 = x35*loadmag[k]
+                x38 = x34*sin(x33)
+                x39 = x38*x9
+                x40 = omega*x38
+                x41 = x32*x38
+                x42 = x40*x7
+                x43 = x20*x4
+                x44 = x37*x4
+                x45 = x23*x38
+                x46 = t*x45
+                x47 = x27*x4
+                x48 = x36*x4
+                x49 = x1*x31
+                x50 = x26*x31
+                x51 = x31*x45
+                A[i, :] += np.sum((x12*x25 - x12*x3 + x12 + x13*x2 - x13*x25 - x13 + x15*x16 - x15*x18 + x16*x24 - x16*x40 - x16*x45 +
+                        x17*loadmag[k + 1] - x17*loadmag[k] - x18*x24 + x18*x40 + x18*x45 -
+                        x19*loadmag[k + 1] + x19*loadmag[k] - x2*x36 + x20*x21 - x20*x22 - x21*x27 +
+                        x21*x28 + x22*x27 - x22*x30 + x25*x36 - x25*x37 - x28*x48 + x29*loadmag[k +
+                        1] - x29*loadmag[k] + x3*x37 + x30*x44 - x36*x43 + x36*x47 - x36*x49 + x36 +
+                        x37*x43 - x37*x47 + x37*x49 - x37 - x39*loadmag[k + 1] + x39*loadmag[k] +
+                        x41*loadmag[k + 1] - x41*loadmag[k] + x42*loadmag[k + 1] - x42*loadmag[k] +
+                        x44*x50 - x46*loadmag[k + 1] + x46*loadmag[k] - x48*x50 + x51*loadmag[k + 1]
+                        - x51*loadmag[k])/(-x0*loadtim[k + 1] + x0*loadtim[k] + x2 - x3 -
+                        x8*loadtim[k + 1] + x8*loadtim[k]), axis=1)
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(-omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] -
-                        omega*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*(t - loadtim[k
-                        + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + omega*(t -
-                        loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - omega*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        omega*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k
-                        + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] +
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) -
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) + omega**2*(t
-                        - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**2*cos(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT*eig) -
-                        omega**2*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - 2*omega*exp(-dT*eig*(t - loadtim[k +
-                        1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k
-                        + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*t*exp(-dT*eig*(t - loadtim[k +
-                        1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k]/(dT**2*eig**2) - omega**3*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k + 1]*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        + omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3) - omega**4*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**3*eig**3)
-                        - omega**4*t*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) +
-                        omega**4*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) +
-                        omega**4*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) -
-                        omega**4*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) -
-                        omega**4*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1]/(dT**3*eig**3) + omega**4*(-dT*eig*loadtim[k +
-                        1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**3*eig**3) + omega**4*cos(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**3*eig**3)
-                        - omega**4*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**3*eig**3) -
-                        omega**4*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**3*eig**3), axis=1)
+                x0 = dT*eig
+                x1 = omega**4/(dT**3*eig**3)
+                x2 = x1*loadtim[k]
+                x3 = x1*loadtim[k + 1]
+                x4 = omega**2
+                x5 = 1/dT
+                x6 = 1/eig
+                x7 = 2*x5*x6
+                x8 = x4*x7
+                x9 = t - loadtim[k + 1]
+                x10 = omega*x9
+                x11 = omega*t
+                x12 = phase + x11
+                x13 = -x10 + x12
+                x14 = exp(-x0*x9)
+                x15 = x14*cos(x13)
+                x16 = x15*loadmag[k]
+                x17 = t - loadtim[k]
+                x18 = omega*x17
+                x19 = x12 - x18
+                x20 = exp(-x0*x17)
+                x21 = x20*cos(x19)
+                x22 = x21*loadmag[k + 1]
+                x23 = x21*loadmag[k]
+                x24 = x15*loadmag[k + 1]
+                x25 = x14*sin(x13)
+                x26 = x25*loadmag[k]
+                x27 = omega*loadtim[k + 1]
+                x28 = x20*sin(x19)
+                x29 = x11*loadmag[k]
+                x30 = x28*loadmag[k + 1]
+                x31 = omega*loadtim[k]
+                x32 = x11*loadmag[k + 1]
+                x33 = x28*loadmag[k]
+                x34 = x25*loadmag[k + 1]
+                x35 = omega*x7
+                x36 = 1/(dT**2*eig**2)
+                x37 = x23*x4
+                x38 = x36*x4
+                x39 = omega**3*x36
+                x40 = x26*x39
+                x41 = x5*x6
+                x42 = x37*x41
+                x43 = t*x16
+                x44 = t*x39
+                x45 = x4*x41
+                x46 = x30*x39
+                x47 = x24*x45
+                x48 = t*x22
+                x49 = x33*x39
+                x50 = x16*x45
+                x51 = x1*x23
+                x52 = x34*x39
+                x53 = x22*x45
+                x54 = x1*x24
+                A[i, :] += np.sum((-t*x42 - t*x47 - t*x51 - t*x54 - x1*x16*x9 - x1*x17*x22 + x1*x43 + x1*x48 + x10*x26 - x10*x34 -
+                        x16*x3 - x16*x38 + x16 + x17*x42 + x17*x46 - x17*x49 + x17*x51 - x17*x53 +
+                        x18*x30 - x18*x33 - x2*x22 + x2*x24 - x22*x38 + x22 + x23*x3 - x23 + x24*x38
+                        - x24 - x25*x29 + x25*x32 + x26*x27 + x26*x35 - x26*x44 - x27*x33 + x28*x29
+                        - x28*x32 + x30*x31 + x30*x35 - x30*x44 - x31*x34 - x33*x35 + x33*x44 -
+                        x34*x35 + x34*x44 + x36*x37 + x40*x9 + x40*loadtim[k + 1] + x42*loadtim[k +
+                        1] + x43*x45 + x45*x48 + x46*loadtim[k] + x47*x9 + x47*loadtim[k] -
+                        x49*loadtim[k + 1] - x50*x9 - x50*loadtim[k + 1] - x52*x9 - x52*loadtim[k] -
+                        x53*loadtim[k] + x54*x9)/(-x0*loadtim[k + 1] + x0*loadtim[k] + x2 - x3 -
+                        x8*loadtim[k + 1] + x8*loadtim[k]), axis=1)
             k = constants_containing_t[i]
             if len(k):
-                A[i,:] += np.sum(-omega*(sin(omega*t + phase)/(1 + omega**2/(dT**2*eig**2)) - omega*cos(omega*t + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) + omega*(exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig), axis=1)
+                x0 = omega*t + phase
+                x1 = omega/(dT*eig)
+                x2 = t - loadtim[k]
+                x3 = -omega*x2 + x0
+                A[i, :] += np.sum(x1*(x1*cos(x0) + (-x1*cos(x3) + sin(x3))*exp(-dT*eig*x2) - sin(x0))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)), axis=1)
             k = constants_less_than_t[i]
             if len(k):
-                A[i,:] += np.sum(-omega*(exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) + omega*(exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig), axis=1)
+                x0 = t - loadtim[k]
+                x1 = dT*eig
+                x2 = omega*t + phase
+                x3 = -omega*x0 + x2
+                x4 = omega/(dT*eig)
+                x5 = t - loadtim[k + 1]
+                x6 = -omega*x5 + x2
+                A[i, :] += np.sum(x4*((-x4*cos(x3) + sin(x3))*exp(-x0*x1) - (-x4*cos(x6) + sin(x6))*exp(-x1*x5))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)), axis=1)
     return A
 
 
@@ -5587,545 +4039,148 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((sin(omega*t + phase)/(1 + omega**2/(dT**2*eig**2)) - omega*cos(omega*t + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig))
+                    x0 = omega*t + phase
+                    x1 = 1/(dT*eig)
+                    x2 = omega*x1
+                    x3 = t - loadtim[k]
+                    x4 = -omega*x3 + x0
+                    A[i,j] += (x1*(-x2*cos(x0) - (-x2*cos(x4) + sin(x4))*exp(-dT*eig*x3) + sin(x0))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)))
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig))
+                    x0 = t - loadtim[k + 1]
+                    x1 = dT*eig
+                    x2 = omega*t + phase
+                    x3 = -omega*x0 + x2
+                    x4 = 1/(dT*eig)
+                    x5 = omega*x4
+                    x6 = t - loadtim[k]
+                    x7 = -omega*x6 + x2
+                    A[i,j] += (x4*((-x5*cos(x3) + sin(x3))*exp(-x0*x1) - (-x5*cos(x7) + sin(x7))*exp(-x1*x6))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)))
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ((-dT*eig*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - dT*eig*sin(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*sin(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] -
-                        omega*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*cos(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*cos(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + sin(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*sin(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*sin(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        2*omega*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**3*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig)
-                        - (-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] + omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) + omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**2*loadtim[k + 1]*(-dT*eig*loadtim[k + 1]
-                        + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2))/(dT*eig))
+                    x0 = dT*eig
+                    x1 = x0*loadtim[k]
+                    x2 = x0*loadtim[k + 1]
+                    x3 = omega**4/(dT**3*eig**3)
+                    x4 = omega**2
+                    x5 = 1/(dT*eig)
+                    x6 = 2*x5
+                    x7 = x4*x6
+                    x8 = omega*t
+                    x9 = phase + x8
+                    x10 = sin(x9)
+                    x11 = x10*loadmag[k + 1]
+                    x12 = x10*loadmag[k]
+                    x13 = omega*loadtim[k + 1]
+                    x14 = cos(x9)
+                    x15 = x14*loadmag[k]
+                    x16 = x14*x8
+                    x17 = omega*loadtim[k]
+                    x18 = x14*loadmag[k + 1]
+                    x19 = t*x0
+                    x20 = omega*x6
+                    x21 = 1/(dT**2*eig**2)
+                    x22 = x21*x4
+                    x23 = omega**3*x21
+                    x24 = t*x5
+                    x25 = x24*x4
+                    x26 = x5*loadtim[k]
+                    x27 = t*x23
+                    x28 = x5*loadtim[k + 1]
+                    x29 = t - loadtim[k]
+                    x30 = x0*x29
+                    x31 = omega*x29
+                    x32 = -x31 + x9
+                    x33 = sin(x32)
+                    x34 = x33*loadmag[k + 1]
+                    x35 = x33*loadmag[k]
+                    x36 = cos(x32)
+                    x37 = x36*loadmag[k]
+                    x38 = x36*x8
+                    x39 = x36*loadmag[k + 1]
+                    x40 = x35*x4
+                    x41 = x23*x37
+                    x42 = x34*x4
+                    x43 = x23*x39
+                    x44 = x29*x5
+                    A[i,j] += (x5*(x1*x11 - x11*x19 - x11*x22 - x11*x25 + x11*x26*x4 + x11 + x12*x19 - x12*x2 + x12*x22 + x12*x25 -
+                        x12*x28*x4 - x12 + x13*x15 + x15*x20 + x15*x23*loadtim[k + 1] - x15*x27 +
+                        x16*loadmag[k + 1] - x16*loadmag[k] - x17*x18 - x18*x20 - x18*x23*loadtim[k]
+                        + x18*x27 - (x1*x34 + x13*x37 - x17*x39 - x19*x34 + x19*x35 - x2*x35 +
+                        x20*x37 - x20*x39 + x21*x40 - x22*x34 + x24*x40 - x24*x42 + x26*x42 -
+                        x27*x37 + x27*x39 - x28*x40 + x29*x41 - x29*x43 + x30*x34 - x30*x35 +
+                        x31*x37 - x31*x39 + x34 - x35 + x38*loadmag[k + 1] - x38*loadmag[k] -
+                        x40*x44 + x41*loadtim[k + 1] + x42*x44 - x43*loadtim[k])*exp(-x30))/(x1 - x2
+                        - x3*loadtim[k + 1] + x3*loadtim[k] - x7*loadtim[k + 1] + x7*loadtim[k]))
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += (-(-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] + omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) + omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**2*loadtim[k + 1]*(-dT*eig*loadtim[k + 1]
-                        + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2))/(dT*eig) + (-dT*eig*t*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*(t - loadtim[k
-                        + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*(t -
-                        loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*loadtim[k
-                        + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*t*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - omega*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*(t - loadtim[k
-                        + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + omega*(t -
-                        loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + omega*loadtim[k +
-                        1]*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1])
-                        + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) + omega**2*(t
-                        - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        2*omega*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**3*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**2*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig))
+                    x0 = dT*eig
+                    x1 = x0*loadtim[k]
+                    x2 = x0*loadtim[k + 1]
+                    x3 = omega**4/(dT**3*eig**3)
+                    x4 = omega**2
+                    x5 = 1/(dT*eig)
+                    x6 = 2*x5
+                    x7 = x4*x6
+                    x8 = t - loadtim[k + 1]
+                    x9 = x0*x8
+                    x10 = omega*x8
+                    x11 = omega*t
+                    x12 = phase + x11
+                    x13 = -x10 + x12
+                    x14 = sin(x13)
+                    x15 = x14*loadmag[k + 1]
+                    x16 = x14*loadmag[k]
+                    x17 = cos(x13)
+                    x18 = x17*loadmag[k]
+                    x19 = omega*loadtim[k + 1]
+                    x20 = x11*x17
+                    x21 = x17*loadmag[k + 1]
+                    x22 = omega*loadtim[k]
+                    x23 = t*x0
+                    x24 = omega*x6
+                    x25 = x16*x4
+                    x26 = 1/(dT**2*eig**2)
+                    x27 = x26*x4
+                    x28 = omega**3*x26
+                    x29 = x18*x28
+                    x30 = t*x5
+                    x31 = x15*x4
+                    x32 = x5*loadtim[k]
+                    x33 = t*x28
+                    x34 = x5*loadtim[k + 1]
+                    x35 = x21*x28
+                    x36 = x5*x8
+                    x37 = t - loadtim[k]
+                    x38 = x0*x37
+                    x39 = omega*x37
+                    x40 = x12 - x39
+                    x41 = sin(x40)
+                    x42 = x41*loadmag[k + 1]
+                    x43 = x41*loadmag[k]
+                    x44 = cos(x40)
+                    x45 = x44*loadmag[k]
+                    x46 = x11*x44
+                    x47 = x44*loadmag[k + 1]
+                    x48 = x28*x45
+                    x49 = x30*x4
+                    x50 = x4*x42
+                    x51 = x4*x43
+                    x52 = x28*x47
+                    x53 = x37*x5
+                    A[i,j] += (x5*((x1*x15 + x10*x18 - x10*x21 - x15*x23 - x15*x27 + x15*x9 + x15 - x16*x2 + x16*x23 - x16*x9 - x16
+                        + x18*x19 + x18*x24 - x18*x33 + x20*loadmag[k + 1] - x20*loadmag[k] -
+                        x21*x22 - x21*x24 + x21*x33 + x25*x26 + x25*x30 - x25*x34 - x25*x36 + x29*x8
+                        + x29*loadtim[k + 1] - x30*x31 + x31*x32 + x31*x36 - x35*x8 -
+                        x35*loadtim[k])*exp(-x9) - (x1*x42 + x19*x45 - x2*x43 - x22*x47 - x23*x42 +
+                        x23*x43 + x24*x45 - x24*x47 - x27*x42 + x27*x43 + x32*x50 - x33*x45 +
+                        x33*x47 - x34*x51 + x37*x48 - x37*x52 + x38*x42 - x38*x43 + x39*x45 -
+                        x39*x47 - x42*x49 + x42 + x43*x49 - x43 + x46*loadmag[k + 1] -
+                        x46*loadmag[k] + x48*loadtim[k + 1] + x50*x53 - x51*x53 -
+                        x52*loadtim[k])*exp(-x38))/(x1 - x2 - x3*loadtim[k + 1] + x3*loadtim[k] -
+                        x7*loadtim[k + 1] + x7*loadtim[k]))
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
         if MUST_TRY_FORTRAN:
@@ -6136,6 +4191,14 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
             except ImportError:
                 fn = Eload_sinlinear
         A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import eload_sinlinear as fn
+        except ImportError:
+            fn = Eload_sinlinear
+        A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -6150,548 +4213,151 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             k = constants_containing_t[i]
             if len(k):
-                A[i, :] += np.sum((sin(omega*t + phase)/(1 + omega**2/(dT**2*eig**2)) - omega*cos(omega*t + phase)/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig), axis=1)
+                x0 = omega*t + phase
+                x1 = 1/(dT*eig)
+                x2 = omega*x1
+                x3 = t - loadtim[k]
+                x4 = -omega*x3 + x0
+                A[i, :] += np.sum(x1*(-x2*cos(x0) - (-x2*cos(x4) + sin(x4))*exp(-dT*eig*x3) + sin(x0))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)), axis=1)
 
             k = constants_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum((exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig) - (exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)/(1 +
-                        omega**2/(dT**2*eig**2)) - omega*cos(omega*t - omega*(t - loadtim[k]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k]))/(dT*eig*(1 +
-                        omega**2/(dT**2*eig**2))))*loadmag[k]/(dT*eig), axis=1)
+                x0 = t - loadtim[k + 1]
+                x1 = dT*eig
+                x2 = omega*t + phase
+                x3 = -omega*x0 + x2
+                x4 = 1/(dT*eig)
+                x5 = omega*x4
+                x6 = t - loadtim[k]
+                x7 = -omega*x6 + x2
+                A[i, :] += np.sum(x4*((-x5*cos(x3) + sin(x3))*exp(-x0*x1) - (-x5*cos(x7) + sin(x7))*exp(-x1*x6))*loadmag[k]/(1 +
+                        omega**2/(dT**2*eig**2)), axis=1)
 
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum((-dT*eig*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - dT*eig*sin(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*sin(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] +
-                        omega*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] -
-                        omega*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*cos(omega*t +
-                        phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*cos(omega*t +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + sin(omega*t +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        omega**2*sin(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*sin(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        2*omega*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**3*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*t*cos(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k]
-                        - 2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) +
-                        omega**3*cos(omega*t + phase)*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*cos(omega*t + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**2*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*sin(omega*t + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig)
-                        - (-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] + omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) + omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**2*loadtim[k + 1]*(-dT*eig*loadtim[k + 1]
-                        + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2))/(dT*eig), axis=1)
+                x0 = dT*eig
+                x1 = x0*loadtim[k]
+                x2 = x0*loadtim[k + 1]
+                x3 = omega**4/(dT**3*eig**3)
+                x4 = omega**2
+                x5 = 1/(dT*eig)
+                x6 = 2*x5
+                x7 = x4*x6
+                x8 = omega*t
+                x9 = phase + x8
+                x10 = sin(x9)
+                x11 = x10*loadmag[k + 1]
+                x12 = x10*loadmag[k]
+                x13 = omega*loadtim[k + 1]
+                x14 = cos(x9)
+                x15 = x14*loadmag[k]
+                x16 = x14*x8
+                x17 = omega*loadtim[k]
+                x18 = x14*loadmag[k + 1]
+                x19 = t*x0
+                x20 = omega*x6
+                x21 = 1/(dT**2*eig**2)
+                x22 = x21*x4
+                x23 = omega**3*x21
+                x24 = t*x5
+                x25 = x24*x4
+                x26 = x5*loadtim[k]
+                x27 = t*x23
+                x28 = x5*loadtim[k + 1]
+                x29 = t - loadtim[k]
+                x30 = x0*x29
+                x31 = omega*x29
+                x32 = -x31 + x9
+                x33 = sin(x32)
+                x34 = x33*loadmag[k + 1]
+                x35 = x33*loadmag[k]
+                x36 = cos(x32)
+                x37 = x36*loadmag[k]
+                x38 = x36*x8
+                x39 = x36*loadmag[k + 1]
+                x40 = x35*x4
+                x41 = x23*x37
+                x42 = x34*x4
+                x43 = x23*x39
+                x44 = x29*x5
+                A[i, :] += np.sum(x5*(x1*x11 - x11*x19 - x11*x22 - x11*x25 + x11*x26*x4 + x11 + x12*x19 - x12*x2 + x12*x22 + x12*x25 -
+                        x12*x28*x4 - x12 + x13*x15 + x15*x20 + x15*x23*loadtim[k + 1] - x15*x27 +
+                        x16*loadmag[k + 1] - x16*loadmag[k] - x17*x18 - x18*x20 - x18*x23*loadtim[k]
+                        + x18*x27 - (x1*x34 + x13*x37 - x17*x39 - x19*x34 + x19*x35 - x2*x35 +
+                        x20*x37 - x20*x39 + x21*x40 - x22*x34 + x24*x40 - x24*x42 + x26*x42 -
+                        x27*x37 + x27*x39 - x28*x40 + x29*x41 - x29*x43 + x30*x34 - x30*x35 +
+                        x31*x37 - x31*x39 + x34 - x35 + x38*loadmag[k + 1] - x38*loadmag[k] -
+                        x40*x44 + x41*loadtim[k + 1] + x42*x44 - x43*loadtim[k])*exp(-x30))/(x1 - x2
+                        - x3*loadtim[k + 1] + x3*loadtim[k] - x7*loadtim[k + 1] + x7*loadtim[k]), axis=1)
 
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum(-(-dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        dT*eig*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*exp(-dT*eig*(t - loadtim[k]))*sin(omega*t - omega*(t -
-                        loadtim[k]) + phase)*loadmag[k + 1] - dT*eig*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        dT*eig*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] +
-                        dT*eig*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1] +
-                        omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]
-                        - omega*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t -
-                        loadtim[k])*cos(omega*t - omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k + 1] + omega*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] +
-                        omega*loadtim[k + 1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k] -
-                        omega*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1] +
-                        (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k + 1]
-                        - (-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t
-                        - loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k] -
-                        omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) + omega**2*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) - omega**2*loadtim[k + 1]*(-dT*eig*loadtim[k + 1]
-                        + dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT*eig) + omega**2*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT*eig) - 2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k + 1]/(dT*eig) +
-                        2*omega*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT*eig) + omega**3*t*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**3*t*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k]/(dT**2*eig**2)
-                        - omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**3*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*(t - loadtim[k])*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) + omega**3*loadtim[k +
-                        1]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t -
-                        omega*(t - loadtim[k]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k]))*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*cos(omega*t - omega*(t -
-                        loadtim[k]) + phase)*exp(-dT*eig*(t - loadtim[k]))*loadmag[k +
-                        1]/(dT**2*eig**2) - omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) + phase)*loadmag[k +
-                        1]/(dT**2*eig**2) + omega**2*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*exp(-dT*eig*(t -
-                        loadtim[k]))*sin(omega*t - omega*(t - loadtim[k]) +
-                        phase)*loadmag[k]/(dT**2*eig**2))/(dT*eig) + (-dT*eig*t*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        + dT*eig*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*(t - loadtim[k
-                        + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*(t -
-                        loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + dT*eig*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] - dT*eig*loadtim[k
-                        + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k +
-                        1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + omega*t*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - omega*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*(t - loadtim[k
-                        + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + omega*(t -
-                        loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] - omega*cos(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t - loadtim[k +
-                        1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1] + omega*loadtim[k +
-                        1]*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] + exp(-dT*eig*(t -
-                        loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k +
-                        1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]
-                        - exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t - loadtim[k + 1])
-                        + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] - 2*omega**2*loadtim[k
-                        + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k +
-                        1]/(dT**3*eig**3) + omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k] -
-                        omega**2*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        omega**2*t*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) + omega**2*(t
-                        - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*(t - loadtim[k + 1])*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t
-                        - omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**2*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*loadtim[k]*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) -
-                        omega**2*loadtim[k + 1]*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t -
-                        omega*(t - loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) -
-                        2*omega*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT*eig) +
-                        2*omega*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT*eig) +
-                        omega**3*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) -
-                        omega**3*t*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t
-                        - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*(t - loadtim[k + 1])*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**3*cos(omega*t - omega*(t - loadtim[k + 1]) + phase)*exp(-dT*eig*(t -
-                        loadtim[k + 1]))*loadtim[k]*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**3*loadtim[k + 1]*cos(omega*t - omega*(t - loadtim[k + 1]) +
-                        phase)*exp(-dT*eig*(t - loadtim[k + 1]))*(-dT*eig*loadtim[k + 1] +
-                        dT*eig*loadtim[k] - 2*omega**2*loadtim[k + 1]/(dT*eig) +
-                        2*omega**2*loadtim[k]/(dT*eig) - omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2) -
-                        omega**2*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k + 1]/(dT**2*eig**2) +
-                        omega**2*exp(-dT*eig*(t - loadtim[k + 1]))*sin(omega*t - omega*(t -
-                        loadtim[k + 1]) + phase)*(-dT*eig*loadtim[k + 1] + dT*eig*loadtim[k] -
-                        2*omega**2*loadtim[k + 1]/(dT*eig) + 2*omega**2*loadtim[k]/(dT*eig) -
-                        omega**4*loadtim[k + 1]/(dT**3*eig**3) +
-                        omega**4*loadtim[k]/(dT**3*eig**3))**(-1)*loadmag[k]/(dT**2*eig**2))/(dT*eig), axis=1)
+                x0 = dT*eig
+                x1 = x0*loadtim[k]
+                x2 = x0*loadtim[k + 1]
+                x3 = omega**4/(dT**3*eig**3)
+                x4 = omega**2
+                x5 = 1/(dT*eig)
+                x6 = 2*x5
+                x7 = x4*x6
+                x8 = t - loadtim[k + 1]
+                x9 = x0*x8
+                x10 = omega*x8
+                x11 = omega*t
+                x12 = phase + x11
+                x13 = -x10 + x12
+                x14 = sin(x13)
+                x15 = x14*loadmag[k + 1]
+                x16 = x14*loadmag[k]
+                x17 = cos(x13)
+                x18 = x17*loadmag[k]
+                x19 = omega*loadtim[k + 1]
+                x20 = x11*x17
+                x21 = x17*loadmag[k + 1]
+                x22 = omega*loadtim[k]
+                x23 = t*x0
+                x24 = omega*x6
+                x25 = x16*x4
+                x26 = 1/(dT**2*eig**2)
+                x27 = x26*x4
+                x28 = omega**3*x26
+                x29 = x18*x28
+                x30 = t*x5
+                x31 = x15*x4
+                x32 = x5*loadtim[k]
+                x33 = t*x28
+                x34 = x5*loadtim[k + 1]
+                x35 = x21*x28
+                x36 = x5*x8
+                x37 = t - loadtim[k]
+                x38 = x0*x37
+                x39 = omega*x37
+                x40 = x12 - x39
+                x41 = sin(x40)
+                x42 = x41*loadmag[k + 1]
+                x43 = x41*loadmag[k]
+                x44 = cos(x40)
+                x45 = x44*loadmag[k]
+                x46 = x11*x44
+                x47 = x44*loadmag[k + 1]
+                x48 = x28*x45
+                x49 = x30*x4
+                x50 = x4*x42
+                x51 = x4*x43
+                x52 = x28*x47
+                x53 = x37*x5
+                A[i, :] += np.sum(x5*((x1*x15 + x10*x18 - x10*x21 - x15*x23 - x15*x27 + x15*x9 + x15 - x16*x2 + x16*x23 - x16*x9 - x16
+                        + x18*x19 + x18*x24 - x18*x33 + x20*loadmag[k + 1] - x20*loadmag[k] -
+                        x21*x22 - x21*x24 + x21*x33 + x25*x26 + x25*x30 - x25*x34 - x25*x36 + x29*x8
+                        + x29*loadtim[k + 1] - x30*x31 + x31*x32 + x31*x36 - x35*x8 -
+                        x35*loadtim[k])*exp(-x9) - (x1*x42 + x19*x45 - x2*x43 - x22*x47 - x23*x42 +
+                        x23*x43 + x24*x45 - x24*x47 - x27*x42 + x27*x43 + x32*x50 - x33*x45 +
+                        x33*x47 - x34*x51 + x37*x48 - x37*x52 + x38*x42 - x38*x43 + x39*x45 -
+                        x39*x47 - x42*x49 + x42 + x43*x49 - x43 + x46*loadmag[k + 1] -
+                        x46*loadmag[k] + x48*loadtim[k + 1] + x50*x53 - x51*x53 -
+                        x52*loadtim[k])*exp(-x38))/(x1 - x2 - x3*loadtim[k + 1] + x3*loadtim[k] -
+                        x7*loadtim[k + 1] + x7*loadtim[k]), axis=1)
     return A
 
 def pdim1sin_DD_abDDf_linear(m, a, b, **kwargs):
@@ -6710,13 +4376,14 @@ def pdim1sin_DD_abDDf_linear(m, a, b, **kwargs):
         eigenvlaues of BVP. generate with geoteca.speccon.m_from_sin_mx
     a, b : PolyLine object
         PolyLine defining piecewise linear relationship.
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -6787,13 +4454,14 @@ def dim1sin_DD_abDDf_linear(m, at, ab, bt, bb,  zt, zb, implementation='vectoriz
         Normalised depth or z-coordinate at top of each layer. `zt[0]` = 0
     zb : ``list`` of ``float``
         Normalised depth or z-coordinate at bottom of each layer. `zt[-1]` = 1
-    implementation : ['vectorized', 'scalar', 'fortran'], optional
+    implementation : ['vectorized', 'scalar', 'fortran', 'jit'], optional
         Functional implementation: 'scalar' = python loops (slow),
-        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast).
+        'fortran' = fortran code (fastest), 'vectorized' = numpy(fast),
+        'jit' = numba compiled loops (about as fast as 'fortran').
         Default implementation='vectorized'.  If fortran extention module
-        cannot be imported then 'vectorized' version will be used.
-        If anything other than 'fortran' or 'scalar' is used then
-        default vectorized version will be used.
+        (or numba for 'jit') cannot be imported then 'vectorized' version
+        will be used.  If anything other than 'fortran', 'scalar' or 'jit'
+        is used then default vectorized version will be used.
 
     Returns
     -------
@@ -7105,6 +4773,13 @@ def dim1sin_DD_abDDf_linear(m, at, ab, bt, bb,  zt, zb, implementation='vectoriz
             except ImportError:
                 A = dim1sin_DD_abDDf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_dd_abddf_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_DD_abDDf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -23,6 +23,8 @@ import os
 
 from geotecha.inputoutput.inputoutput import fcode_one_large_expr
 
+CSE = True #use = False to generate the flat expressions without temporaries.
+
 
 def tw(text, indents=3, width=100, break_long_words=False):
     """Rough text wrapper for long sympy expressions
@@ -60,6 +62,375 @@ def tw(text, indents=3, width=100, break_long_words=False):
     return os.linesep.join(lines)
 
 
+def cse_expr(expr, symbols=None):
+    """Simplify and perform common subexpression elimination on an expression
+
+    `expr` is first tidied with `sympy.factor_terms` (which pulls common
+    factors out of sums but, unlike `sympy.simplify`, never splits
+    exp(-dT*eig*(t - loadtim[k])) into exp(-dT*eig*t)*exp(dT*eig*loadtim[k])
+    which could overflow) and then passed through `sympy.cse`.  Indexed
+    objects such as loadtim[k + 1] are treated as atoms so that index
+    arithmetic is never pulled out as a temporary.
+
+    Parameters
+    ----------
+    expr : sympy expression
+        Expression to reduce.
+    symbols : iterator of sympy.Symbol, optional
+        Names for the temporaries.  Pass the same iterator to several
+        calls to get unique temporaries across several expressions.
+        Default symbols=None i.e. x0, x1, x2, ... .
+
+    Returns
+    -------
+    replacements : list of (sympy.Symbol, sympy expression) tuples
+        Temporaries in the order they must be evaluated.
+    reduced : sympy expression
+        `expr` in terms of the temporaries.
+
+    Notes
+    -----
+    If the module level `CSE` is False then `expr` is returned unchanged
+    with no temporaries, which reproduces the code generated before common
+    subexpression elimination was used (see `python_implementation`).
+
+    """
+
+    if not CSE:
+        return [], expr
+
+    if symbols is None:
+        symbols = sympy.numbered_symbols('x')
+
+    atoms = dict((a, sympy.Dummy()) for a in expr.atoms(sympy.Indexed))
+    back = dict((v, a) for a, v in atoms.items())
+
+    expr = sympy.factor_terms(expr.xreplace(atoms))
+    replacements, reduced = sympy.cse(expr, symbols=symbols)
+
+    replacements = [(s, v.xreplace(back)) for s, v in replacements]
+    reduced = reduced[0].xreplace(back)
+    return replacements, reduced
+
+
+def tw_cse(expr, statement, indents=4, wrap_indents=6):
+    """Python code block for an expression evaluated via temporaries
+
+    Parameters
+    ----------
+    expr : sympy expression
+        Expression to reduce with `cse_expr`.
+    statement : str
+        Python statement with a single {} placeholder for the reduced
+        expression, e.g. 'A[i, :] += np.sum({}, axis=1)'.
+    indents : int, optional
+        Multiple of 4 spaces to indent each line of the block.  As with
+        `tw` the 1st line will not be indented. Default indents=4.
+    wrap_indents : int, optional
+        Multiple of 4 spaces to indent wrapped lines of long
+        expressions. Default wrap_indents=6.
+
+    Returns
+    -------
+    out : str
+        Multi-line string.
+
+    """
+
+    replacements, reduced = cse_expr(expr)
+    lines = []
+    for s, v in replacements:
+        text = tw(v, wrap_indents)
+        if os.linesep in text:
+            # bracket so python knows the wrapped lines continue
+            text = '(' + text + ')'
+        lines.append('{} = {}'.format(s, text))
+    lines.append(statement.format(tw(reduced, wrap_indents)))
+    return (os.linesep + " "*4*indents).join(lines)
+
+
+def fcode_cse(exprs, prepend, complex_bases=()):
+    """Fortran code blocks for expressions evaluated via temporaries
+
+    Parameters
+    ----------
+    exprs : list of sympy expression
+        Expressions to reduce with `cse_expr`.  Each expression gets its
+        own temporaries, numbered uniquely across all the expressions so
+        that they can be declared once at the top of a subroutine.
+    prepend : str
+        Fortran statement start for each reduced expression,
+        e.g. 'a(i, j) = a(i, j) + '.
+    complex_bases : list of sympy.IndexedBase or sympy.Symbol, optional
+        Variables that are COMPLEX(DP) in the subroutine.  Temporaries
+        depending on them will be declared COMPLEX(DP), all others
+        REAL(DP). Default complex_bases=() i.e. all REAL(DP).
+
+    Returns
+    -------
+    declarations : str
+        Fortran declarations of the temporaries.
+    blocks : list of str
+        Fortran code for each expression in `exprs`.
+
+    """
+
+    symbols = sympy.numbered_symbols('x')
+    complex_vars = set(complex_bases)
+    kinds = {'REAL(DP)': [], 'COMPLEX(DP)': []}
+    blocks = []
+    for expr in exprs:
+        replacements, reduced = cse_expr(expr, symbols=symbols)
+        lines = []
+        for s, v in replacements:
+            if any(v.has(c) for c in complex_vars):
+                complex_vars.add(s)
+                kinds['COMPLEX(DP)'].append(str(s))
+            else:
+                kinds['REAL(DP)'].append(str(s))
+            lines.append(fcode_one_large_expr(v, prepend='{} = '.format(s)))
+        lines.append(fcode_one_large_expr(reduced, prepend=prepend))
+        blocks.append(os.linesep.join(lines))
+
+    declarations = []
+    for kind in ['REAL(DP)', 'COMPLEX(DP)']:
+        if not kinds[kind]:
+            continue
+        wrapper = textwrap.TextWrapper(width=70,
+                                       initial_indent=' '*8 + kind + ' :: ',
+                                       subsequent_indent=' '*10)
+        lines = wrapper.wrap(', '.join(kinds[kind]))
+        declarations.append((' &' + os.linesep).join(lines))
+    return os.linesep.join(declarations), blocks
+
+
+def python_implementation(code, name):
+    """Function defined by generated python code
+
+    Used to test and benchmark generated code against the functions in
+    geotecha.speccon.integrals without pasting it in.
+
+    Parameters
+    ----------
+    code : str
+        Python code from one of the *_implementations functions.
+    name : str
+        Name of the function defined in `code`, e.g. 'Eload_linear'.
+
+    Returns
+    -------
+    fn : function
+        The function, executed in a copy of the
+        geotecha.speccon.integrals namespace.
+
+    Examples
+    --------
+    >>> fn = python_implementation(Eload_linear_implementations()[0],
+    ...                            'Eload_linear')
+    >>> fn([0, 1], [0, 1], [1.0], [2.0])
+    array([[0.13533528+0.j]])
+
+    """
+
+    import geotecha.speccon.integrals as integ
+
+    namespace = dict(vars(integ))
+    exec(code, namespace)
+    return namespace[name]
+
+
+def jit_eload_kernel(name, args, dtype='float64', after_step=None,
+                     after_constant=None, after_ramp=None,
+                     within_constant=None, within_ramp=None):
+    """Numba JIT loop kernel for a piecewise linear in time E load integral
+
+    The loop structure is the same as the fortran subroutines for
+    Eload_linear etc.  The loop over time values is a parallel loop.
+
+    Parameters
+    ----------
+    name : str
+        Name of kernel (lowercase, same as fortran subroutine).
+    args : str
+        Comma separated kernel arguments, must include loadtim, loadmag,
+        eigs, tvals.
+    dtype : ['float64', 'complex128'], optional
+        numpy dtype of the output array. Default dtype='float64'.
+    after_step, after_constant, after_ramp : sympy expression, optional
+        Contribution to a[i, j] from a step, constant, or ramp load
+        segment that ends before tvals[i]. Default=None i.e. no
+        contribution.
+    within_constant, within_ramp : sympy expression, optional
+        Contribution to a[i, j] from a constant or ramp load segment
+        containing tvals[i]. Default=None i.e. no contribution.
+
+    Returns
+    -------
+    fn3 : str
+        Python code for the kernel.  Needs the module level imports of
+        `jit_integrals_module`.
+
+    """
+
+    def block(expr):
+        if expr is None:
+            return 'pass'
+        return ('for j in range(neig):' + os.linesep + " "*4*6 +
+                tw_cse(expr, 'a[i, j] += ({})', indents=6, wrap_indents=8))
+
+    text = """\
+@numba.njit(parallel=True, cache=True)
+def {name}({args}):
+    neig = len(eigs)
+    nload = len(loadtim)
+    nt = len(tvals)
+    a = np.zeros((nt, neig), dtype=np.{dtype})
+    EPSILON = 0.0000005
+    for i in numba.prange(nt):
+        for k in range(nload - 1):
+            if tvals[i] < loadtim[k]:
+                #t is before load step
+                break
+            if tvals[i] >= loadtim[k + 1]:
+                #t is after the load step
+                if (abs(loadtim[k] - loadtim[k + 1]) <=
+                        abs(loadtim[k] + loadtim[k + 1]) * EPSILON):
+                    #step load
+                    {0}
+                elif (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    {1}
+                else:
+                    #ramp load
+                    {2}
+            else:
+                #t is in the load step
+                if (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    {3}
+                else:
+                    #ramp load
+                    {4}
+    return a"""
+
+    return text.format(block(after_step), block(after_constant),
+                       block(after_ramp), block(within_constant),
+                       block(within_ramp),
+                       name=name, args=args, dtype=dtype)
+
+
+def _jit_slopes(slopes):
+    """Lines calculating the slope of each linear property within a layer"""
+    return (os.linesep + " "*4*3).join(
+        '{0}_slope = ({0}b[layer] - {0}t[layer]) / '
+        '(zb[layer] - zt[layer])'.format(s) for s in slopes)
+
+
+def jit_symmetric_kernel(name, args, slopes, fdiag, foff):
+    """Numba JIT loop kernel for a symmetric dim1sin integral matrix
+
+    The loop structure is the same as the fortran subroutines for
+    dim1sin_af_linear etc. except that the loop over columns is outermost
+    and parallel (each column is only written by one thread).
+
+    Parameters
+    ----------
+    name : str
+        Name of kernel (same as fortran subroutine).
+    args : str
+        Comma separated kernel arguments. Must include m, zt, zb.
+    slopes : list of str
+        Linear properties that need a slope e.g. ['a', 'b'] gives
+        a_slope and b_slope.
+    fdiag : sympy expression
+        Contribution to a[i, i] from a layer.
+    foff : sympy expression
+        Contribution to a[i, j], i > j from a layer.
+
+    Returns
+    -------
+    fn3 : str
+        Python code for the kernel.  Needs the module level imports of
+        `jit_integrals_module`.
+
+    """
+
+    text = """\
+@numba.njit(parallel=True, cache=True)
+def {name}({args}):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros((neig, neig))
+    for j in numba.prange(neig):
+        for layer in range(nlayers):
+            {slopes}
+            i = j
+            {0}
+            for i in range(j + 1, neig):
+                {1}
+    for j in range(neig - 1):
+        for i in range(j + 1, neig):
+            a[j, i] = a[i, j]
+    return a"""
+
+    return text.format(tw_cse(fdiag, 'a[i, i] += ({})', 3),
+                       tw_cse(foff, 'a[i, j] += ({})', 4),
+                       name=name, args=args, slopes=_jit_slopes(slopes))
+
+
+def jit_column_kernel(name, args, slopes, fcol, fends=None):
+    """Numba JIT loop kernel for a dim1sin integral column vector
+
+    The loop structure is the same as the fortran subroutines for
+    dim1sin_ab_linear etc. except that the loop over rows is outermost
+    and parallel.
+
+    Parameters
+    ----------
+    name : str
+        Name of kernel (same as fortran subroutine).
+    args : str
+        Comma separated kernel arguments. Must include m, zt, zb.
+    slopes : list of str
+        Linear properties that need a slope e.g. ['a', 'b'] gives
+        a_slope and b_slope.
+    fcol : sympy expression
+        Contribution to a[i] from a layer.
+    fends : sympy expression, optional
+        Contribution to a[i] from the end points. Default fends=None.
+
+    Returns
+    -------
+    fn3 : str
+        Python code for the kernel.  Needs the module level imports of
+        `jit_integrals_module`.
+
+    """
+
+    text = """\
+@numba.njit(parallel=True, cache=True)
+def {name}({args}):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros(neig)
+    for i in numba.prange(neig):
+        for layer in range(nlayers):
+            {slopes}
+            {0}
+        {1}
+    return a"""
+
+    if fends is None:
+        ends = ''
+    else:
+        ends = tw_cse(fends, 'a[i] += ({})', 2)
+    text = text.format(tw_cse(fcol, 'a[i] += ({})', 3), ends,
+                       name=name, args=args, slopes=_jit_slopes(slopes))
+    return os.linesep.join(line for line in text.splitlines() if line.strip())
+
+
 
 
 def Eload_linear_implementations():
@@ -75,12 +446,13 @@ def Eload_linear_implementations():
 
     Paste the resulting code (at least the loops) into `Eload_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -89,6 +461,8 @@ def Eload_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
 
     Notes
@@ -238,16 +612,16 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
         for i, t in enumerate(tvals):
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({0})
+                    {0}
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({1})
+                    {1}
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({2})
+                    {2}
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({3})
+                    {3}
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
 
@@ -259,6 +633,12 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
             except ImportError:
                 fn = Eload_linear
         A = fn(loadtim, loadmag, eigs, tvals, dT)
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import eload_linear as fn
+        except ImportError:
+            fn = Eload_linear
+        A = fn(loadtim, loadmag, eigs, tvals, dT)
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -273,19 +653,19 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
         for i, t in enumerate(tvals):
             k = constants_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({0}, axis=1)
+                {4}
 
             k = constants_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({1}, axis=1)
+                {5}
 
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({2}, axis=1)
+                {6}
 
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({3}, axis=1)
+                {7}
     return A"""
 
 
@@ -307,6 +687,7 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
         COMPLEX(DP), intent(out), dimension(0:nt-1, 0:neig-1) :: a
         INTEGER :: i , j, k
         REAL(DP):: EPSILON
+{4}
         a=0.0D0
         EPSILON = 0.0000005D0
         DO i = 0, nt-1
@@ -359,10 +740,14 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
 
 
     fn = text_python.format(
-            tw(within_constant, 6),
-            tw(after_constant, 6),
-            tw(within_ramp, 6),
-            tw(after_ramp, 6))
+            tw_cse(within_constant, 'A[i,j] += ({})', 5),
+            tw_cse(after_constant, 'A[i,j] += ({})', 5),
+            tw_cse(within_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(after_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(within_constant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_constant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(within_ramp, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_ramp, 'A[i, :] += np.sum({}, axis=1)', 4))
 
 
     mp3 = [(eig, eigs[j]),
@@ -371,13 +756,18 @@ def Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectoriz
     after_ramp = after_ramp.subs(mp3)
     within_constant = within_constant.subs(mp3)
     within_ramp = within_ramp.subs(mp3)
-    fn2 = text_fortran.format(
-        fcode_one_large_expr(after_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(after_ramp, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_ramp, prepend='a(i, j) = a(i, j) + '))
+    declarations, blocks = fcode_cse(
+        [after_constant, after_ramp, within_constant, within_ramp],
+        prepend='a(i, j) = a(i, j) + ',
+        complex_bases=[eigs])
+    fn2 = text_fortran.format(*(blocks + [declarations]))
+
+    fn3 = jit_eload_kernel(
+        'eload_linear', 'loadtim, loadmag, eigs, tvals, dT', dtype='complex128',
+        after_constant=after_constant, after_ramp=after_ramp,
+        within_constant=within_constant, within_ramp=within_ramp)
 
-    return fn, fn2
+    return fn, fn2, fn3
 
 
 def EDload_linear_implementations():
@@ -392,12 +782,13 @@ def EDload_linear_implementations():
 
     Paste the resulting code (at least the loops) into `EDload_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -406,6 +797,8 @@ def EDload_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  needs to be compiled with f2py
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     Notes
     -----
@@ -542,13 +935,13 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
         for i, t in enumerate(tvals):
             for k in steps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({0})
+                    {0}
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({1})
+                    {1}
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({2})
+                    {2}
 
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
@@ -561,6 +954,13 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
                 fn = EDload_linear
         A = fn(loadtim, loadmag, eigs, tvals, dT)
 
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import edload_linear as fn
+        except ImportError:
+            fn = EDload_linear
+        A = fn(loadtim, loadmag, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -577,13 +977,13 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
         for i, t in enumerate(tvals):
             k = steps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({0}, axis=1)
+                {3}
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({1}, axis=1)
+                {4}
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({2}, axis=1)
+                {5}
     return A"""
 
 
@@ -605,6 +1005,7 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
         REAL(DP), intent(out), dimension(0:nt-1, 0:neig-1) :: a
         INTEGER :: i , j, k
         REAL(DP):: EPSILON
+{3}
         a=0.0D0
         EPSILON = 0.0000005D0
         DO i = 0, nt-1
@@ -655,9 +1056,12 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
 
 
     fn = text_python.format(
-            tw(after_instant, 6),
-            tw(within_ramp, 6),
-            tw(after_ramp, 6))
+            tw_cse(after_instant, 'A[i,j] += ({})', 5),
+            tw_cse(within_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(after_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(after_instant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(within_ramp, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_ramp, 'A[i, :] += np.sum({}, axis=1)', 4))
 
 
     mp3 = [(eig, eigs[j]),
@@ -665,12 +1069,16 @@ def EDload_linear(loadtim, loadmag, eigs, tvals, dT=1.0, implementation='vectori
     after_instant = after_instant.subs(mp3)
     after_ramp = after_ramp.subs(mp3)
     within_ramp = within_ramp.subs(mp3)
-    fn2 = text_fortran.format(
-        fcode_one_large_expr(after_instant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(after_ramp, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_ramp, prepend='a(i, j) = a(i, j) + '))
+    declarations, blocks = fcode_cse(
+        [after_instant, after_ramp, within_ramp],
+        prepend='a(i, j) = a(i, j) + ')
+    fn2 = text_fortran.format(*(blocks + [declarations]))
+
+    fn3 = jit_eload_kernel(
+        'edload_linear', 'loadtim, loadmag, eigs, tvals, dT', after_step=after_instant, after_ramp=after_ramp,
+        within_ramp=within_ramp)
 
-    return fn, fn2
+    return fn, fn2, fn3
 
 
 def Eload_coslinear_implementations():
@@ -686,12 +1094,13 @@ def Eload_coslinear_implementations():
 
     Paste the resulting code (at least the loops) into `Eload_coslinear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -700,6 +1109,8 @@ def Eload_coslinear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  needs to be compiled with f2py
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
 
     Notes
@@ -852,16 +1263,16 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({0})
+                    {0}
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({1})
+                    {1}
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({2})
+                    {2}
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({3})
+                    {3}
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
         if MUST_TRY_FORTRAN:
@@ -873,6 +1284,13 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
                 fn = Eload_coslinear
         A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
 
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import eload_coslinear as fn
+        except ImportError:
+            fn = Eload_coslinear
+        A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -887,19 +1305,19 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             k = constants_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({0}, axis=1)
+                {4}
 
             k = constants_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({1}, axis=1)
+                {5}
 
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({2}, axis=1)
+                {6}
 
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({3}, axis=1)
+                {7}
     return A"""
 
 
@@ -923,6 +1341,7 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         REAL(DP), intent(out), dimension(0:nt-1, 0:neig-1) :: a
         INTEGER :: i , j, k
         REAL(DP):: EPSILON
+{4}
         a=0.0D0
         EPSILON = 0.0000005D0
         DO i = 0, nt-1
@@ -975,10 +1394,14 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
 
 
     fn = text_python.format(
-            tw(within_constant, 6),
-            tw(after_constant, 6),
-            tw(within_ramp, 6),
-            tw(after_ramp, 6))
+            tw_cse(within_constant, 'A[i,j] += ({})', 5),
+            tw_cse(after_constant, 'A[i,j] += ({})', 5),
+            tw_cse(within_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(after_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(within_constant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_constant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(within_ramp, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_ramp, 'A[i, :] += np.sum({}, axis=1)', 4))
 
 
     mp3 = [(eig, eigs[j]),
@@ -987,13 +1410,16 @@ def Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
     after_ramp = after_ramp.subs(mp3)
     within_constant = within_constant.subs(mp3)
     within_ramp = within_ramp.subs(mp3)
-    fn2 = text_fortran.format(
-        fcode_one_large_expr(after_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(after_ramp, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_ramp, prepend='a(i, j) = a(i, j) + '))
+    declarations, blocks = fcode_cse(
+        [after_constant, after_ramp, within_constant, within_ramp],
+        prepend='a(i, j) = a(i, j) + ')
+    fn2 = text_fortran.format(*(blocks + [declarations]))
+
+    fn3 = jit_eload_kernel(
+        'eload_coslinear', 'loadtim, loadmag, omega, phase, eigs, tvals, dT', after_constant=after_constant, after_ramp=after_ramp,
+        within_constant=within_constant, within_ramp=within_ramp)
 
-    return fn, fn2
+    return fn, fn2, fn3
 
 def EDload_coslinear_implementations():
     """Code generation for Integration of D[cos(omega*tau+phase)*load(tau), tau] * exp(dT * eig * (t-tau)) between [0, t], where
@@ -1007,12 +1433,13 @@ def EDload_coslinear_implementations():
 
     Paste the resulting code (at least the loops) into `EDload_coslinear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -1021,6 +1448,8 @@ def EDload_coslinear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
         Notes
     -----
@@ -1179,19 +1608,19 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             for k in steps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({0})
+                    {0}
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({1})
+                    {1}
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({2})
+                    {2}
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({3})
+                    {3}
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({4})
+                    {4}
 
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
@@ -1204,6 +1633,13 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
                 fn = EDload_coslinear
         A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
 
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import edload_coslinear as fn
+        except ImportError:
+            fn = EDload_coslinear
+        A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -1220,19 +1656,19 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             k = steps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({0}, axis=1)
+                {5}
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({1}, axis=1)
+                {6}
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({2}, axis=1)
+                {7}
             k = constants_containing_t[i]
             if len(k):
-                A[i,:] += np.sum({3}, axis=1)
+                {8}
             k = constants_less_than_t[i]
             if len(k):
-                A[i,:] += np.sum({4}, axis=1)
+                {9}
     return A"""
 
 
@@ -1256,6 +1692,7 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
         REAL(DP), intent(out), dimension(0:nt-1, 0:neig-1) :: a
         INTEGER :: i , j, k
         REAL(DP):: EPSILON
+{5}
         a=0.0D0
         EPSILON = 0.0000005D0
         DO i = 0, nt-1
@@ -1310,11 +1747,16 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
 
 
     fn = text_python.format(
-            tw(after_instant, 6),
-            tw(within_ramp, 6),
-            tw(after_ramp, 6),
-            tw(within_constant, 6),
-            tw(after_constant, 6))
+            tw_cse(after_instant, 'A[i,j] += ({})', 5),
+            tw_cse(within_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(after_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(within_constant, 'A[i,j] += ({})', 5),
+            tw_cse(after_constant, 'A[i,j] += ({})', 5),
+            tw_cse(after_instant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(within_ramp, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_ramp, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(within_constant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_constant, 'A[i, :] += np.sum({}, axis=1)', 4))
 
 
     mp3 = [(eig, eigs[j]),
@@ -1326,14 +1768,17 @@ def EDload_coslinear(loadtim, loadmag, omega, phase,eigs, tvals, dT=1.0, impleme
     after_constant = after_constant.subs(mp3)
     within_constant = within_constant.subs(mp3)
 
-    fn2 = text_fortran.format(
-        fcode_one_large_expr(after_instant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(after_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(after_ramp, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_ramp, prepend='a(i, j) = a(i, j) + '))
+    declarations, blocks = fcode_cse(
+        [after_instant, after_constant, after_ramp, within_constant, within_ramp],
+        prepend='a(i, j) = a(i, j) + ')
+    fn2 = text_fortran.format(*(blocks + [declarations]))
+
+    fn3 = jit_eload_kernel(
+        'edload_coslinear', 'loadtim, loadmag, omega, phase, eigs, tvals, dT', after_step=after_instant, after_constant=after_constant,
+        after_ramp=after_ramp, within_constant=within_constant,
+        within_ramp=within_ramp)
 
-    return fn, fn2
+    return fn, fn2, fn3
 
 def Eload_sinlinear_implementations():
     """Code generation for Integration of sin(omega*tau+phase)*load(tau) * exp(dT * eig * (t-tau))
@@ -1348,12 +1793,13 @@ def Eload_sinlinear_implementations():
 
     Paste the resulting code (at least the loops) into `Eload_sinlinear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -1362,6 +1808,8 @@ def Eload_sinlinear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  needs to be compiled with f2py
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
 
     Notes
@@ -1519,16 +1967,16 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             for k in constants_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({0})
+                    {0}
             for k in constants_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({1})
+                    {1}
             for k in ramps_containing_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({2})
+                    {2}
             for k in ramps_less_than_t[i]:
                 for j, eig in enumerate(eigs):
-                    A[i,j] += ({3})
+                    {3}
     elif implementation == 'fortran':
         #note than all fortran subroutines are lowercase.
         if MUST_TRY_FORTRAN:
@@ -1540,6 +1988,13 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
                 fn = Eload_sinlinear
         A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
 
+    elif implementation == 'jit':
+        try:
+            from geotecha.speccon.jit_integrals import eload_sinlinear as fn
+        except ImportError:
+            fn = Eload_sinlinear
+        A = fn(loadtim, loadmag, omega, phase, eigs, tvals, dT)
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -1554,19 +2009,19 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         for i, t in enumerate(tvals):
             k = constants_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({0}, axis=1)
+                {4}
 
             k = constants_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({1}, axis=1)
+                {5}
 
             k = ramps_containing_t[i]
             if len(k):
-                A[i, :] += np.sum({2}, axis=1)
+                {6}
 
             k = ramps_less_than_t[i]
             if len(k):
-                A[i, :] += np.sum({3}, axis=1)
+                {7}
     return A"""
 
 
@@ -1590,6 +2045,7 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
         COMPLEX(DP), intent(out), dimension(0:nt-1, 0:neig-1) :: a
         INTEGER :: i , j, k
         REAL(DP):: EPSILON
+{4}
         a=0.0D0
         EPSILON = 0.0000005D0
         DO i = 0, nt-1
@@ -1642,10 +2098,14 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
 
 
     fn = text_python.format(
-            tw(within_constant, 6),
-            tw(after_constant, 6),
-            tw(within_ramp, 6),
-            tw(after_ramp, 6))
+            tw_cse(within_constant, 'A[i,j] += ({})', 5),
+            tw_cse(after_constant, 'A[i,j] += ({})', 5),
+            tw_cse(within_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(after_ramp, 'A[i,j] += ({})', 5),
+            tw_cse(within_constant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_constant, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(within_ramp, 'A[i, :] += np.sum({}, axis=1)', 4),
+            tw_cse(after_ramp, 'A[i, :] += np.sum({}, axis=1)', 4))
 
 
     mp3 = [(eig, eigs[j]),
@@ -1654,13 +2114,18 @@ def Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT=1.0, impleme
     after_ramp = after_ramp.subs(mp3)
     within_constant = within_constant.subs(mp3)
     within_ramp = within_ramp.subs(mp3)
-    fn2 = text_fortran.format(
-        fcode_one_large_expr(after_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(after_ramp, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_constant, prepend='a(i, j) = a(i, j) + '),
-        fcode_one_large_expr(within_ramp, prepend='a(i, j) = a(i, j) + '))
+    declarations, blocks = fcode_cse(
+        [after_constant, after_ramp, within_constant, within_ramp],
+        prepend='a(i, j) = a(i, j) + ',
+        complex_bases=[eigs])
+    fn2 = text_fortran.format(*(blocks + [declarations]))
+
+    fn3 = jit_eload_kernel(
+        'eload_sinlinear', 'loadtim, loadmag, omega, phase, eigs, tvals, dT', dtype='complex128',
+        after_constant=after_constant, after_ramp=after_ramp,
+        within_constant=within_constant, within_ramp=within_ramp)
 
-    return fn, fn2
+    return fn, fn2, fn3
 
 
 
@@ -1880,12 +2345,13 @@ def dim1sin_af_linear_implementations():
 
     Paste the resulting code (at least the loops) into `dim1sin_af_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -1894,6 +2360,8 @@ def dim1sin_af_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     Notes
     -----
@@ -1984,6 +2452,13 @@ def dim1sin_af_linear_implementations():
         except ImportError:
             A = dim1sin_af_linear(m, at, ab, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_af_linear(m, at, ab, zt, zb)
+        except ImportError:
+            A = dim1sin_af_linear(m, at, ab, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2054,7 +2529,10 @@ def dim1sin_af_linear_implementations():
     fn2 = text_fortran.format(fcode_one_large_expr(fdiag_loops, prepend='a(i, i) = a(i, i) + '),
                  fcode_one_large_expr(foff_loops, prepend='a(i, j) = a(i, j) + '))
 
-    return fn, fn2
+    fn3 = jit_symmetric_kernel(
+        'dim1sin_af_linear', 'm, at, ab, zt, zb', ['a'], fdiag_loops, foff_loops)
+
+    return fn, fn2, fn3
 
 
 def dim1sin_abf_linear_implementations():
@@ -2066,12 +2544,13 @@ def dim1sin_abf_linear_implementations():
 
     Paste the resulting code (at least the loops) into `dim1sin_abf_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -2080,6 +2559,8 @@ def dim1sin_abf_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     Notes
     -----
@@ -2174,6 +2655,13 @@ def dim1sin_abf_linear_implementations():
             except ImportError:
                 A = dim1sin_abf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_abf_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_abf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2252,7 +2740,10 @@ def dim1sin_abf_linear_implementations():
     fn2 = text_fortran.format(fcode_one_large_expr(fdiag_loops, prepend='a(i, i) = a(i, i) + '),
                  fcode_one_large_expr(foff_loops, prepend='a(i, j) = a(i, j) + '))
 
-    return fn, fn2
+    fn3 = jit_symmetric_kernel(
+        'dim1sin_abf_linear', 'm, at, ab, bt, bb, zt, zb', ['a', 'b'], fdiag_loops, foff_loops)
+
+    return fn, fn2, fn3
 
 
 def dim1sin_D_aDf_linear_implementations():
@@ -2265,12 +2756,13 @@ def dim1sin_D_aDf_linear_implementations():
 
     Paste the resulting code (at least the loops) into `dim1sin_abf_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -2279,6 +2771,8 @@ def dim1sin_D_aDf_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     See Also
     --------
@@ -2394,6 +2888,13 @@ def dim1sin_D_aDf_linear_implementations():
             except ImportError:
                 A = dim1sin_D_aDf_linear(m, at, ab, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_d_adf_linear(m, at, ab, zt, zb)
+        except ImportError:
+            A = dim1sin_D_aDf_linear(m, at, ab, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2464,7 +2965,10 @@ def dim1sin_D_aDf_linear_implementations():
     fn2 = text_fortran.format(fcode_one_large_expr(fdiag_loops, prepend='a(i, i) = a(i, i) + '),
                  fcode_one_large_expr(foff_loops, prepend='a(i, j) = a(i, j) + '))
 
-    return fn, fn2
+    fn3 = jit_symmetric_kernel(
+        'dim1sin_d_adf_linear', 'm, at, ab, zt, zb', ['a'], fdiag_loops, foff_loops)
+
+    return fn, fn2, fn3
 
 
 def dim1sin_ab_linear_implementations():
@@ -2477,12 +2981,13 @@ def dim1sin_ab_linear_implementations():
 
     Paste the resulting code (at least the loops) into `dim1sin_ab_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -2491,6 +2996,8 @@ def dim1sin_ab_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     See Also
     --------
@@ -2585,6 +3092,13 @@ def dim1sin_ab_linear_implementations():
             except ImportError:
                 A = dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2634,7 +3148,10 @@ def dim1sin_ab_linear_implementations():
     fn = text_python.format(tw(fcol_loops,5), tw(fcol_vector,3))
     fn2 = text_fortran.format(fcode_one_large_expr(fcol_loops, prepend='a(i) = a(i) + '))
 
-    return fn, fn2
+    fn3 = jit_column_kernel(
+        'dim1sin_ab_linear', 'm, at, ab, bt, bb, zt, zb', ['a', 'b'], fcol_loops)
+
+    return fn, fn2, fn3
 
 
 def dim1sin_abc_linear_implementations():
@@ -2646,12 +3163,13 @@ def dim1sin_abc_linear_implementations():
 
     Paste the resulting code (at least the loops) into `dim1sin_abc_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -2660,6 +3178,8 @@ def dim1sin_abc_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     See Also
     --------
@@ -2743,6 +3263,13 @@ def dim1sin_abc_linear_implementations():
             except ImportError:
                 A = dim1sin_abc_linear(m, at, ab, bt, bb,  ct, cb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_abc_linear(m, at, ab, bt, bb, ct, cb, zt, zb)
+        except ImportError:
+            A = dim1sin_abc_linear(m, at, ab, bt, bb, ct, cb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -2797,7 +3324,10 @@ def dim1sin_abc_linear_implementations():
     fn = text_python.format(tw(fcol_loops,5), tw(fcol_vector,3))
     fn2 = text_fortran.format(fcode_one_large_expr(fcol_loops, prepend='a(i) = a(i) + '))
 
-    return fn, fn2
+    fn3 = jit_column_kernel(
+        'dim1sin_abc_linear', 'm, at, ab, bt, bb, ct, cb, zt, zb', ['a', 'b', 'c'], fcol_loops)
+
+    return fn, fn2, fn3
 
 
 def dim1sin_D_aDb_linear_implementations():
@@ -2810,12 +3340,13 @@ def dim1sin_D_aDb_linear_implementations():
 
     Paste the resulting code (at least the loops) into `dim1sin_D_aDb_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
 
     .. warning::
@@ -2833,6 +3364,8 @@ def dim1sin_D_aDb_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     See Also
     --------
@@ -2959,6 +3492,13 @@ def dim1sin_D_aDb_linear_implementations():
             except ImportError:
                 A = dim1sin_D_aDb_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_d_adb_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_D_aDb_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -3013,7 +3553,11 @@ def dim1sin_D_aDb_linear_implementations():
     fn2 = text_fortran.format(fcode_one_large_expr(fcol_loops, prepend='a(i) = a(i) + '),
                               fcode_one_large_expr(fends_loops, prepend='a(i) = a(i) + '))
 
-    return fn, fn2
+    fn3 = jit_column_kernel(
+        'dim1sin_d_adb_linear', 'm, at, ab, bt, bb, zt, zb', ['a', 'b'], fcol_loops,
+        fends=fends_loops)
+
+    return fn, fn2, fn3
 
 
 def dim1sin_a_linear_between():
@@ -3356,12 +3900,13 @@ def dim1sin_DD_abDDf_linear_implementations():
 
     Paste the resulting code (at least the loops) into `dim1sin_abf_linear`.
 
-    Creates three implementations:
+    Creates four implementations:
 
      - 'scalar', python loops (slowest).
      - 'vectorized', numpy (much faster than scalar).
      - 'fortran', fortran loops (fastest).  Needs to be compiled and interfaced
        with f2py.
+     - 'jit', numba loop kernel.  Near fortran speed without a compiler.
 
     Returns
     -------
@@ -3370,6 +3915,8 @@ def dim1sin_DD_abDDf_linear_implementations():
         also calls the fortran version.
     fn2 : string
         Fortran code.  Needs to be compiled with f2py.
+    fn3 : string
+        Numba JIT kernel code. See `jit_integrals_module`.
 
     See Also
     --------
@@ -3493,6 +4040,13 @@ def dim1sin_DD_abDDf_linear_implementations():
             except ImportError:
                 A = dim1sin_DD_abDDf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
 
+    elif implementation == 'jit':
+        try:
+            import geotecha.speccon.jit_integrals as jit_integ
+            A = jit_integ.dim1sin_dd_abddf_linear(m, at, ab, bt, bb, zt, zb)
+        except ImportError:
+            A = dim1sin_DD_abDDf_linear(m, at, ab, bt, bb, zt, zb, implementation='vectorized')
+
     else:#default is 'vectorized' using numpy
         sin = np.sin
         cos = np.cos
@@ -3565,7 +4119,78 @@ def dim1sin_DD_abDDf_linear_implementations():
     fn2 = text_fortran.format(fcode_one_large_expr(fdiag_loops, prepend='a(i, i) = a(i, i) + '),
                  fcode_one_large_expr(foff_loops, prepend='a(i, j) = a(i, j) + '))
 
-    return fn, fn2
+    fn3 = jit_symmetric_kernel(
+        'dim1sin_dd_abddf_linear', 'm, at, ab, bt, bb, zt, zb', ['a', 'b'], fdiag_loops, foff_loops)
+
+    return fn, fn2, fn3
+
+
+def jit_integrals_module():
+    """Code for the geotecha.speccon.jit_integrals module
+
+    Collects the numba JIT kernels (the `fn3` output) of all the
+    *_implementations functions into one module.  The kernels have the
+    same names and call signatures as the f2py wrapped fortran subroutines
+    in ext_integrals.
+
+    Returns
+    -------
+    out : string
+        Python code for jit_integrals.py.
+
+    """
+
+    header = '''\
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+"""Numba JIT compiled loop kernels used by geotecha.speccon.integrals
+with implementation='jit'.
+
+Generated by geotecha.speccon.integrals_generate_code.jit_integrals_module,
+do not edit by hand.  Kernel names and call signatures are the same as
+the fortran subroutines in ext_integrals.  Importing this module raises
+ImportError if numba is not installed.
+
+"""
+
+from __future__ import division, print_function
+
+import numpy as np
+import numba
+
+sin = np.sin
+cos = np.cos
+exp = np.exp
+'''
+
+    generators = [dim1sin_af_linear_implementations,
+                  dim1sin_abf_linear_implementations,
+                  dim1sin_D_aDf_linear_implementations,
+                  dim1sin_ab_linear_implementations,
+                  dim1sin_abc_linear_implementations,
+                  dim1sin_D_aDb_linear_implementations,
+                  dim1sin_DD_abDDf_linear_implementations,
+                  Eload_linear_implementations,
+                  EDload_linear_implementations,
+                  Eload_coslinear_implementations,
+                  EDload_coslinear_implementations,
+                  Eload_sinlinear_implementations]
+
+    kernels = [f()[2] for f in generators]
+    return (os.linesep * 3).join([header.rstrip()] + kernels) + os.linesep
 
 
 
@@ -3575,18 +4200,19 @@ if __name__ == '__main__':
 #    nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
 #    nose.runmodule(argv=['nose', '--verbosity=3'])
 
-#    fn, fn2=Eload_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=EDload_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=Eload_coslinear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=EDload_coslinear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=dim1sin_af_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=dim1sin_abf_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=dim1sin_D_aDf_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=dim1sin_ab_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=dim1sin_abc_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=dim1sin_D_aDb_linear_implementations();print(fn);print('#'*40); print(fn2)
-#    fn, fn2=dim1sin_DD_abDDf_linear_implementations();print(fn);print('#'*40); print(fn2)
-    fn, fn2=Eload_sinlinear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=Eload_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=EDload_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=Eload_coslinear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=EDload_coslinear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=dim1sin_af_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=dim1sin_abf_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=dim1sin_D_aDf_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=dim1sin_ab_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=dim1sin_abc_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=dim1sin_D_aDb_linear_implementations();print(fn);print('#'*40); print(fn2)
+#    fn, fn2, fn3=dim1sin_DD_abDDf_linear_implementations();print(fn);print('#'*40); print(fn2)
+    fn, fn2, fn3=Eload_sinlinear_implementations();print(fn);print('#'*40); print(fn2)
+#    print(jit_integrals_module())
 #    print(dim1sin_a_linear_between())
 #    print(dim1_ab_linear_between())
 
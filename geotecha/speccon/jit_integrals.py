@@ -0,0 +1,1316 @@
+# geotecha - A software suite for geotechncial engineering
+# Copyright (C) 2018  Rohan T. Walker (rtrwalker@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see http://www.gnu.org/licenses/gpl.html.
+"""Numba JIT compiled loop kernels used by geotecha.speccon.integrals
+with implementation='jit'.
+
+Generated by geotecha.speccon.integrals_generate_code.jit_integrals_module,
+do not edit by hand.  Kernel names and call signatures are the same as
+the fortran subroutines in ext_integrals.  Importing this module raises
+ImportError if numba is not installed.
+
+"""
+
+from __future__ import division, print_function
+
+import numpy as np
+import numba
+
+sin = np.sin
+cos = np.cos
+exp = np.exp
+
+
+@numba.njit(parallel=True, cache=True)
+def dim1sin_af_linear(m, at, ab, zt, zb):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros((neig, neig))
+    for j in numba.prange(neig):
+        for layer in range(nlayers):
+            a_slope = (ab[layer] - at[layer]) / (zb[layer] - zt[layer])
+            i = j
+            x0 = m[i]*zt[layer]
+            x1 = sin(x0)
+            x2 = x1**2
+            x3 = 2*at[layer]
+            x4 = x3*zt[layer]
+            x5 = cos(x0)
+            x6 = x5**2
+            x7 = m[i]*zb[layer]
+            x8 = sin(x7)
+            x9 = x8**2
+            x10 = x3*zb[layer]
+            x11 = cos(x7)
+            x12 = x11**2
+            x13 = a_slope*zt[layer]**2
+            x14 = a_slope*zb[layer]**2
+            x15 = a_slope/m[i]**2
+            x16 = 2*a_slope*zb[layer]
+            x17 = x16*zt[layer]
+            x18 = 1/m[i]
+            x19 = x18*x3
+            x20 = x11*x8
+            x21 = x18*x20
+            a[i, i] += (a_slope*x21*zt[layer]/2 + x1*x19*x5/4 + x10*x12/4 + x10*x9/4 + x12*x14/4 - x12*x17/4 + x13*x2/4 +
+                        x13*x6/4 + x14*x9/4 - x15*x2/4 + x15*x9/4 - x16*x21/4 - x17*x9/4 - x19*x20/4
+                        - x2*x4/4 - x4*x6/4)
+            for i in range(j + 1, neig):
+                x0 = m[j]**2
+                x1 = m[i]**2
+                x2 = a_slope*x0
+                x3 = m[j]*zb[layer]
+                x4 = sin(x3)
+                x5 = m[i]*zb[layer]
+                x6 = sin(x5)
+                x7 = x4*x6
+                x8 = m[j]**3
+                x9 = x8*at[layer]
+                x10 = m[j]*zt[layer]
+                x11 = cos(x10)
+                x12 = m[i]*zt[layer]
+                x13 = sin(x12)
+                x14 = x11*x13
+                x15 = a_slope*x1
+                x16 = m[i]**3
+                x17 = x16*at[layer]
+                x18 = cos(x12)
+                x19 = sin(x10)
+                x20 = x18*x19
+                x21 = 2*a_slope*m[i]*m[j]
+                x22 = cos(x3)
+                x23 = cos(x5)
+                x24 = x13*x19
+                x25 = x22*x6
+                x26 = x23*x4
+                x27 = x0*at[layer]*m[i]
+                x28 = a_slope*zt[layer]
+                x29 = x25*x8
+                x30 = x1*at[layer]*m[j]
+                x31 = x16*x26
+                x32 = a_slope*zb[layer]
+                x33 = x2*x26
+                x34 = x15*x25
+                a[i, j] += ((-x10*x34 - x11*x18*x21 - x12*x33 - x14*x30 + x14*x9 - x15*x24 + x15*x7 + x17*x20 - x17*x26 - x2*x24
+                        + x2*x7 - x20*x27 + x21*x22*x23 + x25*x30 - x25*x9 + x26*x27 + x28*x29 +
+                        x28*x31 - x29*x32 + x3*x34 - x31*x32 + x33*x5)/(-2*x0*x1 + m[i]**4 +
+                        m[j]**4))
+    for j in range(neig - 1):
+        for i in range(j + 1, neig):
+            a[j, i] = a[i, j]
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def dim1sin_abf_linear(m, at, ab, bt, bb, zt, zb):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros((neig, neig))
+    for j in numba.prange(neig):
+        for layer in range(nlayers):
+            a_slope = (ab[layer] - at[layer]) / (zb[layer] - zt[layer])
+            b_slope = (bb[layer] - bt[layer]) / (zb[layer] - zt[layer])
+            i = j
+            x0 = zt[layer]/2
+            x1 = x0*at[layer]
+            x2 = m[i]*zt[layer]
+            x3 = sin(x2)
+            x4 = x3**2
+            x5 = x4*bt[layer]
+            x6 = cos(x2)
+            x7 = x6**2
+            x8 = x7*bt[layer]
+            x9 = zb[layer]/2
+            x10 = x9*at[layer]
+            x11 = m[i]*zb[layer]
+            x12 = sin(x11)
+            x13 = x12**2
+            x14 = x13*bt[layer]
+            x15 = cos(x11)
+            x16 = x15**2
+            x17 = x16*bt[layer]
+            x18 = b_slope*x10
+            x19 = x18*zt[layer]
+            x20 = a_slope*x14
+            x21 = x9*zt[layer]
+            x22 = a_slope*x17
+            x23 = b_slope*x4
+            x24 = x23*at[layer]
+            x25 = zt[layer]**2
+            x26 = x25/4
+            x27 = b_slope*x7
+            x28 = a_slope*x5
+            x29 = a_slope*zt[layer]**3/6
+            x30 = zb[layer]**2
+            x31 = x30/4
+            x32 = b_slope*at[layer]
+            x33 = x31*x32
+            x34 = zb[layer]**3/6
+            x35 = a_slope*b_slope
+            x36 = x13*x35
+            x37 = x16*x35
+            x38 = m[i]**(-2)
+            x39 = x38/4
+            x40 = x13*x39
+            x41 = x25*x9
+            x42 = x0*x30
+            x43 = a_slope*x39*zt[layer]
+            x44 = x35*zb[layer]
+            x45 = x3*x6
+            x46 = x35/(4*m[i]**3)
+            x47 = x12*x15
+            x48 = 1/m[i]
+            x49 = x48*bt[layer]
+            x50 = x49*at[layer]/2
+            x51 = x47*x48
+            x52 = a_slope*x47*x49
+            x53 = x35*x51/2
+            a[i, i] += (a_slope*x26*x8 + b_slope*x1*x51 - x0*x36*x38 + x0*x52 - x1*x5 - x1*x8 + x10*x14 + x10*x17 - x13*x19
+                        + x13*x33 - x16*x19 + x16*x33 - x18*x51 - x20*x21 + x20*x31 + x20*x39 -
+                        x21*x22 + x22*x31 - x23*x29 + x23*x43 + x24*x26 - x24*x39 - x25*x53 +
+                        x26*x27*at[layer] + x26*x28 - x27*x29 + x27*x43 - x28*x39 - x30*x53 +
+                        x32*x40 + x34*x36 + x34*x37 + x36*x41 - x36*x42 - x37*x39*zb[layer] +
+                        x37*x41 - x37*x42 + x40*x44 + x44*x51*zt[layer] - x45*x46 + x45*x50 +
+                        x46*x47 - x47*x50 - x52*x9)
+            for i in range(j + 1, neig):
+                x0 = m[j]**2
+                x1 = m[i]**4
+                x2 = m[j]**4
+                x3 = m[i]**2
+                x4 = m[j]*zt[layer]
+                x5 = sin(x4)
+                x6 = m[i]*zt[layer]
+                x7 = sin(x6)
+                x8 = x5*x7
+                x9 = x2*x8
+                x10 = b_slope*at[layer]
+                x11 = a_slope*bt[layer]
+                x12 = m[i]*zb[layer]
+                x13 = sin(x12)
+                x14 = m[j]*zb[layer]
+                x15 = cos(x14)
+                x16 = x13*x15
+                x17 = m[j]**5
+                x18 = at[layer]*bt[layer]
+                x19 = x17*x18
+                x20 = sin(x14)
+                x21 = x13*x20
+                x22 = x10*x21
+                x23 = x1*x11
+                x24 = m[i]**5
+                x25 = x18*x24
+                x26 = cos(x6)
+                x27 = x26*x5
+                x28 = a_slope*b_slope
+                x29 = cos(x4)
+                x30 = x29*x7
+                x31 = m[j]**3
+                x32 = 2*x31
+                x33 = x30*x32
+                x34 = x16*x28
+                x35 = x32*x34
+                x36 = x2*x21
+                x37 = x27*x28
+                x38 = m[i]**3
+                x39 = 2*x38
+                x40 = cos(x12)
+                x41 = x20*x40
+                x42 = x28*x41
+                x43 = x39*x42
+                x44 = x1*x10
+                x45 = x18*x27
+                x46 = x2*m[i]
+                x47 = x16*x17
+                x48 = x10*x47
+                x49 = x11*zb[layer]
+                x50 = x16*x18
+                x51 = x1*m[j]
+                x52 = x24*x41
+                x53 = x10*x52
+                x54 = x11*zt[layer]
+                x55 = 6*x0*m[i]
+                x56 = x26*x29
+                x57 = x32*m[i]
+                x58 = x10*x57
+                x59 = x15*x40
+                x60 = x11*x57
+                x61 = x18*x41
+                x62 = 2*x28
+                x63 = x36*x62
+                x64 = 6*m[j]
+                x65 = x3*x34
+                x66 = x39*m[j]
+                x67 = x10*x66
+                x68 = x11*x66
+                x69 = x1*x21*x62
+                x70 = x2*x41
+                x71 = x6*x70
+                x72 = x14*x16
+                x73 = zt[layer]**2
+                x74 = x17*x34
+                x75 = zb[layer]**2
+                x76 = 4*x31
+                x77 = x28*x59
+                x78 = x76*x77
+                x79 = x12*x70
+                x80 = zb[layer]*zt[layer]
+                x81 = 2*x80
+                x82 = 4*x38
+                x83 = x77*x82
+                x84 = x16*x4
+                x85 = x24*x42
+                x86 = x0*x39
+                x87 = x3*x32
+                x88 = x34*x51
+                x89 = 2*zb[layer]
+                x90 = x42*x46
+                x91 = x41*x86
+                x92 = x10*x91
+                x93 = x16*x87
+                x94 = x10*x93
+                x95 = x0*x43
+                x96 = x3*x35
+                a[i, j] += ((-x0*x42*x80*x82 + x1*x22 - x1*x34*x4*x89 + x10*x71 - x10*x79 + x10*x9 - x11*x36 + x11*x71 - x11*x79
+                        + x11*x9 - x12*x78 + x14*x83 + x16*x19 + x18*x3*x33 - x18*x30*x51 - x19*x30
+                        - x2*x22 + x2*x42*x6*x89 + x21*x23 + x23*x72 - x23*x8 - x23*x84 + x25*x27 -
+                        x25*x41 + x28*x3*x30*x64 + x28*x33 - x35 - x37*x39 - x37*x55 - x4*x83 +
+                        x42*x55 + x43 + x44*x72 - x44*x8 - x44*x84 + x45*x46 - x45*x86 - x46*x61 +
+                        x47*x49 - x47*x54 + x48*zb[layer] - x48*zt[layer] - x49*x52 + x49*x91 -
+                        x49*x93 + x50*x51 - x50*x87 + x52*x54 - x53*zb[layer] + x53*zt[layer] -
+                        x54*x91 + x54*x93 + x56*x58 + x56*x60 - x56*x67 - x56*x68 - x58*x59 -
+                        x59*x60 + x59*x67 + x59*x68 + x6*x78 + x61*x86 - x63*zb[layer] +
+                        x63*zt[layer] - x64*x65 + x65*x76*x80 + x69*zb[layer] - x69*zt[layer] +
+                        x73*x74 - x73*x85 + x73*x88 - x73*x90 + x73*x95 - x73*x96 + x74*x75 -
+                        x74*x81 - x75*x85 + x75*x88 - x75*x90 + x75*x95 - x75*x96 + x81*x85 +
+                        x92*zb[layer] - x92*zt[layer] - x94*zb[layer] + x94*zt[layer])/(-3*x0*x1 +
+                        3*x2*x3 + m[i]**6 - m[j]**6))
+    for j in range(neig - 1):
+        for i in range(j + 1, neig):
+            a[j, i] = a[i, j]
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def dim1sin_d_adf_linear(m, at, ab, zt, zb):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros((neig, neig))
+    for j in numba.prange(neig):
+        for layer in range(nlayers):
+            a_slope = (ab[layer] - at[layer]) / (zb[layer] - zt[layer])
+            i = j
+            x0 = m[i]**2
+            x1 = m[i]*zt[layer]
+            x2 = sin(x1)
+            x3 = x2**2
+            x4 = 2*at[layer]
+            x5 = x4*zt[layer]
+            x6 = cos(x1)
+            x7 = x6**2
+            x8 = m[i]*zb[layer]
+            x9 = sin(x8)
+            x10 = x9**2
+            x11 = x4*zb[layer]
+            x12 = cos(x8)
+            x13 = x12**2
+            x14 = a_slope/x0
+            x15 = 2*a_slope*zb[layer]
+            x16 = x15*zt[layer]
+            x17 = a_slope*zt[layer]**2
+            x18 = a_slope*zb[layer]**2
+            x19 = 1/m[i]
+            x20 = x19*x4
+            x21 = x12*x9
+            x22 = x19*x21
+            a[i, i] += (x0*(2*a_slope*x22*zt[layer] - x10*x11 + x10*x14 + x10*x16 - x10*x18 - x11*x13 + x13*x16 - x13*x18 -
+                        x14*x3 - x15*x22 - x17*x3 - x17*x7 + x2*x20*x6 - x20*x21 + x3*x5 + x5*x7)/4)
+            for i in range(j + 1, neig):
+                x0 = m[j]**2
+                x1 = m[i]**2
+                x2 = a_slope*x0
+                x3 = m[j]*zt[layer]
+                x4 = cos(x3)
+                x5 = m[i]*zt[layer]
+                x6 = cos(x5)
+                x7 = x4*x6
+                x8 = m[j]**3
+                x9 = x8*at[layer]
+                x10 = sin(x3)
+                x11 = x10*x6
+                x12 = a_slope*x1
+                x13 = m[i]**3
+                x14 = x13*at[layer]
+                x15 = sin(x5)
+                x16 = x15*x4
+                x17 = m[i]*m[j]
+                x18 = 2*a_slope*x17
+                x19 = m[j]*zb[layer]
+                x20 = sin(x19)
+                x21 = m[i]*zb[layer]
+                x22 = sin(x21)
+                x23 = cos(x19)
+                x24 = cos(x21)
+                x25 = x23*x24
+                x26 = x20*x24
+                x27 = x22*x23
+                x28 = x0*at[layer]*m[i]
+                x29 = a_slope*zt[layer]
+                x30 = x26*x8
+                x31 = x1*at[layer]*m[j]
+                x32 = x13*x27
+                x33 = a_slope*zb[layer]
+                x34 = x2*x27
+                x35 = x12*x26
+                a[i, j] += (x17*(x10*x15*x18 - x11*x31 + x11*x9 - x12*x25 + x12*x7 + x14*x16 - x14*x27 - x16*x28 - x18*x20*x22 +
+                        x19*x35 - x2*x25 + x2*x7 + x21*x34 + x26*x31 - x26*x9 + x27*x28 + x29*x30 +
+                        x29*x32 - x3*x35 - x30*x33 - x32*x33 - x34*x5)/(-2*x0*x1 + m[i]**4 +
+                        m[j]**4))
+    for j in range(neig - 1):
+        for i in range(j + 1, neig):
+            a[j, i] = a[i, j]
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def dim1sin_ab_linear(m, at, ab, bt, bb, zt, zb):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros(neig)
+    for i in numba.prange(neig):
+        for layer in range(nlayers):
+            a_slope = (ab[layer] - at[layer]) / (zb[layer] - zt[layer])
+            b_slope = (bb[layer] - bt[layer]) / (zb[layer] - zt[layer])
+            x0 = 1/m[i]
+            x1 = m[i]*zt[layer]
+            x2 = cos(x1)
+            x3 = at[layer]*bt[layer]
+            x4 = m[i]*zb[layer]
+            x5 = cos(x4)
+            x6 = x5*zt[layer]
+            x7 = b_slope*at[layer]
+            x8 = a_slope*bt[layer]
+            x9 = x5*zb[layer]
+            x10 = x0*sin(x4)
+            x11 = a_slope*b_slope
+            x12 = 2*x11
+            x13 = x11*x5
+            x14 = 2/m[i]**2
+            x15 = x0*sin(x1)
+            x16 = x10*x12
+            a[i] += (x0*(x10*x7 + x10*x8 - x11*x14*x2 + x12*x6*zb[layer] + x13*x14 - x13*zb[layer]**2 - x13*zt[layer]**2
+                        - x15*x7 - x15*x8 + x16*zb[layer] - x16*zt[layer] + x2*x3 - x3*x5 + x6*x7 +
+                        x6*x8 - x7*x9 - x8*x9))
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def dim1sin_abc_linear(m, at, ab, bt, bb, ct, cb, zt, zb):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros(neig)
+    for i in numba.prange(neig):
+        for layer in range(nlayers):
+            a_slope = (ab[layer] - at[layer]) / (zb[layer] - zt[layer])
+            b_slope = (bb[layer] - bt[layer]) / (zb[layer] - zt[layer])
+            c_slope = (cb[layer] - ct[layer]) / (zb[layer] - zt[layer])
+            x0 = 1/m[i]
+            x1 = bt[layer]*ct[layer]
+            x2 = m[i]*zt[layer]
+            x3 = cos(x2)
+            x4 = x3*at[layer]
+            x5 = m[i]*zb[layer]
+            x6 = cos(x5)
+            x7 = x1*x6
+            x8 = b_slope*x6
+            x9 = at[layer]*ct[layer]
+            x10 = x8*x9
+            x11 = x6*bt[layer]
+            x12 = c_slope*at[layer]
+            x13 = x12*zt[layer]
+            x14 = a_slope*x7
+            x15 = x12*zb[layer]
+            x16 = a_slope*c_slope
+            x17 = x16*x8
+            x18 = sin(x5)
+            x19 = x0*x18
+            x20 = b_slope*x19
+            x21 = x19*bt[layer]
+            x22 = a_slope*x1
+            x23 = 2*zb[layer]
+            x24 = a_slope*ct[layer]
+            x25 = 2*zt[layer]
+            x26 = x25*zb[layer]
+            x27 = x11*x16
+            x28 = zt[layer]**2
+            x29 = x28*x8
+            x30 = zb[layer]**2
+            x31 = x30*x8
+            x32 = sin(x2)
+            x33 = 6*x16
+            x34 = b_slope*x33/m[i]**3
+            x35 = m[i]**(-2)
+            x36 = 2*x35
+            x37 = x36*x8
+            x38 = x3*x36
+            x39 = x0*x32
+            x40 = 3*x28
+            x41 = x17*zb[layer]
+            x42 = x17*zt[layer]
+            x43 = 3*x30
+            x44 = 6*x35
+            x45 = 2*x20
+            x46 = x20*x24
+            x47 = x16*x21
+            x48 = x16*x20
+            a[i] += (x0*(-b_slope*c_slope*x36*x4 - b_slope*x24*x38 - b_slope*x39*x9 + x1*x4 - x10*zb[layer] +
+                        x10*zt[layer] + x11*x13 - x11*x15 + x12*x21 - x12*x29 - x12*x31 + x12*x37 -
+                        x12*x39*bt[layer] + x13*x23*x8 - x13*x45 - x14*zb[layer] + x14*zt[layer] +
+                        x15*x45 - x16*x38*bt[layer] - x17*zb[layer]**3 + x17*zt[layer]**3 - x18*x34
+                        + x19*x22 - x20*x33*zb[layer]*zt[layer] + x20*x9 - x22*x39 + x23*x46 +
+                        x23*x47 + x24*x26*x8 - x24*x29 - x24*x31 + x24*x37 - x25*x46 - x25*x47 +
+                        x26*x27 - x27*x28 - x27*x30 + x27*x36 + x32*x34 - x40*x41 + x40*x48 +
+                        x41*x44 + x42*x43 - x42*x44 + x43*x48 - x7*at[layer]))
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def dim1sin_d_adb_linear(m, at, ab, bt, bb, zt, zb):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros(neig)
+    for i in numba.prange(neig):
+        for layer in range(nlayers):
+            a_slope = (ab[layer] - at[layer]) / (zb[layer] - zt[layer])
+            b_slope = (bb[layer] - bt[layer]) / (zb[layer] - zt[layer])
+            x0 = m[i]*zt[layer]
+            x1 = m[i]*zb[layer]
+            x2 = sin(x1)
+            x3 = a_slope*x2
+            x4 = a_slope/m[i]
+            a[i] += (b_slope*(-x2*at[layer] - x3*zb[layer] + x3*zt[layer] + x4*cos(x0) - x4*cos(x1) + sin(x0)*at[layer]))
+        a[i] += (-(bb[0] - bt[0])*sin(m[i]*zt[0])*at[0]/(zb[0] - zt[0]) + (bb[nlayers - 1] - bt[nlayers -
+                        1])*sin(m[i]*zb[nlayers - 1])*ab[nlayers - 1]/(zb[nlayers - 1] - zt[nlayers
+                        - 1]))
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def dim1sin_dd_abddf_linear(m, at, ab, bt, bb, zt, zb):
+    neig = len(m)
+    nlayers = len(zt)
+    a = np.zeros((neig, neig))
+    for j in numba.prange(neig):
+        for layer in range(nlayers):
+            a_slope = (ab[layer] - at[layer]) / (zb[layer] - zt[layer])
+            b_slope = (bb[layer] - bt[layer]) / (zb[layer] - zt[layer])
+            i = j
+            x0 = zt[layer]/2
+            x1 = x0*at[layer]
+            x2 = m[i]*zt[layer]
+            x3 = sin(x2)
+            x4 = x3**2
+            x5 = x4*bt[layer]
+            x6 = cos(x2)
+            x7 = x6**2
+            x8 = x7*bt[layer]
+            x9 = zb[layer]/2
+            x10 = x9*at[layer]
+            x11 = m[i]*zb[layer]
+            x12 = sin(x11)
+            x13 = x12**2
+            x14 = x13*bt[layer]
+            x15 = cos(x11)
+            x16 = x15**2
+            x17 = x16*bt[layer]
+            x18 = b_slope*x10
+            x19 = x18*zt[layer]
+            x20 = a_slope*x14
+            x21 = x9*zt[layer]
+            x22 = a_slope*x17
+            x23 = b_slope*x4
+            x24 = x23*at[layer]
+            x25 = zt[layer]**2
+            x26 = x25/4
+            x27 = b_slope*x7
+            x28 = a_slope*x5
+            x29 = a_slope*zt[layer]**3/6
+            x30 = zb[layer]**2
+            x31 = x30/4
+            x32 = b_slope*at[layer]
+            x33 = x31*x32
+            x34 = zb[layer]**3/6
+            x35 = a_slope*b_slope
+            x36 = x13*x35
+            x37 = x16*x35
+            x38 = m[i]**(-2)
+            x39 = x38/4
+            x40 = x13*x39
+            x41 = x25*x9
+            x42 = x0*x30
+            x43 = a_slope*x39*zt[layer]
+            x44 = x35*zb[layer]
+            x45 = x3*x6
+            x46 = x35/(4*m[i]**3)
+            x47 = x12*x15
+            x48 = 1/m[i]
+            x49 = x48*bt[layer]
+            x50 = x49*at[layer]/2
+            x51 = x47*x48
+            x52 = a_slope*x47*x49
+            x53 = x35*x51/2
+            a[i, i] += ((a_slope*x26*x8 + b_slope*x1*x51 - x0*x36*x38 + x0*x52 - x1*x5 - x1*x8 + x10*x14 + x10*x17 - x13*x19
+                        + x13*x33 - x16*x19 + x16*x33 - x18*x51 - x20*x21 + x20*x31 + x20*x39 -
+                        x21*x22 + x22*x31 - x23*x29 + x23*x43 + x24*x26 - x24*x39 - x25*x53 +
+                        x26*x27*at[layer] + x26*x28 - x27*x29 + x27*x43 - x28*x39 - x30*x53 +
+                        x32*x40 + x34*x36 + x34*x37 + x36*x41 - x36*x42 - x37*x39*zb[layer] +
+                        x37*x41 - x37*x42 + x40*x44 + x44*x51*zt[layer] - x45*x46 + x45*x50 +
+                        x46*x47 - x47*x50 - x52*x9)*m[i]**4)
+            for i in range(j + 1, neig):
+                x0 = m[j]**2
+                x1 = m[i]**2
+                x2 = m[i]**4
+                x3 = m[j]**4
+                x4 = m[j]*zt[layer]
+                x5 = sin(x4)
+                x6 = m[i]*zt[layer]
+                x7 = sin(x6)
+                x8 = x5*x7
+                x9 = x3*x8
+                x10 = b_slope*at[layer]
+                x11 = a_slope*bt[layer]
+                x12 = m[i]*zb[layer]
+                x13 = sin(x12)
+                x14 = m[j]*zb[layer]
+                x15 = cos(x14)
+                x16 = x13*x15
+                x17 = m[j]**5
+                x18 = at[layer]*bt[layer]
+                x19 = x17*x18
+                x20 = sin(x14)
+                x21 = x13*x20
+                x22 = x10*x21
+                x23 = x11*x2
+                x24 = m[i]**5
+                x25 = x18*x24
+                x26 = cos(x6)
+                x27 = x26*x5
+                x28 = a_slope*b_slope
+                x29 = cos(x4)
+                x30 = x29*x7
+                x31 = m[j]**3
+                x32 = 2*x31
+                x33 = x30*x32
+                x34 = x16*x28
+                x35 = x32*x34
+                x36 = x21*x3
+                x37 = x27*x28
+                x38 = m[i]**3
+                x39 = 2*x38
+                x40 = cos(x12)
+                x41 = x20*x40
+                x42 = x28*x41
+                x43 = x39*x42
+                x44 = x10*x2
+                x45 = x18*x27
+                x46 = x3*m[i]
+                x47 = x16*x17
+                x48 = x10*x47
+                x49 = x11*zb[layer]
+                x50 = x16*x18
+                x51 = x2*m[j]
+                x52 = x24*x41
+                x53 = x10*x52
+                x54 = x11*zt[layer]
+                x55 = 6*x0*m[i]
+                x56 = x26*x29
+                x57 = x32*m[i]
+                x58 = x10*x57
+                x59 = x15*x40
+                x60 = x11*x57
+                x61 = x18*x41
+                x62 = 2*x28
+                x63 = x36*x62
+                x64 = 6*m[j]
+                x65 = x1*x34
+                x66 = x39*m[j]
+                x67 = x10*x66
+                x68 = x11*x66
+                x69 = x2*x21*x62
+                x70 = x3*x41
+                x71 = x6*x70
+                x72 = x14*x16
+                x73 = zt[layer]**2
+                x74 = x17*x34
+                x75 = zb[layer]**2
+                x76 = 4*x31
+                x77 = x28*x59
+                x78 = x76*x77
+                x79 = x12*x70
+                x80 = zb[layer]*zt[layer]
+                x81 = 2*x80
+                x82 = 4*x38
+                x83 = x77*x82
+                x84 = x16*x4
+                x85 = x24*x42
+                x86 = x0*x39
+                x87 = x1*x32
+                x88 = x34*x51
+                x89 = 2*zb[layer]
+                x90 = x42*x46
+                x91 = x41*x86
+                x92 = x10*x91
+                x93 = x16*x87
+                x94 = x10*x93
+                x95 = x0*x43
+                x96 = x1*x35
+                a[i, j] += (x0*x1*(-x0*x42*x80*x82 + x1*x18*x33 + x1*x28*x30*x64 + x10*x71 - x10*x79 + x10*x9 - x11*x36 +
+                        x11*x71 - x11*x79 + x11*x9 - x12*x78 + x14*x83 + x16*x19 - x18*x30*x51 -
+                        x19*x30 + x2*x22 - x2*x34*x4*x89 + x21*x23 - x22*x3 + x23*x72 - x23*x8 -
+                        x23*x84 + x25*x27 - x25*x41 + x28*x33 + x3*x42*x6*x89 - x35 - x37*x39 -
+                        x37*x55 - x4*x83 + x42*x55 + x43 + x44*x72 - x44*x8 - x44*x84 + x45*x46 -
+                        x45*x86 - x46*x61 + x47*x49 - x47*x54 + x48*zb[layer] - x48*zt[layer] -
+                        x49*x52 + x49*x91 - x49*x93 + x50*x51 - x50*x87 + x52*x54 - x53*zb[layer] +
+                        x53*zt[layer] - x54*x91 + x54*x93 + x56*x58 + x56*x60 - x56*x67 - x56*x68 -
+                        x58*x59 - x59*x60 + x59*x67 + x59*x68 + x6*x78 + x61*x86 - x63*zb[layer] +
+                        x63*zt[layer] - x64*x65 + x65*x76*x80 + x69*zb[layer] - x69*zt[layer] +
+                        x73*x74 - x73*x85 + x73*x88 - x73*x90 + x73*x95 - x73*x96 + x74*x75 -
+                        x74*x81 - x75*x85 + x75*x88 - x75*x90 + x75*x95 - x75*x96 + x81*x85 +
+                        x92*zb[layer] - x92*zt[layer] - x94*zb[layer] + x94*zt[layer])/(-3*x0*x2 +
+                        3*x1*x3 + m[i]**6 - m[j]**6))
+    for j in range(neig - 1):
+        for i in range(j + 1, neig):
+            a[j, i] = a[i, j]
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def eload_linear(loadtim, loadmag, eigs, tvals, dT):
+    neig = len(eigs)
+    nload = len(loadtim)
+    nt = len(tvals)
+    a = np.zeros((nt, neig), dtype=np.complex128)
+    EPSILON = 0.0000005
+    for i in numba.prange(nt):
+        for k in range(nload - 1):
+            if tvals[i] < loadtim[k]:
+                #t is before load step
+                break
+            if tvals[i] >= loadtim[k + 1]:
+                #t is after the load step
+                if (abs(loadtim[k] - loadtim[k + 1]) <=
+                        abs(loadtim[k] + loadtim[k + 1]) * EPSILON):
+                    #step load
+                    pass
+                elif (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        x0 = dT*eigs[j]
+                        a[i, j] += ((-exp(-x0*(-loadtim[k] + tvals[i])) + exp(-x0*(-loadtim[k + 1] + tvals[i])))*loadmag[k]/(dT*eigs[j]))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = -loadtim[k + 1]
+                        x1 = x0 + tvals[i]
+                        x2 = dT*eigs[j]
+                        x3 = 1/(dT*eigs[j])
+                        x4 = (x3*loadmag[k + 1] - x3*loadmag[k] + loadmag[k + 1]*loadtim[k] - loadmag[k + 1]*tvals[i] -
+                                loadmag[k]*loadtim[k + 1] + loadmag[k]*tvals[i])
+                        x5 = -loadtim[k] + tvals[i]
+                        a[i, j] += (x3*(-(x4 + x5*loadmag[k + 1] - x5*loadmag[k])*exp(-x2*x5) + (x1*loadmag[k + 1] - x1*loadmag[k] +
+                                x4)*exp(-x1*x2))/(x0 + loadtim[k]))
+            else:
+                #t is in the load step
+                if (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        a[i, j] += ((1 - exp(-dT*(-loadtim[k] + tvals[i])*eigs[j]))*loadmag[k]/(dT*eigs[j]))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = -loadtim[k] + tvals[i]
+                        x1 = 1/(dT*eigs[j])
+                        x2 = (x1*loadmag[k + 1] - x1*loadmag[k] + loadmag[k + 1]*loadtim[k] - loadmag[k + 1]*tvals[i] -
+                                loadmag[k]*loadtim[k + 1] + loadmag[k]*tvals[i])
+                        a[i, j] += (x1*(x2 - (x0*loadmag[k + 1] - x0*loadmag[k] + x2)*exp(-dT*x0*eigs[j]))/(-loadtim[k + 1] +
+                                loadtim[k]))
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def edload_linear(loadtim, loadmag, eigs, tvals, dT):
+    neig = len(eigs)
+    nload = len(loadtim)
+    nt = len(tvals)
+    a = np.zeros((nt, neig), dtype=np.float64)
+    EPSILON = 0.0000005
+    for i in numba.prange(nt):
+        for k in range(nload - 1):
+            if tvals[i] < loadtim[k]:
+                #t is before load step
+                break
+            if tvals[i] >= loadtim[k + 1]:
+                #t is after the load step
+                if (abs(loadtim[k] - loadtim[k + 1]) <=
+                        abs(loadtim[k] + loadtim[k + 1]) * EPSILON):
+                    #step load
+                    for j in range(neig):
+                        a[i, j] += ((loadmag[k + 1] - loadmag[k])*exp(-dT*(-loadtim[k] + tvals[i])*eigs[j]))
+                elif (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    pass
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = -loadtim[k]
+                        x1 = dT*eigs[j]
+                        a[i, j] += ((exp(-x1*(-loadtim[k + 1] + tvals[i])) - exp(-x1*(x0 + tvals[i])))*(loadmag[k + 1] -
+                                loadmag[k])/(dT*(x0 + loadtim[k + 1])*eigs[j]))
+            else:
+                #t is in the load step
+                if (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    pass
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = -loadtim[k]
+                        a[i, j] += ((1 - exp(-dT*(x0 + tvals[i])*eigs[j]))*(loadmag[k + 1] - loadmag[k])/(dT*(x0 + loadtim[k +
+                                1])*eigs[j]))
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT):
+    neig = len(eigs)
+    nload = len(loadtim)
+    nt = len(tvals)
+    a = np.zeros((nt, neig), dtype=np.float64)
+    EPSILON = 0.0000005
+    for i in numba.prange(nt):
+        for k in range(nload - 1):
+            if tvals[i] < loadtim[k]:
+                #t is before load step
+                break
+            if tvals[i] >= loadtim[k + 1]:
+                #t is after the load step
+                if (abs(loadtim[k] - loadtim[k + 1]) <=
+                        abs(loadtim[k] + loadtim[k + 1]) * EPSILON):
+                    #step load
+                    pass
+                elif (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        x0 = -loadtim[k + 1] + tvals[i]
+                        x1 = dT*eigs[j]
+                        x2 = omega*tvals[i] + phase
+                        x3 = -omega*x0 + x2
+                        x4 = 1/(dT*eigs[j])
+                        x5 = omega*x4
+                        x6 = -loadtim[k] + tvals[i]
+                        x7 = -omega*x6 + x2
+                        a[i, j] += (x4*((x5*sin(x3) + cos(x3))*exp(-x0*x1) - (x5*sin(x7) + cos(x7))*exp(-x1*x6))*loadmag[k]/(1 +
+                                omega**2/(dT**2*eigs[j]**2)))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = dT*eigs[j]
+                        x1 = x0*loadtim[k]
+                        x2 = x0*loadtim[k + 1]
+                        x3 = omega**4/(dT**3*eigs[j]**3)
+                        x4 = omega**2
+                        x5 = 1/(dT*eigs[j])
+                        x6 = 2*x5
+                        x7 = x4*x6
+                        x8 = -loadtim[k + 1] + tvals[i]
+                        x9 = x0*x8
+                        x10 = omega*x8
+                        x11 = omega*tvals[i]
+                        x12 = phase + x11
+                        x13 = -x10 + x12
+                        x14 = cos(x13)
+                        x15 = x14*loadmag[k + 1]
+                        x16 = x14*loadmag[k]
+                        x17 = sin(x13)
+                        x18 = x17*loadmag[k + 1]
+                        x19 = omega*loadtim[k]
+                        x20 = x17*loadmag[k]
+                        x21 = omega*loadtim[k + 1]
+                        x22 = x0*tvals[i]
+                        x23 = omega*x6
+                        x24 = x16*x4
+                        x25 = 1/(dT**2*eigs[j]**2)
+                        x26 = x25*x4
+                        x27 = omega**3*x25
+                        x28 = x18*x27
+                        x29 = x20*x27
+                        x30 = x15*x4
+                        x31 = x30*x5
+                        x32 = x24*x5
+                        x33 = x5*x8
+                        x34 = -loadtim[k] + tvals[i]
+                        x35 = x0*x34
+                        x36 = omega*x34
+                        x37 = x12 - x36
+                        x38 = cos(x37)
+                        x39 = x38*loadmag[k + 1]
+                        x40 = x38*loadmag[k]
+                        x41 = sin(x37)
+                        x42 = x41*loadmag[k + 1]
+                        x43 = x41*loadmag[k]
+                        x44 = x27*x42
+                        x45 = x27*x43
+                        x46 = x4*x5
+                        x47 = x39*x46
+                        x48 = x40*x46
+                        a[i, j] += (x5*((x1*x15 + x10*x18 - x10*x20 - x11*x18 + x11*x20 - x15*x22 - x15*x26 + x15*x9 + x15 - x16*x2 +
+                                x16*x22 - x16*x9 - x16 + x18*x19 + x18*x23 - x20*x21 - x20*x23 +
+                                x24*x25 - x24*x33 + x28*x8 + x28*loadtim[k] - x28*tvals[i] - x29*x8
+                                - x29*loadtim[k + 1] + x29*tvals[i] + x30*x33 + x31*loadtim[k] -
+                                x31*tvals[i] - x32*loadtim[k + 1] + x32*tvals[i])*exp(-x9) - (x1*x39
+                                - x11*x42 + x11*x43 + x19*x42 - x2*x40 - x21*x43 - x22*x39 + x22*x40
+                                + x23*x42 - x23*x43 - x26*x39 + x26*x40 + x34*x44 - x34*x45 +
+                                x34*x47 - x34*x48 + x35*x39 - x35*x40 + x36*x42 - x36*x43 + x39 -
+                                x40 + x44*loadtim[k] - x44*tvals[i] - x45*loadtim[k + 1] +
+                                x45*tvals[i] + x47*loadtim[k] - x47*tvals[i] - x48*loadtim[k + 1] +
+                                x48*tvals[i])*exp(-x35))/(x1 - x2 - x3*loadtim[k + 1] +
+                                x3*loadtim[k] - x7*loadtim[k + 1] + x7*loadtim[k]))
+            else:
+                #t is in the load step
+                if (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        x0 = omega*tvals[i] + phase
+                        x1 = 1/(dT*eigs[j])
+                        x2 = omega*x1
+                        x3 = -loadtim[k] + tvals[i]
+                        x4 = -omega*x3 + x0
+                        a[i, j] += (x1*(x2*sin(x0) - (x2*sin(x4) + cos(x4))*exp(-dT*x3*eigs[j]) + cos(x0))*loadmag[k]/(1 +
+                                omega**2/(dT**2*eigs[j]**2)))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = dT*eigs[j]
+                        x1 = x0*loadtim[k]
+                        x2 = x0*loadtim[k + 1]
+                        x3 = omega**4/(dT**3*eigs[j]**3)
+                        x4 = omega**2
+                        x5 = 1/(dT*eigs[j])
+                        x6 = 2*x5
+                        x7 = x4*x6
+                        x8 = omega*tvals[i]
+                        x9 = phase + x8
+                        x10 = cos(x9)
+                        x11 = x10*loadmag[k + 1]
+                        x12 = x10*loadmag[k]
+                        x13 = omega*loadtim[k]
+                        x14 = sin(x9)
+                        x15 = x14*loadmag[k + 1]
+                        x16 = x14*loadmag[k]
+                        x17 = omega*loadtim[k + 1]
+                        x18 = x0*tvals[i]
+                        x19 = omega*x6
+                        x20 = 1/(dT**2*eigs[j]**2)
+                        x21 = x20*x4
+                        x22 = omega**3*x20
+                        x23 = x15*x22
+                        x24 = x16*x22
+                        x25 = x4*x5
+                        x26 = x11*x25
+                        x27 = x12*x25
+                        x28 = -loadtim[k] + tvals[i]
+                        x29 = x0*x28
+                        x30 = omega*x28
+                        x31 = -x30 + x9
+                        x32 = cos(x31)
+                        x33 = x32*loadmag[k + 1]
+                        x34 = x32*loadmag[k]
+                        x35 = sin(x31)
+                        x36 = x35*loadmag[k + 1]
+                        x37 = x35*loadmag[k]
+                        x38 = x34*x4
+                        x39 = x22*x36
+                        x40 = x22*x37
+                        x41 = x33*x4
+                        x42 = x41*x5
+                        x43 = x38*x5
+                        x44 = x28*x5
+                        a[i, j] += (x5*(x1*x11 - x11*x18 - x11*x21 + x11 + x12*x18 - x12*x2 + x12*x21 - x12 + x13*x15 + x15*x19 - x15*x8
+                                - x16*x17 - x16*x19 + x16*x8 + x23*loadtim[k] - x23*tvals[i] -
+                                x24*loadtim[k + 1] + x24*tvals[i] + x26*loadtim[k] - x26*tvals[i] -
+                                x27*loadtim[k + 1] + x27*tvals[i] - (x1*x33 + x13*x36 - x17*x37 -
+                                x18*x33 + x18*x34 + x19*x36 - x19*x37 - x2*x34 + x20*x38 - x21*x33 +
+                                x28*x39 - x28*x40 + x29*x33 - x29*x34 + x30*x36 - x30*x37 + x33 -
+                                x34 - x36*x8 + x37*x8 - x38*x44 + x39*loadtim[k] - x39*tvals[i] -
+                                x40*loadtim[k + 1] + x40*tvals[i] + x41*x44 + x42*loadtim[k] -
+                                x42*tvals[i] - x43*loadtim[k + 1] + x43*tvals[i])*exp(-x29))/(x1 -
+                                x2 - x3*loadtim[k + 1] + x3*loadtim[k] - x7*loadtim[k + 1] +
+                                x7*loadtim[k]))
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def edload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals, dT):
+    neig = len(eigs)
+    nload = len(loadtim)
+    nt = len(tvals)
+    a = np.zeros((nt, neig), dtype=np.float64)
+    EPSILON = 0.0000005
+    for i in numba.prange(nt):
+        for k in range(nload - 1):
+            if tvals[i] < loadtim[k]:
+                #t is before load step
+                break
+            if tvals[i] >= loadtim[k + 1]:
+                #t is after the load step
+                if (abs(loadtim[k] - loadtim[k + 1]) <=
+                        abs(loadtim[k] + loadtim[k + 1]) * EPSILON):
+                    #step load
+                    for j in range(neig):
+                        a[i, j] += ((loadmag[k + 1] - loadmag[k])*exp(-dT*(-loadtim[k] + tvals[i])*eigs[j])*cos(omega*loadtim[k] +
+                                phase))
+                elif (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        x0 = -loadtim[k] + tvals[i]
+                        x1 = dT*eigs[j]
+                        x2 = omega*tvals[i] + phase
+                        x3 = -omega*x0 + x2
+                        x4 = omega/(dT*eigs[j])
+                        x5 = -loadtim[k + 1] + tvals[i]
+                        x6 = -omega*x5 + x2
+                        a[i, j] += (x4*((-x4*cos(x3) + sin(x3))*exp(-x0*x1) - (-x4*cos(x6) + sin(x6))*exp(-x1*x5))*loadmag[k]/(1 +
+                                omega**2/(dT**2*eigs[j]**2)))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = dT*eigs[j]
+                        x1 = omega**4/(dT**3*eigs[j]**3)
+                        x2 = x1*loadtim[k]
+                        x3 = x1*loadtim[k + 1]
+                        x4 = omega**2
+                        x5 = 1/dT
+                        x6 = 1/eigs[j]
+                        x7 = 2*x5*x6
+                        x8 = x4*x7
+                        x9 = -loadtim[k + 1] + tvals[i]
+                        x10 = omega*x9
+                        x11 = omega*tvals[i]
+                        x12 = phase + x11
+                        x13 = -x10 + x12
+                        x14 = exp(-x0*x9)
+                        x15 = x14*cos(x13)
+                        x16 = x15*loadmag[k]
+                        x17 = -loadtim[k] + tvals[i]
+                        x18 = omega*x17
+                        x19 = x12 - x18
+                        x20 = exp(-x0*x17)
+                        x21 = x20*cos(x19)
+                        x22 = x21*loadmag[k + 1]
+                        x23 = x21*loadmag[k]
+                        x24 = x15*loadmag[k + 1]
+                        x25 = x20*sin(x19)
+                        x26 = x25*loadmag[k + 1]
+                        x27 = omega*loadtim[k]
+                        x28 = x25*loadmag[k]
+                        x29 = x14*sin(x13)
+                        x30 = x29*loadmag[k]
+                        x31 = omega*loadtim[k + 1]
+                        x32 = x29*loadmag[k + 1]
+                        x33 = omega*x7
+                        x34 = x23*x4
+                        x35 = 1/(dT**2*eigs[j]**2)
+                        x36 = x35*x4
+                        x37 = x1*tvals[i]
+                        x38 = omega**3*x35
+                        x39 = x26*x38
+                        x40 = x38*tvals[i]
+                        x41 = x30*x38
+                        x42 = x5*x6
+                        x43 = x4*x42
+                        x44 = x43*loadtim[k]
+                        x45 = x43*tvals[i]
+                        x46 = x34*x42
+                        x47 = x32*x38
+                        x48 = x28*x38
+                        x49 = x16*x43
+                        x50 = x1*x17
+                        x51 = x24*x9
+                        a[i, j] += ((-x1*x16*x9 + x1*x51 + x10*x30 - x10*x32 - x11*x26 + x11*x28 - x11*x30 + x11*x32 - x16*x3 - x16*x36
+                                + x16*x37 + x16*x45 + x16 - x17*x22*x43 + x17*x39 + x17*x46 -
+                                x17*x48 + x18*x26 - x18*x28 - x2*x22 + x2*x24 - x22*x36 + x22*x37 -
+                                x22*x44 + x22*x45 - x22*x50 + x22 + x23*x3 - x23*x37 + x23*x50 - x23
+                                + x24*x36 - x24*x37 + x24*x44 - x24*x45 - x24 + x26*x27 + x26*x33 -
+                                x27*x32 - x28*x31 - x28*x33 + x28*x40 + x30*x31 + x30*x33 - x32*x33
+                                + x32*x40 + x34*x35 + x39*loadtim[k] - x39*tvals[i] + x41*x9 +
+                                x41*loadtim[k + 1] - x41*tvals[i] + x43*x51 + x46*loadtim[k + 1] -
+                                x46*tvals[i] - x47*x9 - x47*loadtim[k] - x48*loadtim[k + 1] - x49*x9
+                                - x49*loadtim[k + 1])/(-x0*loadtim[k + 1] + x0*loadtim[k] + x2 - x3
+                                - x8*loadtim[k + 1] + x8*loadtim[k]))
+            else:
+                #t is in the load step
+                if (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        x0 = omega*tvals[i] + phase
+                        x1 = omega/(dT*eigs[j])
+                        x2 = -loadtim[k] + tvals[i]
+                        x3 = -omega*x2 + x0
+                        a[i, j] += (x1*(x1*cos(x0) + (-x1*cos(x3) + sin(x3))*exp(-dT*x2*eigs[j]) - sin(x0))*loadmag[k]/(1 +
+                                omega**2/(dT**2*eigs[j]**2)))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = dT*eigs[j]
+                        x1 = omega**4/(dT**3*eigs[j]**3)
+                        x2 = x1*loadtim[k]
+                        x3 = x1*loadtim[k + 1]
+                        x4 = omega**2
+                        x5 = 1/dT
+                        x6 = 1/eigs[j]
+                        x7 = 2*x5*x6
+                        x8 = x4*x7
+                        x9 = omega*tvals[i]
+                        x10 = phase + x9
+                        x11 = cos(x10)
+                        x12 = x11*loadmag[k]
+                        x13 = x11*loadmag[k + 1]
+                        x14 = sin(x10)
+                        x15 = omega*x14
+                        x16 = loadmag[k]*loadtim[k + 1]
+                        x17 = x14*x9
+                        x18 = loadmag[k + 1]*loadtim[k]
+                        x19 = x15*x7
+                        x20 = x13*x4
+                        x21 = 1/(dT**2*eigs[j]**2)
+                        x22 = x12*x4
+                        x23 = x1*tvals[i]
+                        x24 = omega**3*x21
+                        x25 = x14*x24
+                        x26 = x25*tvals[i]
+                        x27 = x5*x6
+                        x28 = x20*x27
+                        x29 = x22*x27
+                        x30 = -loadtim[k] + tvals[i]
+                        x31 = omega*x30
+                        x32 = x10 - x31
+                        x33 = exp(-x0*x30)
+                        x34 = x33*cos(x32)
+                        x35 = x34*loadmag[k + 1]
+                        x36 = x34*loadmag[k]
+                        x37 = x33*sin(x32)
+                        x38 = omega*x37
+                        x39 = x37*x9
+                        x40 = x31*x37
+                        x41 = x38*x7
+                        x42 = x21*x4
+                        x43 = x24*x37
+                        x44 = x43*tvals[i]
+                        x45 = x27*x4
+                        x46 = x36*x45
+                        x47 = x35*x45
+                        x48 = x30*x36
+                        x49 = x30*x43
+                        a[i, j] += ((-x1*x30*x35 + x1*x48 + x12*x23 - x12*x3 + x12 + x13*x2 - x13*x23 - x13 + x15*x16 - x15*x18 +
+                                x16*x25 - x16*x38 - x16*x43 + x17*loadmag[k + 1] - x17*loadmag[k] -
+                                x18*x25 + x18*x38 + x18*x43 - x19*loadmag[k + 1] + x19*loadmag[k] -
+                                x2*x35 + x20*x21 - x21*x22 + x23*x35 - x23*x36 + x26*loadmag[k + 1]
+                                - x26*loadmag[k] + x28*loadtim[k] - x28*tvals[i] - x29*loadtim[k +
+                                1] + x29*tvals[i] + x3*x36 - x30*x47 - x35*x42 + x35 + x36*x42 - x36
+                                - x39*loadmag[k + 1] + x39*loadmag[k] + x40*loadmag[k + 1] -
+                                x40*loadmag[k] + x41*loadmag[k + 1] - x41*loadmag[k] - x44*loadmag[k
+                                + 1] + x44*loadmag[k] + x45*x48 + x46*loadtim[k + 1] - x46*tvals[i]
+                                - x47*loadtim[k] + x47*tvals[i] + x49*loadmag[k + 1] -
+                                x49*loadmag[k])/(-x0*loadtim[k + 1] + x0*loadtim[k] + x2 - x3 -
+                                x8*loadtim[k + 1] + x8*loadtim[k]))
+    return a
+
+
+@numba.njit(parallel=True, cache=True)
+def eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals, dT):
+    neig = len(eigs)
+    nload = len(loadtim)
+    nt = len(tvals)
+    a = np.zeros((nt, neig), dtype=np.complex128)
+    EPSILON = 0.0000005
+    for i in numba.prange(nt):
+        for k in range(nload - 1):
+            if tvals[i] < loadtim[k]:
+                #t is before load step
+                break
+            if tvals[i] >= loadtim[k + 1]:
+                #t is after the load step
+                if (abs(loadtim[k] - loadtim[k + 1]) <=
+                        abs(loadtim[k] + loadtim[k + 1]) * EPSILON):
+                    #step load
+                    pass
+                elif (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        x0 = -loadtim[k + 1] + tvals[i]
+                        x1 = dT*eigs[j]
+                        x2 = omega*tvals[i] + phase
+                        x3 = -omega*x0 + x2
+                        x4 = 1/(dT*eigs[j])
+                        x5 = omega*x4
+                        x6 = -loadtim[k] + tvals[i]
+                        x7 = -omega*x6 + x2
+                        a[i, j] += (x4*((-x5*cos(x3) + sin(x3))*exp(-x0*x1) - (-x5*cos(x7) + sin(x7))*exp(-x1*x6))*loadmag[k]/(1 +
+                                omega**2/(dT**2*eigs[j]**2)))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = dT*eigs[j]
+                        x1 = x0*loadtim[k]
+                        x2 = x0*loadtim[k + 1]
+                        x3 = omega**4/(dT**3*eigs[j]**3)
+                        x4 = omega**2
+                        x5 = 1/(dT*eigs[j])
+                        x6 = 2*x5
+                        x7 = x4*x6
+                        x8 = -loadtim[k + 1] + tvals[i]
+                        x9 = x0*x8
+                        x10 = omega*x8
+                        x11 = omega*tvals[i]
+                        x12 = phase + x11
+                        x13 = -x10 + x12
+                        x14 = sin(x13)
+                        x15 = x14*loadmag[k + 1]
+                        x16 = x14*loadmag[k]
+                        x17 = cos(x13)
+                        x18 = x17*loadmag[k]
+                        x19 = omega*loadtim[k + 1]
+                        x20 = x17*loadmag[k + 1]
+                        x21 = omega*loadtim[k]
+                        x22 = x0*tvals[i]
+                        x23 = omega*x6
+                        x24 = x16*x4
+                        x25 = 1/(dT**2*eigs[j]**2)
+                        x26 = x25*x4
+                        x27 = omega**3*x25
+                        x28 = x18*x27
+                        x29 = x20*x27
+                        x30 = x15*x4
+                        x31 = x30*x5
+                        x32 = x24*x5
+                        x33 = x5*x8
+                        x34 = -loadtim[k] + tvals[i]
+                        x35 = x0*x34
+                        x36 = omega*x34
+                        x37 = x12 - x36
+                        x38 = sin(x37)
+                        x39 = x38*loadmag[k + 1]
+                        x40 = x38*loadmag[k]
+                        x41 = cos(x37)
+                        x42 = x41*loadmag[k]
+                        x43 = x41*loadmag[k + 1]
+                        x44 = x27*x42
+                        x45 = x27*x43
+                        x46 = x4*x5
+                        x47 = x39*x46
+                        x48 = x40*x46
+                        a[i, j] += (x5*((x1*x15 + x10*x18 - x10*x20 - x11*x18 + x11*x20 - x15*x22 - x15*x26 + x15*x9 + x15 - x16*x2 +
+                                x16*x22 - x16*x9 - x16 + x18*x19 + x18*x23 - x20*x21 - x20*x23 +
+                                x24*x25 - x24*x33 + x28*x8 + x28*loadtim[k + 1] - x28*tvals[i] -
+                                x29*x8 - x29*loadtim[k] + x29*tvals[i] + x30*x33 + x31*loadtim[k] -
+                                x31*tvals[i] - x32*loadtim[k + 1] + x32*tvals[i])*exp(-x9) - (x1*x39
+                                - x11*x42 + x11*x43 + x19*x42 - x2*x40 - x21*x43 - x22*x39 + x22*x40
+                                + x23*x42 - x23*x43 - x26*x39 + x26*x40 + x34*x44 - x34*x45 +
+                                x34*x47 - x34*x48 + x35*x39 - x35*x40 + x36*x42 - x36*x43 + x39 -
+                                x40 + x44*loadtim[k + 1] - x44*tvals[i] - x45*loadtim[k] +
+                                x45*tvals[i] + x47*loadtim[k] - x47*tvals[i] - x48*loadtim[k + 1] +
+                                x48*tvals[i])*exp(-x35))/(x1 - x2 - x3*loadtim[k + 1] +
+                                x3*loadtim[k] - x7*loadtim[k + 1] + x7*loadtim[k]))
+            else:
+                #t is in the load step
+                if (abs(loadmag[k] - loadmag[k + 1]) <=
+                        abs(loadmag[k] + loadmag[k + 1]) * EPSILON):
+                    #constant load
+                    for j in range(neig):
+                        x0 = omega*tvals[i] + phase
+                        x1 = 1/(dT*eigs[j])
+                        x2 = omega*x1
+                        x3 = -loadtim[k] + tvals[i]
+                        x4 = -omega*x3 + x0
+                        a[i, j] += (x1*(-x2*cos(x0) - (-x2*cos(x4) + sin(x4))*exp(-dT*x3*eigs[j]) + sin(x0))*loadmag[k]/(1 +
+                                omega**2/(dT**2*eigs[j]**2)))
+                else:
+                    #ramp load
+                    for j in range(neig):
+                        x0 = dT*eigs[j]
+                        x1 = x0*loadtim[k]
+                        x2 = x0*loadtim[k + 1]
+                        x3 = omega**4/(dT**3*eigs[j]**3)
+                        x4 = omega**2
+                        x5 = 1/(dT*eigs[j])
+                        x6 = 2*x5
+                        x7 = x4*x6
+                        x8 = omega*tvals[i]
+                        x9 = phase + x8
+                        x10 = sin(x9)
+                        x11 = x10*loadmag[k + 1]
+                        x12 = x10*loadmag[k]
+                        x13 = omega*loadtim[k + 1]
+                        x14 = cos(x9)
+                        x15 = x14*loadmag[k]
+                        x16 = x14*loadmag[k + 1]
+                        x17 = omega*loadtim[k]
+                        x18 = x0*tvals[i]
+                        x19 = omega*x6
+                        x20 = 1/(dT**2*eigs[j]**2)
+                        x21 = x20*x4
+                        x22 = omega**3*x20
+                        x23 = x15*x22
+                        x24 = x16*x22
+                        x25 = x4*x5
+                        x26 = x11*x25
+                        x27 = x12*x25
+                        x28 = -loadtim[k] + tvals[i]
+                        x29 = x0*x28
+                        x30 = omega*x28
+                        x31 = -x30 + x9
+                        x32 = sin(x31)
+                        x33 = x32*loadmag[k + 1]
+                        x34 = x32*loadmag[k]
+                        x35 = cos(x31)
+                        x36 = x35*loadmag[k]
+                        x37 = x35*loadmag[k + 1]
+                        x38 = x34*x4
+                        x39 = x22*x36
+                        x40 = x22*x37
+                        x41 = x33*x4
+                        x42 = x41*x5
+                        x43 = x38*x5
+                        x44 = x28*x5
+                        a[i, j] += (x5*(x1*x11 - x11*x18 - x11*x21 + x11 + x12*x18 - x12*x2 + x12*x21 - x12 + x13*x15 + x15*x19 - x15*x8
+                                - x16*x17 - x16*x19 + x16*x8 + x23*loadtim[k + 1] - x23*tvals[i] -
+                                x24*loadtim[k] + x24*tvals[i] + x26*loadtim[k] - x26*tvals[i] -
+                                x27*loadtim[k + 1] + x27*tvals[i] - (x1*x33 + x13*x36 - x17*x37 -
+                                x18*x33 + x18*x34 + x19*x36 - x19*x37 - x2*x34 + x20*x38 - x21*x33 +
+                                x28*x39 - x28*x40 + x29*x33 - x29*x34 + x30*x36 - x30*x37 + x33 -
+                                x34 - x36*x8 + x37*x8 - x38*x44 + x39*loadtim[k + 1] - x39*tvals[i]
+                                - x40*loadtim[k] + x40*tvals[i] + x41*x44 + x42*loadtim[k] -
+                                x42*tvals[i] - x43*loadtim[k + 1] + x43*tvals[i])*exp(-x29))/(x1 -
+                                x2 - x3*loadtim[k + 1] + x3*loadtim[k] - x7*loadtim[k + 1] +
+                                x7*loadtim[k]))
+    return a
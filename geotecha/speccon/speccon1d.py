@@ -21,8 +21,13 @@ Spectral Galerkin methods.
 """
 from __future__ import division, print_function
 
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-import matplotlib.pyplot as plt
+from geotecha.inputoutput.lazy_import import lazy_import
+plt = lazy_import('matplotlib.pyplot')
 
 import geotecha.inputoutput.inputoutput as inputoutput
 import geotecha.piecewise.piecewise_linear_1d as pwise
@@ -56,12 +61,17 @@ class Speccon1d(inputoutput.InputFileLoaderCheckerSaver):
         make_time_independent_arrays
         make_time_dependent_arrays
         make_output
+        _make_adaptive_neig : Used instead of the make_* methods if
+            `neig_tol` is not None.
 
         """
         self.check_input_attributes()
-        self.make_time_independent_arrays()
-        self.make_time_dependent_arrays()
-        self.make_output()
+        if getattr(self, 'neig_tol', None) is None:
+            self.make_time_independent_arrays()
+            self.make_time_dependent_arrays()
+            self.make_output()
+        else:
+            self._make_adaptive_neig()
 
         if getattr(self, 'save_data_to_file', False):
             self._save_data()
@@ -75,6 +85,117 @@ class Speccon1d(inputoutput.InputFileLoaderCheckerSaver):
 
         return
 
+    def _make_adaptive_neig(self):
+        """Make all arrays and output, doubling neig until output converges
+
+        Starting with `self.neig`, the time independent arrays, time
+        dependent arrays and output are made.  neig is then doubled
+        (capped at `self.neig_max`) and everything remade until the largest
+        change in any output (pore pressure, average pore pressure,
+        settlement etc.) between successive neig values is less than
+        `self.neig_tol` times the largest absolute value of that output.
+
+        `self.neig` is left as the final (i.e. chosen) number of
+        eigenvalues and `self.neig_history` is a list of (neig, change)
+        tuples for each neig tried (change is None for the first).  A
+        warning is issued if `neig_max` is reached without convergence, or
+        if the starting neig is already at least `neig_max` so that no
+        refinement can be tried.  The default `neig_max` is the larger of
+        twice `neig` and 200.
+
+        Notes
+        -----
+        Each trial rebuilds every matrix from scratch; nothing from the
+        smaller basis is reused (the integrals in
+        geotecha.speccon.integrals only produce complete square matrices,
+        not the new blocks).  As neig doubles, the time independent
+        matrices (O(neig**2) integrations and O(neig**3) eigen solution)
+        for all the trials cost about 4/3 of those for the final neig
+        alone, and the O(neig) time dependent part and output, usually
+        the bulk of the work, about twice.  An adaptive run therefore
+        costs up to about twice a run with `neig` fixed at the final
+        value.  If a suitable neig is known, use it directly.
+
+        """
+
+        neig_max = getattr(self, 'neig_max', None)
+        if neig_max is None:
+            neig_max = max(2 * self.neig, 200)
+
+        self.neig_history = []
+        old = None
+        while True:
+            self.make_time_independent_arrays()
+            self.make_time_dependent_arrays()
+            self.make_output()
+            new = [np.asarray(d['data']) for d in self._grid_data_dicts]
+
+            change = None
+            if not old is None:
+                change = 0.0
+                for a, b in zip(new, old):
+                    scale = np.max(np.abs(a))
+                    if scale == 0:
+                        continue
+                    change = max(change, np.max(np.abs(a - b)) / scale)
+            self.neig_history.append((self.neig, change))
+
+            if not change is None and change < self.neig_tol:
+                return
+            if self.neig >= neig_max and change is None:
+                warnings.warn("neig={} is not less than neig_max={} so "
+                              "convergence to neig_tol={} was not "
+                              "checked.".format(self.neig, neig_max,
+                                                self.neig_tol))
+                return
+            if self.neig >= neig_max:
+                warnings.warn("neig_max={} reached without output "
+                              "converging to neig_tol={}; last relative "
+                              "change was {}.".format(neig_max, self.neig_tol,
+                                                      change))
+                return
+            old = new
+            self.neig = min(2 * self.neig, neig_max)
+
+    def _add_load_contributions(self, contributions):
+        """Make load contributions and add them to self.E_Igamv_the
+
+        Parameters
+        ----------
+        contributions : list of (method, str)
+            Each method makes the attribute named by the str, which is that
+            load's (neig, len(tvals)) contribution to self.E_Igamv_the.
+
+        Notes
+        -----
+        If `self.load_workers` is greater than one then the methods are
+        run concurrently in a pool of that many threads.  The bulk of each
+        contribution is calculated in numpy/fortran/numba code that releases
+        the GIL, so the contributions overlap.  Contributions are added to
+        self.E_Igamv_the in place, in the order listed, so results do not
+        depend on `load_workers` and no extra full size arrays are made.
+
+        With implementation='jit' the numba threading layer must be thread
+        safe (i.e. 'tbb' or 'omp', not 'workqueue') to use `load_workers`.
+
+        """
+
+        workers = getattr(self, 'load_workers', None)
+        if workers is None or workers <= 1 or len(contributions) <= 1:
+            for method, name in contributions:
+                method()
+                self.E_Igamv_the += getattr(self, name)
+            return
+
+        with ThreadPoolExecutor(
+                max_workers=min(workers, len(contributions))) as pool:
+            futures = [(pool.submit(method), name)
+                       for method, name in contributions]
+            for future, name in futures:
+                future.result()
+                self.E_Igamv_the += getattr(self, name)
+        return
+
     def make_time_independent_arrays(self):
         """Make all time-independent arrays; To be overridden in subclasses."""
         raise NotImplementedError("make_time_independent_arrays")
@@ -88,6 +209,196 @@ class Speccon1d(inputoutput.InputFileLoaderCheckerSaver):
         raise NotImplementedError("make_output")
 
 
+def block_solve_2x2(A, B, C, D, R0, R1):
+    """Solve a 2x2 block linear system by Schur complement
+
+    Solves
+
+    .. math:: \\left[\\begin{matrix}A & B \\\\ C & D\\end{matrix}\\right]
+              \\left[\\begin{matrix}X_0 \\\\ X_1\\end{matrix}\\right] =
+              \\left[\\begin{matrix}R_0 \\\\ R_1\\end{matrix}\\right]
+
+    by eliminating :math:`X_0` with LU solves against `A` and then solving
+    the Schur complement system
+    :math:`\\left(D - CA^{-1}B\\right)X_1 = R_1 - CA^{-1}R_0`.
+    No explicit inverses are formed. If `A` is singular the full system
+    is solved directly.
+
+    Parameters
+    ----------
+    A, B, C, D : 2d ndarray
+        Blocks of the coefficient matrix. A and D must be square.
+    R0, R1 : ndarray
+        Right hand side blocks (1d or 2d). len(R0)=len(A),
+        len(R1)=len(D).
+
+    Returns
+    -------
+    X0, X1 : ndarray
+        Solution blocks.
+
+    Examples
+    --------
+    >>> A = np.array([[2.0]]); B = np.array([[1.0]])
+    >>> C = np.array([[1.0]]); D = np.array([[3.0]])
+    >>> X0, X1 = block_solve_2x2(A, B, C, D, np.array([3.0]), np.array([4.0]))
+    >>> X0, X1
+    (array([1.]), array([1.]))
+
+    """
+
+    try:
+        AiB = np.linalg.solve(A, B)
+        AiR0 = np.linalg.solve(A, R0)
+    except np.linalg.LinAlgError:
+        n0 = len(A)
+        X = np.linalg.solve(np.bmat([[A, B], [C, D]]).A,
+                            np.concatenate((R0, R1)))
+        return X[:n0], X[n0:]
+
+    S = D - np.dot(C, AiB)
+    X1 = np.linalg.solve(S, R1 - np.dot(C, AiR0))
+    X0 = AiR0 - np.dot(AiB, X1)
+    return X0, X1
+
+
+def block_solve_diag_row(c0, c1, M, R):
+    """Solve a 3x3 block system whose first block row is diagonal
+
+    Solves
+
+    .. math:: \\left[\\begin{matrix}
+                c_0 I & c_1 I & 0 \\\\
+                M_{10} & M_{11} & M_{12} \\\\
+                M_{20} & M_{21} & M_{22}\\end{matrix}\\right]
+              \\left[\\begin{matrix}X_0 \\\\ X_1 \\\\ X_2\\end{matrix}\\right]
+              =
+              \\left[\\begin{matrix}R_0 \\\\ R_1 \\\\ R_2\\end{matrix}\\right]
+
+    The first block row is used to eliminate X_0 (or X_1 if
+    abs(c1) > abs(c0)) leaving a 2x2 block system that is solved with
+    `block_solve_2x2`.  So a 3n x 3n problem costs about as much as a
+    2n x 2n one.
+
+    Parameters
+    ----------
+    c0, c1 : float
+        Diagonal values of the first block row. Both cannot be zero.
+    M : 2x3 nested list of 2d ndarray
+        Blocks of the second and third block rows, i.e. M[0][0] is
+        M_{10}, M[1][2] is M_{22}.  All blocks are n x n.
+    R : list of 3 ndarray
+        Right hand side blocks, each with n rows.
+
+    Returns
+    -------
+    X : list of 3 ndarray
+        Solution blocks [X_0, X_1, X_2].
+
+    Examples
+    --------
+    >>> I = np.identity(2)
+    >>> M = [[I, 2*I, I], [I, I, 3*I]]
+    >>> R = [np.ones(2), 4*np.ones(2), 5*np.ones(2)]
+    >>> X = block_solve_diag_row(1.0, 1.0, M, R)
+    >>> Ibet = np.bmat([[I, I, 0*I], M[0], M[1]]).A
+    >>> np.allclose(Ibet.dot(np.concatenate(X)), np.concatenate(R))
+    True
+
+    """
+
+    if c0 == 0 and c1 == 0:
+        raise ValueError('c0 and c1 cannot both be zero')
+
+    R0, R1, R2 = R
+    (M10, M11, M12), (M20, M21, M22) = M
+    if abs(c0) >= abs(c1):
+        # X0 = (R0 - c1 * X1) / c0
+        f = c1 / c0
+        Xa, X2 = block_solve_2x2(M11 - f * M10, M12,
+                                 M21 - f * M20, M22,
+                                 R1 - np.dot(M10, R0) / c0,
+                                 R2 - np.dot(M20, R0) / c0)
+        X1 = Xa
+        X0 = (R0 - c1 * X1) / c0
+    else:
+        # X1 = (R0 - c0 * X0) / c1
+        f = c0 / c1
+        Xa, X2 = block_solve_2x2(M10 - f * M11, M12,
+                                 M20 - f * M21, M22,
+                                 R1 - np.dot(M11, R0) / c1,
+                                 R2 - np.dot(M21, R0) / c1)
+        X0 = Xa
+        X1 = (R0 - c0 * X0) / c1
+    return [X0, X1, X2]
+
+
+def _interp_choose_max(x, y, xi):
+    """Vectorized pwise.interp_x_y(x, y, xi, choose_max=True)
+
+    For non-decreasing `x` (e.g. load time histories) the segment containing
+    each `xi` is found with a single np.searchsorted.  Other `x` fall back to
+    pwise.interp_x_y.
+
+    """
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xi = np.atleast_1d(xi)
+    if not pwise.non_decreasing(x):
+        return pwise.interp_x_y(x, y, xi, choose_max=True)
+
+    n = len(x)
+    #k is number of x values <= xi, so for k < n the segment k-1 is the
+    #last, non-step, segment containing xi
+    k = np.searchsorted(x, xi, side='right')
+    j = np.clip(k - 1, 0, n - 2)
+    dx = x[j + 1] - x[j]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        A = np.where(dx > 0, y[j] + (y[j + 1] - y[j]) / dx * (xi - x[j]),
+                     y[j])
+    #xi at or beyond the last x: end of the last non-step segment
+    ilast = np.searchsorted(x, x[-1], side='left')
+    A[k >= n] = y[ilast] if ilast > 0 else y[-1]
+    A[xi > x[-1]] = y[-1]
+    A[xi < x[0]] = y[0]
+    return A
+
+
+def _bc_time_factor(vs_time, omega_phase, tvals):
+    """Superposed boundary condition magnitude at each time
+
+    Parameters
+    ----------
+    vs_time : list of PolyLine
+        Piecewise linear magnitude vs time.
+    omega_phase : list of 2 element tuples or None
+        (omega, phase) for use in cos(omega * t + phase) * mag_vs_time.
+    tvals : 1d numpy.ndarray
+        Time values to evaluate at.
+
+    Returns
+    -------
+    f : 1d ndarray
+        Sum over each load of mag_vs_time(t) * cos(omega * t + phase),
+        evaluated at `tvals`.  Interpolation at a step in mag_vs_time uses
+        the value after the step.
+
+    """
+
+    tvals = np.atleast_1d(tvals)
+    if omega_phase is None:
+        omega_phase = [None] * len(vs_time)
+    f = np.zeros(len(tvals))
+    for mag_vs_time, om_ph in zip(vs_time, omega_phase):
+        y = _interp_choose_max(mag_vs_time.x, mag_vs_time.y, tvals)
+        if not om_ph is None:
+            omega, phase = om_ph
+            y *= np.cos(omega * tvals + phase)
+        f += y
+    return f
+
+
 def dim1sin_f(m,
               outz,
               tvals,
@@ -154,32 +465,25 @@ def dim1sin_f(m,
 
     phi = integ.dim1sin(m, outz)
     u = np.dot(phi, v_E_Igamv_the)
+
+    #boundary conditions are all the same linear depth distribution so are
+    #a rank-1 update of u with the superposed time variation.
+    outz = np.atleast_1d(outz)
     #top part
     if not top_vs_time is None:
-        if top_omega_phase is None:
-            top_omega_phase = [None] * len(top_vs_time)
-        for mag_vs_time, om_ph in zip(top_vs_time, top_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                mult = np.cos(omega * tvals + phase)
-            else:
-                mult = 1
-
-            if drn==1:
-                u += pwise.pinterp_x_y(mag_vs_time, tvals, choose_max=True) * mult
-            else:
-                u += pwise.pinterp_xa_ya_multipy_x1b_x2b_y1b_y2b(mag_vs_time, PolyLine([0], [1], [1], [0]), tvals, outz, achoose_max=True) * mult
+        if drn==1:
+            zdist = np.ones(len(outz))
+        else:
+            zdist = pwise.interp_x1_x2_y1_y2([0], [1], [1], [0], outz,
+                                             choose_max=True)
+        u += np.outer(zdist, _bc_time_factor(top_vs_time, top_omega_phase,
+                                             tvals))
     #bot part
     if not bot_vs_time is None:
-        if bot_omega_phase is None:
-            bot_omega_phase = [None] * len(bot_vs_time)
-        for mag_vs_time, om_ph in zip(bot_vs_time, bot_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                mult = np.cos(omega * tvals + phase)
-            else:
-                mult=1
-            u += pwise.pinterp_xa_ya_multipy_x1b_x2b_y1b_y2b(mag_vs_time, PolyLine([0], [1], [0], [1]), tvals, outz, achoose_max=True) * mult
+        zdist = pwise.interp_x1_x2_y1_y2([0], [1], [0], [1], outz,
+                                         choose_max=True)
+        u += np.outer(zdist, _bc_time_factor(bot_vs_time, bot_omega_phase,
+                                             tvals))
     return u
 
 
@@ -263,34 +567,19 @@ def dim1sin_avgf(m,
 
     #top part
     if not top_vs_time is None:
-        if top_omega_phase is None:
-            top_omega_phase = [None] * len(top_vs_time)
-        for mag_vs_time, om_ph in zip(top_vs_time, top_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                mult = np.cos(omega * tvals + phase)
-            else:
-                mult = 1
-            if drn==1:
-                #bottom part
-                avg += pwise.pinterp_x_y(mag_vs_time, tvals, choose_max=True)*mult
-            else:
-                avg += pwise.pxa_ya_multipy_avg_x1b_x2b_y1b_y2b_between(mag_vs_time,
-                                                                        PolyLine([0], [1], [1], [0]),
-                                                                        tvals, z1, z2, achoose_max=True)*mult
+        if drn==1:
+            zdist = np.ones(len(z1))
+        else:
+            zdist = pwise.avg_x1_x2_y1_y2_between_xi_xj([0], [1], [1], [0],
+                                                        z1, z2)
+        avg += np.outer(zdist, _bc_time_factor(top_vs_time,
+                                               top_omega_phase, tvals))
     #bottom part
     if not bot_vs_time is None:
-        if bot_omega_phase is None:
-            bot_omega_phase = [None] * len(bot_vs_time)
-        for mag_vs_time, om_ph in zip(bot_vs_time, bot_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                mult = np.cos(omega * tvals + phase)
-            else:
-                mult=1
-            avg += pwise.pxa_ya_multipy_avg_x1b_x2b_y1b_y2b_between(mag_vs_time,
-                                                                        PolyLine([0], [1], [0], [1]),
-                                                                        tvals, z1,z2, achoose_max=True) * mult
+        zdist = pwise.avg_x1_x2_y1_y2_between_xi_xj([0], [1], [0], [1],
+                                                    z1, z2)
+        avg += np.outer(zdist, _bc_time_factor(bot_vs_time,
+                                               bot_omega_phase, tvals))
 
     return avg
 
@@ -375,47 +664,106 @@ def dim1sin_integrate_af(m,
 
     #top part
     if not top_vs_time is None:
-        if top_omega_phase is None:
-            top_omega_phase = [None] * len(top_vs_time)
-        for mag_vs_time, om_ph in zip(top_vs_time, top_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                mult = np.cos(omega * tvals + phase)
-            else:
-                mult = 1
-            if drn==1:
-                out += mult * pwise.pxa_ya_multiply_integrate_x1b_x2b_y1b_y2b_multiply_x1c_x2c_y1c_y2c_between(
-                    mag_vs_time,
-                    a,
-                    PolyLine(a.x1, a.x2, np.ones_like(a.x1), np.ones_like(a.x2)),
-                    tvals, z1, z2, achoose_max=True)
-            else:
-                out += mult * pwise.pxa_ya_multiply_integrate_x1b_x2b_y1b_y2b_multiply_x1c_x2c_y1c_y2c_between(
-                    mag_vs_time,
-                    a,
-                    PolyLine(a.x1, a.x2, 1-a.x1, 1-a.x2),
-                    tvals, z1, z2, achoose_max=True)
-
+        if drn==1:
+            y1, y2 = np.ones_like(a.x1), np.ones_like(a.x2)
+        else:
+            y1, y2 = 1 - a.x1, 1 - a.x2
+        zdist = pwise.integrate_x1a_x2a_y1a_y2a_multiply_x1b_x2b_y1b_y2b_between(
+            a.x1, a.x2, a.y1, a.y2, a.x1, a.x2, y1, y2, z1, z2)
+        out += np.outer(zdist, _bc_time_factor(top_vs_time,
+                                               top_omega_phase, tvals))
 
     #bot part
     if not bot_vs_time is None:
-        if bot_omega_phase is None:
-            bot_omega_phase = [None] * len(bot_vs_time)
-        for mag_vs_time, om_ph in zip(bot_vs_time, bot_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                mult = np.cos(omega * tvals + phase)
-            else:
-                mult=1
-            out += mult * pwise.pxa_ya_multiply_integrate_x1b_x2b_y1b_y2b_multiply_x1c_x2c_y1c_y2c_between(
-                    mag_vs_time,
-                    a,
-                    PolyLine(a.x1, a.x2, a.x1, a.x2),
-                    tvals, z1, z2, achoose_max=True)
+        zdist = pwise.integrate_x1a_x2a_y1a_y2a_multiply_x1b_x2b_y1b_y2b_between(
+            a.x1, a.x2, a.y1, a.y2, a.x1, a.x2, a.x1, a.x2, z1, z2)
+        out += np.outer(zdist, _bc_time_factor(bot_vs_time,
+                                               bot_omega_phase, tvals))
     #self.set *= self.H * self.mvref
     return out
 
 
+def _time_history_key(mag_vs_t, om_ph):
+    """Hashable key identifying a mag_vs_time-omega_phase pairing
+
+    Two loads with the same key have identical E matrices.  PolyLine
+    points are compared exactly (not with PolyLine.__eq__ tolerances).
+
+    """
+
+    xy = np.ascontiguousarray(mag_vs_t.xy, dtype=float)
+    if om_ph is None:
+        omp = None
+    else:
+        omp = tuple(om_ph)
+    return (xy.shape, xy.tobytes(), omp)
+
+
+def _fuse_load_terms(terms):
+    """Group load terms that share a time history and sum their theta
+
+    E_Igamv_the is linear in theta, so loads with the same
+    mag_vs_time-omega_phase pairing (e.g. staged fill where each lift has
+    its own depth distribution but the same construction schedule) can be
+    combined as E*inverse(gam*v)*(theta_1 + theta_2 + ...).  Each distinct
+    E matrix is then only calculated once.
+
+    Parameters
+    ----------
+    terms : iterable of (PolyLine, 2 element tuple or None, 1d ndarray)
+        (mag_vs_t, omega_phase, theta) for each load.
+
+    Returns
+    -------
+    fused : list of (PolyLine, 2 element tuple or None, 1d ndarray)
+        One (mag_vs_t, omega_phase, sum of theta) per distinct time
+        history, in order of first appearance.
+
+    Raises
+    ------
+    ValueError
+        If any mag_vs_t is None.
+
+    """
+
+    groups = OrderedDict()
+    for mag_vs_t, om_ph, theta in terms:
+        if mag_vs_t is None:
+            raise ValueError("load time history (e.g. mag_vs_time, "
+                             "top_vs_time) has a None entry; leave the load "
+                             "out instead.")
+        key = _time_history_key(mag_vs_t, om_ph)
+        if key in groups:
+            groups[key][2] = groups[key][2] + theta
+        else:
+            groups[key] = [mag_vs_t, om_ph, np.array(theta)]
+    return [tuple(v) for v in groups.values()]
+
+
+def _E_load(mag_vs_t, om_ph, eigs, tvals, dT, derivative=False,
+            implementation='vectorized'):
+    """E matrix for one mag_vs_time-omega_phase pairing
+
+    Calls integ.pEload_linear/pEload_coslinear or, if derivative=True,
+    integ.pEDload_linear/pEDload_coslinear.
+
+    """
+
+    if not om_ph is None:
+        omega, phase = om_ph
+        if derivative:
+            return integ.pEDload_coslinear(mag_vs_t, omega, phase, eigs,
+                                           tvals, dT,
+                                           implementation=implementation)
+        return integ.pEload_coslinear(mag_vs_t, omega, phase, eigs, tvals,
+                                      dT, implementation=implementation)
+    if derivative:
+        return integ.pEDload_linear(mag_vs_t, eigs, tvals, dT,
+                                    implementation=implementation)
+    return integ.pEload_linear(mag_vs_t, eigs, tvals, dT,
+                               implementation=implementation)
+
+
 def dim1sin_E_Igamv_the_BC_aDfDt_linear(drn,
                                         m,
                                         eigs,
@@ -595,6 +943,7 @@ def dim1sin_E_Igamv_the_BC_aDfDt_linear(drn,
             zdist = PolyLine(a.x1,a.x2, a.x2[-1]-a.x1, a.x2[-1]-a.x2)
 
 
+        terms = []
         if not top_vs_time is None:
             if top_omega_phase is None:
                 top_omega_phase = [None] * len(top_vs_time)
@@ -603,12 +952,7 @@ def dim1sin_E_Igamv_the_BC_aDfDt_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for top_vs_t, om_ph in zip(top_vs_time, top_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEDload_coslinear(top_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEDload_linear(top_vs_t, eigs, tvals, dT, implementation=implementation)
-                E_Igamv_the += (E*np.dot(Igamv, theta)).T
+                terms.append((top_vs_t, om_ph, theta))
 
 
         if not bot_vs_time is None:
@@ -619,12 +963,12 @@ def dim1sin_E_Igamv_the_BC_aDfDt_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for bot_vs_t, om_ph in zip(bot_vs_time, bot_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEDload_coslinear(bot_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEDload_linear(bot_vs_t, eigs, tvals, dT, implementation=implementation)
-                E_Igamv_the += (E*np.dot(Igamv, theta)).T
+                terms.append((bot_vs_t, om_ph, theta))
+
+        for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+            E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT, derivative=True,
+                        implementation=implementation)
+            E_Igamv_the += (E*np.dot(Igamv, theta)).T
 
     #theta is 1d array, Igamv is nieg by neig array, np.dot(Igamv, theta)
     #and np.dot(theta, Igamv) will give differetn 1d arrays.
@@ -814,6 +1158,7 @@ def dim1sin_E_Igamv_the_BC_abf_linear(drn,
         else:
             zdist = PolyLine(a.x1,a.x2, a.x2[-1]-a.x1, a.x2[-1]-a.x2)
 
+        terms = []
         if not top_vs_time is None:
             if top_omega_phase is None:
                 top_omega_phase = [None] * len(top_vs_time)
@@ -822,13 +1167,7 @@ def dim1sin_E_Igamv_the_BC_abf_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for top_vs_t, om_ph in zip(top_vs_time, top_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEload_coslinear(top_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEload_linear(top_vs_t, eigs, tvals, dT, implementation=implementation)
-#                E_Igamv_the += (E*np.dot(Igamv, theta)).T
-                np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
+                terms.append((top_vs_t, om_ph, theta))
 
         if not bot_vs_time is None:
             if bot_omega_phase is None:
@@ -837,13 +1176,12 @@ def dim1sin_E_Igamv_the_BC_abf_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for bot_vs_t, om_ph in zip(bot_vs_time, bot_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEload_coslinear(bot_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEload_linear(bot_vs_t, eigs, tvals, dT, implementation=implementation)
-                #E_Igamv_the += (E*np.dot(Igamv, theta)).T
-                np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
+                terms.append((bot_vs_t, om_ph, theta))
+
+        for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+            E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT,
+                        implementation=implementation)
+            np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
 
     #theta is 1d array, Igamv is nieg by neig array, np.dot(Igamv, theta)
     #and np.dot(theta, Igamv) will give differetn 1d arrays.
@@ -1035,6 +1373,7 @@ def dim1sin_E_Igamv_the_BC_abDfDt_linear(drn,
         else:
             zdist = PolyLine(a.x1,a.x2, a.x2[-1]-a.x1, a.x2[-1]-a.x2)
 
+        terms = []
         if not top_vs_time is None:
             if top_omega_phase is None:
                 top_omega_phase = [None] * len(top_vs_time)
@@ -1043,12 +1382,7 @@ def dim1sin_E_Igamv_the_BC_abDfDt_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for top_vs_t, om_ph in zip(top_vs_time, top_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEDload_coslinear(top_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEDload_linear(top_vs_t, eigs, tvals, dT, implementation=implementation)
-                E_Igamv_the += (E*np.dot(Igamv, theta)).T
+                terms.append((top_vs_t, om_ph, theta))
 
         if not bot_vs_time is None:
             if bot_omega_phase is None:
@@ -1057,12 +1391,12 @@ def dim1sin_E_Igamv_the_BC_abDfDt_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for bot_vs_t, om_ph in zip(bot_vs_time, bot_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEDload_coslinear(bot_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEDload_linear(bot_vs_t, eigs, tvals, dT, implementation=implementation)
-                E_Igamv_the += (E*np.dot(Igamv, theta)).T
+                terms.append((bot_vs_t, om_ph, theta))
+
+        for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+            E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT, derivative=True,
+                        implementation=implementation)
+            E_Igamv_the += (E*np.dot(Igamv, theta)).T
 
     #theta is 1d array, Igamv is nieg by neig array, np.dot(Igamv, theta)
     #and np.dot(theta, Igamv) will give differetn 1d arrays.
@@ -1253,6 +1587,7 @@ def dim1sin_E_Igamv_the_BC_D_aDf_linear(drn,
         else:
             zdist = PolyLine(a.x1,a.x2, a.x2[-1]-a.x1, a.x2[-1]-a.x2)
 
+        terms = []
         if not top_vs_time is None:
             if top_omega_phase is None:
                 top_omega_phase = [None] * len(top_vs_time)
@@ -1261,13 +1596,7 @@ def dim1sin_E_Igamv_the_BC_D_aDf_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for top_vs_t, om_ph in zip(top_vs_time, top_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEload_coslinear(top_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEload_linear(top_vs_t, eigs, tvals, dT, implementation=implementation)
-#                E_Igamv_the += (E*np.dot(Igamv, theta)).T
-                np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
+                terms.append((top_vs_t, om_ph, theta))
 
         if not bot_vs_time is None:
             if bot_omega_phase is None:
@@ -1277,13 +1606,12 @@ def dim1sin_E_Igamv_the_BC_D_aDf_linear(drn,
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
             for bot_vs_t, om_ph in zip(bot_vs_time, bot_omega_phase):
-                if not om_ph is None:
-                    omega, phase = om_ph
-                    E = integ.pEload_coslinear(bot_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-                else:
-                    E = integ.pEload_linear(bot_vs_t, eigs, tvals, dT, implementation=implementation)
-                np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
-#                E_Igamv_the += (E*np.dot(Igamv, theta)).T
+                terms.append((bot_vs_t, om_ph, theta))
+
+        for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+            E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT,
+                        implementation=implementation)
+            np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
 
     #theta is 1d array, Igamv is nieg by neig array, np.dot(Igamv, theta)
     #and np.dot(theta, Igamv) will give differetn 1d arrays.
@@ -1465,39 +1793,33 @@ def dim1sin_E_Igamv_the_BC_deltaf_linear(drn,
         zdist = 1.0 - zvals
 
     zdist = 1 - zvals * (1 - drn)
+    terms = []
     if not top_vs_time is None:
         if top_omega_phase is None:
             top_omega_phase = [None] * len(top_vs_time)
 
         for top_vs_t, om_ph in zip(top_vs_time, top_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                E = integ.pEload_coslinear(top_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-            else:
-                E = integ.pEload_linear(top_vs_t, eigs, tvals, dT, implementation=implementation)
             for z, zd, k in zip(zvals, zdist, pseudo_k):
                 theta = k * np.sin(z * m) * zd
                 if not theta_zero_indexes is None:
                     theta[theta_zero_indexes] = 0.0
-#                E_Igamv_the += (E*np.dot(Igamv, theta)).T
-                np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
+                terms.append((top_vs_t, om_ph, theta))
 
     if not bot_vs_time is None:
         if bot_omega_phase is None:
             bot_omega_phase = [None] * len(bot_vs_time)
 
         for bot_vs_t, om_ph in zip(bot_vs_time, bot_omega_phase):
-            if not om_ph is None:
-                omega, phase = om_ph
-                E = integ.pEload_coslinear(bot_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-            else:
-                E = integ.pEload_linear(bot_vs_t, eigs, tvals, dT, implementation=implementation)
             for z, k in zip(zvals, pseudo_k):
                 theta = k * np.sin(z * m) * z
                 if not theta_zero_indexes is None:
                     theta[theta_zero_indexes] = 0.0
-#                E_Igamv_the += (E*np.dot(Igamv, theta)).T
-                np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
+                terms.append((bot_vs_t, om_ph, theta))
+
+    for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+        E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT,
+                    implementation=implementation)
+        np.add(E_Igamv_the, (E*np.dot(Igamv, theta)).T,out=E_Igamv_the, casting='unsafe')
 
     #theta is 1d array, Igamv is nieg by neig array, np.dot(Igamv, theta)
     #and np.dot(theta, Igamv) will give differetn 1d arrays.
@@ -1636,17 +1958,18 @@ def dim1sin_E_Igamv_the_deltamag_linear(m,
     if omega_phase is None:
             omega_phase = [None] * len(mag_vs_time)
 
+    terms = []
     for z, k, mag_vs_t, om_ph in zip(zvals, pseudo_k, mag_vs_time, omega_phase):
         if mag_vs_t is None:
             continue
         theta = k * np.sin(z * m)
         if not theta_zero_indexes is None:
             theta[theta_zero_indexes] = 0.0
-        if not om_ph is None:
-            omega, phase = om_ph
-            E = integ.pEload_coslinear(mag_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-        else:
-            E = integ.pEload_linear(mag_vs_t, eigs, tvals, dT, implementation=implementation)
+        terms.append((mag_vs_t, om_ph, theta))
+
+    for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+        E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT,
+                    implementation=implementation)
         E_Igamv_the += (E*np.dot(Igamv, theta)).T
 
 
@@ -1797,18 +2120,17 @@ def dim1sin_E_Igamv_the_aDmagDt_bilinear(m,
         if omega_phase is None:
             omega_phase = [None] * len(mag_vs_time)
 
+        terms = []
         for mag_vs_t, mag_vs_z, om_ph in zip(mag_vs_time, mag_vs_depth, omega_phase):
             a, mag_vs_z = pwise.polyline_make_x_common(a, mag_vs_z)
             theta = integ.pdim1sin_ab_linear(m, a, mag_vs_z)
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
+            terms.append((mag_vs_t, om_ph, theta))
 
-            if not om_ph is None:
-                omega, phase = om_ph
-                E = integ.pEDload_coslinear(mag_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-            else:
-                E = integ.pEDload_linear(mag_vs_t, eigs, tvals, dT, implementation=implementation)
-
+        for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+            E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT, derivative=True,
+                        implementation=implementation)
 
             #theta is 1d array, Igamv is nieg by neig array, np.dot(Igamv, theta)
             #and np.dot(theta, Igamv) will give differetn 1d arrays.
@@ -1922,16 +2244,17 @@ def dim1sin_E_Igamv_the_abmag_bilinear(m,
         if omega_phase is None:
             omega_phase = [None] * len(mag_vs_time)
 
+        terms = []
         for mag_vs_t, mag_vs_z, om_ph in zip(mag_vs_time, mag_vs_depth, omega_phase):
             a, b , mag_vs_z = pwise.polyline_make_x_common(a, b, mag_vs_z)
             theta = integ.pdim1sin_abc_linear(m, a, b, mag_vs_z)
             if not theta_zero_indexes is None:
                 theta[theta_zero_indexes] = 0.0
-            if not om_ph is None:
-                omega, phase = om_ph
-                E = integ.pEload_coslinear(mag_vs_t, omega, phase, eigs, tvals, dT, implementation=implementation)
-            else:
-                E = integ.pEload_linear(mag_vs_t, eigs, tvals, dT, implementation=implementation)
+            terms.append((mag_vs_t, om_ph, theta))
+
+        for mag_vs_t, om_ph, theta in _fuse_load_terms(terms):
+            E = _E_load(mag_vs_t, om_ph, eigs, tvals, dT,
+                        implementation=implementation)
 
             #theta is 1d array, Igamv is nieg by neig array, np.dot(Igamv, theta)
             #and np.dot(theta, Igamv) will give differetn 1d arrays.
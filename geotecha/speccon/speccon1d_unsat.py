@@ -24,8 +24,9 @@ from __future__ import division, print_function
 import geotecha.plotting.one_d #import MarkersDashesColors as MarkersDashesColors
 import time
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
+from geotecha.inputoutput.lazy_import import lazy_import
+matplotlib = lazy_import('matplotlib')
+plt = lazy_import('matplotlib.pyplot')
 
 import geotecha.speccon.speccon1d as speccon1d
 import geotecha.piecewise.piecewise_linear_1d as pwise
@@ -213,11 +214,29 @@ class Speccon1dUnsat(speccon1d.Speccon1d):
         i.e. only calc settlement_z_pairs at a subset of the `tvals` values.
         Default settlement_z_pairs_tval_indexes=slice(None, None) i.e. use
         all the `tvals`.
-    implementation : ['scalar', 'vectorized','fortran'], optional
+    implementation : ['scalar', 'vectorized','fortran', 'jit'], optional
         Where possible use the stated implementation type.  'scalar'=
         python loops (slowest), 'vectorized' = numpy (fast), 'fortran' =
-        fortran extension (fastest).  Note only some functions have multiple
-        implementations.
+        fortran extension (fastest), 'jit' = numba compiled loops (about
+        as fast as 'fortran', needs numba).  Note only some functions have
+        multiple implementations.
+    neig_tol : float, optional
+        If not None then `neig` is the starting number of eigenvalues, which
+        will be doubled until the relative change in all output (pore
+        pressure, settlement etc.) is less than `neig_tol`. The chosen
+        number of eigenvalues is in `neig` after the analysis and each
+        neig tried, with the corresponding relative change, is recorded in
+        `neig_history`.  Default neig_tol=None i.e. use `neig`
+        eigenvalues.  Each neig tried is a complete analysis, so this
+        costs up to about twice an analysis with the final neig.
+    neig_max : int, optional
+        Maximum number of eigenvalues when using `neig_tol`.  Default
+        neig_max=None i.e. the larger of 2*`neig` and 200.
+    load_workers : int, optional
+        Number of threads used to calculate the surcharge, boundary
+        condition etc. load contributions concurrently.  Default
+        load_workers=None i.e. calculate one after the other.  Only worth
+        using with several load types and long `tvals`.
     RLzero : float, optional
         Reduced level of the top of the soil layer.  If RLzero is not None
         then all depths (in plots and results) will be transformed to an RL
@@ -304,6 +323,9 @@ class Speccon1dUnsat(speccon1d.Speccon1d):
         times corresponding to `tvals`.  This is an output array of size
         (len(avg_ppress_z_pairs), len(tvals[settlement_z_pairs_tval_indexes])).
         setw and sets are settlement in water and air. set is water + air.
+    neig_history : list of tuple, only present if neig_tol is input
+        Number of eigenvalues tried and the corresponding relative change
+        in output.  The last neig is the one used.
 
     Notes
     -----
@@ -519,7 +541,8 @@ class Speccon1dUnsat(speccon1d.Speccon1d):
             'atop_vs_time abot_vs_time '
             'wtop_vs_time wbot_vs_time '
             'ppress_z avg_ppress_z_pairs settlement_z_pairs tvals '
-            'implementation ppress_z_tval_indexes '
+            'implementation load_workers neig_tol neig_max '
+            'ppress_z_tval_indexes '
             'avg_ppress_z_pairs_tval_indexes settlement_z_pairs_tval_indexes '
             'surcharge_omega_phase '
             'atop_omega_phase abot_omega_phase '
@@ -630,6 +653,9 @@ class Speccon1dUnsat(speccon1d.Speccon1d):
         self.wtop_omega_phase = None
         self.wbot_omega_phase = None
         self.RLzero = None
+        self.load_workers = None
+        self.neig_tol = None
+        self.neig_max = None
         self.prefix = self._attribute_defaults.get('prefix', None)
         self.ua_ = self._attribute_defaults.get('ua_', None)
         self.n = None
@@ -875,7 +901,17 @@ class Speccon1dUnsat(speccon1d.Speccon1d):
         """
 
 #        self.psi[np.abs(self.psi) < 1e-8] = 0.0
-        Igam_psi = np.dot(np.linalg.inv(self.gam), self.psi)
+
+        # gam is a 2x2 block matrix and psi is block diagonal, so
+        # inverse(gam)*psi is found by Schur complement block solves.
+        n = self.neig
+        gam = self.gam
+        Z = np.zeros((n, n))
+        X0, X1 = speccon1d.block_solve_2x2(
+                    gam[:n, :n], gam[:n, n:], gam[n:, :n], gam[n:, n:],
+                    np.hstack((self.psi[:n, :n], Z)),
+                    np.hstack((Z, self.psi[n:, n:])))
+        Igam_psi = np.vstack((X0, X1))
         self.eigs, self.v = np.linalg.eig(Igam_psi)
         self.v = np.asarray(self.v)
         self.Igamv = np.linalg.inv(np.dot(self.gam, self.v))
@@ -909,18 +945,20 @@ class Speccon1dUnsat(speccon1d.Speccon1d):
         """
 
         self.E_Igamv_the = np.zeros((2*self.neig, len(self.tvals)))
+        contributions = []
 
         if sum([v is None for
                 v in [self.surcharge_vs_depth, self.surcharge_vs_time]])==0:
-            self._make_E_Igamv_the_surcharge()
-            self.E_Igamv_the += self.E_Igamv_the_surcharge
+            contributions.append((self._make_E_Igamv_the_surcharge,
+                                  'E_Igamv_the_surcharge'))
         if sum(v is None for v in[self.atop_vs_time,
                                   self.abot_vs_time,
                                   self.wtop_vs_time,
                                   self.wbot_vs_time])!=0:
-            self._make_E_Igamv_the_BC()
-            self.E_Igamv_the += self.E_Igamv_the_BC
+            contributions.append((self._make_E_Igamv_the_BC,
+                                  'E_Igamv_the_BC'))
 
+        self._add_load_contributions(contributions)
         return
 
     def _make_E_Igamv_the_surcharge(self):
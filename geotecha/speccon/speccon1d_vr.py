@@ -25,9 +25,11 @@ from __future__ import division, print_function
 
 import geotecha.plotting.one_d #import MarkersDashesColors as MarkersDashesColors
 import time
+import copy
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
+from geotecha.inputoutput.lazy_import import lazy_import
+matplotlib = lazy_import('matplotlib')
+plt = lazy_import('matplotlib.pyplot')
 
 import geotecha.speccon.speccon1d as speccon1d
 import geotecha.piecewise.piecewise_linear_1d as pwise
@@ -230,11 +232,29 @@ class Speccon1dVR(speccon1d.Speccon1d):
         i.e. only calc settlement_z_pairs at a subset of the `tvals` values.
         Default settlement_z_pairs_tval_indexes=slice(None, None) i.e. use
         all the `tvals`.
-    implementation : ['scalar', 'vectorized','fortran'], optional
+    implementation : ['scalar', 'vectorized','fortran', 'jit'], optional
         Where possible use the stated implementation type.  'scalar'=
         python loops (slowest), 'vectorized' = numpy (fast), 'fortran' =
-        fortran extension (fastest).  Note only some functions have multiple
-        implementations.
+        fortran extension (fastest), 'jit' = numba compiled loops (about
+        as fast as 'fortran', needs numba).  Note only some functions have
+        multiple implementations.
+    neig_tol : float, optional
+        If not None then `neig` is the starting number of eigenvalues, which
+        will be doubled until the relative change in all output (pore
+        pressure, settlement etc.) is less than `neig_tol`. The chosen
+        number of eigenvalues is in `neig` after the analysis and each
+        neig tried, with the corresponding relative change, is recorded in
+        `neig_history`.  Default neig_tol=None i.e. use `neig`
+        eigenvalues.  Each neig tried is a complete analysis, so this
+        costs up to about twice an analysis with the final neig.
+    neig_max : int, optional
+        Maximum number of eigenvalues when using `neig_tol`.  Default
+        neig_max=None i.e. the larger of 2*`neig` and 200.
+    load_workers : int, optional
+        Number of threads used to calculate the surcharge, boundary
+        condition etc. load contributions concurrently.  Default
+        load_workers=None i.e. calculate one after the other.  Only worth
+        using with several load types and long `tvals`.
     RLzero : float, optional
         Reduced level of the top of the soil layer.  If RLzero is not None
         then all depths (in plots and results) will be transformed to an RL
@@ -309,6 +329,9 @@ class Speccon1dVR(speccon1d.Speccon1d):
         Settlement between depths corresponding to `settlement_z_pairs` and
         times corresponding to `tvals`.  This is an output array of size
         (len(avg_ppress_z_pairs), len(tvals[settlement_z_pairs_tval_indexes]))
+    neig_history : list of tuple, only present if neig_tol is input
+        Number of eigenvalues tried and the corresponding relative change
+        in output.  The last neig is the one used.
 
 
     Notes
@@ -494,7 +517,8 @@ class Speccon1dVR(speccon1d.Speccon1d):
             'vacuum_vs_depth vacuum_vs_time '
             'top_vs_time bot_vs_time '
             'ppress_z avg_ppress_z_pairs settlement_z_pairs tvals '
-            'implementation ppress_z_tval_indexes '
+            'implementation load_workers neig_tol neig_max '
+            'ppress_z_tval_indexes '
             'avg_ppress_z_pairs_tval_indexes settlement_z_pairs_tval_indexes '
             'fixed_ppress surcharge_omega_phase vacuum_omega_phase '
             'fixed_ppress_omega_phase top_omega_phase bot_omega_phase '
@@ -605,6 +629,9 @@ class Speccon1dVR(speccon1d.Speccon1d):
         self.settlement_z_pairs = None
         self.tvals = None
         self.RLzero = None
+        self.load_workers = None
+        self.neig_tol = None
+        self.neig_max = None
 
         self.plot_properties = self._attribute_defaults.get(
             'plot_properties', None)
@@ -837,26 +864,28 @@ class Speccon1dVR(speccon1d.Speccon1d):
         """
 
         self.E_Igamv_the = np.zeros((self.neig,len(self.tvals)))
+        contributions = []
         if sum([v is None for v in [self.surcharge_vs_depth,
                                     self.surcharge_vs_time]])==0:
-            self._make_E_Igamv_the_surcharge()
-            self.E_Igamv_the += self.E_Igamv_the_surcharge
+            contributions.append((self._make_E_Igamv_the_surcharge,
+                                  'E_Igamv_the_surcharge'))
         if sum([v is None for v in [self.vacuum_vs_depth,
                                     self.vacuum_vs_time, self.et,
                                     self.kh,self.dTh]])==0:
             if self.dTh!=0:
-                self._make_E_Igamv_the_vacuum()
-                self.E_Igamv_the += self.E_Igamv_the_vacuum
+                contributions.append((self._make_E_Igamv_the_vacuum,
+                                      'E_Igamv_the_vacuum'))
         if not self.top_vs_time is None or not self.bot_vs_time is None:
-            self._make_E_Igamv_the_BC()
-            self.E_Igamv_the += self.E_Igamv_the_BC
+            contributions.append((self._make_E_Igamv_the_BC,
+                                  'E_Igamv_the_BC'))
         if not self.fixed_ppress is None:
-            self._make_E_Igamv_the_fixed_ppress()
-            self.E_Igamv_the +=self.E_Igamv_the_fixed_ppress
+            contributions.append((self._make_E_Igamv_the_fixed_ppress,
+                                  'E_Igamv_the_fixed_ppress'))
         if not self.pumping is None:
-            self._make_E_Igamv_the_pumping()
-            self.E_Igamv_the += self.E_Igamv_the_pumping
+            contributions.append((self._make_E_Igamv_the_pumping,
+                                  'E_Igamv_the_pumping'))
 
+        self._add_load_contributions(contributions)
         return
 
     def _make_E_Igamv_the_surcharge(self):
@@ -1410,6 +1439,273 @@ class Speccon1dVR(speccon1d.Speccon1d):
                     prop_dict=load_prop))
 
 
+def _history_after(mag_vs_t, t0):
+    """Part of a piecewise linear load time history after time t0
+
+    E*inverse(gam*v)*theta at time t is the decayed value at t0 plus the
+    contribution of the load between t0 and t.  The latter is found by
+    evaluating the usual E matrix functions with the part of the time
+    history after t0.  Steps at t0 are excluded as they already contribute
+    to the value at t0.
+
+    Parameters
+    ----------
+    mag_vs_t : PolyLine or None
+        Load magnitude vs time.
+    t0 : float
+        Time after which to keep the load history.
+
+    Returns
+    -------
+    out : PolyLine or None
+        Load history for t >= t0.  If `mag_vs_t` finishes at or before t0
+        then a zero magnitude PolyLine is returned.  None if `mag_vs_t` is
+        None.
+
+    """
+
+    if mag_vs_t is None:
+        return None
+
+    x = mag_vs_t.x
+    y = mag_vs_t.y
+    if t0 >= x[-1]:
+        return PolyLine([t0, t0 + 1], [0, 0])
+
+    i = np.searchsorted(x, t0, side='right')
+    if i == 0:
+        return PolyLine(x, y)
+
+    y0 = y[i - 1] + (y[i] - y[i - 1]) * (t0 - x[i - 1]) / (x[i] - x[i - 1])
+    return PolyLine(np.r_[t0, x[i:]], np.r_[y0, y[i:]])
+
+
+class Speccon1dVRIncremental(object):
+    """Extend a Speccon1dVR analysis to later times without recalculating
+    the whole time history.
+
+    For monitoring/back-analysis where output is required at new times as
+    they arrive.  Rather than re-running `Speccon1dVR.make_all` for the
+    entire `tvals` history, E*inverse(gam*v)*theta at the latest solved
+    time is carried forward using:
+
+    .. math:: \\mathbf{E}\\left(\\mathbf{\\Gamma v}\\right)^{-1}
+              \\mathbf{\\theta}\\left({t}\\right)=
+              \\exp\\left({-\\lambda dT\\left({t-t_0}\\right)}\\right)
+              \\mathbf{E}\\left(\\mathbf{\\Gamma v}\\right)^{-1}
+              \\mathbf{\\theta}\\left({t_0}\\right)+
+              \\mathbf{E}_{t_0\\rightarrow t}
+              \\left(\\mathbf{\\Gamma v}\\right)^{-1}\\mathbf{\\theta}
+
+    where the last term only involves the load segments after
+    :math:`t_0`.  The cost of each new time therefore does not depend on
+    how many times have already been solved.
+
+    Parameters
+    ----------
+    model : Speccon1dVR
+        Analysis to extend.  Material properties, eigenvalues etc. are
+        taken from `model`.  If `model` has not been solved then its
+        time independent arrays and E_Igamv_the (for `model.tvals`) will be
+        made.  Load PolyLines in `model` are replaced when `append_load` is
+        used.
+
+    Attributes
+    ----------
+    t_last : float
+        Latest time at which the solution is known.
+    E_Igamv_the_last : 1d ndarray
+        E*inverse(gam*v)*theta at `t_last`.
+    tvals : 1d ndarray
+        Times from the most recent call to `extend`.
+    E_Igamv_the : ndarray
+        E*inverse(gam*v)*theta of size (neig, len(tvals)) for the most
+        recent call to `extend`.
+    por, avp, set : ndarray
+        Pore pressure, average pore pressure and settlement at the times
+        in `tvals`.  Only made if `model.ppress_z`,
+        `model.avg_ppress_z_pairs`, `model.settlement_z_pairs`
+        respectively are not None.  `model`'s ``*_tval_indexes`` are not
+        used; output is for every value in `tvals`.
+
+    See Also
+    --------
+    Speccon1dVR : The underlying analysis.
+
+    Examples
+    --------
+    >>> a = Speccon1dVR('''
+    ... neig = 20
+    ... mv = PolyLine([0, 1], [1, 1])
+    ... kv = PolyLine([0, 1], [1, 1])
+    ... dTv = 1.0
+    ... surcharge_vs_depth = PolyLine([0, 1], [1, 1])
+    ... surcharge_vs_time = PolyLine([0, 0.1, 10], [0, 1, 1])
+    ... settlement_z_pairs = [[0, 1]]
+    ... tvals = [0.1, 0.2]
+    ... ''')
+    >>> a.make_all()
+    >>> b = Speccon1dVRIncremental(a)
+    >>> b.extend([0.3, 0.4])
+    >>> b.set.shape
+    (1, 2)
+
+    """
+
+    _load_attributes = ('surcharge_vs_time vacuum_vs_time top_vs_time '
+                        'bot_vs_time fixed_ppress pumping').split()
+
+    def __init__(self, model):
+        self.model = model
+        if getattr(model, 'E_Igamv_the', None) is None:
+            model.check_input_attributes()
+            model.make_time_independent_arrays()
+            model.make_time_dependent_arrays()
+
+        tvals = np.asarray(model.tvals)
+        i = np.argmax(tvals)
+        self.t_last = tvals[i]
+        self.E_Igamv_the_last = model.E_Igamv_the[:, i].copy()
+
+        self.tvals = None
+        self.E_Igamv_the = None
+        self.por = None
+        self.avp = None
+        self.set = None
+
+    @staticmethod
+    def _get_histories(name, value):
+        """List of the load time history PolyLines in a load attribute"""
+        if value is None:
+            return None
+        if name == 'fixed_ppress':
+            return [v[2] for v in value]
+        if name == 'pumping':
+            return [v[1] for v in value]
+        return list(value)
+
+    @staticmethod
+    def _set_histories(name, value, histories):
+        """Load attribute with its time history PolyLines replaced"""
+        if value is None:
+            return None
+        if name == 'fixed_ppress':
+            return [(v[0], v[1], h) for v, h in zip(value, histories)]
+        if name == 'pumping':
+            return [(v[0], h) for v, h in zip(value, histories)]
+        return histories
+
+    def append_load(self, name, index, x, y):
+        """Add segments to the end of a load time history
+
+        Parameters
+        ----------
+        name : ['surcharge_vs_time', 'vacuum_vs_time', 'top_vs_time',
+                'bot_vs_time', 'fixed_ppress', 'pumping']
+            Load to add to.
+        index : int
+            Which load in the `name` list to add to.
+        x, y : 1d array_like
+            Time and magnitude values to append.  x[0] must not be less
+            than `t_last` or the last existing time value of the load.  If
+            x[0] equals the last existing time value then a step in the load
+            is introduced.  If the load history is None (only possible for
+            fixed_ppress) then `x` and `y` become the new load history.
+
+        """
+
+        if not name in self._load_attributes:
+            raise ValueError("name must be one of {}, not "
+                             "'{}'.".format(self._load_attributes, name))
+
+        value = getattr(self.model, name)
+        histories = self._get_histories(name, value)
+        if histories is None:
+            raise ValueError("model.{} is None.".format(name))
+
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        if x[0] < self.t_last:
+            raise ValueError("Cannot append load at time {:g} which is "
+                             "earlier than t_last={:g}.".format(x[0],
+                                                                self.t_last))
+        old = histories[index]
+        if old is None:
+            histories[index] = PolyLine(x, y)
+        else:
+            if x[0] < old.x[-1]:
+                raise ValueError("Cannot append load at time {:g} which is "
+                                 "earlier than the end of the existing "
+                                 "load, {:g}.".format(x[0], old.x[-1]))
+            histories[index] = PolyLine(np.r_[old.x, x], np.r_[old.y, y])
+
+        setattr(self.model, name, self._set_histories(name, value, histories))
+        return
+
+    def extend(self, tvals):
+        """Solve for times later than `t_last`
+
+        Makes `tvals`, `E_Igamv_the`, `por`, `avp`, `set` for the new
+        times and moves `t_last` to max(tvals).
+
+        Parameters
+        ----------
+        tvals : 1d array_like
+            New time values.  All must be greater than or equal to
+            `t_last`.
+
+        """
+
+        tvals = np.atleast_1d(np.asarray(tvals, dtype=float))
+        if np.any(tvals < self.t_last):
+            raise ValueError("All tvals must be >= t_last={:g}. Use "
+                             "Speccon1dVR for earlier times.".format(
+                                self.t_last))
+
+        model = self.model
+        work = copy.copy(model)
+        work.tvals = tvals
+        for name in self._load_attributes:
+            value = getattr(model, name)
+            histories = self._get_histories(name, value)
+            if histories is None:
+                continue
+            histories = [_history_after(h, self.t_last) for h in histories]
+            setattr(work, name, self._set_histories(name, value, histories))
+
+        work.make_E_Igamv_the()
+        E_Igamv_the = work.E_Igamv_the
+        E_Igamv_the += (np.exp(-model.dT * model.eigs[:, np.newaxis] *
+                               (tvals[np.newaxis, :] - self.t_last)) *
+                        self.E_Igamv_the_last[:, np.newaxis])
+
+        #output uses load values at tvals, so the full load histories
+        for name in self._load_attributes:
+            setattr(work, name, getattr(model, name))
+        work.E_Igamv_the = E_Igamv_the
+        work.v_E_Igamv_the = np.dot(model.v, E_Igamv_the)
+        work.ppress_z_tval_indexes = slice(None, None)
+        work.avg_ppress_z_pairs_tval_indexes = slice(None, None)
+        work.settlement_z_pairs_tval_indexes = slice(None, None)
+
+        self.tvals = tvals
+        self.E_Igamv_the = E_Igamv_the
+        if not model.ppress_z is None:
+            work._make_por()
+            self.por = work.por
+        if not model.avg_ppress_z_pairs is None:
+            work._make_avp()
+            self.avp = work.avp
+        if not model.settlement_z_pairs is None:
+            work._make_set()
+            self.set = work.set
+
+        i = np.argmax(tvals)
+        self.t_last = tvals[i]
+        self.E_Igamv_the_last = E_Igamv_the[:, i].copy()
+        return
+
+
 def main():
     """Run speccon1d_vr as script."""
     a = GenericInputFileArgParser(obj=Speccon1dVR,
@@ -25,8 +25,9 @@ from __future__ import division, print_function
 import geotecha.plotting.one_d #import MarkersDashesColors as MarkersDashesColors
 import time
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
+from geotecha.inputoutput.lazy_import import lazy_import
+matplotlib = lazy_import('matplotlib')
+plt = lazy_import('matplotlib.pyplot')
 
 import geotecha.speccon.speccon1d as speccon1d
 import geotecha.piecewise.piecewise_linear_1d as pwise
@@ -216,11 +217,29 @@ class Speccon1dVRC(speccon1d.Speccon1d):
         i.e. only calc settlement_z_pairs at a subset of the `tvals` values.
         Default settlement_z_pairs_tval_indexes=slice(None, None) i.e. use
         all the `tvals`.
-    implementation : ['scalar', 'vectorized','fortran'], optional
+    implementation : ['scalar', 'vectorized','fortran', 'jit'], optional
         Where possible use the stated implementation type.  'scalar'=
         python loops (slowest), 'vectorized' = numpy (fast), 'fortran' =
-        fortran extension (fastest).  Note only some functions have multiple
-        implementations.
+        fortran extension (fastest), 'jit' = numba compiled loops (about
+        as fast as 'fortran', needs numba).  Note only some functions have
+        multiple implementations.
+    neig_tol : float, optional
+        If not None then `neig` is the starting number of eigenvalues, which
+        will be doubled until the relative change in all output (pore
+        pressure, settlement etc.) is less than `neig_tol`. The chosen
+        number of eigenvalues is in `neig` after the analysis and each
+        neig tried, with the corresponding relative change, is recorded in
+        `neig_history`.  Default neig_tol=None i.e. use `neig`
+        eigenvalues.  Each neig tried is a complete analysis, so this
+        costs up to about twice an analysis with the final neig.
+    neig_max : int, optional
+        Maximum number of eigenvalues when using `neig_tol`.  Default
+        neig_max=None i.e. the larger of 2*`neig` and 200.
+    load_workers : int, optional
+        Number of threads used to calculate the surcharge, boundary
+        condition etc. load contributions concurrently.  Default
+        load_workers=None i.e. calculate one after the other.  Only worth
+        using with several load types and long `tvals`.
     RLzero : float, optional
         Reduced level of the top of the soil layer.  If RLzero is not None
         then all depths (in plots and results) will be transformed to an RL
@@ -304,6 +323,17 @@ class Speccon1dVRC(speccon1d.Speccon1d):
         Settlement between depths corresponding to `settlement_z_pairs` and
         times corresponding to `tvals`.  This is an output array of size
         (len(avg_ppress_z_pairs), len(tvals[settlement_z_pairs_tval_indexes]))
+    neig_history : list of tuple, only present if neig_tol is input
+        Number of eigenvalues tried and the corresponding relative change
+        in output.  The last neig is the one used.
+    bet00, bet10, bet20, bet01_alp02, bet11_alp12, bet21_alp22 : ndarray
+        Block columns of bet, the inverse of the 3x3 block matrix Ibet in
+        `_make_bet`, that are used in the analysis.  bet01_alp02 is
+        bet01 + alp * bet02 etc.
+    bet, bet01, bet02, bet11, bet12, bet21, bet22 : ndarray, read only
+        The full inverse and its other blocks.  These are not needed in
+        the analysis and are calculated (by inverting Ibet) each time they
+        are accessed.
 
 
     Notes
@@ -529,7 +559,8 @@ class Speccon1dVRC(speccon1d.Speccon1d):
             'surcharge_vs_depth surcharge_vs_time '
             'top_vs_time bot_vs_time '
             'ppress_z avg_ppress_z_pairs settlement_z_pairs tvals '
-            'implementation ppress_z_tval_indexes '
+            'implementation load_workers neig_tol neig_max '
+            'ppress_z_tval_indexes '
             'avg_ppress_z_pairs_tval_indexes settlement_z_pairs_tval_indexes '
             'surcharge_omega_phase '
             'top_omega_phase bot_omega_phase '
@@ -632,6 +663,9 @@ class Speccon1dVRC(speccon1d.Speccon1d):
         self.settlement_z_pairs = None
         self.tvals = None
         self.RLzero = None
+        self.load_workers = None
+        self.neig_tol = None
+        self.neig_max = None
 
         self.plot_properties = self._attribute_defaults.get('plot_properties',
                                                             None)
@@ -839,34 +873,7 @@ class Speccon1dVRC(speccon1d.Speccon1d):
             self.psi_c = self.psi_ch - self.psi_cv
 
 
-
-
-        Ibet = np.bmat([[np.diag([1.0 - self.alp] * self.neig),
-                         np.diag([self.alp] * self.neig),
-                         np.zeros((self.neig, self.neig))],
-                        [self.psi_s,
-                         -self.psi_c ,
-                         self.psi_ch - self.psi_sh ],
-                        [self.psi_sh - self.alp * self.psi_sv,
-                         self.alp * self.psi_cv,
-                         -self.psi_sh]])
-
-        Ibet = np.asarray(Ibet) # np.bmat returns an array
-
-        self.bet = np.linalg.inv(Ibet)
-
-        self.bet00 = self.bet[:self.neig, :self.neig]
-        self.bet01 = self.bet[:self.neig, self.neig:2 * self.neig]
-        self.bet02 = self.bet[:self.neig, 2 * self.neig:]
-
-        self.bet10 = self.bet[self.neig: 2*self.neig, :self.neig]
-        self.bet11 = self.bet[self.neig: 2*self.neig, self.neig:2 * self.neig]
-        self.bet12 = self.bet[self.neig: 2*self.neig, 2 * self.neig:]
-
-        self.bet20 = self.bet[2*self.neig:, :self.neig]
-        self.bet21 = self.bet[2*self.neig:, self.neig:2 * self.neig]
-        self.bet22 = self.bet[2*self.neig:, 2 * self.neig:]
-
+        self._make_bet()
 
         self.psi = (1 - self.alp) * np.dot(self.psi_sv, self.bet00)
         self.psi += self.alp * np.dot(self.psi_cv, self.bet10)
@@ -875,6 +882,88 @@ class Speccon1dVRC(speccon1d.Speccon1d):
 
         return
 
+    def _Ibet(self):
+        """3x3 block matrix whose inverse is bet"""
+
+        return np.asarray(
+            np.bmat([[np.diag([1.0 - self.alp] * self.neig),
+                      np.diag([self.alp] * self.neig),
+                      np.zeros((self.neig, self.neig))],
+                     [self.psi_s,
+                      -self.psi_c,
+                      self.psi_ch - self.psi_sh],
+                     [self.psi_sh - self.alp * self.psi_sv,
+                      self.alp * self.psi_cv,
+                      -self.psi_sh]]))
+
+    def _make_bet(self):
+        """make the bet block columns used in the analysis
+
+        bet is the inverse of the block matrix (see `_Ibet`)
+        Ibet = [[(1-alp)*I, alp*I, 0],
+                [psi_s, -psi_c, psi_ch - psi_sh],
+                [psi_sh - alp*psi_sv, alp*psi_cv, -psi_sh]].
+        Only bet[:, 0] and bet[:, 1] + alp*bet[:, 2] (block columns) are
+        needed.  The diagonal first block row is eliminated so the work
+        is a 2n x 2n Schur complement solve rather than a 3n x 3n inverse.
+
+        """
+
+        n = self.neig
+        I = np.identity(n)
+        Z = np.zeros((n, n))
+        M = [[self.psi_s, -self.psi_c, self.psi_ch - self.psi_sh],
+             [self.psi_sh - self.alp * self.psi_sv, self.alp * self.psi_cv,
+              -self.psi_sh]]
+        R = [np.hstack((I, Z)),
+             np.hstack((Z, I)),
+             np.hstack((Z, self.alp * I))]
+        X = speccon1d.block_solve_diag_row(1.0 - self.alp, self.alp, M, R)
+
+        self.bet00, self.bet01_alp02 = X[0][:, :n], X[0][:, n:]
+        self.bet10, self.bet11_alp12 = X[1][:, :n], X[1][:, n:]
+        self.bet20, self.bet21_alp22 = X[2][:, :n], X[2][:, n:]
+
+    def _bet_block(self, i, j):
+        """block (i, j) of bet"""
+        n = self.neig
+        return self.bet[i * n:(i + 1) * n, j * n:(j + 1) * n]
+
+    @property
+    def bet(self):
+        """inverse of the 3x3 block matrix Ibet, calculated on access"""
+        return np.linalg.inv(self._Ibet())
+
+    @property
+    def bet01(self):
+        """bet block (0, 1), calculated on access"""
+        return self._bet_block(0, 1)
+
+    @property
+    def bet02(self):
+        """bet block (0, 2), calculated on access"""
+        return self._bet_block(0, 2)
+
+    @property
+    def bet11(self):
+        """bet block (1, 1), calculated on access"""
+        return self._bet_block(1, 1)
+
+    @property
+    def bet12(self):
+        """bet block (1, 2), calculated on access"""
+        return self._bet_block(1, 2)
+
+    @property
+    def bet21(self):
+        """bet block (2, 1), calculated on access"""
+        return self._bet_block(2, 1)
+
+    @property
+    def bet22(self):
+        """bet block (2, 2), calculated on access"""
+        return self._bet_block(2, 2)
+
     def _make_eigs_and_v(self):
         """make Igam_psi, v and eigs, and Igamv
 
@@ -897,7 +986,7 @@ class Speccon1dVRC(speccon1d.Speccon1d):
         """
 
         self.psi[np.abs(self.psi) < 1e-8] = 0.0
-        Igam_psi = np.dot(np.linalg.inv(self.gam), self.psi)
+        Igam_psi = np.linalg.solve(self.gam, self.psi)
         self.eigs, self.v = np.linalg.eig(Igam_psi)
         self.v = np.asarray(self.v)
         self.Igamv = np.linalg.inv(np.dot(self.gam, self.v))
@@ -923,16 +1012,18 @@ class Speccon1dVRC(speccon1d.Speccon1d):
         """
 
         self.E_Igamv_the = np.zeros((self.neig, len(self.tvals)))
+        contributions = []
 
         if sum([v is None for
                 v in [self.surcharge_vs_depth, self.surcharge_vs_time]])==0:
-            self._make_E_Igamv_the_surcharge()
-            self.E_Igamv_the += self.E_Igamv_the_surcharge
+            contributions.append((self._make_E_Igamv_the_surcharge,
+                                  'E_Igamv_the_surcharge'))
 
         if not self.top_vs_time is None or not self.bot_vs_time is None:
-            self._make_E_Igamv_the_BC()
-            self.E_Igamv_the += self.E_Igamv_the_BC
+            contributions.append((self._make_E_Igamv_the_BC,
+                                  'E_Igamv_the_BC'))
 
+        self._add_load_contributions(contributions)
         return
 
     def _make_E_Igamv_the_surcharge(self):
@@ -1014,8 +1105,8 @@ class Speccon1dVRC(speccon1d.Speccon1d):
 
 
         G = np.diag([self.alp]*self.neig)
-        G -= (1-self.alp) * self.psi_sv.dot((self.bet01 + self.alp*self.bet02))
-        G -= self.alp * self.psi_cv.dot((self.bet11 + self.alp*self.bet12))
+        G -= (1-self.alp) * self.psi_sv.dot(self.bet01_alp02)
+        G -= self.alp * self.psi_cv.dot(self.bet11_alp12)
 
         #dTv * d/dZ(kv * du/dZ) component
         if sum([v is None for v in [self.kv, self.dTv]])==0:
@@ -1080,13 +1171,13 @@ class Speccon1dVRC(speccon1d.Speccon1d):
             a = self.dTv * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet01 + self.alp * self.bet02),
+                    self.bet01_alp02,
                     self.kv, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             b = self.dTvc * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet01 + self.alp * self.bet02),
+                    self.bet01_alp02,
                     self.kvc, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             self.pors += speccon1d.dim1sin_f(self.m, self.ppress_z,
@@ -1102,13 +1193,13 @@ class Speccon1dVRC(speccon1d.Speccon1d):
             a = self.dTv * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet11 + self.alp * self.bet12),
+                    self.bet11_alp12,
                     self.kv, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             b = self.dTvc * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet11 + self.alp * self.bet12),
+                    self.bet11_alp12,
                     self.kvc, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             self.porc += speccon1d.dim1sin_f(self.m, self.ppress_z,
@@ -1153,13 +1244,13 @@ class Speccon1dVRC(speccon1d.Speccon1d):
             a = self.dTv * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet01 + self.alp * self.bet02),
+                    self.bet01_alp02,
                     self.kv, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             b = self.dTvc * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet01 + self.alp * self.bet02),
+                    self.bet01_alp02,
                     self.kvc, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             self.avps += speccon1d.dim1sin_avgf(self.m, self.avg_ppress_z_pairs,
@@ -1175,13 +1266,13 @@ class Speccon1dVRC(speccon1d.Speccon1d):
             a = self.dTv * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet11 + self.alp * self.bet12),
+                    self.bet11_alp12,
                     self.kv, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             b = self.dTvc * speccon1d.dim1sin_foft_Ipsiw_the_BC_D_aDf_linear(
                     self.drn, self.m, self.eigs,
                     tvals,
-                    (self.bet11 + self.alp * self.bet12),
+                    self.bet11_alp12,
                     self.kvc, self.top_vs_time, bot_vs_time,
                     self.top_omega_phase, self.bot_omega_phase)
             self.avpc += speccon1d.dim1sin_avgf(self.m, self.avg_ppress_z_pairs,
@@ -25,8 +25,9 @@ from __future__ import division, print_function
 import geotecha.plotting.one_d #import MarkersDashesColors as MarkersDashesColors
 import time
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
+from geotecha.inputoutput.lazy_import import lazy_import
+matplotlib = lazy_import('matplotlib')
+plt = lazy_import('matplotlib.pyplot')
 
 import geotecha.speccon.speccon1d as speccon1d
 import geotecha.piecewise.piecewise_linear_1d as pwise
@@ -232,11 +233,29 @@ class Speccon1dVRW(speccon1d.Speccon1d):
         i.e. only calc settlement_z_pairs at a subset of the `tvals` values.
         Default settlement_z_pairs_tval_indexes=slice(None, None) i.e. use
         all the `tvals`.
-    implementation : ['scalar', 'vectorized','fortran'], optional
+    implementation : ['scalar', 'vectorized','fortran', 'jit'], optional
         Where possible use the stated implementation type.  'scalar'=
         python loops (slowest), 'vectorized' = numpy (fast), 'fortran' =
-        fortran extension (fastest).  Note only some functions have multiple
-        implementations.
+        fortran extension (fastest), 'jit' = numba compiled loops (about
+        as fast as 'fortran', needs numba).  Note only some functions have
+        multiple implementations.
+    neig_tol : float, optional
+        If not None then `neig` is the starting number of eigenvalues, which
+        will be doubled until the relative change in all output (pore
+        pressure, settlement etc.) is less than `neig_tol`. The chosen
+        number of eigenvalues is in `neig` after the analysis and each
+        neig tried, with the corresponding relative change, is recorded in
+        `neig_history`.  Default neig_tol=None i.e. use `neig`
+        eigenvalues.  Each neig tried is a complete analysis, so this
+        costs up to about twice an analysis with the final neig.
+    neig_max : int, optional
+        Maximum number of eigenvalues when using `neig_tol`.  Default
+        neig_max=None i.e. the larger of 2*`neig` and 200.
+    load_workers : int, optional
+        Number of threads used to calculate the surcharge, boundary
+        condition etc. load contributions concurrently.  Default
+        load_workers=None i.e. calculate one after the other.  Only worth
+        using with several load types and long `tvals`.
     RLzero : float, optional
         Reduced level of the top of the soil layer.  If RLzero is not None
         then all depths (in plots and results) will be transformed to an RL
@@ -312,6 +331,9 @@ class Speccon1dVRW(speccon1d.Speccon1d):
         Settlement between depths corresponding to `settlement_z_pairs` and
         times corresponding to `tvals`.  This is an output array of size
         (len(avg_ppress_z_pairs), len(tvals[settlement_z_pairs_tval_indexes]))
+    neig_history : list of tuple, only present if neig_tol is input
+        Number of eigenvalues tried and the corresponding relative change
+        in output.  The last neig is the one used.
 
 
     Notes
@@ -515,7 +537,8 @@ class Speccon1dVRW(speccon1d.Speccon1d):
             'surcharge_vs_depth surcharge_vs_time '
             'top_vs_time bot_vs_time '
             'ppress_z avg_ppress_z_pairs settlement_z_pairs tvals '
-            'implementation ppress_z_tval_indexes '
+            'implementation load_workers neig_tol neig_max '
+            'ppress_z_tval_indexes '
             'avg_ppress_z_pairs_tval_indexes settlement_z_pairs_tval_indexes '
             'fixed_ppress surcharge_omega_phase '
             'fixed_ppress_omega_phase top_omega_phase bot_omega_phase '
@@ -620,6 +643,9 @@ class Speccon1dVRW(speccon1d.Speccon1d):
         self.settlement_z_pairs = None
         self.tvals = None
         self.RLzero = None
+        self.load_workers = None
+        self.neig_tol = None
+        self.neig_max = None
 
         self.plot_properties = (
             self._attribute_defaults.get('plot_properties', None))
@@ -880,20 +906,22 @@ class Speccon1dVRW(speccon1d.Speccon1d):
         """
 
         self.E_Igamv_the = np.zeros((self.neig,len(self.tvals)))
+        contributions = []
         if sum([v is None for v in [self.surcharge_vs_depth,
                                     self.surcharge_vs_time]])==0:
-            self._make_E_Igamv_the_surcharge()
-            self.E_Igamv_the += self.E_Igamv_the_surcharge
+            contributions.append((self._make_E_Igamv_the_surcharge,
+                                  'E_Igamv_the_surcharge'))
         if not self.top_vs_time is None or not self.bot_vs_time is None:
-            self._make_E_Igamv_the_BC()
-            self.E_Igamv_the += self.E_Igamv_the_BC
+            contributions.append((self._make_E_Igamv_the_BC,
+                                  'E_Igamv_the_BC'))
         if not self.fixed_ppress is None:
-            self._make_E_Igamv_the_fixed_ppress()
-            self.E_Igamv_the +=self.E_Igamv_the_fixed_ppress
+            contributions.append((self._make_E_Igamv_the_fixed_ppress,
+                                  'E_Igamv_the_fixed_ppress'))
         if not self.pumping is None:
-            self._make_E_Igamv_the_pumping()
-            self.E_Igamv_the += self.E_Igamv_the_pumping
+            contributions.append((self._make_E_Igamv_the_pumping,
+                                  'E_Igamv_the_pumping'))
 
+        self._add_load_contributions(contributions)
         return
 
     def _make_E_Igamv_the_surcharge(self):
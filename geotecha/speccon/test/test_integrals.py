@@ -212,7 +212,7 @@ class test_dim1sin_af_linear(base_t_ester):
     def __init__(self):
         base_t_ester.__init__(self, dim1sin_af_linear, prefix = self.__class__.__name__)
         self.gamma_isotropic = np.array([[0.5, 0], [0, 0.5]])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         self.cases = [
 
             ['a const, PTIB',
@@ -281,7 +281,7 @@ class test_dim1sin_abf_linear(base_t_ester):
     def __init__(self):
         base_t_ester.__init__(self, dim1sin_abf_linear, prefix = self.__class__.__name__)
         self.iso = np.array([[0.5, 0], [0, 0.5]])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         self.cases = [
 
             #a
@@ -428,7 +428,7 @@ class test_dim1sin_D_aDf_linear(base_t_ester):
         base_t_ester.__init__(self, dim1sin_D_aDf_linear, prefix = self.__class__.__name__)
         self.iso_PTIB = (-0.5) * np.array([[(np.pi/2.0)**2.0, 0], [0, (3.0*np.pi/2.0)**2.0]])
         self.iso_PTPB = (-0.5) * np.array([[(np.pi)**2.0, 0], [0, (2.0*np.pi)**2.0]])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         self.cases = [
 
             ['a const, PTIB',
@@ -503,7 +503,7 @@ class test_dim1sin_ab_linear(base_t_ester):
 
         self.iso_PTIB = np.array([2/pi, 2/(3*pi)])
         self.iso_PTPB = np.array([2/pi, 0.0])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
 
         self.cases = [
 
@@ -598,7 +598,7 @@ class test_dim1sin_abc_linear(base_t_ester):
 
         self.iso_PTIB = np.array([2/pi, 2/(3*pi)])
         self.iso_PTPB = np.array([2/pi, 0.0])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
 
         self.cases = [
             #a
@@ -718,7 +718,7 @@ class test_dim1sin_D_aDb_linear(base_t_ester):
     def __init__(self):
         base_t_ester.__init__(self, dim1sin_D_aDb_linear, prefix = self.__class__.__name__)
         self.zero = np.zeros(2)
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
 
 
         self.cases = [
@@ -790,7 +790,7 @@ class test_EDload_linear(base_t_ester):
         base_t_ester.__init__(self, EDload_linear, prefix = self.__class__.__name__)
         self.eigs = np.array([2.46740110027, 22.2066099025])
         self.eigs_dT2 = np.array([1.23370055014, 11.1033049512])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         #EDload_linear(loadtim, loadmag, eigs, tvals)
 
 
@@ -851,7 +851,7 @@ class test_EDload_coslinear(base_t_ester):
         base_t_ester.__init__(self, EDload_coslinear, prefix = self.__class__.__name__)
         self.eigs = np.array([2.46740110027, 22.2066099025])
         self.eigs_dT2 = np.array([1.23370055014, 11.1033049512])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         #EDload_coslinear(loadtim, loadmag, omega_phase, eigs, tvals)
 
 #        EDload_coslinear(loadtim, loadmag, omega_phase, eigs, tvals)
@@ -918,7 +918,7 @@ class test_Eload_linear(base_t_ester):
         base_t_ester.__init__(self, Eload_linear, prefix = self.__class__.__name__)
         self.eigs = np.array([2.46740110027, 22.2066099025])
         self.eigs_dT2 = np.array([1.23370055014, 11.1033049512])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         #Eload_linear(loadtim, loadmag, eigs, tvals)
 
 
@@ -979,7 +979,7 @@ class test_Eload_coslinear(base_t_ester):
         base_t_ester.__init__(self, Eload_coslinear, prefix = self.__class__.__name__)
         self.eigs = np.array([2.46740110027, 22.2066099025])
         self.eigs_dT2 = np.array([1.23370055014, 11.1033049512])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         #Eload_coslinear(loadtim, loadmag, omega, phase, eigs, tvals)
 
 
@@ -1046,7 +1046,7 @@ class test_Eload_sinlinear(base_t_ester):
         base_t_ester.__init__(self, Eload_sinlinear, prefix = self.__class__.__name__)
         self.eigs = np.array([2.46740110027, 22.2066099025])
         self.eigs_dT2 = np.array([1.23370055014, 11.1033049512])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         #Eload_sinlinear(loadtim, loadmag, omega, phase, eigs, tvals)
 
 
@@ -1194,7 +1194,7 @@ class test_dim1sin_DD_abDDf_linear(base_t_ester):
         base_t_ester.__init__(self, dim1sin_DD_abDDf_linear, prefix = self.__class__.__name__)
         self.iso_PTIB = (0.5) * np.array([[(np.pi/2.0)**4.0, 0], [0, (3.0*np.pi/2.0)**4.0]])
         self.iso_PTPB = (0.5) * np.array([[(np.pi)**4.0, 0], [0, (2.0*np.pi)**4.0]])
-        self.implementation = ['scalar','vectorized','fortran']
+        self.implementation = ['scalar','vectorized','fortran','jit']
         self.cases = [
 
             #a
@@ -1331,6 +1331,41 @@ class test_pdim1sin_DD_abDDf_linear(base_t_ester):
             ]
 
 
+def test_Eload_cse_against_flat_expressions():
+    """Eload_linear and Eload_coslinear against code generated without
+    common subexpression elimination"""
+
+    from geotecha.speccon import integrals_generate_code as gen
+
+    gen.CSE = False
+    try:
+        flat_linear = gen.python_implementation(
+            gen.Eload_linear_implementations()[0], 'Eload_linear')
+        flat_coslinear = gen.python_implementation(
+            gen.Eload_coslinear_implementations()[0], 'Eload_coslinear')
+    finally:
+        gen.CSE = True
+
+    eigs = np.array([m_from_sin_mx(i, boundary=1) for i in range(20)])**2
+    tvals = np.logspace(-3, 1.5, 30)
+    loadtim = np.array([0, 0, 1, 2, 2, 5, 8])
+    loadmag = np.array([0, 1, 1, 3, 2, 2, 0.5])
+
+    for implementation in ['scalar', 'vectorized']:
+        assert_allclose(
+            Eload_linear(loadtim, loadmag, eigs, tvals, dT=1.5,
+                         implementation=implementation),
+            flat_linear(loadtim, loadmag, eigs, tvals, dT=1.5,
+                        implementation=implementation),
+            rtol=1e-12, atol=1e-14)
+        assert_allclose(
+            Eload_coslinear(loadtim, loadmag, 2.0, 0.3, eigs, tvals, dT=1.5,
+                            implementation=implementation),
+            flat_coslinear(loadtim, loadmag, 2.0, 0.3, eigs, tvals, dT=1.5,
+                           implementation=implementation),
+            rtol=1e-12, atol=1e-14)
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
@@ -23,6 +23,7 @@ from nose.tools.trivial import assert_almost_equal
 from nose.tools.trivial import assert_raises
 from nose.tools.trivial import ok_
 from numpy.testing import assert_allclose
+from mock import patch
 
 import unittest
 
@@ -42,6 +43,11 @@ from geotecha.speccon.speccon1d import dim1sin_E_Igamv_the_BC_deltaf_linear
 from geotecha.speccon.speccon1d import dim1sin_E_Igamv_the_abmag_bilinear
 from geotecha.speccon.speccon1d import dim1sin_E_Igamv_the_aDmagDt_bilinear
 from geotecha.speccon.speccon1d import dim1sin_E_Igamv_the_deltamag_linear
+from geotecha.speccon.speccon1d import block_solve_2x2
+from geotecha.speccon.speccon1d import block_solve_diag_row
+from geotecha.speccon.speccon1d import _interp_choose_max
+import geotecha.piecewise.piecewise_linear_1d as pwise
+import geotecha.speccon.integrals as integ
 
 class test_dim1sin_f(unittest.TestCase):
     """tests for dim1sin_f
@@ -976,6 +982,48 @@ class test_dim1sin_E_Igamv_the_abmag_bilinear(unittest.TestCase):
                                            [-1.04132046, -1.63127676],
                                            [-0.81568051, -1.27780132]]))
 
+    def test_shared_time_history(self):
+        #staged fill: several depth distributions, same time history.
+        mag_vs_depth = [self.mag_vs_depth,
+                        PolyLine([0, 1], [0, 3]),
+                        PolyLine([0, 1], [2, 0.5]),
+                        PolyLine([0, 1], [1, 1])]
+        mag_vs_time = [self.mag_vs_time,
+                       PolyLine([0, 2, 4], [0, 2, 2]),
+                       PolyLine([0, 1, 4], [0, 1, 3]),
+                       PolyLine([0, 2, 4], [0, 2, 2])]
+        omega_phase = [None, None, None, self.omega_phase]
+
+        expected = np.zeros((3, 2))
+        for z, t, om in zip(mag_vs_depth, mag_vs_time, omega_phase):
+            expected += dim1sin_E_Igamv_the_abmag_bilinear(
+                m=self.m, eigs=self.eigs, tvals=self.tvals, Igamv=self.Igamv,
+                a=self.a, b=self.b, mag_vs_depth=[z], mag_vs_time=[t],
+                omega_phase=[om])
+
+        with patch.object(integ, 'pEload_linear',
+                          wraps=integ.pEload_linear) as p_lin:
+            with patch.object(integ, 'pEload_coslinear',
+                              wraps=integ.pEload_coslinear) as p_cos:
+                result = dim1sin_E_Igamv_the_abmag_bilinear(
+                    m=self.m, eigs=self.eigs, tvals=self.tvals,
+                    Igamv=self.Igamv, a=self.a, b=self.b,
+                    mag_vs_depth=mag_vs_depth, mag_vs_time=mag_vs_time,
+                    omega_phase=omega_phase)
+
+        assert_allclose(result, expected)
+        #loads 0 and 1 share an E matrix
+        ok_(p_lin.call_count == 2)
+        ok_(p_cos.call_count == 1)
+
+    def test_None_time_history(self):
+        assert_raises(ValueError, dim1sin_E_Igamv_the_abmag_bilinear,
+                      m=self.m, eigs=self.eigs, tvals=self.tvals,
+                      Igamv=self.Igamv, a=self.a, b=self.b,
+                      mag_vs_depth=[self.mag_vs_depth, self.mag_vs_depth],
+                      mag_vs_time=[self.mag_vs_time, None],
+                      omega_phase=[None, None])
+
 
 
 
@@ -1098,6 +1146,104 @@ class test_dim1sin_E_Igamv_the_deltamag_linear(unittest.TestCase):
                                            [-185.05611264, -289.89897759]]))
 
 
+def test_block_solve_2x2():
+    """block_solve_2x2 vs full solve, including singular A fallback"""
+
+    rs = np.random.RandomState(0)
+    n = 4
+    A, B, C, D = [rs.rand(n, n) + n * np.identity(n) for i in range(4)]
+    R0, R1 = rs.rand(n, 3), rs.rand(n, 3)
+    full = np.bmat([[A, B], [C, D]]).A
+    expected = np.linalg.solve(full, np.vstack((R0, R1)))
+
+    X0, X1 = block_solve_2x2(A, B, C, D, R0, R1)
+    assert_allclose(np.vstack((X0, X1)), expected)
+
+    A = np.zeros((n, n))
+    B = np.identity(n)
+    C = np.identity(n)
+    full = np.bmat([[A, B], [C, D]]).A
+    expected = np.linalg.solve(full, np.vstack((R0, R1)))
+    X0, X1 = block_solve_2x2(A, B, C, D, R0, R1)
+    assert_allclose(np.vstack((X0, X1)), expected)
+
+
+def test_block_solve_diag_row():
+    """block_solve_diag_row vs full solve for various c0, c1"""
+
+    rs = np.random.RandomState(1)
+    n = 3
+    I = np.identity(n)
+    Z = np.zeros((n, n))
+    M = [[rs.rand(n, n) + n * I for j in range(3)] for i in range(2)]
+    R = [rs.rand(n, 2 * n) for i in range(3)]
+    for c0, c1 in [(1.0, 0.0), (0.7, 0.3), (0.2, 0.8), (0.0, 1.0)]:
+        full = np.bmat([[c0 * I, c1 * I, Z], M[0], M[1]]).A
+        expected = np.linalg.solve(full, np.vstack(R))
+        X = block_solve_diag_row(c0, c1, M, R)
+        assert_allclose(np.vstack(X), expected)
+
+    assert_raises(ValueError, block_solve_diag_row, 0, 0, M, R)
+
+
+def test_interp_choose_max():
+    """_interp_choose_max vs interp_x_y(choose_max=True), steps and ends"""
+
+    xi = np.array([-1, 0, 0.5, 1, 1.5, 2, 2.5, 3, 4])
+    for x, y in [([0, 1, 2, 3], [1, 2, 4, 3]),
+                 ([0, 0, 1, 1, 2, 3, 3], [0, 1, 2, 4, 3, 3, 5]),
+                 ([0, 1, 3, 3], [1, 2, 4, 6]),
+                 ([3, 2, 1], [1, 2, 3])]:
+        assert_allclose(_interp_choose_max(x, y, xi),
+                        pwise.interp_x_y(x, y, xi, choose_max=True))
+
+
+def test_bc_rank1_vs_polyline():
+    """dim1sin_f, dim1sin_avgf, dim1sin_integrate_af BC part vs PolyLine
+    interpolation/integration for each load"""
+
+    m = np.array([pi / 2, 3 * pi / 2])
+    tvals = np.array([0, 0.5, 1, 1.5, 3])
+    v = np.zeros((2, len(tvals)))
+    top = [PolyLine([0, 1, 1, 2], [0, 1, 2, 3]), PolyLine([0, 4], [1, 1])]
+    top_om = [(2, 0.3), None]
+    bot = [PolyLine([0, 2], [2, 0])]
+    outz = np.array([0, 0.3, 1])
+    z = np.array([[0, 1], [0.2, 0.6]])
+    a = PolyLine([0, 0.4, 1], [1, 2, 1])
+
+    def f(mag_vs_time, om_ph):
+        out = pwise.pinterp_x_y(mag_vs_time, tvals, choose_max=True)
+        if not om_ph is None:
+            out = out * np.cos(om_ph[0] * tvals + om_ph[1])
+        return out
+
+    ftop = sum(f(mag, om) for mag, om in zip(top, top_om))
+    fbot = f(bot[0], None)
+    for drn in [0, 1]:
+        if drn == 1:
+            gtop, avgtop = np.ones(3), np.ones(2)
+            btop = PolyLine(a.x1, a.x2, np.ones(2), np.ones(2))
+        else:
+            gtop, avgtop = 1 - outz, 1 - z.mean(axis=1)
+            btop = PolyLine(a.x1, a.x2, 1 - a.x1, 1 - a.x2)
+        bbot = PolyLine(a.x1, a.x2, a.x1, a.x2)
+
+        assert_allclose(
+            dim1sin_f(m, outz, tvals, v, drn, top, bot, top_om),
+            np.outer(gtop, ftop) + np.outer(outz, fbot))
+        assert_allclose(
+            dim1sin_avgf(m, z, tvals, v, drn, top, bot, top_om),
+            np.outer(avgtop, ftop) + np.outer(z.mean(axis=1), fbot))
+        itop = pwise.pintegrate_x1a_x2a_y1a_y2a_multiply_x1b_x2b_y1b_y2b_between(
+            a, btop, z[:, 0], z[:, 1])
+        ibot = pwise.pintegrate_x1a_x2a_y1a_y2a_multiply_x1b_x2b_y1b_y2b_between(
+            a, bbot, z[:, 0], z[:, 1])
+        assert_allclose(
+            dim1sin_integrate_af(m, z, tvals, v, drn, a, top, bot, top_om),
+            np.outer(itop, ftop) + np.outer(ibot, fbot))
+
+
 if __name__ == '__main__':
 
     import nose
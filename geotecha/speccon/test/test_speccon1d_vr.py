@@ -20,11 +20,13 @@ from __future__ import division, print_function
 
 from nose import with_setup
 from nose.tools.trivial import assert_almost_equal
+from nose.tools.trivial import assert_equal
 from nose.tools.trivial import assert_raises
 from nose.tools.trivial import ok_
 from numpy.testing import assert_allclose
 import unittest
 
+import warnings
 from math import pi
 import numpy as np
 import textwrap
@@ -32,6 +34,8 @@ import matplotlib.pyplot as plt
 from geotecha.piecewise.piecewise_linear_1d import PolyLine
 
 from geotecha.speccon.speccon1d_vr import Speccon1dVR
+from geotecha.speccon.speccon1d_vr import Speccon1dVRIncremental
+from geotecha.speccon.speccon1d_vr import _history_after
 
 import geotecha.mathematics.transformations as transformations
 
@@ -3622,6 +3626,251 @@ def test_zhuandyin2012_drn0_kv_mv_non_linear_BC():
                                 "implementation='%s', dT=%s" % (impl, dT)))
 
 
+def test_incremental_extend_vs_make_all():
+    """Speccon1dVRIncremental.extend in batches vs single make_all
+
+    all load types, steps at solved times, cyclic loads.
+
+    """
+
+    reader = textwrap.dedent("""\
+    H = 2
+    drn = 0
+    neig = 20
+    dTv = 0.5
+    dTh = 0.3
+    mv = PolyLine([0, 1], [1, 1.5])
+    kv = PolyLine([0, 1], [1, 2])
+    kh = PolyLine([0, 1], [1, 1])
+    et = PolyLine([0, 1], [1, 1])
+    surcharge_vs_depth = [PolyLine([0, 1], [100, 80]),
+                          PolyLine([0, 1], [10, 10])]
+    surcharge_vs_time = [PolyLine([0, 0.2, 0.2, 0.5, 3], [0, 1, 1.5, 1.5, 2]),
+                         PolyLine([0.3, 0.6], [0, 1])]
+    surcharge_omega_phase = [None, (5, 0.2)]
+    vacuum_vs_depth = PolyLine([0, 1], [1, 0.5])
+    vacuum_vs_time = PolyLine([0, 0.1, 0.7, 0.7, 4], [0, -10, -10, -20, -20])
+    top_vs_time = PolyLine([0, 0.15, 1.2], [0, 5, 5])
+    top_omega_phase = (3, 0.1)
+    bot_vs_time = PolyLine([0, 0.4, 2], [0, 2, 8])
+    fixed_ppress = [(0.5, 1000, PolyLine([0, 0.35, 3], [0, 3, 3]))]
+    pumping = (0.3, PolyLine([0, 0.25, 0.8, 5], [0, 0.5, 0.5, 0.1]))
+    ppress_z = [0.1, 0.5, 0.9]
+    avg_ppress_z_pairs = [[0, 1], [0.2, 0.6]]
+    settlement_z_pairs = [[0, 1], [0.5, 1]]
+    """)
+
+    t = np.array([0.05, 0.1, 0.2, 0.25, 0.35, 0.5, 0.7, 0.9, 1.5, 2.5, 4, 6])
+
+    expected = Speccon1dVR(reader + "\ntvals = np.%s" % repr(t))
+    expected.make_all()
+
+    a = Speccon1dVR(reader + "\ntvals = np.%s" % repr(t[:3]))
+    a.make_all()
+    b = Speccon1dVRIncremental(a)
+    por = [a.por]
+    avp = [a.avp]
+    settle = [a.set]
+    for tvals in [t[3:4], t[4:8], t[8:]]:
+        b.extend(tvals)
+        por.append(b.por)
+        avp.append(b.avp)
+        settle.append(b.set)
+
+    assert_allclose(np.hstack(por), expected.por, atol=1e-8)
+    assert_allclose(np.hstack(avp), expected.avp, atol=1e-8)
+    assert_allclose(np.hstack(settle), expected.set, atol=1e-8)
+    assert_allclose(b.t_last, t[-1])
+
+
+def test_incremental_append_load():
+    """Speccon1dVRIncremental.append_load vs make_all with full load"""
+
+    reader = textwrap.dedent("""\
+    neig = 15
+    dTv = 1
+    dTh = 0.5
+    mv = PolyLine([0, 1], [1, 1])
+    kv = PolyLine([0, 1], [1, 1])
+    kh = PolyLine([0, 1], [1, 1])
+    et = PolyLine([0, 1], [1, 1])
+    surcharge_vs_depth = PolyLine([0, 1], [100, 100])
+    vacuum_vs_depth = PolyLine([0, 1], [1, 1])
+    ppress_z = [0.2, 0.7]
+    settlement_z_pairs = [[0, 1]]
+    """)
+
+    t = np.array([0.05, 0.1, 0.2, 0.3, 0.5, 0.8, 1.2])
+
+    expected = Speccon1dVR(reader + textwrap.dedent("""\
+        surcharge_vs_time = PolyLine([0, 0.1, 0.4, 0.6, 1], [0, 1, 1, 2, 2])
+        vacuum_vs_time = PolyLine([0, 0.05, 0.25, 0.25, 1], [0, -5, -5, -10, -10])
+        tvals = np.%s""" % repr(t)))
+    expected.make_all()
+
+    a = Speccon1dVR(reader + textwrap.dedent("""\
+        surcharge_vs_time = PolyLine([0, 0.1, 0.2], [0, 1, 1])
+        vacuum_vs_time = PolyLine([0, 0.05, 0.2], [0, -5, -5])
+        tvals = np.%s""" % repr(t[:3])))
+    a.make_all()
+    b = Speccon1dVRIncremental(a)
+    b.append_load('surcharge_vs_time', 0, [0.4, 0.6, 1], [1, 2, 2])
+    b.append_load('vacuum_vs_time', 0, [0.25, 0.25, 1], [-5, -10, -10])
+    b.extend(t[3:])
+
+    assert_allclose(b.por, expected.por[:, 3:], atol=1e-8)
+    assert_allclose(b.set, expected.set[:, 3:], atol=1e-8)
+
+
+def test_incremental_before_t_last():
+    """Speccon1dVRIncremental times/loads before t_last raise ValueError"""
+
+    a = Speccon1dVR(textwrap.dedent("""\
+        neig = 5
+        dTv = 1
+        mv = PolyLine([0, 1], [1, 1])
+        kv = PolyLine([0, 1], [1, 1])
+        surcharge_vs_depth = PolyLine([0, 1], [100, 100])
+        surcharge_vs_time = PolyLine([0, 0.1, 0.5], [0, 1, 1])
+        ppress_z = [0.5]
+        tvals = [0.1, 0.2]
+        """))
+    b = Speccon1dVRIncremental(a)
+    assert_raises(ValueError, b.extend, [0.15, 0.3])
+    assert_raises(ValueError, b.append_load, 'surcharge_vs_time', 0,
+                  [0.15], [1])
+    assert_raises(ValueError, b.append_load, 'surcharge_vs_time', 0,
+                  [0.3], [1])
+    assert_raises(ValueError, b.append_load, 'vacuum_vs_time', 0,
+                  [0.6], [1])
+
+
+def test_history_after():
+    """_history_after for t0 before, within, on a step, and after load"""
+
+    a = PolyLine([1, 2, 2, 4], [0, 2, 3, 3])
+    ok_(_history_after(a, 0.5) == a)
+    ok_(_history_after(a, 1.5) == PolyLine([1.5, 2, 2, 4], [1, 2, 3, 3]))
+    ok_(_history_after(a, 2) == PolyLine([2, 4], [3, 3]))
+    ok_(_history_after(a, 5) == PolyLine([5, 6], [0, 0]))
+    ok_(_history_after(None, 5) is None)
+
+
+def test_load_workers():
+    """load_workers thread pool gives same E_Igamv_the as sequential"""
+
+    reader = textwrap.dedent("""\
+    neig = 10
+    dTv = 0.5
+    dTh = 0.3
+    mv = PolyLine([0, 1], [1, 1.5])
+    kv = PolyLine([0, 1], [1, 2])
+    kh = PolyLine([0, 1], [1, 1])
+    et = PolyLine([0, 1], [1, 1])
+    surcharge_vs_depth = PolyLine([0, 1], [100, 80])
+    surcharge_vs_time = PolyLine([0, 0.2, 3], [0, 1, 1])
+    vacuum_vs_depth = PolyLine([0, 1], [1, 0.5])
+    vacuum_vs_time = PolyLine([0, 0.1, 4], [0, -10, -10])
+    top_vs_time = PolyLine([0, 0.15, 1.2], [0, 5, 5])
+    fixed_ppress = [(0.5, 1000, PolyLine([0, 0.35, 3], [0, 3, 3]))]
+    pumping = (0.3, PolyLine([0, 0.25, 0.8, 5], [0, 0.5, 0.5, 0.1]))
+    ppress_z = [0.1, 0.5, 0.9]
+    tvals = np.linspace(0.01, 5, 20)
+    """)
+
+    a = Speccon1dVR(reader)
+    a.make_all()
+    b = Speccon1dVR(reader + "\nload_workers = 3")
+    b.make_all()
+
+    assert_allclose(b.E_Igamv_the, a.E_Igamv_the, rtol=0, atol=0)
+    assert_allclose(b.E_Igamv_the_pumping, a.E_Igamv_the_pumping)
+    assert_allclose(b.por, a.por)
+
+
+def test_neig_tol():
+    """neig_tol doubles neig until output converges"""
+
+    reader = textwrap.dedent("""\
+    H = 1
+    drn = 1
+    dTv = 0.1
+    mv = PolyLine([0, 0.5, 0.5, 1], [1, 1, 0.3, 0.3])
+    kv = PolyLine([0, 0.5, 0.5, 1], [1, 1, 5, 5])
+    surcharge_vs_depth = PolyLine([0, 0.5, 0.5, 1], [100, 100, 100, 100])
+    surcharge_vs_time = PolyLine([0, 0.1, 10], [0, 1, 1])
+    ppress_z = [0.2, 0.5, 0.8]
+    settlement_z_pairs = [[0, 1]]
+    tvals = np.logspace(-2, 1, 10)
+    """)
+
+    a = Speccon1dVR(reader + "\nneig = 4\nneig_tol = 0.01")
+    a.make_all()
+    assert_equal([v[0] for v in a.neig_history], [4, 8, 16])
+    ok_(a.neig_history[0][1] is None)
+    ok_(a.neig_history[-1][1] < 0.01)
+    ok_(a.neig_history[-2][1] >= 0.01)
+    assert_equal(a.neig, 16)
+    assert_equal(a.por.shape, (3, 10))
+
+    b = Speccon1dVR(reader + "\nneig = 200")
+    b.make_all()
+    assert_allclose(a.set, b.set, atol=0.01 * np.max(b.set))
+
+
+def test_neig_tol_neig_max():
+    """neig_tol not reached by neig_max gives warning"""
+
+    reader = textwrap.dedent("""\
+    dTv = 0.1
+    mv = PolyLine([0, 1], [1, 1])
+    kv = PolyLine([0, 1], [1, 1])
+    surcharge_vs_depth = PolyLine([0, 1], [100, 100])
+    surcharge_vs_time = PolyLine([0, 0, 10], [0, 1, 1])
+    ppress_z = [0.2, 0.5]
+    tvals = [0.01, 0.1]
+    neig = 3
+    neig_tol = 1e-12
+    neig_max = 10
+    """)
+
+    a = Speccon1dVR(reader)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        a.make_all()
+    assert_equal([v[0] for v in a.neig_history], [3, 6, 10])
+    assert_equal(a.neig, 10)
+    ok_(any('neig_max=10' in str(v.message) for v in w))
+
+
+
+def test_neig_tol_neig_max_not_above_neig():
+    """neig already at neig_max warns that convergence was not checked"""
+
+    reader = textwrap.dedent("""\
+    dTv = 0.1
+    mv = PolyLine([0, 1], [1, 1])
+    kv = PolyLine([0, 1], [1, 1])
+    surcharge_vs_depth = PolyLine([0, 1], [100, 100])
+    surcharge_vs_time = PolyLine([0, 0, 10], [0, 1, 1])
+    ppress_z = [0.2, 0.5]
+    tvals = [0.01, 0.1]
+    neig = 10
+    neig_tol = 1e-3
+    neig_max = 10
+    """)
+
+    a = Speccon1dVR(reader)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        a.make_all()
+    assert_equal(a.neig_history, [(10, None)])
+    msg = [str(v.message) for v in w if 'neig_max' in str(v.message)]
+    assert_equal(len(msg), 1)
+    ok_('not checked' in msg[0])
+    ok_(not 'reached' in msg[0])
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
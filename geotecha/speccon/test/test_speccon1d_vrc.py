@@ -4992,6 +4992,32 @@ settlement_z_pairs = [[0,1]]
                             err_msg = ("Fail. luetal2010, settle, "
                                 "implementation='%s', dT=%s" % (impl, dT)))
 
+
+def test_bet_blocks():
+    """bet blocks used in the analysis agree with the full inverse"""
+
+    np.random.seed(0)
+    n = 4
+    a = Speccon1dVRC.__new__(Speccon1dVRC)
+    a.neig = n
+    a.alp = 0.3
+    for name in ['psi_sv', 'psi_sh', 'psi_cv', 'psi_ch']:
+        setattr(a, name, np.random.rand(n, n) + n * np.identity(n))
+    a.psi_s = a.psi_sh - a.psi_sv
+    a.psi_c = a.psi_ch - a.psi_cv
+    a._make_bet()
+
+    bet = a.bet
+    assert_allclose(bet.dot(a._Ibet()), np.identity(3 * n), atol=1e-12)
+    assert_allclose(bet[:n, :n], a.bet00)
+    assert_allclose(bet[n:2 * n, :n], a.bet10)
+    assert_allclose(bet[2 * n:, :n], a.bet20)
+    assert_allclose(a.bet01 + a.alp * a.bet02, a.bet01_alp02)
+    assert_allclose(a.bet11 + a.alp * a.bet12, a.bet11_alp12)
+    assert_allclose(a.bet21 + a.alp * a.bet22, a.bet21_alp22)
+    assert_raises(AttributeError, setattr, a, 'bet01', bet[:n, n:2 * n])
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=['nose', '--verbosity=3', '--with-doctest'])
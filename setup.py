@@ -136,6 +136,7 @@ TESTS_REQUIRE=['nose', 'testfixtures']
 DATA_FILES = [(NAME, ['LICENSE.txt','README.rst', 'CHANGELOG.txt'])]
 PACKAGES=setuptools.find_packages()
 PACKAGES.remove('tools')
+PACKAGES.remove('benchmarks')
 
 PACKAGE_DATA={
               '': ['*.f95','*.f90', '*.csv'],}